@@ -12,9 +12,17 @@ from app.core import security
 from app.core.config import settings
 from app.core.db import engine
 from app.models import TokenPayload, User
+from app.services.content_cache import ContentCache, content_cache
+from app.services.federated import FederatedResearchService
 from app.services.gemini import GeminiService
+from app.services.gemini_poller import GeminiStatusPoller, gemini_poller
+from app.services.gemini_registry import GeminiInteractionRegistry, gemini_interactions
+from app.services.job_queue import JobQueue, job_queue
 from app.services.perplexity import PerplexityService
+from app.services.registry import services
+from app.services.search_cache import SearchCache, search_cache
 from app.services.tavily import TavilyService
+from app.services.webhooks import WebhookDispatcher, webhooks
 from app.services.youcom import YouComService
 
 reusable_oauth2 = OAuth2PasswordBearer(
@@ -32,51 +40,158 @@ TokenDep = Annotated[str, Depends(reusable_oauth2)]
 
 
 def get_tavily_service() -> TavilyService:
-    """Factory function for TavilyService dependency injection.
+    """Dependency returning the process-wide TavilyService.
 
     Returns:
-        TavilyService: A configured TavilyService instance.
+        TavilyService: The shared instance created at application startup.
     """
-    return TavilyService()
+    return services.get(TavilyService)
 
 
 TavilyDep = Annotated[TavilyService, Depends(get_tavily_service)]
 
 
 def get_perplexity_service() -> PerplexityService:
-    """Factory function for PerplexityService dependency injection.
+    """Dependency returning the process-wide PerplexityService.
 
     Returns:
-        PerplexityService: A configured PerplexityService instance.
+        PerplexityService: The shared instance created at application startup.
+
+    Raises:
+        PerplexityAPIError: If the Perplexity API key is not configured.
     """
-    return PerplexityService()
+    return services.get(PerplexityService)
 
 
 PerplexityDep = Annotated[PerplexityService, Depends(get_perplexity_service)]
 
 
 def get_gemini_service() -> GeminiService:
-    """Factory function for GeminiService dependency injection.
+    """Dependency returning the process-wide GeminiService.
 
     Returns:
-        GeminiService: A configured GeminiService instance.
+        GeminiService: The shared instance created at application startup.
+
+    Raises:
+        GeminiAPIError: If the Gemini API key is not configured.
     """
-    return GeminiService()
+    return services.get(GeminiService)
 
 
 GeminiDep = Annotated[GeminiService, Depends(get_gemini_service)]
 
 
+def get_gemini_poller() -> GeminiStatusPoller:
+    """Dependency returning the shared Gemini status poller.
+
+    Returns:
+        GeminiStatusPoller: The process-wide poller and status cache.
+    """
+    return gemini_poller
+
+
+GeminiPollerDep = Annotated[GeminiStatusPoller, Depends(get_gemini_poller)]
+
+
+def get_gemini_registry() -> GeminiInteractionRegistry:
+    """Dependency returning the Gemini interaction registry.
+
+    Returns:
+        GeminiInteractionRegistry: The registry shared with the status poller.
+    """
+    return gemini_interactions
+
+
+GeminiRegistryDep = Annotated[GeminiInteractionRegistry, Depends(get_gemini_registry)]
+
+
+def get_webhook_dispatcher() -> WebhookDispatcher:
+    """Dependency returning the completion webhook dispatcher.
+
+    Returns:
+        WebhookDispatcher: The dispatcher shared with the status poller.
+    """
+    return webhooks
+
+
+WebhookDep = Annotated[WebhookDispatcher, Depends(get_webhook_dispatcher)]
+
+
 def get_youcom_service() -> YouComService:
-    """Factory function for YouComService dependency injection."""
+    """Dependency returning the process-wide YouComService."""
 
-    return YouComService()
+    return services.get(YouComService)
 
 
 YouComDep = Annotated[YouComService, Depends(get_youcom_service)]
 
 
-def get_current_user(session: SessionDep, token: TokenDep) -> User:
+def get_federated_service() -> FederatedResearchService:
+    """Dependency returning a FederatedResearchService over the shared registry.
+
+    Returns:
+        FederatedResearchService: Fan-out service resolving provider services
+            from the process-wide registry.
+    """
+    return FederatedResearchService(services)
+
+
+FederatedDep = Annotated[FederatedResearchService, Depends(get_federated_service)]
+
+
+def get_content_cache() -> ContentCache:
+    """Dependency returning the process-wide extracted-content cache.
+
+    Returns:
+        ContentCache: The cache shared with TavilyService.
+    """
+    return content_cache
+
+
+ContentCacheDep = Annotated[ContentCache, Depends(get_content_cache)]
+
+
+def get_search_cache() -> SearchCache:
+    """Dependency returning the process-wide Tavily search response cache.
+
+    Returns:
+        SearchCache: The in-memory cache of encoded search responses.
+    """
+    return search_cache
+
+
+SearchCacheDep = Annotated[SearchCache, Depends(get_search_cache)]
+
+
+def get_job_queue() -> JobQueue:
+    """Dependency returning the process-wide research job queue.
+
+    Returns:
+        JobQueue: The Postgres-backed queue drained by app.worker.
+    """
+    return job_queue
+
+
+JobQueueDep = Annotated[JobQueue, Depends(get_job_queue)]
+
+
+def get_user_from_token(session: Session, token: str) -> User:
+    """Return the active user an access token was issued to.
+
+    Shared by get_current_user and the WebSocket routes, which cannot use
+    the OAuth2 bearer dependency and authenticate once per connection.
+
+    Args:
+        session: Database session.
+        token: The JWT access token.
+
+    Returns:
+        The authenticated user.
+
+    Raises:
+        HTTPException: If the token is invalid or the user is unknown or
+            inactive.
+    """
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
@@ -95,6 +210,10 @@ def get_current_user(session: SessionDep, token: TokenDep) -> User:
     return user
 
 
+def get_current_user(session: SessionDep, token: TokenDep) -> User:
+    return get_user_from_token(session, token)
+
+
 CurrentUser = Annotated[User, Depends(get_current_user)]
 
 
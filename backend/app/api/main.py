@@ -1,11 +1,14 @@
 from fastapi import APIRouter
 
 from app.api.routes import (
+    content_cache,
+    federated,
     gemini,
     items,
     login,
     perplexity,
     private,
+    subscriptions,
     tavily,
     users,
     utils,
@@ -22,6 +25,9 @@ api_router.include_router(tavily.router)
 api_router.include_router(perplexity.router)
 api_router.include_router(gemini.router)
 api_router.include_router(youcom.router)
+api_router.include_router(federated.router)
+api_router.include_router(content_cache.router)
+api_router.include_router(subscriptions.router)
 
 
 if settings.ENVIRONMENT == "local":
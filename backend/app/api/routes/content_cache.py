@@ -0,0 +1,57 @@
+"""Admin route handlers for the extracted-content cache.
+
+This module provides superuser-only routes to inspect and purge the
+Postgres-backed cache of Tavily extractions.
+
+Endpoints:
+    GET /content-cache/stats - Entry count, size and hit totals
+    GET /content-cache/ - List entries, most recently used first
+    DELETE /content-cache/ - Purge all, expired, or a single URL's entries
+"""
+
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query
+
+from app.api.deps import ContentCacheDep, get_current_active_superuser
+from app.models import ContentCacheEntriesPublic, ContentCacheStats, Message
+
+router = APIRouter(
+    prefix="/content-cache",
+    tags=["content-cache"],
+    dependencies=[Depends(get_current_active_superuser)],
+)
+
+
+@router.get("/stats", response_model=ContentCacheStats)
+def read_stats(cache: ContentCacheDep) -> Any:
+    """
+    Retrieve content cache statistics.
+    """
+    return cache.stats()
+
+
+@router.get("/", response_model=ContentCacheEntriesPublic)
+def read_entries(
+    cache: ContentCacheDep,
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=1000),
+) -> Any:
+    """
+    Retrieve cached extractions, most recently used first.
+    """
+    entries, count = cache.list_entries(skip=skip, limit=limit)
+    return ContentCacheEntriesPublic(data=entries, count=count)
+
+
+@router.delete("/", response_model=Message)
+def purge_entries(
+    cache: ContentCacheDep,
+    url: str | None = None,
+    expired_only: bool = False,
+) -> Message:
+    """
+    Purge cached extractions: all of them, only expired ones, or one URL.
+    """
+    deleted = cache.purge(url=url, expired_only=expired_only)
+    return Message(message=f"Purged {deleted} cached extractions")
@@ -0,0 +1,42 @@
+"""Federated research route handlers.
+
+This module provides a FastAPI route that runs one query through several
+providers concurrently. Routes require JWT authentication via CurrentUser
+dependency and use FederatedDep for service injection.
+
+Endpoints:
+    POST /federated/research - Fan a query out to Tavily, Perplexity and You.com
+"""
+
+from typing import Any
+
+from fastapi import APIRouter
+
+from app.api.deps import CurrentUser, FederatedDep
+from app.schemas.federated import FederatedResearchRequest, FederatedResearchResponse
+
+router = APIRouter(prefix="/federated", tags=["federated"])
+
+
+@router.post("/research", response_model=FederatedResearchResponse)
+async def research(
+    _current_user: CurrentUser,
+    federated: FederatedDep,
+    request: FederatedResearchRequest,
+) -> Any:
+    """Run one research query through several providers concurrently.
+
+    Each selected provider is called in parallel under its own deadline, so
+    the request takes as long as the slowest provider rather than the sum of
+    all of them. Provider failures and timeouts do not fail the request;
+    they are reported per provider alongside the successful results.
+
+    Args:
+        _current_user: Authenticated user (required for authorization).
+        federated: Injected FederatedResearchService instance.
+        request: Federated research request with query and provider selection.
+
+    Returns:
+        FederatedResearchResponse with per-provider results, errors and timings.
+    """
+    return await federated.research(request)
@@ -6,34 +6,349 @@ polling workflow where clients submit a job, receive an interaction ID,
 and then poll for status updates until completion.
 
 Routes require JWT authentication via CurrentUser dependency and use
-GeminiDep for service injection.
+GeminiDep for service injection. Status reads go through the shared
+GeminiStatusPoller (GeminiPollerDep), so each in-flight interaction is polled
+upstream at most once per poll interval no matter how many clients watch it.
+
+Every interaction started here is recorded in the interaction registry
+(GeminiRegistryDep) with the user who started it. Only that user (or a
+superuser) can read, stream or cancel it; other IDs are reported as not
+found.
+
+Jobs started with a callback_url are followed by the poller until they
+finish, and a signed completion webhook is then POSTed to the URL, so the
+client does not need to poll at all.
+
+If the client of a sync request disconnects, waiting stops and (unless
+GEMINI_CANCEL_ON_DISCONNECT is off, or the job has a callback_url) the
+upstream job is cancelled.
 
 Endpoints:
     POST /gemini/deep-research/sync - Execute deep research and wait for completion
     POST /gemini/deep-research - Start async deep research job
-    GET /gemini/deep-research/{interaction_id} - Poll for job status
+    GET /gemini/deep-research - List the user's jobs with their last status
+    POST /gemini/deep-research/status - Status of many jobs in one call
+    GET /gemini/deep-research/{interaction_id} - Poll for job status (deltas
+        since a cursor, optionally long polling)
+    GET /gemini/deep-research/{interaction_id}/stream - Stream progress (SSE)
     DELETE /gemini/deep-research/{interaction_id} - Cancel running job
 """
 
-from typing import Any
-
-from fastapi import APIRouter, Query
-
-from app.api.deps import CurrentUser, GeminiDep
+import asyncio
+import hashlib
+import logging
+from collections.abc import AsyncIterator
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Header, Query, Request
+from fastapi.responses import Response, StreamingResponse
+
+from app.api.deps import (
+    CurrentUser,
+    GeminiDep,
+    GeminiPollerDep,
+    GeminiRegistryDep,
+    WebhookDep,
+)
+from app.core.config import settings
+from app.core.deadline import remaining
+from app.core.disconnect import ClientDisconnectedError, cancel_on_disconnect
+from app.core.streaming import (
+    SSE_HEADERS,
+    SSE_KEEPALIVE,
+    SSE_MEDIA_TYPE,
+    format_sse_event,
+)
+from app.exceptions.gemini import GeminiAPIError, GeminiErrorCode
+from app.models import GeminiInteraction, GeminiInteractionsPublic
 from app.schemas.gemini import (
+    GeminiBulkStatusRequest,
+    GeminiBulkStatusResponse,
     GeminiDeepResearchJobResponse,
+    GeminiDeepResearchPollResponse,
     GeminiDeepResearchRequest,
     GeminiDeepResearchResultResponse,
+    GeminiInteractionStatus,
+    GeminiStatusSummary,
+    GeminiStreamEventType,
 )
+from app.schemas.tavily import ErrorResponse
+from app.services.gemini import TERMINAL_STATUSES, GeminiService
+from app.services.gemini_poller import (
+    GeminiStatusPoller,
+    build_cursor,
+    cursor_offset,
+    delta_response,
+    parse_cursor,
+)
+from app.services.gemini_registry import GeminiInteractionRegistry
+from app.services.webhooks import WebhookDispatcher, WebhookURLError
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/gemini", tags=["gemini"])
 
+# Seconds of silence after which a keep-alive comment is sent on SSE streams
+SSE_HEARTBEAT_SECONDS = 15.0
+
+# Seconds a long poll (or sync research wait) answers before the request
+# deadline, leaving time for the response to reach the caller
+LONG_POLL_DEADLINE_MARGIN = 0.5
+
+
+async def _owned_interaction(
+    registry: GeminiInteractionRegistry,
+    interaction_id: str,
+    current_user: CurrentUser,
+) -> GeminiInteraction:
+    """Return a recorded interaction the user may access.
+
+    Args:
+        registry: Interaction registry.
+        interaction_id: The interaction ID from the request path.
+        current_user: The authenticated user.
+
+    Returns:
+        The recorded interaction.
+
+    Raises:
+        GeminiAPIError: If the interaction is unknown or belongs to another
+            user (reported the same way, as not found).
+    """
+    interaction = await asyncio.to_thread(
+        registry.get_for_user, interaction_id, current_user
+    )
+    if interaction is None:
+        raise GeminiAPIError.interaction_not_found(
+            details={"interaction_id": interaction_id}
+        )
+    return interaction
+
+
+async def _start(
+    gemini: GeminiService,
+    poller: GeminiStatusPoller,
+    registry: GeminiInteractionRegistry,
+    webhooks: WebhookDispatcher,
+    request: GeminiDeepResearchRequest,
+    current_user: CurrentUser,
+) -> GeminiDeepResearchJobResponse:
+    """Start a job, record it for the user and have the poller track it.
+
+    Raises:
+        GeminiAPIError: If the callback URL cannot be used or the API
+            request fails.
+    """
+    callback_url = str(request.callback_url) if request.callback_url else None
+    if callback_url is not None:
+        if not webhooks.enabled:
+            raise GeminiAPIError.invalid_request(
+                message="Completion webhooks are not enabled on this server.",
+            )
+        if settings.ENVIRONMENT != "local" and not callback_url.startswith("https://"):
+            raise GeminiAPIError.invalid_request(
+                message="callback_url must use https.",
+                details={"callback_url": callback_url},
+            )
+        try:
+            await webhooks.check_url(callback_url)
+        except WebhookURLError as exc:
+            raise GeminiAPIError.invalid_request(
+                message=str(exc),
+                details={"callback_url": callback_url},
+            ) from exc
+
+    job = await gemini.start_research(request)
+    await asyncio.to_thread(
+        registry.record,
+        job.interaction_id,
+        current_user.id,
+        request.query,
+        job.status,
+        callback_url,
+    )
+    poller.track(job.interaction_id, watch=callback_url is not None)
+    return job
+
+
+async def _research_events(
+    gemini: GeminiService,
+    poller: GeminiStatusPoller,
+    interaction_id: str,
+    last_event_id: str | None,
+) -> AsyncIterator[str]:
+    """Translate shared poller snapshots into Server-Sent Events.
+
+    Every event ID is a cursor (see build_cursor) recording how many output
+    segments the client has received, so a reconnect with Last-Event-ID
+    resumes after the last delivered segment.
+
+    Args:
+        gemini: GeminiService used to classify terminal failures.
+        poller: Shared status poller providing snapshots.
+        interaction_id: The interaction ID to follow.
+        last_event_id: Cursor from the client's Last-Event-ID header.
+
+    Yields:
+        Encoded SSE frames.
+    """
+    delivered, _ = parse_cursor(last_event_id)
+    last_status: GeminiInteractionStatus | None = None
+
+    try:
+        async for result in poller.iter_updates(
+            interaction_id, heartbeat=SSE_HEARTBEAT_SECONDS
+        ):
+            if result is None:
+                yield SSE_KEEPALIVE
+                continue
+
+            if result.status != last_status:
+                last_status = result.status
+                yield format_sse_event(
+                    {"status": result.status.value, "event_id": result.event_id},
+                    event=GeminiStreamEventType.STATUS_UPDATE.value,
+                    event_id=build_cursor(delivered, result.event_id),
+                )
+
+            for index in range(delivered, len(result.outputs)):
+                output = result.outputs[index]
+                delivered = index + 1
+                event_type = (
+                    GeminiStreamEventType.THINKING_UPDATE
+                    if output.thinking_summary
+                    else GeminiStreamEventType.RESEARCH_UPDATE
+                )
+                yield format_sse_event(
+                    {"index": index, "output": output.model_dump(mode="json")},
+                    event=event_type.value,
+                    event_id=build_cursor(delivered, result.event_id),
+                )
+
+            if result.status in TERMINAL_STATUSES:
+                gemini.raise_for_terminal_failure(interaction_id, result)
+                yield format_sse_event(
+                    {
+                        "status": result.status.value,
+                        "output_count": len(result.outputs),
+                        "usage": result.usage.model_dump() if result.usage else None,
+                        "completed_at": result.completed_at,
+                    },
+                    event=GeminiStreamEventType.FINAL_RESULT.value,
+                    event_id=build_cursor(delivered, result.event_id),
+                )
+    except GeminiAPIError as exc:
+        yield format_sse_event(
+            ErrorResponse(
+                error_code=exc.error_code,
+                message=exc.message,
+                details=exc.details,
+            ).model_dump(),
+            event=GeminiStreamEventType.ERROR.value,
+        )
+
+
+async def _cancel(
+    gemini: GeminiService,
+    poller: GeminiStatusPoller,
+    registry: GeminiInteractionRegistry,
+    webhooks: WebhookDispatcher,
+    interaction_id: str,
+) -> None:
+    """Cancel a job upstream, record it and notify its webhook.
+
+    Raises:
+        GeminiAPIError: If the cancellation request fails.
+    """
+    await gemini.cancel_research(interaction_id)
+    finished = await asyncio.to_thread(
+        registry.mark, interaction_id, GeminiInteractionStatus.CANCELLED
+    )
+    if finished is not None:
+        webhooks.notify_finished(finished)
+    poller.invalidate(interaction_id)
+
+
+def _poll_etag(result: GeminiDeepResearchResultResponse, offset: int) -> str:
+    """Return the entity tag of a poll response.
+
+    A poll response is fully determined by the snapshot's status, event ID
+    and output count plus the offset of the first output returned.
+    """
+    key = f"{result.status.value}:{result.event_id}:{len(result.outputs)}:{offset}"
+    return f'"{hashlib.sha256(key.encode()).hexdigest()[:32]}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an entity tag (weak comparison)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+async def _status_summary(
+    poller: GeminiStatusPoller,
+    interaction: GeminiInteraction,
+    semaphore: asyncio.Semaphore,
+) -> GeminiStatusSummary | ErrorResponse:
+    """Read one job's status for a bulk request, capturing its error.
+
+    A finished job the poller no longer caches is answered from the
+    registry; other jobs go through the poller, which polls upstream only
+    when its cached status is stale.
+
+    Args:
+        poller: Shared status poller.
+        interaction: The recorded interaction.
+        semaphore: Semaphore bounding the request's concurrency.
+
+    Returns:
+        GeminiStatusSummary, or ErrorResponse if the status could not be read.
+    """
+    interaction_id = interaction.interaction_id
+    if (
+        poller.get_cached(interaction_id) is None
+        and GeminiInteractionStatus(interaction.status) in TERMINAL_STATUSES
+    ):
+        return GeminiStatusSummary(
+            status=GeminiInteractionStatus(interaction.status),
+            output_count=interaction.output_count,
+            event_id=interaction.last_event_id,
+            completed_at=interaction.completed_at,
+            error_message=interaction.error_message,
+        )
+
+    async with semaphore:
+        try:
+            result = await poller.get_status(interaction_id)
+        except GeminiAPIError as exc:
+            return ErrorResponse(
+                error_code=exc.error_code,
+                message=exc.message,
+                details=exc.details,
+            )
+    return GeminiStatusSummary(
+        status=result.status,
+        output_count=len(result.outputs),
+        event_id=result.event_id,
+        completed_at=result.completed_at,
+        error_message=result.error_message,
+    )
+
 
 @router.post("/deep-research/sync", response_model=GeminiDeepResearchResultResponse)
 async def deep_research_sync(
-    _current_user: CurrentUser,
+    current_user: CurrentUser,
     gemini: GeminiDep,
+    poller: GeminiPollerDep,
+    registry: GeminiRegistryDep,
+    webhooks: WebhookDep,
     request: GeminiDeepResearchRequest,
+    http_request: Request,
 ) -> Any:
     """Execute a deep research query and wait for completion.
 
@@ -44,85 +359,331 @@ async def deep_research_sync(
     Note: This endpoint may take 20-60 minutes to complete for complex queries.
     Consider using the async workflow (POST + polling) for better control.
 
+    If the client disconnects first, waiting stops and the upstream job is
+    cancelled, unless settings.gemini.cancel_on_disconnect is off or the job
+    has a callback_url (whose receiver still expects the result).
+
+    With a request deadline (X-Timeout-Ms or X-Request-Deadline), waiting
+    stops shortly before it and a 504 naming the interaction is returned;
+    the job keeps running and can be polled or streamed from there.
+
     Args:
-        _current_user: Authenticated user (required for authorization).
+        current_user: Authenticated user, recorded as the job's owner.
         gemini: Injected GeminiService instance.
+        poller: Injected shared status poller.
+        registry: Injected interaction registry.
+        webhooks: Injected completion webhook dispatcher.
         request: Deep research request with query and optional parameters.
+        http_request: The incoming HTTP request, watched for disconnects.
 
     Returns:
         GeminiDeepResearchResultResponse with final status and results.
 
     Raises:
-        GeminiAPIError: If the job fails or polling exceeds max attempts.
+        GeminiAPIError: If the job fails, polling exceeds max attempts or
+            the request deadline is reached first.
+        ClientDisconnectedError: If the client disconnected before the job
+            finished.
     """
-    job = await gemini.start_research(request)
-    return await gemini.wait_for_completion(job.interaction_id)
+    job = await _start(gemini, poller, registry, webhooks, request, current_user)
+    timeout = None
+    budget = remaining()
+    if budget is not None:
+        timeout = max(budget - LONG_POLL_DEADLINE_MARGIN, 0.0)
+    try:
+        return await cancel_on_disconnect(
+            http_request,
+            poller.wait_for_completion(job.interaction_id, timeout=timeout),
+        )
+    except GeminiAPIError as exc:
+        if (
+            exc.error_code == GeminiErrorCode.MAX_POLLS_EXCEEDED
+            and (left := remaining()) is not None
+            and left <= LONG_POLL_DEADLINE_MARGIN
+        ):
+            raise GeminiAPIError.request_timeout(
+                message="The request deadline passed before the research "
+                "finished; poll the interaction for its result.",
+                details={"interaction_id": job.interaction_id},
+            ) from exc
+        raise
+    except ClientDisconnectedError:
+        if settings.gemini.cancel_on_disconnect and request.callback_url is None:
+            logger.info(
+                "Client disconnected; cancelling Gemini interaction %s",
+                job.interaction_id,
+            )
+            try:
+                await _cancel(gemini, poller, registry, webhooks, job.interaction_id)
+            except GeminiAPIError as exc:
+                logger.warning(
+                    "Cancelling abandoned Gemini interaction %s failed: %s",
+                    job.interaction_id,
+                    exc.message,
+                )
+        raise
 
 
 @router.post("/deep-research", response_model=GeminiDeepResearchJobResponse)
 async def start_deep_research(
-    _current_user: CurrentUser,
+    current_user: CurrentUser,
     gemini: GeminiDep,
+    poller: GeminiPollerDep,
+    registry: GeminiRegistryDep,
+    webhooks: WebhookDep,
     request: GeminiDeepResearchRequest,
 ) -> Any:
     """Start a new deep research job.
 
     Submits a research query to the Gemini API and returns immediately with
     an interaction ID. Use the poll endpoint to check job status and retrieve
-    results when complete.
+    results when complete. The job is recorded as owned by the current user
+    and registered with the shared status poller, so the first client poll
+    is usually served from cache.
+
+    With a callback_url, the poller follows the job until it finishes and
+    then POSTs a signed GeminiWebhookPayload to the URL (see
+    app.services.webhooks for the signature scheme).
 
     Args:
-        _current_user: Authenticated user (required for authorization).
+        current_user: Authenticated user, recorded as the job's owner.
         gemini: Injected GeminiService instance.
+        poller: Injected shared status poller.
+        registry: Injected interaction registry.
+        webhooks: Injected completion webhook dispatcher.
         request: Deep research request with query and optional parameters.
 
     Returns:
         GeminiDeepResearchJobResponse with interaction_id and initial status.
 
     Raises:
-        GeminiAPIError: If the API request fails for any reason.
+        GeminiAPIError: If the callback URL is rejected or the API request
+            fails for any reason.
     """
-    return await gemini.start_research(request)
+    return await _start(gemini, poller, registry, webhooks, request, current_user)
+
+
+@router.get("/deep-research", response_model=GeminiInteractionsPublic)
+def list_deep_research(
+    current_user: CurrentUser,
+    registry: GeminiRegistryDep,
+    skip: int = 0,
+    limit: int = Query(default=100, ge=1, le=1000),
+    status: GeminiInteractionStatus | None = None,
+) -> Any:
+    """List deep research jobs, newest first.
+
+    Served from the interaction registry without calling Gemini, so each
+    status is the one seen by the latest poll. Users see their own jobs;
+    superusers see every job.
+
+    Args:
+        current_user: Authenticated user whose jobs are listed.
+        registry: Injected interaction registry.
+        skip: Number of jobs to skip.
+        limit: Maximum number of jobs to return.
+        status: Only list jobs with this status.
+
+    Returns:
+        GeminiInteractionsPublic with the jobs and their total count.
+    """
+    interactions, count = registry.list_for_user(
+        current_user, skip=skip, limit=limit, status=status
+    )
+    return GeminiInteractionsPublic(data=interactions, count=count)
+
+
+@router.post("/deep-research/status", response_model=GeminiBulkStatusResponse)
+async def bulk_deep_research_status(
+    current_user: CurrentUser,
+    poller: GeminiPollerDep,
+    registry: GeminiRegistryDep,
+    request: GeminiBulkStatusRequest,
+) -> Any:
+    """Return the status of several deep research jobs in one call.
+
+    Replaces one poll request per job for dashboards that follow many jobs.
+    Statuses are read concurrently (up to GEMINI_BULK_STATUS_CONCURRENCY at
+    a time) through the shared status cache, without outputs. A job that
+    cannot be read, including one that is unknown or owned by another user,
+    is reported in errors instead of failing the whole request.
+
+    Args:
+        current_user: Authenticated user; must own the jobs or be a superuser.
+        poller: Injected shared status poller.
+        registry: Injected interaction registry.
+        request: The interaction IDs to read.
+
+    Returns:
+        GeminiBulkStatusResponse keyed by interaction ID.
+    """
+    ids = request.interaction_ids
+    interactions = await asyncio.to_thread(
+        registry.get_many_for_user, ids, current_user
+    )
+    semaphore = asyncio.Semaphore(settings.gemini.bulk_status_concurrency)
+    outcomes = await asyncio.gather(
+        *(
+            _status_summary(poller, interaction, semaphore)
+            for interaction in interactions.values()
+        )
+    )
+
+    summaries = dict(zip(interactions, outcomes, strict=True))
+
+    response = GeminiBulkStatusResponse()
+    for interaction_id in ids:
+        outcome = summaries.get(interaction_id)
+        if outcome is None:
+            exc = GeminiAPIError.interaction_not_found(
+                details={"interaction_id": interaction_id}
+            )
+            outcome = ErrorResponse(
+                error_code=exc.error_code, message=exc.message, details=exc.details
+            )
+        if isinstance(outcome, ErrorResponse):
+            response.errors[interaction_id] = outcome
+        else:
+            response.statuses[interaction_id] = outcome
+    return response
 
 
 @router.get(
     "/deep-research/{interaction_id}",
-    response_model=GeminiDeepResearchResultResponse,
+    response_model=GeminiDeepResearchPollResponse,
+    responses={304: {"description": "The job has not changed (If-None-Match)"}},
 )
 async def poll_deep_research(
-    _current_user: CurrentUser,
-    gemini: GeminiDep,
+    current_user: CurrentUser,
+    poller: GeminiPollerDep,
+    registry: GeminiRegistryDep,
     interaction_id: str,
+    http_request: Request,
     last_event_id: str | None = Query(default=None),
+    wait: float = Query(default=0.0, ge=0),
+    if_none_match: Annotated[str | None, Header()] = None,
 ) -> Any:
     """Poll for deep research job status and results.
 
     Retrieves the current status and any available outputs from a running
-    research job. The last_event_id parameter enables reconnection after
-    network interruption, allowing clients to resume from where they left off.
+    research job. Results come from the shared status cache, which is
+    refreshed upstream at most once per poll interval.
+
+    With wait (seconds) and the cursor of the previous response as
+    last_event_id, the request is held until the status or outputs change,
+    the job finishes or the wait expires (long polling), instead of the
+    client polling on a timer. The wait is capped at
+    GEMINI_LONG_POLL_MAX_WAIT and at the request deadline; it is served by
+    the shared poller's change notification, not by extra upstream polls.
+
+    Responses carry an ETag derived from the status, event ID, output count
+    and cursor offset. A request whose If-None-Match matches it gets
+    304 Not Modified, without building or serializing the body.
+
+    Every response carries a cursor. Sending it back as last_event_id
+    returns only the output segments produced since that response, so the
+    payload of each poll stays small however long the research runs.
+    Cursors of stream events work the same way; anything else (such as a
+    bare upstream event ID) returns every output.
 
     Args:
-        _current_user: Authenticated user (required for authorization).
-        gemini: Injected GeminiService instance.
+        current_user: Authenticated user; must own the job or be a superuser.
+        poller: Injected shared status poller.
+        registry: Injected interaction registry.
         interaction_id: The interaction ID from job creation.
-        last_event_id: Optional ID of last received event for reconnection.
+        http_request: The incoming HTTP request, watched for disconnects
+            while a long poll waits.
+        last_event_id: Optional cursor from a previous poll or stream event.
+        wait: Seconds to wait for a change after last_event_id (default:
+            answer immediately).
+        if_none_match: ETag of a response the client already has.
 
     Returns:
-        GeminiDeepResearchResultResponse with current status and outputs.
+        GeminiDeepResearchPollResponse with current status, the outputs
+        after the cursor and the cursor to resume from, or an empty 304
+        response if the client's copy is current.
 
     Raises:
         GeminiAPIError: If the interaction is not found or polling fails.
     """
-    return await gemini.poll_research(
-        interaction_id=interaction_id,
-        last_event_id=last_event_id,
+    await _owned_interaction(registry, interaction_id, current_user)
+    wait = min(wait, settings.gemini.long_poll_max_wait)
+    budget = remaining()
+    if budget is not None:
+        wait = min(wait, max(budget - LONG_POLL_DEADLINE_MARGIN, 0.0))
+
+    if wait > 0 and last_event_id is not None:
+        result = await cancel_on_disconnect(
+            http_request,
+            poller.wait_for_change(interaction_id, last_event_id, wait),
+        )
+    else:
+        result = await poller.get_status(interaction_id)
+
+    offset = cursor_offset(result, last_event_id)
+    etag = _poll_etag(result, offset)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=delta_response(result, offset).model_dump_json(),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+@router.get(
+    "/deep-research/{interaction_id}/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {SSE_MEDIA_TYPE: {}}}},
+)
+async def stream_deep_research(
+    current_user: CurrentUser,
+    gemini: GeminiDep,
+    poller: GeminiPollerDep,
+    registry: GeminiRegistryDep,
+    interaction_id: str,
+    last_event_id: Annotated[str | None, Header()] = None,
+) -> StreamingResponse:
+    """Stream deep research progress as Server-Sent Events.
+
+    Pushes a status_update event whenever the job status changes, a
+    thinking_update or research_update event for each new output segment,
+    and a final_result (or error) event when the job ends. The stream is fed
+    by the shared status poller, so it adds no upstream polls of its own.
+
+    Clients that reconnect send the last received event ID in the
+    Last-Event-ID header and resume after the last delivered segment.
+
+    Args:
+        current_user: Authenticated user; must own the job or be a superuser.
+        gemini: Injected GeminiService instance.
+        poller: Injected shared status poller.
+        registry: Injected interaction registry.
+        interaction_id: The interaction ID from job creation.
+        last_event_id: Optional Last-Event-ID header for resumption.
+
+    Returns:
+        StreamingResponse emitting text/event-stream frames.
+
+    Raises:
+        GeminiAPIError: If the interaction is not found.
+    """
+    await _owned_interaction(registry, interaction_id, current_user)
+    return StreamingResponse(
+        _research_events(gemini, poller, interaction_id, last_event_id),
+        media_type=SSE_MEDIA_TYPE,
+        headers=SSE_HEADERS,
     )
 
 
 @router.delete("/deep-research/{interaction_id}")
 async def cancel_deep_research(
-    _current_user: CurrentUser,
+    current_user: CurrentUser,
     gemini: GeminiDep,
+    poller: GeminiPollerDep,
+    registry: GeminiRegistryDep,
+    webhooks: WebhookDep,
     interaction_id: str,
 ) -> dict[str, str]:
     """Cancel a running deep research job.
@@ -131,15 +692,20 @@ async def cancel_deep_research(
     cancelled or was already in a terminal state.
 
     Args:
-        _current_user: Authenticated user (required for authorization).
+        current_user: Authenticated user; must own the job or be a superuser.
         gemini: Injected GeminiService instance.
+        poller: Injected shared status poller.
+        registry: Injected interaction registry.
+        webhooks: Injected completion webhook dispatcher.
         interaction_id: The interaction ID of the job to cancel.
 
     Returns:
         Success message confirming cancellation.
 
     Raises:
-        GeminiAPIError: If the cancellation request fails.
+        GeminiAPIError: If the interaction is not found or the cancellation
+            request fails.
     """
-    await gemini.cancel_research(interaction_id)
+    await _owned_interaction(registry, interaction_id, current_user)
+    await _cancel(gemini, poller, registry, webhooks, interaction_id)
     return {"message": "Research job cancelled successfully"}
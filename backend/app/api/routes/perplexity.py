@@ -5,42 +5,232 @@ operations. Routes require JWT authentication via CurrentUser dependency
 and use PerplexityDep for service injection.
 
 Endpoints:
-    POST /perplexity/deep-research - Execute deep research query
+    POST /perplexity/deep-research - Execute deep research query (streams
+        Server-Sent Events when the request sets stream=true)
+    POST /perplexity/deep-research/jobs - Queue a deep research job
+    GET /perplexity/deep-research/jobs/{job_id} - Status of a queued job
+    GET /perplexity/deep-research/jobs/{job_id}/result - Result of a job
 """
 
+import uuid
+from collections.abc import AsyncIterator
 from typing import Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import JSONResponse, StreamingResponse
 
-from app.api.deps import CurrentUser, PerplexityDep
+from app.api.deps import CurrentUser, JobQueueDep, PerplexityDep
+from app.core.disconnect import cancel_on_disconnect
+from app.core.streaming import SSE_HEADERS, SSE_MEDIA_TYPE, format_sse_event
+from app.exceptions.perplexity import PerplexityAPIError
+from app.models import ResearchJob, ResearchJobPublic
 from app.schemas.perplexity import (
     PerplexityDeepResearchRequest,
     PerplexityDeepResearchResponse,
+    PerplexityStreamEvent,
+    PerplexityStreamEventType,
 )
+from app.schemas.tavily import ErrorResponse
 
 router = APIRouter(prefix="/perplexity", tags=["perplexity"])
 
 
-@router.post("/deep-research", response_model=PerplexityDeepResearchResponse)
+def _format_stream_event(event: PerplexityStreamEvent) -> str:
+    """Encode a service stream event as an SSE frame.
+
+    Args:
+        event: Event yielded by PerplexityService.stream_deep_research.
+
+    Returns:
+        The encoded SSE frame.
+    """
+    if event.event == PerplexityStreamEventType.CONTENT:
+        data: dict[str, Any] = {"content": event.content}
+    else:
+        data = event.response.model_dump(mode="json") if event.response else {}
+    return format_sse_event(data, event=event.event.value)
+
+
+async def _research_events(
+    first: PerplexityStreamEvent,
+    events: AsyncIterator[PerplexityStreamEvent],
+) -> AsyncIterator[str]:
+    """Relay service stream events to the client as Server-Sent Events.
+
+    Errors raised after the response has started cannot change the HTTP
+    status, so they are sent as a final error event instead.
+
+    Args:
+        first: The already-received first event.
+        events: The remaining service stream.
+
+    Yields:
+        Encoded SSE frames.
+    """
+    yield _format_stream_event(first)
+    try:
+        async for event in events:
+            yield _format_stream_event(event)
+    except PerplexityAPIError as exc:
+        yield format_sse_event(
+            ErrorResponse(
+                error_code=exc.error_code,
+                message=exc.message,
+                details=exc.details,
+            ).model_dump(),
+            event=PerplexityStreamEventType.ERROR.value,
+        )
+
+
+@router.post(
+    "/deep-research",
+    response_model=PerplexityDeepResearchResponse,
+    responses={200: {"content": {SSE_MEDIA_TYPE: {}}}},
+)
 async def deep_research(
     _current_user: CurrentUser,
     perplexity: PerplexityDep,
     request: PerplexityDeepResearchRequest,
+    http_request: Request,
 ) -> Any:
     """Execute a deep research query using Perplexity Sonar API.
 
     Performs a deep research query with the provided parameters, returning
     a comprehensive response with citations and search results.
 
+    When stream is true, the response is a Server-Sent Events stream of
+    content deltas as the model generates them, ending with a final_result
+    event containing the full response with citations and usage. The first
+    upstream chunk is awaited before responding, so connection and
+    authentication failures still return a regular error response.
+
+    If the client disconnects before the answer is ready, the upstream
+    request is cancelled (streams stop when the client goes away).
+
     Args:
         _current_user: Authenticated user (required for authorization).
         perplexity: Injected PerplexityService instance.
         request: Deep research request with query and optional parameters.
+        http_request: The incoming HTTP request, watched for disconnects.
 
     Returns:
-        PerplexityDeepResearchResponse with model response and citations.
+        PerplexityDeepResearchResponse with model response and citations,
+        or a StreamingResponse when streaming is requested.
 
     Raises:
         PerplexityAPIError: If the Perplexity API request fails.
+        ClientDisconnectedError: If the client disconnected first.
+    """
+    if not request.stream:
+        return await cancel_on_disconnect(
+            http_request, perplexity.deep_research(request)
+        )
+
+    events = perplexity.stream_deep_research(request)
+    first = await cancel_on_disconnect(http_request, anext(events))
+    return StreamingResponse(
+        _research_events(first, events),
+        media_type=SSE_MEDIA_TYPE,
+        headers=SSE_HEADERS,
+    )
+
+
+def _get_job(
+    queue: JobQueueDep, job_id: uuid.UUID, current_user: CurrentUser
+) -> ResearchJob:
+    """Return a Perplexity job visible to the user, or raise 404."""
+    job = queue.get_for_user(job_id, current_user, "perplexity")
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.post(
+    "/deep-research/jobs",
+    response_model=ResearchJobPublic,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def submit_deep_research_job(
+    current_user: CurrentUser,
+    queue: JobQueueDep,
+    request: PerplexityDeepResearchRequest,
+) -> Any:
+    """Queue a deep research query to run in a background worker.
+
+    Returns immediately with the queued job; poll its status and fetch the
+    result when it has succeeded. The stream option is ignored.
+
+    Args:
+        current_user: Authenticated user, recorded as the job's owner.
+        queue: Injected research job queue.
+        request: Deep research request with query and optional parameters.
+
+    Returns:
+        ResearchJobPublic for the queued job.
+    """
+    return queue.submit(
+        current_user.id,
+        "perplexity",
+        request.model_dump(mode="json", exclude={"stream"}),
+    )
+
+
+@router.get("/deep-research/jobs/{job_id}", response_model=ResearchJobPublic)
+def get_deep_research_job(
+    current_user: CurrentUser,
+    queue: JobQueueDep,
+    job_id: uuid.UUID,
+) -> Any:
+    """Return the status of a deep research job.
+
+    Args:
+        current_user: Authenticated user; must own the job (or be a superuser).
+        queue: Injected research job queue.
+        job_id: ID of the job.
+
+    Returns:
+        ResearchJobPublic with the job's status, attempts and error.
+
+    Raises:
+        HTTPException: 404 if the job does not exist or is not visible.
+    """
+    return _get_job(queue, job_id, current_user)
+
+
+@router.get(
+    "/deep-research/jobs/{job_id}/result",
+    response_model=PerplexityDeepResearchResponse,
+    responses={409: {"description": "The job has not finished yet"}},
+)
+def get_deep_research_job_result(
+    current_user: CurrentUser,
+    queue: JobQueueDep,
+    job_id: uuid.UUID,
+) -> Any:
+    """Return the result of a finished deep research job.
+
+    A failed job returns its stored provider error with the original
+    status code.
+
+    Args:
+        current_user: Authenticated user; must own the job (or be a superuser).
+        queue: Injected research job queue.
+        job_id: ID of the job.
+
+    Returns:
+        PerplexityDeepResearchResponse of the succeeded job.
+
+    Raises:
+        HTTPException: 404 if the job does not exist or is not visible, or
+            409 if it is still queued or running.
     """
-    return await perplexity.deep_research(request)
+    job = _get_job(queue, job_id, current_user)
+    if job.status == "failed" and job.error is not None:
+        error = dict(job.error)
+        return JSONResponse(
+            status_code=error.pop("status_code", 500),
+            content=ErrorResponse.model_validate(error).model_dump(),
+        )
+    if job.status != "succeeded":
+        raise HTTPException(status_code=409, detail=f"Job is {job.status}")
+    return job.result
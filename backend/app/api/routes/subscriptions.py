@@ -0,0 +1,438 @@
+"""WebSocket route pushing research updates to subscribed clients.
+
+A client following several Gemini interactions and queued research jobs
+would otherwise run one polling loop (or SSE stream) per item, each request
+authenticated separately. Instead it opens one WebSocket, authenticated once
+when it connects, and subscribes it to every item it wants to follow; status
+changes and new outputs are pushed as they happen.
+
+The access token is passed in the Authorization header or, for browsers,
+which cannot set headers on WebSockets, in the token query parameter.
+Connections with an invalid token are closed with code 1008 (policy
+violation).
+
+Gemini updates come from the shared GeminiStatusPoller, so subscriptions add
+no upstream polls; queued jobs are re-read from Postgres in one query per
+connection every SUBSCRIPTIONS_JOB_REFRESH_INTERVAL seconds. Users can only
+follow their own items (superusers any); other IDs are reported as not found.
+
+Endpoints:
+    WS /subscriptions/ws - Subscribe to interaction and job updates
+"""
+
+import asyncio
+import functools
+import logging
+import uuid
+from typing import Annotated
+
+from fastapi import (
+    APIRouter,
+    Header,
+    HTTPException,
+    Query,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from pydantic import BaseModel, ValidationError
+from sqlmodel import Session
+
+from app.api.deps import (
+    GeminiPollerDep,
+    GeminiRegistryDep,
+    JobQueueDep,
+    get_user_from_token,
+)
+from app.core.config import settings
+from app.core.db import engine
+from app.exceptions.gemini import GeminiAPIError
+from app.models import ResearchJob, ResearchJobPublic, User
+from app.schemas.subscriptions import (
+    InteractionUpdate,
+    JobUpdate,
+    SubscriptionAck,
+    SubscriptionAction,
+    SubscriptionError,
+    SubscriptionMessageType,
+    SubscriptionRequest,
+)
+from app.schemas.tavily import ErrorResponse
+from app.services.gemini_poller import (
+    GeminiStatusPoller,
+    delta_response,
+    parse_cursor,
+)
+from app.services.gemini_registry import GeminiInteractionRegistry
+from app.services.job_queue import JobQueue
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/subscriptions", tags=["subscriptions"])
+
+# Seconds after which a followed interaction wakes up without a change; there
+# is nothing to send, WebSocket protocol pings keep the connection alive
+INTERACTION_HEARTBEAT_SECONDS = 30.0
+
+# Job statuses after which a job no longer changes
+TERMINAL_JOB_STATUSES = frozenset({"succeeded", "failed"})
+
+
+def _authenticate(token: str | None) -> User:
+    """Return the user of a WebSocket access token.
+
+    Raises:
+        HTTPException: If the token is missing or invalid, or the user is
+            unknown or inactive.
+    """
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Not authenticated"
+        )
+    with Session(engine) as session:
+        return get_user_from_token(session, token)
+
+
+def _too_many_subscriptions() -> ErrorResponse:
+    """Return the error of an item rejected by the subscription limit."""
+    return ErrorResponse(
+        error_code="too_many_subscriptions",
+        message="The connection follows the maximum number of items.",
+        details={"max_subscriptions": settings.subscriptions.max_subscriptions},
+    )
+
+
+class _Subscriptions:
+    """The subscriptions of one WebSocket connection.
+
+    Each followed interaction is served by its own task iterating the shared
+    poller's updates; all followed jobs are served by a single task.
+
+    Attributes:
+        _websocket: The accepted connection.
+        _user: The authenticated user.
+        _poller: Shared Gemini status poller.
+        _registry: Interaction registry, for ownership checks.
+        _queue: Research job queue.
+        _interactions: Following task per interaction ID.
+        _jobs: Last state sent per followed job ID (None before the first).
+        _jobs_changed: Set when jobs are subscribed, to read them at once.
+        _send_lock: Serializes sends from the following tasks.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        user: User,
+        poller: GeminiStatusPoller,
+        registry: GeminiInteractionRegistry,
+        queue: JobQueue,
+    ) -> None:
+        self._websocket = websocket
+        self._user = user
+        self._poller = poller
+        self._registry = registry
+        self._queue = queue
+        self._interactions: dict[str, asyncio.Task[None]] = {}
+        self._jobs: dict[uuid.UUID, ResearchJobPublic | None] = {}
+        self._jobs_changed = asyncio.Event()
+        self._send_lock = asyncio.Lock()
+
+    @property
+    def count(self) -> int:
+        """Number of items currently followed."""
+        return len(self._interactions) + len(self._jobs)
+
+    async def run(self) -> None:
+        """Serve subscription requests until the client disconnects."""
+        jobs_task = asyncio.create_task(self._follow_jobs())
+        try:
+            while True:
+                try:
+                    message = await self._websocket.receive_text()
+                except WebSocketDisconnect:
+                    return
+                await self._handle(message)
+        finally:
+            tasks = [jobs_task, *self._interactions.values()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _send(self, message: BaseModel) -> None:
+        async with self._send_lock:
+            await self._websocket.send_text(message.model_dump_json())
+
+    async def _handle(self, message: str) -> None:
+        """Apply one subscription request, reporting invalid ones."""
+        try:
+            request = SubscriptionRequest.model_validate_json(message)
+        except ValidationError as exc:
+            await self._send(
+                SubscriptionError(
+                    error=ErrorResponse(
+                        error_code="invalid_request",
+                        message="Invalid subscription request.",
+                        details={
+                            "errors": exc.errors(
+                                include_url=False, include_context=False
+                            )
+                        },
+                    )
+                )
+            )
+            return
+
+        if request.action == SubscriptionAction.SUBSCRIBE:
+            await self._subscribe(request)
+        else:
+            await self._unsubscribe(request)
+
+    async def _subscribe(self, request: SubscriptionRequest) -> None:
+        """Start following the requested items the user may see.
+
+        Items beyond SUBSCRIPTIONS_MAX_SUBSCRIPTIONS are rejected, as are
+        unknown and foreign ones; each rejection is reported in its own
+        SubscriptionError after the acknowledgement.
+        """
+        interaction_ids = [
+            i for i in request.interaction_ids if i not in self._interactions
+        ]
+        job_ids = [i for i in request.job_ids if i not in self._jobs]
+        interactions, jobs = await asyncio.gather(
+            asyncio.to_thread(
+                self._registry.get_many_for_user, interaction_ids, self._user
+            ),
+            asyncio.to_thread(self._queue.get_many_for_user, job_ids, self._user),
+        )
+
+        errors: list[SubscriptionError] = []
+        room = settings.subscriptions.max_subscriptions - self.count
+        accepted_interactions: list[str] = []
+        for interaction_id in interaction_ids:
+            if interaction_id not in interactions:
+                exc = GeminiAPIError.interaction_not_found(
+                    details={"interaction_id": interaction_id}
+                )
+                error = ErrorResponse(
+                    error_code=exc.error_code,
+                    message=exc.message,
+                    details=exc.details,
+                )
+            elif room <= 0:
+                error = _too_many_subscriptions()
+            else:
+                room -= 1
+                accepted_interactions.append(interaction_id)
+                continue
+            errors.append(SubscriptionError(interaction_id=interaction_id, error=error))
+
+        accepted_jobs: list[uuid.UUID] = []
+        for job_id in job_ids:
+            if job_id not in jobs:
+                error = ErrorResponse(
+                    error_code="job_not_found", message="Job not found"
+                )
+            elif room <= 0:
+                error = _too_many_subscriptions()
+            else:
+                room -= 1
+                accepted_jobs.append(job_id)
+                self._jobs[job_id] = None
+                continue
+            errors.append(SubscriptionError(job_id=job_id, error=error))
+
+        await self._send(
+            SubscriptionAck(
+                type=SubscriptionMessageType.SUBSCRIBED,
+                interaction_ids=accepted_interactions,
+                job_ids=accepted_jobs,
+            )
+        )
+        for error_message in errors:
+            await self._send(error_message)
+
+        for interaction_id in accepted_interactions:
+            task = asyncio.create_task(
+                self._follow_interaction(
+                    interaction_id, request.cursors.get(interaction_id)
+                )
+            )
+            self._interactions[interaction_id] = task
+            task.add_done_callback(functools.partial(self._forget, interaction_id))
+        if accepted_jobs:
+            self._jobs_changed.set()
+
+    async def _unsubscribe(self, request: SubscriptionRequest) -> None:
+        """Stop following the requested items."""
+        interaction_ids = []
+        for interaction_id in request.interaction_ids:
+            task = self._interactions.pop(interaction_id, None)
+            if task is not None:
+                task.cancel()
+                interaction_ids.append(interaction_id)
+        job_ids = [i for i in request.job_ids if self._jobs.pop(i, False) is not False]
+        await self._send(
+            SubscriptionAck(
+                type=SubscriptionMessageType.UNSUBSCRIBED,
+                interaction_ids=interaction_ids,
+                job_ids=job_ids,
+            )
+        )
+
+    def _forget(self, interaction_id: str, task: asyncio.Task[None]) -> None:
+        """Drop a finished interaction task, logging why it stopped."""
+        if self._interactions.get(interaction_id) is task:
+            del self._interactions[interaction_id]
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            # Sends fail once the client has gone; run() is then closing
+            logger.debug("Stopped following interaction %s: %r", interaction_id, exc)
+
+    async def _follow_interaction(
+        self, interaction_id: str, cursor: str | None
+    ) -> None:
+        """Push an interaction's changes until it finishes.
+
+        An update is sent whenever the status changes or new outputs
+        arrive, holding only the outputs not sent before.
+
+        Args:
+            interaction_id: The interaction to follow.
+            cursor: Cursor from the client, whose outputs are not resent.
+        """
+        delivered, _ = parse_cursor(cursor)
+        last_status = None
+        try:
+            async for result in self._poller.iter_updates(
+                interaction_id, heartbeat=INTERACTION_HEARTBEAT_SECONDS
+            ):
+                if result is None:
+                    continue
+                if result.status == last_status and len(result.outputs) <= delivered:
+                    continue
+                last_status = result.status
+                await self._send(
+                    InteractionUpdate(
+                        interaction_id=interaction_id,
+                        update=delta_response(
+                            result, min(delivered, len(result.outputs))
+                        ),
+                    )
+                )
+                delivered = max(delivered, len(result.outputs))
+        except GeminiAPIError as exc:
+            await self._send(
+                SubscriptionError(
+                    interaction_id=interaction_id,
+                    error=ErrorResponse(
+                        error_code=exc.error_code,
+                        message=exc.message,
+                        details=exc.details,
+                    ),
+                )
+            )
+
+    async def _follow_jobs(self) -> None:
+        """Push changes of the followed jobs until the connection closes.
+
+        All followed jobs are read in one query, every
+        SUBSCRIPTIONS_JOB_REFRESH_INTERVAL seconds and right after new
+        subscriptions. A job is dropped once it has finished or is gone.
+        A failed read is logged and retried on the next refresh.
+        """
+        interval = settings.subscriptions.job_refresh_interval
+        while True:
+            self._jobs_changed.clear()
+            if self._jobs:
+                job_ids = list(self._jobs)
+                try:
+                    jobs = await asyncio.to_thread(
+                        self._queue.get_many_for_user, job_ids, self._user
+                    )
+                except Exception:
+                    logger.exception("Reading subscribed research jobs failed")
+                else:
+                    await self._push_job_changes(job_ids, jobs)
+
+            waiter = asyncio.ensure_future(self._jobs_changed.wait())
+            try:
+                await asyncio.wait({waiter}, timeout=interval)
+            finally:
+                waiter.cancel()
+
+    async def _push_job_changes(
+        self, job_ids: list[uuid.UUID], jobs: dict[uuid.UUID, ResearchJob]
+    ) -> None:
+        """Send the changes of freshly read jobs since they were last sent."""
+        for job_id in job_ids:
+            if job_id not in self._jobs:
+                # Unsubscribed while the jobs were read
+                continue
+            job = jobs.get(job_id)
+            if job is None:
+                del self._jobs[job_id]
+                await self._send(
+                    SubscriptionError(
+                        job_id=job_id,
+                        error=ErrorResponse(
+                            error_code="job_not_found",
+                            message="Job not found",
+                        ),
+                    )
+                )
+                continue
+            try:
+                public = ResearchJobPublic.model_validate(job)
+            except ValidationError:
+                logger.exception("Research job %s cannot be serialized", job_id)
+                continue
+            last = self._jobs[job_id]
+            if job.status in TERMINAL_JOB_STATUSES:
+                del self._jobs[job_id]
+            else:
+                self._jobs[job_id] = public
+            if public != last:
+                await self._send(JobUpdate(job=public))
+
+
+@router.websocket("/ws")
+async def subscribe_updates(
+    websocket: WebSocket,
+    poller: GeminiPollerDep,
+    registry: GeminiRegistryDep,
+    queue: JobQueueDep,
+    token: str | None = Query(default=None),
+    authorization: Annotated[str | None, Header()] = None,
+) -> None:
+    """Push research updates for the items a client subscribes to.
+
+    After connecting, the client sends SubscriptionRequest messages (JSON)
+    to subscribe to or unsubscribe from Gemini interaction IDs and research
+    job IDs. Each request is acknowledged with a SubscriptionAck, and items
+    that cannot be followed are reported with a SubscriptionError.
+
+    The server then sends an InteractionUpdate whenever a followed
+    interaction's status changes or new outputs arrive (with only the new
+    outputs), and a JobUpdate whenever a followed job changes. Following an
+    item ends once it finishes.
+
+    Args:
+        websocket: The WebSocket connection.
+        poller: Injected shared status poller.
+        registry: Injected interaction registry.
+        queue: Injected research job queue.
+        token: Access token, for clients that cannot send headers.
+        authorization: Authorization header with a bearer access token.
+    """
+    if authorization and authorization.lower().startswith("bearer "):
+        token = authorization[len("bearer ") :]
+    try:
+        user = await asyncio.to_thread(_authenticate, token)
+    except HTTPException as exc:
+        await websocket.close(
+            code=status.WS_1008_POLICY_VIOLATION, reason=str(exc.detail)
+        )
+        return
+
+    await websocket.accept()
+    await _Subscriptions(websocket, user, poller, registry, queue).run()
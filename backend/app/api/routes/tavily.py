@@ -6,28 +6,62 @@ and use TavilyDep for service injection.
 
 Endpoints:
     POST /tavily/search - Perform web search using Tavily API
+    POST /tavily/search/batch - Run many searches concurrently in one request
+        (streams Server-Sent Events when the request sets stream=true)
+    GET /tavily/search/cache - Search response cache counters (superuser)
+    DELETE /tavily/search/cache - Clear the search response cache (superuser)
     POST /tavily/extract - Extract content from URLs
     POST /tavily/crawl - Crawl a website starting from a URL
     POST /tavily/map - Generate a sitemap of URLs from a website
+        (both stream newline-delimited JSON when the request sets stream=true)
 """
 
 import asyncio
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
 from typing import Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from fastapi.responses import Response, StreamingResponse
 
-from app.api.deps import CurrentUser, TavilyDep
+from app.api.deps import (
+    CurrentUser,
+    SearchCacheDep,
+    TavilyDep,
+    get_current_active_superuser,
+)
+from app.core.config import settings
 from app.core.exceptions import TavilyAPIError
+from app.core.streaming import (
+    NDJSON_MEDIA_TYPE,
+    SSE_HEADERS,
+    SSE_MEDIA_TYPE,
+    format_ndjson_line,
+    format_sse_event,
+)
+from app.models import Message
 from app.schemas.tavily import (
+    BatchSearchItem,
+    BatchSearchRequest,
+    BatchSearchResponse,
     CrawlRequest,
     CrawlResponse,
+    CrawlResult,
+    CrawlStreamResult,
+    CrawlStreamSummary,
+    ErrorResponse,
     ExtractRequest,
     ExtractResponse,
     MapRequest,
     MapResponse,
+    MapStreamSummary,
+    MapStreamUrl,
+    SearchCacheStats,
     SearchRequest,
     SearchResponse,
 )
+from app.services.search_cache import SearchCache
+from app.services.tavily import TavilyService
 
 router = APIRouter(prefix="/tavily", tags=["tavily"])
 
@@ -72,10 +106,153 @@ def _handle_tavily_exception(exc: Exception) -> TavilyAPIError:
     )
 
 
+async def _cached_search(
+    tavily: TavilyService,
+    cache: SearchCache,
+    request: SearchRequest,
+) -> bytes:
+    """Return the JSON-encoded response of a search, using the response cache.
+
+    Args:
+        tavily: TavilyService instance.
+        cache: Search response cache.
+        request: Search request with query and optional parameters.
+
+    Returns:
+        The JSON-encoded SearchResponse, cached or fresh.
+
+    Raises:
+        TavilyAPIError: If the Tavily API request fails.
+    """
+    try:
+        return await cache.search(tavily, request)
+    except TavilyAPIError:
+        raise
+    except Exception as exc:
+        raise _handle_tavily_exception(exc) from exc
+
+
+@dataclass(frozen=True)
+class _EncodedItem:
+    """A BatchSearchItem already encoded as JSON.
+
+    Cached search responses are spliced into the item as stored, so batch
+    hits are not validated and serialized again.
+
+    Attributes:
+        index: Position of the search in the batch.
+        succeeded: Whether the search returned a result.
+        body: The JSON-encoded BatchSearchItem.
+    """
+
+    index: int
+    succeeded: bool
+    body: bytes
+
+
+async def _search_item(
+    tavily: TavilyService,
+    cache: SearchCache,
+    index: int,
+    request: SearchRequest,
+    semaphore: asyncio.Semaphore,
+) -> _EncodedItem:
+    """Run one search of a batch, capturing its error instead of raising.
+
+    Args:
+        tavily: TavilyService instance.
+        cache: Search response cache.
+        index: Position of the search in the batch.
+        request: The search request.
+        semaphore: Semaphore bounding the batch's concurrency.
+
+    Returns:
+        The encoded BatchSearchItem with the search result or error.
+    """
+    async with semaphore:
+        try:
+            body = await _cached_search(tavily, cache, request)
+        except TavilyAPIError as exc:
+            item = BatchSearchItem(
+                index=index,
+                error=ErrorResponse(
+                    error_code=exc.error_code,
+                    message=exc.message,
+                    details=exc.details,
+                ),
+            )
+            return _EncodedItem(index, False, item.model_dump_json().encode())
+    return _EncodedItem(
+        index, True, b'{"index":%d,"result":%b,"error":null}' % (index, body)
+    )
+
+
+async def _batch_items(
+    tavily: TavilyService,
+    cache: SearchCache,
+    request: BatchSearchRequest,
+) -> AsyncIterator[_EncodedItem]:
+    """Run a batch of searches concurrently, yielding items as they complete.
+
+    Pending searches are cancelled if the consumer stops early (for example
+    when a streaming client disconnects).
+
+    Args:
+        tavily: TavilyService instance.
+        cache: Search response cache.
+        request: Batch search request.
+
+    Yields:
+        The encoded item of each search, in completion order.
+    """
+    concurrency = settings.tavily.batch_concurrency
+    if request.concurrency is not None:
+        concurrency = min(concurrency, request.concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    tasks = [
+        asyncio.create_task(_search_item(tavily, cache, index, query, semaphore))
+        for index, query in enumerate(request.queries)
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _batch_events(items: AsyncIterator[_EncodedItem]) -> AsyncIterator[str]:
+    """Relay batch items to the client as Server-Sent Events.
+
+    Each completed search is sent as a "result" event whose ID is its index,
+    followed by a final "done" event with the success and failure counts.
+
+    Args:
+        items: Encoded batch items in completion order.
+
+    Yields:
+        Encoded SSE frames.
+    """
+    succeeded = failed = 0
+    async for item in items:
+        if item.succeeded:
+            succeeded += 1
+        else:
+            failed += 1
+        yield format_sse_event(
+            item.body.decode(),
+            event="result",
+            event_id=str(item.index),
+        )
+    yield format_sse_event({"succeeded": succeeded, "failed": failed}, event="done")
+
+
 @router.post("/search", response_model=SearchResponse)
 async def search(
     _current_user: CurrentUser,
     tavily: TavilyDep,
+    search_cache: SearchCacheDep,
     request: SearchRequest,
 ) -> Any:
     """Perform a web search using Tavily API.
@@ -83,9 +260,14 @@ async def search(
     Executes a web search with the provided query and parameters, returning
     relevant search results and optionally an AI-generated answer.
 
+    Identical searches (after normalizing the query and domain lists) are
+    answered from the response cache with the stored JSON body, skipping
+    the upstream call and response validation.
+
     Args:
         current_user: Authenticated user (required for authorization).
         tavily: Injected TavilyService instance.
+        search_cache: Injected search response cache.
         request: Search request with query and optional parameters.
 
     Returns:
@@ -94,24 +276,95 @@ async def search(
     Raises:
         TavilyAPIError: If the Tavily API request fails.
     """
-    try:
-        result = await tavily.search(
-            query=request.query,
-            search_depth=request.search_depth.value,
-            topic=request.topic.value,
-            max_results=request.max_results,
-            include_images=request.include_images,
-            include_image_descriptions=request.include_image_descriptions,
-            include_answer=request.include_answer,
-            include_raw_content=request.include_raw_content,
-            include_domains=request.include_domains,
-            exclude_domains=request.exclude_domains,
+    body = await _cached_search(tavily, search_cache, request)
+    return Response(content=body, media_type="application/json")
+
+
+@router.get(
+    "/search/cache",
+    dependencies=[Depends(get_current_active_superuser)],
+    response_model=SearchCacheStats,
+)
+def search_cache_stats(search_cache: SearchCacheDep) -> Any:
+    """Return search response cache counters (superuser only).
+
+    Args:
+        search_cache: Injected search response cache.
+
+    Returns:
+        SearchCacheStats with entry count, hits, misses and evictions.
+    """
+    return search_cache.stats()
+
+
+@router.delete(
+    "/search/cache",
+    dependencies=[Depends(get_current_active_superuser)],
+    response_model=Message,
+)
+def clear_search_cache(search_cache: SearchCacheDep) -> Any:
+    """Drop every cached search response (superuser only).
+
+    Args:
+        search_cache: Injected search response cache.
+
+    Returns:
+        Message confirming the cache was cleared.
+    """
+    search_cache.clear()
+    return Message(message="Search cache cleared")
+
+
+@router.post(
+    "/search/batch",
+    response_model=BatchSearchResponse,
+    responses={200: {"content": {SSE_MEDIA_TYPE: {}}}},
+)
+async def batch_search(
+    _current_user: CurrentUser,
+    tavily: TavilyDep,
+    search_cache: SearchCacheDep,
+    request: BatchSearchRequest,
+) -> Any:
+    """Run several web searches concurrently in one request.
+
+    Searches run through the shared TavilyService with bounded concurrency,
+    so a batch takes about as long as its slowest searches rather than all
+    of them in sequence. A failed search does not fail the batch; its error
+    is returned in place of its result. Cached responses are sent as
+    stored, without validating them again.
+
+    When stream is true, the response is a Server-Sent Events stream with a
+    "result" event per search as soon as it completes (in completion order,
+    tagged with its index), followed by a "done" event with the counts.
+
+    Args:
+        _current_user: Authenticated user (required for authorization).
+        tavily: Injected TavilyService instance.
+        search_cache: Injected search response cache.
+        request: Batch search request with the list of searches.
+
+    Returns:
+        BatchSearchResponse with per-search results and errors in request
+        order, or a StreamingResponse when streaming is requested.
+    """
+    items = _batch_items(tavily, search_cache, request)
+    if request.stream:
+        return StreamingResponse(
+            _batch_events(items),
+            media_type=SSE_MEDIA_TYPE,
+            headers=SSE_HEADERS,
         )
-        return SearchResponse.model_validate(result)
-    except TavilyAPIError:
-        raise
-    except Exception as exc:
-        raise _handle_tavily_exception(exc) from exc
+
+    # Encoded by hand around the items' bytes; same shape as BatchSearchResponse
+    results = sorted([item async for item in items], key=lambda item: item.index)
+    succeeded = sum(item.succeeded for item in results)
+    body = b'{"results":[%b],"succeeded":%d,"failed":%d}' % (
+        b",".join(item.body for item in results),
+        succeeded,
+        len(results) - succeeded,
+    )
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/extract", response_model=ExtractResponse)
@@ -145,7 +398,59 @@ async def extract(
         raise _handle_tavily_exception(exc) from exc
 
 
-@router.post("/crawl", response_model=CrawlResponse)
+def _crawl_lines(result: dict[str, Any], base_url: str) -> Iterator[str]:
+    """Yield a crawl result as NDJSON: one line per page, then a summary.
+
+    Pages are removed from the upstream result as they are sent, so each
+    page's content can be freed once it has been written.
+
+    Args:
+        result: Raw crawl result from TavilyService.
+        base_url: Starting URL of the crawl, used if the result lacks one.
+
+    Yields:
+        One JSON line per crawled page, then a summary line.
+    """
+    pages: list[Any] = result.get("results") or []
+    pages.reverse()
+    total = 0
+    while pages:
+        page = CrawlResult.model_validate(pages.pop())
+        yield format_ndjson_line(CrawlStreamResult(result=page))
+        total += 1
+    yield format_ndjson_line(
+        CrawlStreamSummary(
+            base_url=result.get("base_url") or base_url, total_pages=total
+        )
+    )
+
+
+def _map_lines(result: dict[str, Any], base_url: str) -> Iterator[str]:
+    """Yield a map result as NDJSON: one line per URL, then a summary.
+
+    Args:
+        result: Raw map result from TavilyService.
+        base_url: Starting URL of the mapping, used if the result lacks one.
+
+    Yields:
+        One JSON line per discovered URL, then a summary line.
+    """
+    urls = result.get("urls") or result.get("results") or []
+    total = 0
+    for url in urls:
+        if isinstance(url, str):
+            yield format_ndjson_line(MapStreamUrl(url=url))
+            total += 1
+    yield format_ndjson_line(
+        MapStreamSummary(base_url=result.get("base_url") or base_url, total_urls=total)
+    )
+
+
+@router.post(
+    "/crawl",
+    response_model=CrawlResponse,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
 async def crawl(
     _current_user: CurrentUser,
     tavily: TavilyDep,
@@ -156,13 +461,19 @@ async def crawl(
     Performs recursive crawling of a website, extracting content from
     discovered pages up to the specified depth and breadth limits.
 
+    When stream is true, the response is newline-delimited JSON: a
+    {"type": "result"} record per page, written as it is serialized rather
+    than after the whole response is built, followed by a
+    {"type": "summary"} record with total_pages.
+
     Args:
         current_user: Authenticated user (required for authorization).
         tavily: Injected TavilyService instance.
         request: Crawl request with URL and crawl parameters.
 
     Returns:
-        CrawlResponse with base URL, crawled page results, and total count.
+        CrawlResponse with base URL, crawled page results, and total count,
+        or a StreamingResponse when streaming is requested.
 
     Raises:
         TavilyAPIError: If the Tavily API request fails.
@@ -177,6 +488,12 @@ async def crawl(
             select_paths=request.select_paths,
             select_domains=request.select_domains,
         )
+        if request.stream:
+            return StreamingResponse(
+                _crawl_lines(result, request.url),
+                media_type=NDJSON_MEDIA_TYPE,
+                headers=SSE_HEADERS,
+            )
         return CrawlResponse.model_validate(result)
     except TavilyAPIError:
         raise
@@ -184,7 +501,11 @@ async def crawl(
         raise _handle_tavily_exception(exc) from exc
 
 
-@router.post("/map", response_model=MapResponse)
+@router.post(
+    "/map",
+    response_model=MapResponse,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
 async def map_urls(
     _current_user: CurrentUser,
     tavily: TavilyDep,
@@ -195,13 +516,18 @@ async def map_urls(
     Discovers and returns URLs from a website without extracting content.
     Useful for understanding site structure before targeted extraction.
 
+    When stream is true, the response is newline-delimited JSON: a
+    {"type": "url"} record per discovered URL followed by a
+    {"type": "summary"} record with total_urls.
+
     Args:
         current_user: Authenticated user (required for authorization).
         tavily: Injected TavilyService instance.
         request: Map request with URL and mapping parameters.
 
     Returns:
-        MapResponse with base URL, discovered URLs, and total count.
+        MapResponse with base URL, discovered URLs, and total count, or a
+        StreamingResponse when streaming is requested.
 
     Raises:
         TavilyAPIError: If the Tavily API request fails.
@@ -216,6 +542,12 @@ async def map_urls(
             select_paths=request.select_paths,
             select_domains=request.select_domains,
         )
+        if request.stream:
+            return StreamingResponse(
+                _map_lines(result, request.url),
+                media_type=NDJSON_MEDIA_TYPE,
+                headers=SSE_HEADERS,
+            )
         return MapResponse.model_validate(result)
     except TavilyAPIError:
         raise
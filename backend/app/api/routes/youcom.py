@@ -1,10 +1,15 @@
 """You.com API route handlers."""
 
+import uuid
 from typing import Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import JSONResponse
 
-from app.api.deps import CurrentUser, YouComDep
+from app.api.deps import CurrentUser, JobQueueDep, YouComDep
+from app.core.disconnect import cancel_on_disconnect
+from app.models import ResearchJob, ResearchJobPublic
+from app.schemas.tavily import ErrorResponse
 from app.schemas.youcom import YouComDeepResearchRequest, YouComDeepResearchResponse
 
 router = APIRouter(prefix="/youcom", tags=["youcom"])
@@ -15,7 +20,71 @@ async def deep_research(
     _current_user: CurrentUser,
     youcom: YouComDep,
     request: YouComDeepResearchRequest,
+    http_request: Request,
 ) -> Any:
-    """Execute a synchronous deep research query using You.com."""
+    """Execute a synchronous deep research query using You.com.
 
-    return await youcom.deep_research(request)
+    The upstream request is cancelled if the client disconnects first.
+    """
+
+    return await cancel_on_disconnect(http_request, youcom.deep_research(request))
+
+
+def _get_job(
+    queue: JobQueueDep, job_id: uuid.UUID, current_user: CurrentUser
+) -> ResearchJob:
+    """Return a You.com job visible to the user, or raise 404."""
+    job = queue.get_for_user(job_id, current_user, "youcom")
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.post(
+    "/deep-research/jobs",
+    response_model=ResearchJobPublic,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def submit_deep_research_job(
+    current_user: CurrentUser,
+    queue: JobQueueDep,
+    request: YouComDeepResearchRequest,
+) -> Any:
+    """Queue a You.com deep research query to run in a background worker."""
+
+    return queue.submit(current_user.id, "youcom", request.model_dump(mode="json"))
+
+
+@router.get("/deep-research/jobs/{job_id}", response_model=ResearchJobPublic)
+def get_deep_research_job(
+    current_user: CurrentUser,
+    queue: JobQueueDep,
+    job_id: uuid.UUID,
+) -> Any:
+    """Return the status of a You.com deep research job."""
+
+    return _get_job(queue, job_id, current_user)
+
+
+@router.get(
+    "/deep-research/jobs/{job_id}/result",
+    response_model=YouComDeepResearchResponse,
+    responses={409: {"description": "The job has not finished yet"}},
+)
+def get_deep_research_job_result(
+    current_user: CurrentUser,
+    queue: JobQueueDep,
+    job_id: uuid.UUID,
+) -> Any:
+    """Return the result (or stored error) of a finished You.com job."""
+
+    job = _get_job(queue, job_id, current_user)
+    if job.status == "failed" and job.error is not None:
+        error = dict(job.error)
+        return JSONResponse(
+            status_code=error.pop("status_code", 500),
+            content=ErrorResponse.model_validate(error).model_dump(),
+        )
+    if job.status != "succeeded":
+        raise HTTPException(status_code=409, detail=f"Job is {job.status}")
+    return job.result
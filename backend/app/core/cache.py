@@ -0,0 +1,104 @@
+"""In-memory TTL cache with LRU eviction.
+
+A small, dependency-free cache for hot, process-local data such as encoded
+upstream responses. Entries expire after a per-entry TTL; when the cache is
+full, the least recently used entry is evicted. Hits, misses, evictions and
+expirations are counted so cache effectiveness can be monitored.
+
+The cache is not thread-safe; it is meant to be used from the event loop.
+
+Usage:
+    from app.core.cache import TTLCache
+
+    cache: TTLCache[bytes] = TTLCache(max_entries=1024)
+    cache.set("key", b"value", ttl=60)
+    value = cache.get("key")
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """Least-recently-used cache whose entries expire after a TTL.
+
+    Attributes:
+        max_entries: Maximum number of entries kept.
+        hits: Lookups that found a fresh entry.
+        misses: Lookups that found nothing or an expired entry.
+        evictions: Entries dropped to make room for new ones.
+        expirations: Entries dropped because their TTL had elapsed.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of entries kept.
+            clock: Monotonic time source (overridable in tests).
+        """
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        """Number of entries currently stored (including expired ones)."""
+        return len(self._entries)
+
+    def get(self, key: str) -> V | None:
+        """Return a fresh entry and mark it as recently used.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The cached value, or None on a miss.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: V, ttl: float) -> None:
+        """Store an entry, evicting the least recently used ones if full.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+            ttl: Seconds until the entry expires.
+        """
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = self.expirations = 0
@@ -58,6 +58,19 @@ class GeminiAgent(StrEnum):
     DEFAULT = "default"
 
 
+class GeminiPollStrategy(StrEnum):
+    """Polling strategies for waiting on Gemini research jobs.
+
+    Attributes:
+        FIXED: Poll every poll_interval seconds.
+        ADAPTIVE: Poll quickly at first, then back off exponentially with
+            jitter up to poll_max_interval.
+    """
+
+    FIXED = "fixed"
+    ADAPTIVE = "adaptive"
+
+
 # =============================================================================
 # You.com API Enums
 # =============================================================================
@@ -86,6 +99,21 @@ class TavilySettings(BaseSettings):
         TAVILY_API_KEY: Required API key from tavily.com
         TAVILY_TIMEOUT: Request timeout in seconds (default: 60)
         TAVILY_PROXY: Optional HTTP proxy URL for API requests
+        TAVILY_BATCH_CONCURRENCY: Maximum searches of one batch request run
+            concurrently (default: 5)
+        TAVILY_EXTRACT_CHUNK_SIZE: Maximum URLs sent in one extract call;
+            larger lists are split into chunks (default: 20)
+        TAVILY_EXTRACT_CONCURRENCY: Maximum extract chunks in flight at once
+            (default: 4)
+        TAVILY_HEDGE: Hedge searches that do not ask otherwise (default: false)
+        TAVILY_HEDGE_PERCENTILE: Latency percentile of recent searches after
+            which a hedged search sends a second request (default: 95)
+        TAVILY_HEDGE_MAX_RATE: Maximum fraction of hedged searches that send
+            a second request (default: 0.1)
+        TAVILY_HEDGE_WINDOW: Recent searches the percentile and rate cap are
+            computed over (default: 200)
+        TAVILY_HEDGE_MIN_SAMPLES: Searches observed before hedging starts
+            (default: 20)
     """
 
     model_config = SettingsConfigDict(
@@ -104,6 +132,53 @@ class TavilySettings(BaseSettings):
     # Optional: HTTP proxy URL for API requests
     proxy: str | None = None
 
+    # Optional: Maximum concurrent searches per batch search request
+    batch_concurrency: int = Field(
+        default=5,
+        ge=1,
+        description="Maximum searches of one batch request run concurrently",
+    )
+
+    # Optional: Chunking of large extract URL lists
+    extract_chunk_size: int = Field(
+        default=20,
+        ge=1,
+        description="Maximum URLs sent in one extract call",
+    )
+    extract_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum extract chunks in flight at once",
+    )
+
+    # Optional: Hedged searches for latency-sensitive callers
+    hedge: bool = Field(
+        default=False,
+        description="Hedge searches that do not ask otherwise",
+    )
+    hedge_percentile: float = Field(
+        default=95.0,
+        gt=0,
+        lt=100,
+        description="Latency percentile after which a hedge is sent",
+    )
+    hedge_max_rate: float = Field(
+        default=0.1,
+        ge=0,
+        le=1,
+        description="Maximum fraction of hedged searches that send a hedge",
+    )
+    hedge_window: int = Field(
+        default=200,
+        ge=1,
+        description="Recent searches the percentile and rate cap cover",
+    )
+    hedge_min_samples: int = Field(
+        default=20,
+        ge=1,
+        description="Searches observed before hedging starts",
+    )
+
 
 # Perplexity API configuration settings
 # Used for AI-powered deep research with citations
@@ -166,7 +241,29 @@ class GeminiSettings(BaseSettings):
         GEMINI_TIMEOUT: Request timeout in seconds (default: 120)
         GEMINI_POLL_INTERVAL: Polling interval in seconds (default: 10)
         GEMINI_MAX_POLL_ATTEMPTS: Maximum polling attempts (default: 360)
+        GEMINI_POLL_STRATEGY: Polling strategy, fixed or adaptive (default: adaptive)
+        GEMINI_POLL_INITIAL_INTERVAL: Adaptive interval during the fast initial
+            phase in seconds (default: 2)
+        GEMINI_POLL_FAST_ATTEMPTS: Adaptive polls made at the initial interval
+            before backing off (default: 5)
+        GEMINI_POLL_BACKOFF_MULTIPLIER: Adaptive growth factor per poll (default: 1.5)
+        GEMINI_POLL_MAX_INTERVAL: Adaptive interval cap in seconds (default: 60)
+        GEMINI_POLL_JITTER: Adaptive random jitter as a fraction of the
+            interval (default: 0.2)
         GEMINI_AGENT: Agent selection (default: default)
+        GEMINI_STATUS_POLL_CONCURRENCY: Max concurrent background polls (default: 10)
+        GEMINI_STATUS_IDLE_TIMEOUT: Seconds without readers before background
+            polling of a job stops (default: 600)
+        GEMINI_STATUS_RETENTION: Seconds finished jobs stay cached (default: 3600)
+        GEMINI_STATUS_LEASE: Seconds a process holds the background polling
+            of an unfinished job before another process may take it over
+            (default: 60)
+        GEMINI_CANCEL_ON_DISCONNECT: Cancel the upstream job when a sync
+            research client disconnects (default: true)
+        GEMINI_BULK_STATUS_CONCURRENCY: Maximum statuses of one bulk status
+            request read concurrently (default: 10)
+        GEMINI_LONG_POLL_MAX_WAIT: Longest a poll may wait for a change, in
+            seconds (default: 60)
     """
 
     model_config = SettingsConfigDict(
@@ -200,12 +297,87 @@ class GeminiSettings(BaseSettings):
         description="Maximum number of polling attempts",
     )
 
+    # Polling strategy (upstream Retry-After hints override either strategy)
+    poll_strategy: GeminiPollStrategy = Field(
+        default=GeminiPollStrategy.ADAPTIVE,
+        description="Polling strategy for waiting on research jobs",
+    )
+    poll_initial_interval: float = Field(
+        default=2.0,
+        gt=0,
+        description="Adaptive polling interval during the fast initial phase",
+    )
+    poll_fast_attempts: int = Field(
+        default=5,
+        ge=0,
+        description="Adaptive polls made at the initial interval before backing off",
+    )
+    poll_backoff_multiplier: float = Field(
+        default=1.5,
+        ge=1.0,
+        description="Adaptive polling interval growth factor per poll",
+    )
+    poll_max_interval: float = Field(
+        default=60.0,
+        gt=0,
+        description="Upper bound on the adaptive polling interval in seconds",
+    )
+    poll_jitter: float = Field(
+        default=0.2,
+        ge=0.0,
+        lt=1.0,
+        description="Random jitter applied to adaptive intervals (fraction)",
+    )
+
     # Agent selection
     agent: GeminiAgent = Field(
         default=GeminiAgent.DEFAULT,
         description="Gemini agent to use",
     )
 
+    # Shared background status poller
+    status_poll_concurrency: int = Field(
+        default=10,
+        ge=1,
+        description="Maximum concurrent upstream polls issued by the status poller",
+    )
+    status_idle_timeout: int = Field(
+        default=600,
+        ge=1,
+        description="Seconds without readers before a job stops being polled",
+    )
+    status_retention: int = Field(
+        default=3600,
+        ge=0,
+        description="Seconds a finished job's final status stays cached",
+    )
+    status_lease: float = Field(
+        default=60.0,
+        gt=0,
+        description="Seconds a process holds the background polling of a job "
+        "before another process may take it over",
+    )
+
+    # Abandoned sync requests
+    cancel_on_disconnect: bool = Field(
+        default=True,
+        description="Cancel the upstream job when a sync research client disconnects",
+    )
+
+    # Bulk status reads
+    bulk_status_concurrency: int = Field(
+        default=10,
+        ge=1,
+        description="Maximum statuses of one bulk status request read concurrently",
+    )
+
+    # Long polling
+    long_poll_max_wait: float = Field(
+        default=60.0,
+        ge=0,
+        description="Longest a poll request may wait for a status change, in seconds",
+    )
+
 
 class YouComSettings(BaseSettings):
     """Configuration for You.com Research API integration.
@@ -237,6 +409,446 @@ class YouComSettings(BaseSettings):
     )
 
 
+# Shared HTTP client pool configuration
+# Used by the per-provider httpx clients managed in app.core.http_utils
+class HTTPClientSettings(BaseSettings):
+    """Configuration for pooled outbound HTTP clients.
+
+    Environment variables:
+        HTTP_CLIENT_MAX_CONNECTIONS: Max open connections per provider (default: 100)
+        HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS: Max idle keep-alive connections (default: 20)
+        HTTP_CLIENT_KEEPALIVE_EXPIRY: Idle keep-alive expiry in seconds (default: 30)
+        HTTP_CLIENT_HTTP2: Enable HTTP/2 when the h2 package is installed (default: false)
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_ignore_empty=True,
+        extra="ignore",
+        env_prefix="HTTP_CLIENT_",
+    )
+
+    max_connections: int = Field(
+        default=100,
+        ge=1,
+        description="Maximum number of open connections per provider client",
+    )
+    max_keepalive_connections: int = Field(
+        default=20,
+        ge=0,
+        description="Maximum number of idle keep-alive connections per provider client",
+    )
+    keepalive_expiry: float = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds an idle keep-alive connection is kept open",
+    )
+    http2: bool = Field(
+        default=False,
+        description="Negotiate HTTP/2 with upstream providers (requires h2)",
+    )
+
+
+class ResilienceSettings(BaseSettings):
+    """Configuration for upstream retries and circuit breakers.
+
+    Applied per provider: each provider service gets its own retry policy
+    and circuit breaker built from these values.
+
+    Environment variables:
+        RESILIENCE_ENABLED: Enable retries and circuit breaking (default: true)
+        RESILIENCE_MAX_ATTEMPTS: Total attempts per call, including the first
+            (default: 3)
+        RESILIENCE_BACKOFF_BASE: Base of the jittered exponential backoff in
+            seconds (default: 0.5)
+        RESILIENCE_BACKOFF_MAX: Maximum backoff between attempts in seconds
+            (default: 8)
+        RESILIENCE_MAX_RETRY_AFTER: Longest upstream Retry-After honoured with a
+            retry; longer hints fail immediately (default: 30)
+        RESILIENCE_FAILURE_THRESHOLD: Consecutive failures that open the
+            circuit (default: 5)
+        RESILIENCE_RECOVERY_TIMEOUT: Seconds the circuit stays open before a
+            half-open probe (default: 30)
+        RESILIENCE_HALF_OPEN_MAX_CALLS: Concurrent probe calls allowed while
+            half-open (default: 1)
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_ignore_empty=True,
+        extra="ignore",
+        env_prefix="RESILIENCE_",
+    )
+
+    enabled: bool = Field(
+        default=True,
+        description="Enable retries and circuit breaking for provider calls",
+    )
+    max_attempts: int = Field(
+        default=3,
+        ge=1,
+        description="Total attempts per upstream call, including the first",
+    )
+    backoff_base: float = Field(
+        default=0.5,
+        ge=0,
+        description="Base of the jittered exponential backoff in seconds",
+    )
+    backoff_max: float = Field(
+        default=8.0,
+        ge=0,
+        description="Maximum backoff between attempts in seconds",
+    )
+    max_retry_after: float = Field(
+        default=30.0,
+        ge=0,
+        description="Longest upstream Retry-After hint that is waited out",
+    )
+    failure_threshold: int = Field(
+        default=5,
+        ge=1,
+        description="Consecutive failures that open the circuit",
+    )
+    recovery_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds the circuit stays open before probing",
+    )
+    half_open_max_calls: int = Field(
+        default=1,
+        ge=1,
+        description="Concurrent probe calls allowed while half-open",
+    )
+
+
+class RateLimitSettings(BaseSettings):
+    """Configuration for client-side per-provider rate limiting.
+
+    Each provider gets a token bucket refilled at its configured requests per
+    minute; individual endpoints (e.g. ``tavily:crawl``) can get an extra,
+    stricter bucket. Callers over the limit wait in a bounded queue instead
+    of being rejected upstream.
+
+    Environment variables:
+        RATE_LIMIT_ENABLED: Enable client-side rate limiting (default: true)
+        RATE_LIMIT_PROVIDER_RPM: JSON map of provider to requests per minute
+            (default: {"tavily": 100, "perplexity": 50, "gemini": 60, "youcom": 60})
+        RATE_LIMIT_ENDPOINT_RPM: JSON map of "provider:endpoint" to requests
+            per minute, e.g. {"tavily:crawl": 20} (default: {})
+        RATE_LIMIT_BURST: Requests a bucket can issue back-to-back after
+            being idle (default: 5)
+        RATE_LIMIT_MAX_QUEUE: Maximum callers waiting per bucket (default: 100)
+        RATE_LIMIT_MAX_WAIT: Maximum seconds a caller waits for a slot
+            (default: 30)
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_ignore_empty=True,
+        extra="ignore",
+        env_prefix="RATE_LIMIT_",
+    )
+
+    enabled: bool = Field(
+        default=True,
+        description="Enable client-side rate limiting of provider calls",
+    )
+    provider_rpm: dict[str, float] = Field(
+        default_factory=lambda: {
+            "tavily": 100.0,
+            "perplexity": 50.0,
+            "gemini": 60.0,
+            "youcom": 60.0,
+        },
+        description="Requests per minute allowed per provider",
+    )
+    endpoint_rpm: dict[str, float] = Field(
+        default_factory=dict,
+        description='Requests per minute per "provider:endpoint" (optional)',
+    )
+    burst: int = Field(
+        default=5,
+        ge=1,
+        description="Requests a bucket can issue back-to-back after being idle",
+    )
+    max_queue: int = Field(
+        default=100,
+        ge=0,
+        description="Maximum callers waiting for a slot per bucket",
+    )
+    max_wait: float = Field(
+        default=30.0,
+        ge=0,
+        description="Maximum seconds a caller waits for a slot",
+    )
+
+
+class ContentCacheSettings(BaseSettings):
+    """Configuration for the persistent extracted-content cache.
+
+    Tavily extraction results are stored in Postgres keyed by canonical URL
+    and served locally until they expire. When the cache grows past
+    max_bytes, the least recently used entries are evicted.
+
+    Environment variables:
+        CONTENT_CACHE_ENABLED: Serve and store extractions in the cache
+            (default: true)
+        CONTENT_CACHE_TTL: Seconds an extraction stays fresh (default: 86400)
+        CONTENT_CACHE_MAX_BYTES: Total size of cached content before LRU
+            eviction starts (default: 268435456, i.e. 256 MiB)
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_ignore_empty=True,
+        extra="ignore",
+        env_prefix="CONTENT_CACHE_",
+    )
+
+    enabled: bool = Field(
+        default=True,
+        description="Serve and store Tavily extractions in the content cache",
+    )
+    ttl: int = Field(
+        default=86400,
+        ge=1,
+        description="Seconds a cached extraction stays fresh",
+    )
+    max_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        ge=1,
+        description="Total size of cached content before LRU eviction",
+    )
+
+
+class SearchCacheSettings(BaseSettings):
+    """Configuration for the in-memory Tavily search response cache.
+
+    Identical search requests (after normalization) are answered from
+    memory until their topic's TTL elapses; the least recently used
+    responses are evicted once max_entries is reached.
+
+    Environment variables:
+        SEARCH_CACHE_ENABLED: Cache Tavily search responses (default: true)
+        SEARCH_CACHE_MAX_ENTRIES: Maximum cached responses (default: 1024)
+        SEARCH_CACHE_GENERAL_TTL: Seconds general-topic responses stay
+            cached (default: 3600)
+        SEARCH_CACHE_NEWS_TTL: Seconds news-topic responses stay cached
+            (default: 300)
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_ignore_empty=True,
+        extra="ignore",
+        env_prefix="SEARCH_CACHE_",
+    )
+
+    enabled: bool = Field(
+        default=True,
+        description="Cache Tavily search responses in memory",
+    )
+    max_entries: int = Field(
+        default=1024,
+        ge=1,
+        description="Maximum number of cached search responses",
+    )
+    general_ttl: float = Field(
+        default=3600.0,
+        ge=0,
+        description="Seconds general-topic search responses stay cached",
+    )
+    news_ttl: float = Field(
+        default=300.0,
+        ge=0,
+        description="Seconds news-topic search responses stay cached",
+    )
+
+
+class JobQueueSettings(BaseSettings):
+    """Configuration for the Postgres-backed research job queue.
+
+    Deep research requests submitted as jobs are stored in Postgres and run
+    by separate worker processes (python -m app.worker). A worker holds a
+    lease on each job it runs and renews it while the job is in progress;
+    a job whose lease expires (its worker died) is claimed again, up to
+    max_attempts times.
+
+    Environment variables:
+        JOB_QUEUE_WORKER_CONCURRENCY: Jobs one worker runs at once
+            (default: 4)
+        JOB_QUEUE_POLL_INTERVAL: Seconds an idle worker waits between
+            claims (default: 1.0)
+        JOB_QUEUE_LEASE: Seconds a claimed job is held before another
+            worker may reclaim it (default: 60)
+        JOB_QUEUE_MAX_ATTEMPTS: Claims of a job before it is failed
+            (default: 3)
+        JOB_QUEUE_SHUTDOWN_GRACE: Seconds a stopping worker lets running
+            jobs finish before putting them back in the queue (default: 30)
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_ignore_empty=True,
+        extra="ignore",
+        env_prefix="JOB_QUEUE_",
+    )
+
+    worker_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Jobs one worker runs at once",
+    )
+    poll_interval: float = Field(
+        default=1.0,
+        gt=0,
+        description="Seconds an idle worker waits between claims",
+    )
+    lease: float = Field(
+        default=60.0,
+        gt=0,
+        description="Seconds a claimed job is held before it may be reclaimed",
+    )
+    max_attempts: int = Field(
+        default=3,
+        ge=1,
+        description="Claims of a job before it is failed",
+    )
+    shutdown_grace: float = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds a stopping worker lets running jobs finish",
+    )
+
+
+class WebhookSettings(BaseSettings):
+    """Configuration for research completion webhooks.
+
+    Clients may pass a callback_url when starting Gemini deep research; once
+    the job finishes, the backend POSTs a notification signed with
+    HMAC-SHA256 over the timestamp and body using the shared secret.
+    Deliveries go through a bounded in-memory queue served by a few
+    background senders, and failed deliveries are retried with jittered
+    exponential backoff. Callback hosts must resolve to public addresses
+    unless listed in allowed_hosts.
+
+    Environment variables:
+        WEBHOOK_SECRET: Shared signing secret; callback URLs are rejected
+            while it is unset (optional)
+        WEBHOOK_TIMEOUT: Seconds to wait for a receiver (default: 10)
+        WEBHOOK_MAX_ATTEMPTS: Deliveries attempted per notification,
+            including the first (default: 5)
+        WEBHOOK_BACKOFF_BASE: Base of the retry backoff in seconds
+            (default: 1.0)
+        WEBHOOK_BACKOFF_MAX: Maximum backoff between attempts in seconds
+            (default: 60)
+        WEBHOOK_QUEUE_SIZE: Notifications held for delivery before new ones
+            are dropped (default: 1000)
+        WEBHOOK_CONCURRENCY: Deliveries sent at once (default: 4)
+        WEBHOOK_ALLOWED_HOSTS: JSON list of callback hosts exempt from the
+            public address check, e.g. internal receivers (default: [])
+        WEBHOOK_REDELIVERY_WINDOW: Seconds after a job finishes during
+            which a notification not yet accepted is sent again on startup
+            (default: 86400)
+        WEBHOOK_REDELIVERY_LEASE: Seconds a process holds the notifications
+            it sends again on startup before another process may (default:
+            3600)
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_ignore_empty=True,
+        extra="ignore",
+        env_prefix="WEBHOOK_",
+    )
+
+    secret: str | None = Field(
+        default=None,
+        description="Shared secret used to sign webhook notifications",
+    )
+    timeout: float = Field(
+        default=10.0,
+        gt=0,
+        description="Seconds to wait for a webhook receiver",
+    )
+    max_attempts: int = Field(
+        default=5,
+        ge=1,
+        description="Deliveries attempted per notification",
+    )
+    backoff_base: float = Field(
+        default=1.0,
+        ge=0,
+        description="Base of the retry backoff in seconds",
+    )
+    backoff_max: float = Field(
+        default=60.0,
+        ge=0,
+        description="Maximum backoff between attempts in seconds",
+    )
+    queue_size: int = Field(
+        default=1000,
+        ge=1,
+        description="Notifications held for delivery before new ones are dropped",
+    )
+    concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Deliveries sent at once",
+    )
+    allowed_hosts: list[str] = Field(
+        default_factory=list,
+        description="Callback hosts that may resolve to non-public addresses",
+    )
+    redelivery_window: float = Field(
+        default=86400.0,
+        ge=0,
+        description="Seconds after finishing during which undelivered "
+        "notifications are sent again on startup",
+    )
+    redelivery_lease: float = Field(
+        default=3600.0,
+        gt=0,
+        description="Seconds a process holds the notifications it sends "
+        "again on startup",
+    )
+
+
+class SubscriptionSettings(BaseSettings):
+    """Configuration for the WebSocket subscription endpoint.
+
+    A client opens one authenticated WebSocket and subscribes it to any
+    number of Gemini interactions and queued research jobs; status changes
+    and new outputs are pushed over it. Gemini updates come from the shared
+    status poller; queued jobs are re-read from Postgres, in one query per
+    connection, every job_refresh_interval seconds.
+
+    Environment variables:
+        SUBSCRIPTIONS_MAX_SUBSCRIPTIONS: Interactions plus jobs one
+            connection may follow at once (default: 100)
+        SUBSCRIPTIONS_JOB_REFRESH_INTERVAL: Seconds between reads of the
+            subscribed jobs (default: 2.0)
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_ignore_empty=True,
+        extra="ignore",
+        env_prefix="SUBSCRIPTIONS_",
+    )
+
+    max_subscriptions: int = Field(
+        default=100,
+        ge=1,
+        description="Interactions plus jobs one connection may follow at once",
+    )
+    job_refresh_interval: float = Field(
+        default=2.0,
+        gt=0,
+        description="Seconds between reads of the subscribed jobs",
+    )
+
+
 def parse_cors(v: Any) -> list[str] | str:
     if isinstance(v, str) and not v.startswith("["):
         return [i.strip() for i in v.split(",") if i.strip()]
@@ -351,5 +963,37 @@ class Settings(BaseSettings):
     # You.com API settings (nested model)
     youcom: YouComSettings = Field(default_factory=lambda: YouComSettings())
 
+    # Shared outbound HTTP client pool settings (nested model)
+    http_client: HTTPClientSettings = Field(
+        default_factory=lambda: HTTPClientSettings()
+    )
+
+    # Upstream retry and circuit breaker settings (nested model)
+    resilience: ResilienceSettings = Field(default_factory=lambda: ResilienceSettings())
+
+    # Client-side per-provider rate limiting (nested model)
+    rate_limit: RateLimitSettings = Field(default_factory=lambda: RateLimitSettings())
+
+    # Persistent extracted-content cache (nested model)
+    content_cache: ContentCacheSettings = Field(
+        default_factory=lambda: ContentCacheSettings()
+    )
+
+    # In-memory Tavily search response cache (nested model)
+    search_cache: SearchCacheSettings = Field(
+        default_factory=lambda: SearchCacheSettings()
+    )
+
+    # Postgres-backed research job queue (nested model)
+    job_queue: JobQueueSettings = Field(default_factory=lambda: JobQueueSettings())
+
+    # Research completion webhooks (nested model)
+    webhook: WebhookSettings = Field(default_factory=lambda: WebhookSettings())
+
+    # WebSocket subscriptions to research updates (nested model)
+    subscriptions: SubscriptionSettings = Field(
+        default_factory=lambda: SubscriptionSettings()
+    )
+
 
 settings = Settings()  # type: ignore
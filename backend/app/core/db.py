@@ -1,3 +1,5 @@
+from datetime import datetime, timezone
+
 from sqlmodel import Session, create_engine, select
 
 from app import crud
@@ -7,6 +9,15 @@ from app.models import User, UserCreate
 engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
 
 
+def utc_now() -> datetime:
+    """Return the current time as an aware UTC datetime.
+
+    Timestamp columns are ``timestamp with time zone``; services stamp and
+    compare them with this.
+    """
+    return datetime.now(timezone.utc)
+
+
 # make sure all SQLModel models are imported (app.models) before initializing DB
 # otherwise, SQLModel might fail to initialize relationships properly
 # for more details: https://github.com/fastapi/full-stack-fastapi-template/issues/28
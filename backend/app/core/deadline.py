@@ -0,0 +1,177 @@
+"""Request deadlines propagated from clients to upstream calls.
+
+Callers (typically the API gateway) state how long they are willing to wait
+with either header:
+
+- ``X-Timeout-Ms``: the remaining budget in milliseconds;
+- ``X-Request-Deadline``: an absolute deadline, as Unix time in seconds or
+  milliseconds, an ISO 8601 timestamp or an HTTP date.
+
+When both are sent the earlier deadline wins; malformed values are ignored.
+DeadlineMiddleware stores the deadline in a context variable for the rest
+of the request, so provider services and the resilience policy can cap each
+upstream timeout (and rate limiter wait) at the remaining budget instead of
+their fixed configured timeout. A request whose budget is already spent on
+arrival is rejected with 504 before any work is done.
+
+Usage:
+    from app.core.deadline import cap_timeout
+
+    timeout = httpx.Timeout(cap_timeout(self._timeout))
+"""
+
+import contextlib
+import time
+from collections.abc import Iterator, Mapping
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Header carrying the caller's remaining budget in milliseconds
+TIMEOUT_HEADER = "x-timeout-ms"
+
+# Header carrying the caller's absolute deadline
+DEADLINE_HEADER = "x-request-deadline"
+
+# Numeric deadlines above this are Unix time in milliseconds, not seconds
+_EPOCH_MS_THRESHOLD = 100_000_000_000
+
+# Smallest timeout handed to an upstream call while budget remains
+_MIN_TIMEOUT = 0.001
+
+# Monotonic time by which the current request must be answered, if any
+_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+
+def _parse_absolute(value: str) -> float | None:
+    """Parse an absolute deadline header value to Unix time in seconds."""
+    value = value.strip()
+    try:
+        number = float(value)
+    except ValueError:
+        pass
+    else:
+        return number / 1000 if number > _EPOCH_MS_THRESHOLD else number
+
+    parsed: datetime | None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def parse_budget(headers: Mapping[str, str]) -> float | None:
+    """Return the request budget in seconds stated by the deadline headers.
+
+    Args:
+        headers: Request headers (case-insensitive mapping).
+
+    Returns:
+        Seconds left until the earliest stated deadline (zero or negative if
+        it has passed), or None if no valid deadline header was sent.
+    """
+    budgets: list[float] = []
+
+    timeout_ms = headers.get(TIMEOUT_HEADER)
+    if timeout_ms is not None:
+        try:
+            budgets.append(float(timeout_ms) / 1000)
+        except ValueError:
+            pass
+
+    deadline = headers.get(DEADLINE_HEADER)
+    if deadline is not None:
+        absolute = _parse_absolute(deadline)
+        if absolute is not None:
+            budgets.append(absolute - time.time())
+
+    return min(budgets, default=None)
+
+
+@contextlib.contextmanager
+def deadline_scope(budget: float | None) -> Iterator[None]:
+    """Set the deadline of the current context for the duration of a block.
+
+    Args:
+        budget: Seconds from now until the deadline, or None for no deadline.
+    """
+    deadline = None if budget is None else time.monotonic() + budget
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    """Return the seconds left before the current deadline, if one is set."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def expired() -> bool:
+    """Whether the current deadline has passed."""
+    budget = remaining()
+    return budget is not None and budget <= 0
+
+
+def cap_timeout(timeout: float) -> float:
+    """Cap a configured timeout at the remaining budget of the request.
+
+    Args:
+        timeout: Configured timeout in seconds.
+
+    Returns:
+        The smaller of timeout and the remaining budget (never below a
+        millisecond), or timeout when no deadline is set.
+    """
+    budget = remaining()
+    if budget is None:
+        return timeout
+    return min(timeout, max(budget, _MIN_TIMEOUT))
+
+
+class DeadlineMiddleware:
+    """ASGI middleware applying the deadline headers of HTTP requests."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an ASGI application.
+
+        Args:
+            app: The application to wrap.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle one ASGI connection."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        budget = parse_budget(Headers(scope=scope))
+        if budget is not None and budget <= 0:
+            response = JSONResponse(
+                status_code=504,
+                content={
+                    "error_code": "deadline_exceeded",
+                    "message": "The request deadline passed before it was handled.",
+                    "details": {"budget_ms": round(budget * 1000)},
+                },
+            )
+            await response(scope, receive, send)
+            return
+
+        with deadline_scope(budget):
+            await self.app(scope, receive, send)
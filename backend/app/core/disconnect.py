@@ -0,0 +1,82 @@
+"""Cancellation of request work when the client disconnects.
+
+Long-running routes (Gemini sync research, Perplexity and You.com deep
+research) hold an upstream call or poll loop open for minutes. When the
+client closes the connection (a closed tab, a gateway timeout), nobody is
+left to read the answer, but the work would otherwise run to completion and
+keep occupying the worker and spending upstream quota.
+
+cancel_on_disconnect runs the work alongside a watcher listening for the
+ASGI ``http.disconnect`` message. If the client leaves first, the work is
+cancelled and ClientDisconnectedError is raised; the application answers it
+with 499 (Client Closed Request), which nobody receives but keeps access
+logs meaningful.
+
+Usage:
+    from app.core.disconnect import cancel_on_disconnect
+
+    return await cancel_on_disconnect(http_request, service.deep_research(body))
+"""
+
+import asyncio
+import contextlib
+from collections.abc import Awaitable
+from typing import TypeVar
+
+from starlette.requests import Request
+
+T = TypeVar("T")
+
+# Non-standard status code logged for requests abandoned by the client
+CLIENT_CLOSED_REQUEST = 499
+
+
+class ClientDisconnectedError(Exception):
+    """Raised when the client disconnected before the work finished."""
+
+
+async def wait_for_disconnect(request: Request) -> None:
+    """Return once the client has disconnected.
+
+    Must only be called after the request body has been read, since it
+    consumes the remaining ASGI receive messages.
+
+    Args:
+        request: The incoming request.
+    """
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+async def cancel_on_disconnect(request: Request, work: Awaitable[T]) -> T:
+    """Await work, cancelling it if the client disconnects first.
+
+    Args:
+        request: The incoming request, with its body already read.
+        work: The coroutine (or other awaitable) to run.
+
+    Returns:
+        The result of the work.
+
+    Raises:
+        ClientDisconnectedError: If the client disconnected first; the work
+            has been cancelled and awaited by then.
+    """
+    task = asyncio.ensure_future(work)
+    watcher = asyncio.ensure_future(wait_for_disconnect(request))
+    try:
+        await asyncio.wait({task, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        watcher.cancel()
+        if not task.done():
+            task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await watcher
+        # Errors raised while the work unwinds are irrelevant once cancelled
+        await asyncio.gather(task, return_exceptions=True)
+
+    if task.cancelled():
+        raise ClientDisconnectedError
+    return task.result()
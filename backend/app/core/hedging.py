@@ -0,0 +1,186 @@
+"""Hedged requests for latency-sensitive upstream calls.
+
+Some upstream calls have a long latency tail: most answer quickly, but a few
+take many times longer for reasons unrelated to the request. A hedged call
+starts a second, identical attempt once the first has been running longer
+than a high percentile of recently observed latencies; whichever attempt
+finishes first wins and the other is cancelled.
+
+Hedges cost extra upstream quota, so they are capped: a hedge is only sent
+while hedges make up less than a configured fraction of recent hedged-mode
+calls. Until enough latencies have been observed, calls are never hedged.
+
+Usage:
+    from app.core.hedging import Hedger
+
+    hedger = Hedger(percentile=95, max_rate=0.1)
+    result = await hedger.run(lambda: client.search(query), hedge=True)
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """Rolling window of recent call latencies.
+
+    Attributes:
+        min_samples: Samples required before percentiles are reported.
+    """
+
+    def __init__(self, window: int, min_samples: int) -> None:
+        """Initialize an empty tracker.
+
+        Args:
+            window: Number of most recent latencies kept.
+            min_samples: Samples required before percentiles are reported.
+        """
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def __len__(self) -> int:
+        """Number of latencies currently kept."""
+        return len(self._samples)
+
+    def record(self, latency: float) -> None:
+        """Add a latency in seconds to the window."""
+        self._samples.append(latency)
+
+    def percentile(self, percentile: float) -> float | None:
+        """Return a percentile of the recorded latencies (nearest rank).
+
+        Args:
+            percentile: Percentile between 0 and 100.
+
+        Returns:
+            The latency in seconds, or None while fewer than min_samples
+            latencies have been recorded.
+        """
+        if len(self._samples) < max(self.min_samples, 1):
+            return None
+        ordered = sorted(self._samples)
+        rank = math.ceil(percentile / 100 * len(ordered))
+        return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+
+class Hedger:
+    """Runs calls with an optional hedge after a latency percentile.
+
+    Attributes:
+        percentile: Latency percentile after which a hedge is sent.
+        max_rate: Maximum fraction of hedged-mode calls that send a hedge.
+        latencies: Recent latencies of attempts, including failed and
+            cancelled ones (their elapsed time until then).
+        hedges_sent: Total hedges sent.
+        hedges_won: Total hedges that finished before the first attempt.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 95.0,
+        max_rate: float = 0.1,
+        window: int = 200,
+        min_samples: int = 20,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the hedger.
+
+        Args:
+            percentile: Latency percentile after which a hedge is sent.
+            max_rate: Maximum fraction of hedged-mode calls that send a hedge.
+            window: Number of recent latencies (and hedged-mode calls)
+                considered.
+            min_samples: Latencies required before hedges are sent.
+            clock: Monotonic time source (overridable in tests).
+        """
+        self.percentile = percentile
+        self.max_rate = max_rate
+        self.latencies = LatencyTracker(window, min_samples)
+        self.hedges_sent = 0
+        self.hedges_won = 0
+        self._clock = clock
+        # Whether each recent hedged-mode call sent a hedge
+        self._recent: deque[bool] = deque(maxlen=window)
+
+    def hedge_delay(self) -> float | None:
+        """Return how long to wait before hedging, or None if unknown yet."""
+        return self.latencies.percentile(self.percentile)
+
+    def _hedge_allowed(self) -> bool:
+        """Whether another hedge stays within the hedge rate cap."""
+        hedged = sum(self._recent)
+        return hedged + 1 <= self.max_rate * (len(self._recent) + 1)
+
+    async def _timed(self, call: Callable[[], Awaitable[T]]) -> T:
+        """Await an attempt, recording its latency however it ends.
+
+        Slow attempts are the ones that fail, time out or lose to a hedge and
+        get cancelled; leaving them out would bias the percentile towards
+        the fast calls and send hedges too early.
+        """
+        started = self._clock()
+        try:
+            return await call()
+        finally:
+            self.latencies.record(self._clock() - started)
+
+    async def run(self, call: Callable[[], Awaitable[T]], *, hedge: bool) -> T:
+        """Run a call, hedging it if it is slow and hedge is set.
+
+        Latencies of every attempt feed the percentile, hedged or not,
+        including attempts that fail or are cancelled. A failed attempt never
+        wins while the other attempt is still running.
+
+        Args:
+            call: Zero-argument coroutine function making the call. It is
+                invoked a second time for the hedge, so it must be safe to
+                repeat.
+            hedge: Whether a hedge may be sent for this call.
+
+        Returns:
+            The result of the first attempt to succeed.
+
+        Raises:
+            Exception: The error of the last attempt if every attempt failed.
+        """
+        delay = self.hedge_delay() if hedge else None
+        if delay is None:
+            if hedge:
+                self._recent.append(False)
+            return await self._timed(call)
+
+        primary = asyncio.ensure_future(self._timed(call))
+        tasks: set[asyncio.Future[T]] = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not self._hedge_allowed():
+                self._recent.append(False)
+                return await primary
+
+            self._recent.append(True)
+            self.hedges_sent += 1
+            logger.debug("Hedging call still running after %.3fs", delay)
+            secondary = asyncio.ensure_future(self._timed(call))
+            tasks.add(secondary)
+
+            while True:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    tasks.discard(task)
+                    if task.exception() is None or not tasks:
+                        if task is secondary and task.exception() is None:
+                            self.hedges_won += 1
+                        return task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -1,13 +1,33 @@
 """HTTP client utilities for API integrations.
 
 Provides reusable configuration helpers for httpx clients including
-timeout settings and header builders for consistent API authentication.
+timeout settings and header builders for consistent API authentication,
+plus a registry of long-lived, per-provider pooled clients so connections
+(and their TCP/TLS handshakes) are reused across requests.
+
+Usage:
+    from app.core.http_utils import http_clients
+
+    client = http_clients.get("perplexity")
+    response = await client.post(url, json=payload, timeout=create_timeout(300))
 """
 
+import importlib.util
+import logging
+import time
+from email.utils import parsedate_to_datetime
 from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import httpx
 
+from app.core.config import HTTPClientSettings, settings
+
+logger = logging.getLogger(__name__)
+
+# Ports implied by each URL scheme, dropped when canonicalizing
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
 
 def create_timeout(
     timeout_seconds: int | float,
@@ -29,6 +49,107 @@ def create_timeout(
     )
 
 
+def create_limits(
+    max_connections: int,
+    max_keepalive_connections: int,
+    keepalive_expiry: float,
+) -> httpx.Limits:
+    """Create an httpx connection pool Limits configuration.
+
+    Args:
+        max_connections: Maximum number of concurrent open connections.
+        max_keepalive_connections: Maximum number of idle keep-alive connections.
+        keepalive_expiry: Seconds an idle keep-alive connection is retained.
+
+    Returns:
+        Configured httpx.Limits instance.
+    """
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def create_pooled_client(client_settings: HTTPClientSettings) -> httpx.AsyncClient:
+    """Create a long-lived httpx AsyncClient with a tuned connection pool.
+
+    HTTP/2 is only enabled when requested and the optional ``h2`` package is
+    installed; otherwise the client falls back to HTTP/1.1 keep-alive.
+
+    Args:
+        client_settings: Pool configuration (limits, keep-alive, HTTP/2).
+
+    Returns:
+        Configured httpx.AsyncClient instance. Callers pass per-request
+        timeouts, so the client itself uses the httpx default.
+    """
+    http2 = client_settings.http2
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP/2 requested but the h2 package is not installed")
+        http2 = False
+
+    return httpx.AsyncClient(
+        limits=create_limits(
+            max_connections=client_settings.max_connections,
+            max_keepalive_connections=client_settings.max_keepalive_connections,
+            keepalive_expiry=client_settings.keepalive_expiry,
+        ),
+        http2=http2,
+    )
+
+
+class HTTPClientRegistry:
+    """Registry of long-lived, per-provider pooled httpx clients.
+
+    Each provider gets its own AsyncClient (and therefore its own connection
+    pool) so a slow or saturated provider cannot starve the others. Clients
+    are created lazily on first use and closed by the application lifespan.
+    A client that has been closed is transparently recreated on next access,
+    which keeps short-lived lifespans (e.g. test clients) working.
+
+    Attributes:
+        _settings: Pool configuration applied to every client.
+        _clients: Mapping of provider name to its pooled client.
+    """
+
+    def __init__(self, client_settings: HTTPClientSettings | None = None) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            client_settings: Optional pool configuration. Defaults to
+                settings.http_client.
+        """
+        self._settings = client_settings or settings.http_client
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    def get(self, provider: str) -> httpx.AsyncClient:
+        """Return the pooled client for a provider, creating it if needed.
+
+        Args:
+            provider: Provider name (e.g. "gemini", "perplexity", "youcom").
+
+        Returns:
+            The shared httpx.AsyncClient for that provider.
+        """
+        client = self._clients.get(provider)
+        if client is None or client.is_closed:
+            client = create_pooled_client(self._settings)
+            self._clients[provider] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close every pooled client and release their connections."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
+
+
+# Process-wide registry used by the provider services
+http_clients = HTTPClientRegistry()
+
+
 def build_bearer_auth_headers(
     api_key: str,
     additional_headers: dict[str, str] | None = None,
@@ -73,3 +194,66 @@ def build_api_key_headers(
     if additional_headers:
         headers.update(additional_headers)
     return headers
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header value into seconds.
+
+    Accepts both forms allowed by RFC 9110: a number of seconds or an
+    HTTP-date.
+
+    Args:
+        value: The raw header value, if present.
+
+    Returns:
+        Seconds to wait (never negative), or None if absent or unparseable.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+def canonicalize_url(url: str) -> str:
+    """Return a canonical form of a URL for deduplication.
+
+    Lower-cases the scheme and host, drops default ports, fragments and
+    trailing slashes of non-root paths, and sorts query parameters, so
+    URLs that address the same resource compare equal.
+
+    Args:
+        url: Absolute URL.
+
+    Returns:
+        The canonical URL (the input, stripped, if it cannot be parsed).
+    """
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").rstrip(".")
+    if ":" in host:
+        host = f"[{host}]"
+    if port is not None and port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+    if parts.username or parts.password:
+        userinfo = parts.username or ""
+        if parts.password:
+            userinfo = f"{userinfo}:{parts.password}"
+        host = f"{userinfo}@{host}"
+
+    path = parts.path.rstrip("/") or "/"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, path, query, ""))
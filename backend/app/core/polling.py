@@ -0,0 +1,168 @@
+"""Polling strategies for long-running upstream jobs.
+
+A polling strategy decides how long to wait before the next status poll of a
+job. FixedPolling reproduces a constant interval; AdaptivePolling polls fast
+while a job is young (so short jobs are detected quickly) and then backs off
+exponentially with jitter up to a cap (so hour-long jobs cost few upstream
+calls). Both honour a Retry-After hint from the upstream API when present.
+
+Usage:
+    from app.core.config import settings
+    from app.core.polling import create_polling_strategy
+
+    strategy = create_polling_strategy(settings.gemini)
+    delay = strategy.next_delay(attempt, retry_after=result.retry_after)
+"""
+
+import random
+from abc import ABC, abstractmethod
+
+from app.core.config import GeminiPollStrategy, GeminiSettings
+
+
+class PollingStrategy(ABC):
+    """Computes the delay before each successive poll of a job.
+
+    Attempts are counted from zero: next_delay(0) is the wait after the first
+    poll.
+
+    Attributes:
+        jitter: Random jitter as a fraction of the base delay (0 disables it).
+    """
+
+    def __init__(self, jitter: float = 0.0) -> None:
+        """Initialize the strategy.
+
+        Args:
+            jitter: Random jitter as a fraction of the base delay.
+        """
+        self.jitter = jitter
+
+    @abstractmethod
+    def base_delay(self, attempt: int) -> float:
+        """Return the delay after a poll before jitter is applied.
+
+        Args:
+            attempt: Zero-based number of the poll just made.
+
+        Returns:
+            Delay in seconds.
+        """
+
+    @property
+    def min_interval(self) -> float:
+        """Shortest delay this strategy produces without a Retry-After hint."""
+        return self.base_delay(0) * (1 - self.jitter)
+
+    def next_delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """Return how long to wait before the next poll.
+
+        An upstream Retry-After hint takes precedence over the computed delay,
+        since the API knows best when new progress will be available.
+
+        Args:
+            attempt: Zero-based number of the poll just made.
+            retry_after: Optional Retry-After hint in seconds from the last
+                upstream response.
+
+        Returns:
+            Delay in seconds.
+        """
+        if retry_after is not None:
+            return max(retry_after, 0.0)
+
+        delay = self.base_delay(attempt)
+        if self.jitter:
+            delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return delay
+
+
+class FixedPolling(PollingStrategy):
+    """Polls at a constant interval.
+
+    Attributes:
+        interval: Seconds between polls.
+    """
+
+    def __init__(self, interval: float) -> None:
+        """Initialize the strategy.
+
+        Args:
+            interval: Seconds between polls.
+        """
+        super().__init__()
+        self.interval = interval
+
+    def base_delay(self, attempt: int) -> float:  # noqa: ARG002
+        """Return the constant interval."""
+        return self.interval
+
+
+class AdaptivePolling(PollingStrategy):
+    """Polls fast at first, then backs off exponentially up to a cap.
+
+    The first fast_attempts polls are spaced initial_interval apart; after
+    that each delay grows by multiplier until it reaches max_interval.
+
+    Attributes:
+        initial_interval: Delay during the fast initial phase.
+        fast_attempts: Number of polls made at the initial interval.
+        multiplier: Growth factor applied per poll after the fast phase.
+        max_interval: Upper bound on the base delay.
+    """
+
+    def __init__(
+        self,
+        initial_interval: float,
+        max_interval: float,
+        *,
+        multiplier: float = 1.5,
+        fast_attempts: int = 0,
+        jitter: float = 0.0,
+    ) -> None:
+        """Initialize the strategy.
+
+        Args:
+            initial_interval: Delay during the fast initial phase.
+            max_interval: Upper bound on the base delay.
+            multiplier: Growth factor applied per poll after the fast phase.
+            fast_attempts: Number of polls made at the initial interval.
+            jitter: Random jitter as a fraction of the base delay.
+        """
+        super().__init__(jitter)
+        self.initial_interval = initial_interval
+        self.max_interval = max(max_interval, initial_interval)
+        self.multiplier = multiplier
+        self.fast_attempts = fast_attempts
+
+    def base_delay(self, attempt: int) -> float:
+        """Return the backed-off delay for a poll attempt."""
+        if attempt < self.fast_attempts:
+            return self.initial_interval
+        exponent = attempt - self.fast_attempts + 1
+        try:
+            delay = self.initial_interval * self.multiplier**exponent
+        except OverflowError:
+            return self.max_interval
+        return min(delay, self.max_interval)
+
+
+def create_polling_strategy(gemini_settings: GeminiSettings) -> PollingStrategy:
+    """Create the polling strategy selected in Gemini settings.
+
+    Args:
+        gemini_settings: Gemini configuration (settings.gemini).
+
+    Returns:
+        FixedPolling or AdaptivePolling per poll_strategy.
+    """
+    if gemini_settings.poll_strategy == GeminiPollStrategy.FIXED:
+        return FixedPolling(gemini_settings.poll_interval)
+
+    return AdaptivePolling(
+        initial_interval=gemini_settings.poll_initial_interval,
+        max_interval=gemini_settings.poll_max_interval,
+        multiplier=gemini_settings.poll_backoff_multiplier,
+        fast_attempts=gemini_settings.poll_fast_attempts,
+        jitter=gemini_settings.poll_jitter,
+    )
@@ -0,0 +1,338 @@
+"""Client-side token-bucket rate limiting for upstream provider calls.
+
+Bursts of requests used to be forwarded straight to the providers, which
+answered with 429s that were lost to the user. Each provider now has a token
+bucket refilled at its configured requests per minute (optionally with an
+extra bucket per endpoint, such as Tavily crawl). Callers over the limit wait
+in a bounded FIFO queue, up to a deadline, for the next slot.
+
+The pace adapts to what the provider reports:
+
+- ``X-RateLimit-Remaining`` / ``X-RateLimit-Reset`` (or the IETF
+  ``RateLimit-Remaining`` / ``RateLimit-Reset``) spread the remaining quota
+  over the reset window, never exceeding the configured rate;
+- a 429 halves the rate and pauses the bucket for the Retry-After hint;
+- successful calls recover the rate gradually back to the configured value.
+
+Limiters are owned by each provider's ResiliencePolicy (app.core.resilience),
+which acquires a slot before every upstream attempt.
+
+Usage:
+    from app.core.rate_limit import ProviderRateLimiter
+
+    limiter = ProviderRateLimiter("tavily")
+    await limiter.acquire("search")
+"""
+
+import asyncio
+import time
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from app.core.config import RateLimitSettings, settings
+
+# Lowest fraction of the configured rate a bucket slows down to after 429s
+_MIN_RATE_FACTOR = 0.1
+
+# Multiplicative slowdown applied on every 429
+_BACKOFF_FACTOR = 0.5
+
+# Fraction of the configured rate recovered per successful call
+_RECOVERY_STEP = 0.05
+
+# Reset header values above this are Unix timestamps rather than deltas
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+class RateLimitQueueFull(Exception):
+    """Raised when too many callers are already waiting for a slot."""
+
+
+class RateLimitTimeout(Exception):
+    """Raised when no slot became available before the caller's deadline."""
+
+
+def _header_float(headers: Mapping[str, str], *names: str) -> float | None:
+    """Return the first of several headers that parses as a number."""
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(value.split(",")[0].strip())
+        except ValueError:
+            continue
+    return None
+
+
+class TokenBucket:
+    """Token bucket with a bounded FIFO wait queue and adaptive rate.
+
+    Attributes:
+        name: Bucket name used in errors (e.g. "tavily" or "tavily:crawl").
+        max_rate: Configured rate in requests per second (the ceiling).
+        rate: Current rate in requests per second.
+        capacity: Maximum tokens, i.e. the allowed burst.
+        max_queue: Maximum number of callers waiting for a slot.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        capacity: float,
+        max_queue: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            name: Bucket name used in errors.
+            rate: Refill rate in requests per second.
+            capacity: Maximum tokens, i.e. the allowed burst.
+            max_queue: Maximum number of callers waiting for a slot.
+            clock: Monotonic time source (overridable in tests).
+        """
+        self.name = name
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.max_queue = max_queue
+        self._clock = clock
+        self._tokens = capacity
+        self._updated_at = clock()
+        self._paused_until = 0.0
+        self._queued = 0
+        self._lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def queued(self) -> int:
+        """Number of callers currently waiting for a slot."""
+        return self._queued
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Return the FIFO lock for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last update."""
+        elapsed = max(now - self._updated_at, 0.0)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    def _reserve(self) -> float:
+        """Take a token if one is available.
+
+        Returns:
+            0 if a token was taken, otherwise seconds until one may be.
+        """
+        now = self._clock()
+        self._refill(now)
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def estimated_wait(self) -> float:
+        """Rough seconds until a newly queued caller would get a slot."""
+        now = self._clock()
+        self._refill(now)
+        backlog = self._queued + 1 - self._tokens
+        wait = max(backlog, 0.0) / self.rate
+        return max(wait, self._paused_until - now, 0.0)
+
+    async def acquire(self, timeout: float) -> None:
+        """Wait for a slot, in arrival order.
+
+        Args:
+            timeout: Maximum seconds to wait.
+
+        Raises:
+            RateLimitQueueFull: If max_queue callers are already waiting.
+            RateLimitTimeout: If no slot became available within timeout.
+        """
+        if self._queued == 0 and self._reserve() == 0:
+            return
+        if self._queued >= self.max_queue:
+            raise RateLimitQueueFull(self.name)
+
+        self._queued += 1
+        try:
+            await asyncio.wait_for(self._wait_for_token(), timeout=timeout)
+        except asyncio.TimeoutError as exc:
+            raise RateLimitTimeout(self.name) from exc
+        finally:
+            self._queued -= 1
+
+    def refund(self) -> None:
+        """Give back a slot taken for a call that is not made."""
+        self._refill(self._clock())
+        self._tokens = min(self.capacity, self._tokens + 1)
+
+    async def _wait_for_token(self) -> None:
+        """Sleep until a token can be taken; waiters are served FIFO."""
+        async with self._get_lock():
+            while (delay := self._reserve()) > 0:
+                await asyncio.sleep(delay)
+
+    def penalize(self, retry_after: float | None = None) -> None:
+        """Slow down after the provider rejected a call with 429.
+
+        Args:
+            retry_after: Optional Retry-After hint in seconds; the bucket
+                issues no slots until it has elapsed.
+        """
+        self.rate = max(self.rate * _BACKOFF_FACTOR, self.max_rate * _MIN_RATE_FACTOR)
+        self._tokens = 0.0
+        pause = retry_after if retry_after is not None else 1 / self.rate
+        self._paused_until = max(self._paused_until, self._clock() + pause)
+
+    def recover(self) -> None:
+        """Move the rate back towards the configured value after a success."""
+        self.rate = min(self.max_rate, self.rate + self.max_rate * _RECOVERY_STEP)
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """Adapt the pace to rate-limit headers from a provider response.
+
+        Args:
+            headers: Response headers (case-insensitive mapping).
+        """
+        remaining = _header_float(
+            headers, "x-ratelimit-remaining", "ratelimit-remaining"
+        )
+        reset = _header_float(headers, "x-ratelimit-reset", "ratelimit-reset")
+        if remaining is None or reset is None:
+            return
+        if reset > _EPOCH_THRESHOLD:
+            reset -= time.time()
+        if reset <= 0:
+            return
+
+        if remaining < 1:
+            self._tokens = 0.0
+            self._paused_until = max(self._paused_until, self._clock() + reset)
+            return
+        self.rate = max(
+            min(self.max_rate, remaining / reset), self.max_rate * _MIN_RATE_FACTOR
+        )
+
+
+class ProviderRateLimiter:
+    """Token buckets for one provider and its individually limited endpoints.
+
+    Every call takes a slot from the provider bucket; calls to an endpoint
+    with its own configured rate also take a slot from the endpoint bucket.
+
+    Attributes:
+        provider: Provider key used in settings (e.g. "tavily").
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        rate_limit_settings: RateLimitSettings | None = None,
+    ) -> None:
+        """Initialize the limiter with configuration from settings.rate_limit.
+
+        Args:
+            provider: Provider key used in settings (e.g. "tavily").
+            rate_limit_settings: Override for settings.rate_limit.
+        """
+        self.provider = provider
+        self._settings = rate_limit_settings or settings.rate_limit
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def _bucket(self, key: str, rpm: float | None) -> TokenBucket | None:
+        """Return the bucket for a key, creating it on first use."""
+        if rpm is None or rpm <= 0:
+            return None
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(
+                name=key,
+                rate=rpm / 60,
+                capacity=self._settings.burst,
+                max_queue=self._settings.max_queue,
+            )
+            self._buckets[key] = bucket
+        return bucket
+
+    def buckets(self, endpoint: str | None = None) -> list[TokenBucket]:
+        """Return the buckets a call to an endpoint must pass, outermost first.
+
+        Args:
+            endpoint: Optional endpoint name (e.g. "search").
+
+        Returns:
+            The endpoint bucket (if configured) followed by the provider bucket.
+        """
+        if not self._settings.enabled:
+            return []
+        found: list[TokenBucket | None] = []
+        if endpoint is not None:
+            key = f"{self.provider}:{endpoint}"
+            found.append(self._bucket(key, self._settings.endpoint_rpm.get(key)))
+        found.append(
+            self._bucket(self.provider, self._settings.provider_rpm.get(self.provider))
+        )
+        return [bucket for bucket in found if bucket is not None]
+
+    async def acquire(
+        self,
+        endpoint: str | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        """Wait for a slot for a call to an endpoint.
+
+        Args:
+            endpoint: Optional endpoint name (e.g. "search").
+            timeout: Maximum total seconds to wait, capped at max_wait.
+                Defaults to max_wait.
+
+        Raises:
+            RateLimitQueueFull: If a bucket's wait queue is full.
+            RateLimitTimeout: If no slot became available in time.
+        """
+        limit = self._settings.max_wait
+        if timeout is not None:
+            limit = min(limit, timeout)
+        deadline = time.monotonic() + limit
+        taken: list[TokenBucket] = []
+        try:
+            for bucket in self.buckets(endpoint):
+                await bucket.acquire(max(deadline - time.monotonic(), 0.0))
+                taken.append(bucket)
+        except (RateLimitQueueFull, RateLimitTimeout, asyncio.CancelledError):
+            # The call is not made, so the endpoint slot it took is given back
+            for bucket in taken:
+                bucket.refund()
+            raise
+
+    def estimated_wait(self, endpoint: str | None = None) -> float:
+        """Rough seconds until a new call to an endpoint would get a slot."""
+        return max(
+            (bucket.estimated_wait() for bucket in self.buckets(endpoint)),
+            default=0.0,
+        )
+
+    def penalize(self, endpoint: str | None, retry_after: float | None) -> None:
+        """Slow down the buckets of an endpoint after a 429."""
+        for bucket in self.buckets(endpoint):
+            bucket.penalize(retry_after)
+
+    def recover(self, endpoint: str | None = None) -> None:
+        """Recover the pace of an endpoint's buckets after a success."""
+        for bucket in self.buckets(endpoint):
+            bucket.recover()
+
+    def observe(self, headers: Mapping[str, Any], endpoint: str | None = None) -> None:
+        """Adapt an endpoint's buckets to provider rate-limit headers."""
+        for bucket in self.buckets(endpoint):
+            bucket.observe(headers)
@@ -0,0 +1,452 @@
+"""Retries, backoff and circuit breaking for upstream provider calls.
+
+Each provider service owns a ResiliencePolicy. Calls made through it are:
+
+- paced by the provider's client-side rate limiter (app.core.rate_limit),
+  waiting in a bounded queue for a slot before every upstream attempt;
+- retried (bounded, with jittered exponential backoff via tenacity) when the
+  service's ``_handle_error`` mapping produced a rate limit (429) or service
+  unavailable (503) error, waiting out an upstream Retry-After hint when one
+  was recorded in the error details;
+- guarded by a CircuitBreaker that opens after consecutive upstream failures
+  (5xx and timeouts), fails fast while open, and lets a limited number of
+  half-open probe requests through once the recovery timeout has elapsed;
+- bounded by the request deadline (app.core.deadline), if the caller set
+  one: no attempt starts, and no retry backoff is slept, past it.
+
+Classification works on the provider exceptions the services already raise
+(``status_code`` and ``details``), so no provider-specific logic lives here.
+
+Usage:
+    from app.core.resilience import ResiliencePolicy, resilient
+
+    class PerplexityService:
+        def __init__(self) -> None:
+            self._resilience = ResiliencePolicy("Perplexity", PerplexityAPIError)
+
+        @resilient()
+        async def deep_research(self, request): ...
+"""
+
+import contextlib
+import functools
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from enum import StrEnum
+from typing import Any, TypeVar, cast
+
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception,
+    wait_random_exponential,
+)
+
+from app.core import deadline
+from app.core.config import ResilienceSettings, settings
+from app.core.rate_limit import (
+    ProviderRateLimiter,
+    RateLimitQueueFull,
+    RateLimitTimeout,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+# Mapped provider error statuses that are worth retrying
+RETRYABLE_STATUS_CODES: frozenset[int] = frozenset({429, 503})
+
+# Mapped status of rate limit errors, the only ones retried for
+# non-idempotent calls (the upstream rejected them before doing any work)
+RATE_LIMIT_STATUS_CODE = 429
+
+
+class CircuitState(StrEnum):
+    """States of a circuit breaker.
+
+    Attributes:
+        CLOSED: Calls flow normally; failures are counted.
+        OPEN: Calls fail fast until the recovery timeout elapses.
+        HALF_OPEN: A limited number of probe calls decide whether to close.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with half-open probing.
+
+    Attributes:
+        failure_threshold: Consecutive failures that open the circuit.
+        recovery_timeout: Seconds the circuit stays open before probing.
+        half_open_max_calls: Concurrent probe calls allowed while half-open.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        recovery_timeout: float,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a closed circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit.
+            recovery_timeout: Seconds the circuit stays open before probing.
+            half_open_max_calls: Concurrent probe calls allowed while half-open.
+            clock: Monotonic time source (overridable in tests).
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving from OPEN to HALF_OPEN once the timeout ends."""
+        if (
+            self._state == CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.recovery_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probes = 0
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit starts accepting probe calls."""
+        if self.state != CircuitState.OPEN:
+            return 0.0
+        return max(self.recovery_timeout - (self._clock() - self._opened_at), 0.0)
+
+    def acquire(self) -> bool:
+        """Ask permission for a call.
+
+        Returns:
+            True if the call may proceed, False if it should fail fast.
+        """
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN and self._probes < self.half_open_max_calls:
+            self._probes += 1
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Record a call that reached a healthy upstream; closes the circuit."""
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._probes = 0
+
+    def record_failure(self) -> None:
+        """Record an upstream failure, opening the circuit when warranted."""
+        if self.state == CircuitState.HALF_OPEN:
+            self._open()
+            return
+        self._failures += 1
+        if self._failures >= self.failure_threshold:
+            self._open()
+
+    def release(self) -> None:
+        """Record a call with no verdict on upstream health (e.g. cancelled)."""
+        if self._state == CircuitState.HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+
+    def _open(self) -> None:
+        """Open the circuit and start the recovery timer."""
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._failures = 0
+        self._probes = 0
+
+
+def _error_details(exc: BaseException) -> dict[str, Any]:
+    """Return the details dict of a provider error (empty if none)."""
+    details = getattr(exc, "details", None)
+    return details if isinstance(details, dict) else {}
+
+
+class ResiliencePolicy:
+    """Retry and circuit breaker policy for one provider.
+
+    Attributes:
+        provider: Provider name used in log messages and errors.
+        breaker: The provider's circuit breaker.
+        limiter: The provider's client-side rate limiter.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        error_cls: type[Exception],
+        resilience_settings: ResilienceSettings | None = None,
+        *,
+        rate_limit_key: str | None = None,
+    ) -> None:
+        """Initialize the policy with configuration from settings.resilience.
+
+        Args:
+            provider: Provider name used in log messages and errors.
+            error_cls: The provider's exception class. Its instances expose
+                status_code and details, and the class provides a
+                service_unavailable factory used while the circuit is open.
+            resilience_settings: Override for settings.resilience.
+            rate_limit_key: Provider key in settings.rate_limit. Defaults to
+                the lower-cased provider name.
+        """
+        self.provider = provider
+        self._error_cls = error_cls
+        self._settings = resilience_settings or settings.resilience
+        self.breaker = CircuitBreaker(
+            failure_threshold=self._settings.failure_threshold,
+            recovery_timeout=self._settings.recovery_timeout,
+            half_open_max_calls=self._settings.half_open_max_calls,
+        )
+        self.limiter = ProviderRateLimiter(rate_limit_key or provider.lower())
+
+    def _is_failure(self, exc: BaseException) -> bool:
+        """Whether an error indicates an unhealthy upstream (5xx or timeout)."""
+        return (
+            isinstance(exc, self._error_cls) and getattr(exc, "status_code", 0) >= 500
+        )
+
+    def _should_retry(self, exc: BaseException, idempotent: bool) -> bool:
+        """Whether a failed attempt should be retried."""
+        if not isinstance(exc, self._error_cls):
+            return False
+        details = _error_details(exc)
+        # Raised locally (open circuit, rate limiter, deadline): retrying
+        # cannot help
+        if "circuit" in details or "rate_limiter" in details or "deadline" in details:
+            return False
+
+        status_code = getattr(exc, "status_code", 0)
+        if not idempotent and status_code != RATE_LIMIT_STATUS_CODE:
+            return False
+        if status_code not in RETRYABLE_STATUS_CODES:
+            return False
+
+        retry_after = details.get("retry_after")
+        return retry_after is None or retry_after <= self._settings.max_retry_after
+
+    def _wait(self, retry_state: RetryCallState) -> float:
+        """Backoff before the next attempt, preferring a Retry-After hint."""
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        retry_after = _error_details(exc).get("retry_after") if exc else None
+        if retry_after is not None:
+            return float(retry_after)
+        backoff = wait_random_exponential(
+            multiplier=self._settings.backoff_base,
+            max=self._settings.backoff_max,
+        )
+        return backoff(retry_state)
+
+    def _stop(self, retry_state: RetryCallState) -> bool:
+        """Stop after max_attempts, or when the backoff would pass the deadline."""
+        if retry_state.attempt_number >= self._settings.max_attempts:
+            return True
+        budget = deadline.remaining()
+        return budget is not None and (retry_state.upcoming_sleep or 0) >= budget
+
+    def _log_retry(self, retry_state: RetryCallState) -> None:
+        """Log each retry with the reason and the chosen backoff."""
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        logger.warning(
+            "Retrying %s call (attempt %d) in %.2fs after: %s",
+            self.provider,
+            retry_state.attempt_number,
+            retry_state.upcoming_sleep,
+            exc,
+        )
+
+    async def _acquire_slot(self, endpoint: str | None) -> None:
+        """Wait for a rate limiter slot, converting limiter errors.
+
+        Raises:
+            Exception: The provider's rate_limit_exceeded error if the wait
+                queue is full or no slot became available in time.
+        """
+        try:
+            await self.limiter.acquire(endpoint, timeout=deadline.remaining())
+        except (RateLimitQueueFull, RateLimitTimeout) as exc:
+            reason = "queue_full" if isinstance(exc, RateLimitQueueFull) else "timeout"
+            raise cast(Any, self._error_cls).rate_limit_exceeded(
+                message=(
+                    f"Too many concurrent {self.provider} requests; "
+                    "please retry shortly."
+                ),
+                details={
+                    "rate_limiter": reason,
+                    "retry_after": round(self.limiter.estimated_wait(endpoint), 3),
+                },
+            ) from exc
+
+    def observe_headers(
+        self,
+        headers: Mapping[str, Any],
+        endpoint: str | None = None,
+    ) -> None:
+        """Feed provider rate-limit response headers to the rate limiter.
+
+        Args:
+            headers: Response headers (case-insensitive mapping).
+            endpoint: Optional endpoint the response belongs to.
+        """
+        self.limiter.observe(headers, endpoint)
+
+    @contextlib.asynccontextmanager
+    async def guard(self, endpoint: str | None = None) -> AsyncIterator[None]:
+        """Run one upstream attempt under the circuit breaker and rate limiter.
+
+        Fails fast with the provider's service_unavailable error while the
+        circuit is open, waits for a rate limiter slot, and records the
+        attempt's outcome. Use it directly for calls that cannot be retried,
+        such as streams.
+
+        Args:
+            endpoint: Optional endpoint name for per-endpoint rate limits.
+
+        Raises:
+            Exception: The provider's request_timeout error if the request
+                deadline has passed, service_unavailable if the circuit is
+                open, or rate_limit_exceeded if no rate limiter slot became
+                available.
+        """
+        if deadline.expired():
+            raise cast(Any, self._error_cls).request_timeout(
+                message=(
+                    f"The request deadline passed before the {self.provider} "
+                    "call could be made."
+                ),
+                details={"deadline": "exceeded"},
+            )
+
+        if self._settings.enabled and not self.breaker.acquire():
+            raise cast(Any, self._error_cls).service_unavailable(
+                message=(
+                    f"{self.provider} API is failing; requests are paused "
+                    "while it recovers."
+                ),
+                details={
+                    "circuit": CircuitState.OPEN.value,
+                    "retry_after": round(self.breaker.retry_after(), 3),
+                },
+            )
+
+        try:
+            await self._acquire_slot(endpoint)
+        except BaseException:
+            self.breaker.release()
+            raise
+
+        try:
+            yield
+        except Exception as exc:
+            if self._is_failure(exc):
+                was_open = self.breaker.state == CircuitState.OPEN
+                self.breaker.record_failure()
+                if not was_open and self.breaker.state == CircuitState.OPEN:
+                    logger.warning(
+                        "Circuit opened for %s after: %s", self.provider, exc
+                    )
+            elif isinstance(exc, self._error_cls):
+                self.breaker.record_success()
+                if getattr(exc, "status_code", 0) == RATE_LIMIT_STATUS_CODE:
+                    self.limiter.penalize(
+                        endpoint, _error_details(exc).get("retry_after")
+                    )
+            else:
+                self.breaker.release()
+            raise
+        except BaseException:
+            self.breaker.release()
+            raise
+        else:
+            self.breaker.record_success()
+            self.limiter.recover(endpoint)
+
+    async def _attempt(self, fn: Callable[[], Awaitable[T]], endpoint: str | None) -> T:
+        """Make one guarded attempt."""
+        async with self.guard(endpoint):
+            return await fn()
+
+    async def call(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        *,
+        idempotent: bool = True,
+        endpoint: str | None = None,
+    ) -> T:
+        """Call an upstream operation with rate limiting, retries and circuit breaking.
+
+        Args:
+            fn: Zero-argument coroutine function making one upstream call.
+            idempotent: Whether the call is safe to repeat. Non-idempotent
+                calls are only retried after rate limit errors.
+            endpoint: Optional endpoint name for per-endpoint rate limits.
+
+        Returns:
+            The result of the first successful attempt.
+
+        Raises:
+            Exception: The provider error from the last attempt, the
+                service_unavailable error while the circuit is open, or
+                rate_limit_exceeded if no rate limiter slot became available.
+        """
+        if not self._settings.enabled:
+            return await self._attempt(fn, endpoint)
+
+        retrying = AsyncRetrying(
+            stop=self._stop,
+            wait=self._wait,
+            retry=retry_if_exception(lambda exc: self._should_retry(exc, idempotent)),
+            before_sleep=self._log_retry,
+            reraise=True,
+        )
+        return await retrying(self._attempt, fn, endpoint)
+
+
+def resilient(
+    *,
+    idempotent: bool = True,
+    endpoint: str | None = None,
+) -> Callable[[F], F]:
+    """Route a service method through the service's ResiliencePolicy.
+
+    The decorated method's instance must have a ``_resilience`` attribute.
+
+    Args:
+        idempotent: Whether the call is safe to repeat (see
+            ResiliencePolicy.call).
+        endpoint: Endpoint name for per-endpoint rate limits. Defaults to
+            the method name.
+
+    Returns:
+        A decorator for async service methods.
+    """
+
+    def decorator(func: F) -> F:
+        endpoint_name = endpoint or func.__name__
+
+        @functools.wraps(func)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            policy: ResiliencePolicy = self._resilience
+            return await policy.call(
+                lambda: func(self, *args, **kwargs),
+                idempotent=idempotent,
+                endpoint=endpoint_name,
+            )
+
+        return cast(F, wrapper)
+
+    return decorator
@@ -0,0 +1,79 @@
+"""Streaming response helpers for long-running API integrations.
+
+Provides formatting helpers for Server-Sent Events (SSE) so route handlers
+can push incremental progress to clients over a single long-lived response
+instead of making them poll, and for newline-delimited JSON (NDJSON) so
+large result sets can be sent record by record instead of as one document.
+
+Usage:
+    from fastapi.responses import StreamingResponse
+
+    from app.core.streaming import SSE_HEADERS, SSE_MEDIA_TYPE, format_sse_event
+
+    async def events() -> AsyncIterator[str]:
+        yield format_sse_event({"status": "running"}, event="status")
+
+    return StreamingResponse(events(), media_type=SSE_MEDIA_TYPE, headers=SSE_HEADERS)
+"""
+
+import json
+from typing import Any
+
+from pydantic import BaseModel
+
+# Media type for Server-Sent Events responses
+SSE_MEDIA_TYPE = "text/event-stream"
+
+# Headers that keep proxies from buffering or caching event streams
+SSE_HEADERS: dict[str, str] = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
+# Comment frame sent periodically so idle connections are not dropped
+SSE_KEEPALIVE = ": keep-alive\n\n"
+
+# Media type for newline-delimited JSON responses
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def format_sse_event(
+    data: Any,
+    *,
+    event: str | None = None,
+    event_id: str | None = None,
+) -> str:
+    """Format a payload as a single Server-Sent Events frame.
+
+    Args:
+        data: Payload for the data field. Strings are sent as-is; anything
+            else is JSON-encoded.
+        event: Optional event name (the SSE "event" field).
+        event_id: Optional event ID (the SSE "id" field), echoed back by
+            clients in the Last-Event-ID header when they reconnect.
+
+    Returns:
+        The encoded frame, terminated by a blank line.
+    """
+    payload = data if isinstance(data, str) else json.dumps(data, default=str)
+
+    lines: list[str] = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event is not None:
+        lines.append(f"event: {event}")
+    lines.extend(f"data: {line}" for line in payload.splitlines() or [""])
+    return "\n".join(lines) + "\n\n"
+
+
+def format_ndjson_line(record: BaseModel) -> str:
+    """Encode a record as one line of newline-delimited JSON.
+
+    Args:
+        record: The record to encode.
+
+    Returns:
+        The JSON-encoded record followed by a newline.
+    """
+    return record.model_dump_json() + "\n"
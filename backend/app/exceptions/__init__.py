@@ -4,11 +4,18 @@ This package contains custom exception classes and error codes for handling
 errors from external API integrations in a structured way.
 """
 
+from app.core.exceptions import TavilyAPIError
 from app.exceptions.gemini import GeminiAPIError, GeminiErrorCode
 from app.exceptions.perplexity import PerplexityAPIError, PerplexityErrorCode
 from app.exceptions.youcom import YouComAPIError, YouComErrorCode
 
+# Structured errors raised by the Tavily, Perplexity and You.com services (and
+# their constructors); each carries status_code, error_code, message and details
+PROVIDER_ERRORS = (TavilyAPIError, PerplexityAPIError, YouComAPIError)
+
 __all__ = [
+    # Shared
+    "PROVIDER_ERRORS",
     # Perplexity
     "PerplexityAPIError",
     "PerplexityErrorCode",
@@ -34,6 +34,7 @@ class PerplexityErrorCode(StrEnum):
         REQUEST_TIMEOUT: Request timed out waiting for response.
         INVALID_REQUEST: Request parameters are invalid.
         CONTENT_FILTER: Content was filtered due to policy violation.
+        SERVICE_UNAVAILABLE: Perplexity API is unavailable or failing; retry later.
         PERPLEXITY_API_ERROR: Unexpected error from Perplexity API.
     """
 
@@ -42,6 +43,7 @@ class PerplexityErrorCode(StrEnum):
     REQUEST_TIMEOUT = "request_timeout"
     INVALID_REQUEST = "invalid_request"
     CONTENT_FILTER = "content_filter"
+    SERVICE_UNAVAILABLE = "service_unavailable"
     PERPLEXITY_API_ERROR = "perplexity_api_error"
 
 
@@ -190,6 +192,31 @@ class PerplexityAPIError(Exception):
             details=details,
         )
 
+    @classmethod
+    def service_unavailable(
+        cls,
+        message: str = "Perplexity API is temporarily unavailable. Please try again later.",
+        details: dict[str, Any] | None = None,
+    ) -> "PerplexityAPIError":
+        """Create a service unavailable error.
+
+        Raised for upstream 502/503/504 responses and while the provider
+        circuit breaker is open.
+
+        Args:
+            message: Custom error message. Defaults to standard unavailable message.
+            details: Optional additional error details (e.g. retry_after).
+
+        Returns:
+            PerplexityAPIError configured for service unavailable (503).
+        """
+        return cls(
+            status_code=503,
+            error_code=PerplexityErrorCode.SERVICE_UNAVAILABLE,
+            message=message,
+            details=details,
+        )
+
     @classmethod
     def api_error(
         cls,
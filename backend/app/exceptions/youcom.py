@@ -11,6 +11,7 @@ class YouComErrorCode(StrEnum):
     INVALID_API_KEY = "invalid_api_key"
     REQUEST_TIMEOUT = "request_timeout"
     INVALID_REQUEST = "invalid_request"
+    SERVICE_UNAVAILABLE = "service_unavailable"
     YOUCOM_API_ERROR = "youcom_api_error"
 
 
@@ -82,6 +83,19 @@ class YouComAPIError(Exception):
             details=details,
         )
 
+    @classmethod
+    def service_unavailable(
+        cls,
+        message: str = "You.com API is temporarily unavailable. Please try again later.",
+        details: dict[str, Any] | None = None,
+    ) -> "YouComAPIError":
+        return cls(
+            status_code=503,
+            error_code=YouComErrorCode.SERVICE_UNAVAILABLE,
+            message=message,
+            details=details,
+        )
+
     @classmethod
     def api_error(
         cls,
@@ -1,16 +1,25 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 import sentry_sdk
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.routing import APIRoute
 from starlette.middleware.cors import CORSMiddleware
 
 from app.api.main import api_router
 from app.core.config import settings
+from app.core.deadline import DeadlineMiddleware
+from app.core.disconnect import CLIENT_CLOSED_REQUEST, ClientDisconnectedError
 from app.core.exceptions import TavilyAPIError
+from app.core.http_utils import http_clients
 from app.exceptions.gemini import GeminiAPIError
 from app.exceptions.perplexity import PerplexityAPIError
 from app.exceptions.youcom import YouComAPIError
 from app.schemas.tavily import ErrorResponse
+from app.services.gemini_poller import gemini_poller
+from app.services.registry import services
+from app.services.webhooks import webhooks
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
@@ -20,12 +29,40 @@ def custom_generate_unique_id(route: APIRoute) -> str:
 if settings.SENTRY_DSN and settings.ENVIRONMENT != "local":
     sentry_sdk.init(dsn=str(settings.SENTRY_DSN), enable_tracing=True)
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Manage application-scoped resources.
+
+    Provider services are constructed once at startup and shared by every
+    request. Pooled upstream HTTP clients are created lazily on first use,
+    as is the Gemini status poller's scheduler task; Gemini interactions
+    that had not finished before the last shutdown are tracked again so
+    their recorded status is reconciled, and completion webhooks that were
+    never accepted are queued again. All of them are stopped or closed
+    here on shutdown so connections are released cleanly; queued completion
+    webhooks get a short grace period to go out first.
+    """
+    services.startup()
+    await gemini_poller.resume()
+    await webhooks.resume()
+    yield
+    await gemini_poller.stop()
+    await webhooks.stop()
+    services.clear()
+    await http_clients.aclose()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
+    lifespan=lifespan,
 )
 
+# Apply X-Request-Deadline / X-Timeout-Ms budgets to upstream timeouts
+app.add_middleware(DeadlineMiddleware)
+
 # Set all CORS enabled origins
 if settings.all_cors_origins:
     app.add_middleware(
@@ -135,4 +172,17 @@ async def youcom_exception_handler(
     )
 
 
+@app.exception_handler(ClientDisconnectedError)
+async def client_disconnected_handler(
+    _request: Request,
+    _exc: ClientDisconnectedError,
+) -> Response:
+    """Answer requests whose client left before the work finished.
+
+    The work has already been cancelled and nobody reads the response; the
+    499 status only marks the request as abandoned in access logs.
+    """
+    return Response(status_code=CLIENT_CLOSED_REQUEST)
+
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
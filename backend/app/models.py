@@ -1,8 +1,9 @@
 import uuid
+from datetime import datetime
 from typing import Any, Literal
 
 from pydantic import EmailStr
-from sqlalchemy import JSON, String, Text
+from sqlalchemy import JSON, DateTime, Index, String, Text
 from sqlmodel import Field, Relationship, SQLModel
 
 # Content type for Tavily results and deep research - validated at Pydantic level, stored as string in DB
@@ -110,6 +111,137 @@ class ItemsPublic(SQLModel):
     count: int
 
 
+# Shared properties of cached Tavily extractions
+class ContentCacheEntryBase(SQLModel):
+    url: str = Field(max_length=2048)
+    size_bytes: int = 0
+    hits: int = 0
+    created_at: datetime = Field(sa_type=DateTime(timezone=True))  # type: ignore[call-overload]
+    expires_at: datetime = Field(sa_type=DateTime(timezone=True), index=True)  # type: ignore[call-overload]
+    last_accessed_at: datetime = Field(sa_type=DateTime(timezone=True), index=True)  # type: ignore[call-overload]
+
+
+# Database model, keyed by canonical URL
+class ContentCacheEntry(ContentCacheEntryBase, table=True):
+    __tablename__ = "content_cache"
+
+    url_key: str = Field(primary_key=True, max_length=2048)
+    data: dict[str, Any] = Field(sa_type=JSON)
+
+
+# Properties to return via API (without the cached content)
+class ContentCacheEntryPublic(ContentCacheEntryBase):
+    url_key: str
+
+
+class ContentCacheEntriesPublic(SQLModel):
+    data: list[ContentCacheEntryPublic]
+    count: int
+
+
+class ContentCacheStats(SQLModel):
+    entries: int
+    expired: int
+    total_bytes: int
+    max_bytes: int
+    hits: int
+
+
+# Providers whose deep research can run as a background job
+ResearchJobProvider = Literal["perplexity", "youcom"]
+
+# Lifecycle of a background research job
+ResearchJobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+
+# Shared properties of background research jobs
+class ResearchJobBase(SQLModel):
+    provider: ResearchJobProvider = Field(sa_type=String(20))  # type: ignore[call-overload]
+    status: ResearchJobStatus = Field(default="queued", sa_type=String(20))  # type: ignore[call-overload]
+    attempts: int = 0
+    error: dict[str, Any] | None = Field(default=None, sa_type=JSON)
+    created_at: datetime = Field(sa_type=DateTime(timezone=True))  # type: ignore[call-overload]
+    started_at: datetime | None = Field(default=None, sa_type=DateTime(timezone=True))  # type: ignore[call-overload]
+    finished_at: datetime | None = Field(default=None, sa_type=DateTime(timezone=True))  # type: ignore[call-overload]
+
+
+# Database model; workers claim queued jobs (or jobs whose lease expired)
+# with SELECT ... FOR UPDATE SKIP LOCKED
+class ResearchJob(ResearchJobBase, table=True):
+    __tablename__ = "research_job"
+    __table_args__ = (
+        Index("ix_research_job_status_created_at", "status", "created_at"),
+    )
+
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    owner_id: uuid.UUID = Field(
+        foreign_key="user.id", nullable=False, ondelete="CASCADE", index=True
+    )
+    request: dict[str, Any] = Field(sa_type=JSON)
+    result: dict[str, Any] | None = Field(default=None, sa_type=JSON)
+    worker_id: str | None = Field(default=None, max_length=255)
+    lease_expires_at: datetime | None = Field(  # type: ignore[call-overload]
+        default=None, sa_type=DateTime(timezone=True)
+    )
+
+
+# Properties to return via API (without the request and result payloads)
+class ResearchJobPublic(ResearchJobBase):
+    id: uuid.UUID
+
+
+# Shared properties of Gemini deep research interactions
+class GeminiInteractionBase(SQLModel):
+    query: str
+    status: str = Field(default="pending", max_length=20)
+    last_event_id: str | None = Field(default=None, max_length=255)
+    output_count: int = 0
+    error_message: str | None = None
+    created_at: datetime = Field(sa_type=DateTime(timezone=True))  # type: ignore[call-overload]
+    updated_at: datetime = Field(sa_type=DateTime(timezone=True))  # type: ignore[call-overload]
+    completed_at: datetime | None = Field(default=None, sa_type=DateTime(timezone=True))  # type: ignore[call-overload]
+
+
+# Database model, keyed by the upstream interaction ID; records who started
+# each interaction and its last polled status
+class GeminiInteraction(GeminiInteractionBase, table=True):
+    __tablename__ = "gemini_interaction"
+    __table_args__ = (
+        Index("ix_gemini_interaction_owner_id_created_at", "owner_id", "created_at"),
+        Index("ix_gemini_interaction_status", "status"),
+    )
+
+    interaction_id: str = Field(primary_key=True, max_length=255)
+    owner_id: uuid.UUID = Field(
+        foreign_key="user.id", nullable=False, ondelete="CASCADE"
+    )
+    callback_url: str | None = Field(default=None, max_length=2048)
+    # Set once the completion webhook was accepted by the receiver
+    webhook_delivered_at: datetime | None = Field(  # type: ignore[call-overload]
+        default=None, sa_type=DateTime(timezone=True)
+    )
+    # Until when a process resending the unaccepted webhook holds it
+    webhook_lease_expires_at: datetime | None = Field(  # type: ignore[call-overload]
+        default=None, sa_type=DateTime(timezone=True)
+    )
+    # Process polling the interaction in the background and until when it
+    # holds it; other processes take it over once the lease has expired
+    poller_id: str | None = Field(default=None, max_length=255)
+    poll_lease_expires_at: datetime | None = Field(  # type: ignore[call-overload]
+        default=None, sa_type=DateTime(timezone=True)
+    )
+
+
+# Properties to return via API
+class GeminiInteractionPublic(GeminiInteractionBase):
+    interaction_id: str
+
+
+class GeminiInteractionsPublic(SQLModel):
+    data: list[GeminiInteractionPublic]
+    count: int
+
+
 # Generic message
 class Message(SQLModel):
     message: str
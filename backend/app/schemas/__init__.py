@@ -4,6 +4,17 @@ This package contains all Pydantic v2 schemas used by the FastAPI application
 for request validation, response serialization, and OpenAPI documentation.
 """
 
+from app.schemas.federated import (
+    # Enums
+    FederatedProvider,
+    # Nested Models
+    FederatedProviderResult,
+    FederatedProviderStatus,
+    # Request Schemas
+    FederatedResearchRequest,
+    # Response Schemas
+    FederatedResearchResponse,
+)
 from app.schemas.gemini import (
     # Response Schemas
     GeminiDeepResearchJobResponse,
@@ -36,6 +47,18 @@ from app.schemas.perplexity import (
     PerplexityUsage,
     PerplexityVideo,
 )
+from app.schemas.subscriptions import (
+    # Server Messages
+    InteractionUpdate,
+    JobUpdate,
+    # Enums
+    SubscriptionAck,
+    SubscriptionAction,
+    SubscriptionError,
+    SubscriptionMessageType,
+    # Request Schemas
+    SubscriptionRequest,
+)
 from app.schemas.tavily import (
     # Request Schemas
     CrawlRequest,
@@ -120,4 +143,23 @@ __all__ = [
     "YouComDeepResearchRequest",
     # You.com Response Schemas
     "YouComDeepResearchResponse",
+    # Federated Enums
+    "FederatedProvider",
+    "FederatedProviderStatus",
+    # Federated Nested Models
+    "FederatedProviderResult",
+    # Federated Request Schemas
+    "FederatedResearchRequest",
+    # Federated Response Schemas
+    "FederatedResearchResponse",
+    # Subscription Enums
+    "SubscriptionAction",
+    "SubscriptionMessageType",
+    # Subscription Request Schemas
+    "SubscriptionRequest",
+    # Subscription Server Messages
+    "SubscriptionAck",
+    "InteractionUpdate",
+    "JobUpdate",
+    "SubscriptionError",
 ]
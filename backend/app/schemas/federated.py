@@ -0,0 +1,143 @@
+"""Pydantic schemas for federated multi-provider research.
+
+A federated research request sends one query to several providers at once
+(Tavily search, Perplexity deep research and You.com research) and returns
+every provider's outcome side by side, including partial failures.
+"""
+
+from enum import StrEnum
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from app.schemas.perplexity import PerplexityDeepResearchResponse
+from app.schemas.tavily import ErrorResponse, SearchDepth, SearchResponse
+from app.schemas.youcom import YouComDeepResearchResponse, YouComResearchEffort
+
+# Response of any provider a federated query can fan out to
+FederatedResult = (
+    SearchResponse | PerplexityDeepResearchResponse | YouComDeepResearchResponse
+)
+
+
+class FederatedProvider(StrEnum):
+    """Providers a federated research query can fan out to.
+
+    Attributes:
+        TAVILY: Tavily web search.
+        PERPLEXITY: Perplexity Sonar deep research.
+        YOUCOM: You.com research.
+    """
+
+    TAVILY = "tavily"
+    PERPLEXITY = "perplexity"
+    YOUCOM = "youcom"
+
+
+class FederatedProviderStatus(StrEnum):
+    """Outcome of one provider call in a federated query.
+
+    Attributes:
+        SUCCESS: The provider returned a result.
+        ERROR: The provider call failed.
+        TIMEOUT: The provider did not answer within its deadline.
+    """
+
+    SUCCESS = "success"
+    ERROR = "error"
+    TIMEOUT = "timeout"
+
+
+class FederatedResearchRequest(BaseModel):
+    """Request schema for federated research across several providers.
+
+    Every selected provider is called concurrently with the same query.
+    Each gets its own deadline: provider_timeouts if set for it, else
+    timeout, else the provider's configured request timeout.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    query: str = Field(
+        min_length=1,
+        max_length=10000,
+        description="The research query sent to every provider",
+    )
+    providers: list[FederatedProvider] = Field(
+        default_factory=lambda: list(FederatedProvider),
+        min_length=1,
+        description="Providers to query concurrently (default: all)",
+    )
+    timeout: Annotated[float, Field(gt=0, le=600)] | None = Field(
+        default=None,
+        description="Deadline in seconds applied to each provider",
+    )
+    provider_timeouts: dict[
+        FederatedProvider, Annotated[float, Field(gt=0, le=600)]
+    ] = Field(
+        default_factory=dict,
+        description="Per-provider deadlines in seconds, overriding timeout",
+    )
+    search_depth: SearchDepth = Field(
+        default=SearchDepth.BASIC,
+        description="Tavily search depth",
+    )
+    max_results: Annotated[int, Field(ge=1, le=20)] = Field(
+        default=5,
+        description="Maximum number of Tavily search results",
+    )
+    research_effort: YouComResearchEffort = Field(
+        default=YouComResearchEffort.STANDARD,
+        description="You.com research effort",
+    )
+
+    @field_validator("query")
+    @classmethod
+    def validate_query(cls, value: str) -> str:
+        """Strip the query and reject whitespace-only values."""
+        value = value.strip()
+        if not value:
+            raise ValueError("Research query is required")
+        return value
+
+    @field_validator("providers")
+    @classmethod
+    def dedupe_providers(
+        cls, value: list[FederatedProvider]
+    ) -> list[FederatedProvider]:
+        """Drop repeated providers, keeping the first occurrence."""
+        return list(dict.fromkeys(value))
+
+
+class FederatedProviderResult(BaseModel):
+    """Outcome of one provider call in a federated query."""
+
+    provider: FederatedProvider = Field(description="Provider that was queried")
+    status: FederatedProviderStatus = Field(description="Outcome of the call")
+    duration_ms: float = Field(description="Time spent on the call in milliseconds")
+    result: FederatedResult | None = Field(
+        default=None,
+        description="The provider's response when status is success",
+    )
+    error: ErrorResponse | None = Field(
+        default=None,
+        description="The provider's error when status is error or timeout",
+    )
+
+
+class FederatedResearchResponse(BaseModel):
+    """Combined response of a federated research query.
+
+    The response is returned even when some providers fail; check each
+    result's status, or succeeded/failed for a summary.
+    """
+
+    query: str = Field(description="The research query")
+    results: list[FederatedProviderResult] = Field(
+        description="Per-provider outcomes, in the requested provider order",
+    )
+    succeeded: int = Field(description="Number of providers that returned a result")
+    failed: int = Field(description="Number of providers that failed or timed out")
+    duration_ms: float = Field(
+        description="Wall-clock time of the whole fan-out in milliseconds",
+    )
@@ -8,14 +8,27 @@ and then poll for status updates and results.
 Schema Organization:
     1. Enums - GeminiInteractionStatus, GeminiStreamEventType, GeminiDeltaType
     2. Nested Models - GeminiUsage, GeminiOutput
-    3. Request Models - GeminiDeepResearchRequest, GeminiDeepResearchPollRequest
-    4. Response Models - GeminiDeepResearchJobResponse, GeminiDeepResearchResultResponse
+    3. Request Models - GeminiDeepResearchRequest, GeminiDeepResearchPollRequest,
+       GeminiBulkStatusRequest
+    4. Response Models - GeminiDeepResearchJobResponse, GeminiDeepResearchResultResponse,
+       GeminiDeepResearchPollResponse, GeminiStatusSummary, GeminiBulkStatusResponse
+    5. Webhook Models - GeminiWebhookPayload
 """
 
 from datetime import datetime
 from enum import StrEnum
+from typing import Annotated, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    HttpUrl,
+    UrlConstraints,
+    field_validator,
+)
+
+from app.schemas.tavily import ErrorResponse
 
 # =============================================================================
 # Enums
@@ -50,12 +63,14 @@ class GeminiStreamEventType(StrEnum):
     enabling clients to handle different event types appropriately.
 
     Attributes:
+        STATUS_UPDATE: Interaction status changed.
         THINKING_UPDATE: Progress update on reasoning/thinking process.
         RESEARCH_UPDATE: Progress update on research gathering.
         FINAL_RESULT: Final result payload with complete response.
         ERROR: Error event indicating job failure.
     """
 
+    STATUS_UPDATE = "status_update"
     THINKING_UPDATE = "thinking_update"
     RESEARCH_UPDATE = "research_update"
     FINAL_RESULT = "final_result"
@@ -144,6 +159,7 @@ class GeminiDeepResearchRequest(BaseModel):
         Core: query (required)
         Options: enable_thinking_summaries, file_search_store_names
         Continuation: previous_interaction_id
+        Notification: callback_url
     """
 
     model_config = ConfigDict(extra="forbid")
@@ -174,6 +190,13 @@ class GeminiDeepResearchRequest(BaseModel):
         default=None,
         description="ID of previous interaction for continuation",
     )
+    callback_url: Annotated[HttpUrl, UrlConstraints(max_length=2048)] | None = Field(
+        default=None,
+        description=(
+            "URL that receives a signed POST (GeminiWebhookPayload) when the "
+            "job finishes, instead of the client polling for it"
+        ),
+    )
 
     # -------------------------------------------------------------------------
     # Validators
@@ -218,6 +241,31 @@ class GeminiDeepResearchPollRequest(BaseModel):
     )
 
 
+class GeminiBulkStatusRequest(BaseModel):
+    """Request schema for reading the status of several jobs in one call.
+
+    Statuses are read concurrently, up to the configured
+    GEMINI_BULK_STATUS_CONCURRENCY at a time. Repeated IDs are read once.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    interaction_ids: list[str] = Field(
+        min_length=1,
+        max_length=100,
+        description="Interaction IDs of the jobs to read",
+    )
+
+    @field_validator("interaction_ids")
+    @classmethod
+    def dedupe_interaction_ids(cls, v: list[str]) -> list[str]:
+        """Strip IDs and drop blanks and repeats, keeping request order."""
+        ids = [i.strip() for i in v if i.strip()]
+        if not ids:
+            raise ValueError("interaction_ids must contain a non-empty ID")
+        return list(dict.fromkeys(ids))
+
+
 # =============================================================================
 # Response Schemas
 # =============================================================================
@@ -283,3 +331,101 @@ class GeminiDeepResearchResultResponse(BaseModel):
         default=None,
         description="Error message if status is FAILED",
     )
+    retry_after: float | None = Field(
+        default=None,
+        exclude=True,
+        description="Upstream Retry-After hint in seconds (not serialized)",
+    )
+
+
+class GeminiDeepResearchPollResponse(GeminiDeepResearchResultResponse):
+    """Response schema for the poll endpoint, with a resumable cursor.
+
+    When the poll sends the cursor of a previous response as last_event_id,
+    outputs holds only the segments produced since then, starting at index
+    output_offset of the full list; otherwise it holds every segment.
+    """
+
+    output_offset: int = Field(
+        default=0,
+        description="Index in the full output list of the first returned output",
+    )
+    cursor: str = Field(
+        description="Pass as last_event_id on the next poll to receive only new outputs",
+    )
+
+
+class GeminiStatusSummary(BaseModel):
+    """Compact status of one job, without its outputs."""
+
+    status: GeminiInteractionStatus = Field(
+        description="Current status of the research job",
+    )
+    output_count: int = Field(
+        default=0,
+        description="Number of output segments available",
+    )
+    event_id: str | None = Field(
+        default=None,
+        description="ID of the latest event seen",
+    )
+    completed_at: datetime | None = Field(
+        default=None,
+        description="Timestamp when the job finished (if applicable)",
+    )
+    error_message: str | None = Field(
+        default=None,
+        description="Error message if status is FAILED",
+    )
+
+
+class GeminiBulkStatusResponse(BaseModel):
+    """Response schema for bulk status reads, keyed by interaction ID.
+
+    Every requested ID appears in exactly one of statuses and errors.
+    """
+
+    statuses: dict[str, GeminiStatusSummary] = Field(
+        default_factory=dict,
+        description="Status of each job that could be read",
+    )
+    errors: dict[str, ErrorResponse] = Field(
+        default_factory=dict,
+        description="Error of each job that could not be read",
+    )
+
+
+# =============================================================================
+# Webhook Schemas
+# =============================================================================
+
+
+class GeminiWebhookPayload(BaseModel):
+    """Body of the notification POSTed to a job's callback URL.
+
+    Sent once, when the job reaches a terminal status. The notification
+    carries the outcome only; fetch the outputs with the poll endpoint.
+    """
+
+    event: Literal["deep_research.finished"] = Field(
+        default="deep_research.finished",
+        description="Type of notification",
+    )
+    interaction_id: str = Field(
+        description="The interaction ID of the finished job",
+    )
+    status: GeminiInteractionStatus = Field(
+        description="Terminal status of the job",
+    )
+    output_count: int = Field(
+        default=0,
+        description="Number of output segments available",
+    )
+    completed_at: datetime | None = Field(
+        default=None,
+        description="Timestamp when the job finished",
+    )
+    error_message: str | None = Field(
+        default=None,
+        description="Error message if the job failed",
+    )
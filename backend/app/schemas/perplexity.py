@@ -6,10 +6,11 @@ request validation, response serialization, and OpenAPI documentation generation
 for the FastAPI routes.
 
 Schema Organization:
-    1. Enums - SearchMode, ReasoningEffort, SearchContextSize, RecencyFilter
+    1. Enums - SearchMode, ReasoningEffort, SearchContextSize, RecencyFilter,
+       StreamEventType
     2. Nested Result Models - SearchResult, Video, Usage, Choice, Message
     3. Request Models - PerplexityDeepResearchRequest
-    4. Response Models - PerplexityDeepResearchResponse
+    4. Response Models - PerplexityDeepResearchResponse, PerplexityStreamEvent
 """
 
 import re
@@ -91,6 +92,20 @@ class PerplexityRecencyFilter(StrEnum):
     MONTH = "month"
 
 
+class PerplexityStreamEventType(StrEnum):
+    """Event types emitted by the streaming deep research endpoint.
+
+    Attributes:
+        CONTENT: Incremental text generated by the model.
+        FINAL_RESULT: Complete response with accumulated citations and usage.
+        ERROR: Error event indicating the stream failed.
+    """
+
+    CONTENT = "content"
+    FINAL_RESULT = "final_result"
+    ERROR = "error"
+
+
 # =============================================================================
 # Nested Result Models
 # =============================================================================
@@ -418,3 +433,25 @@ class PerplexityDeepResearchResponse(BaseModel):
         default=None,
         description="Token usage information",
     )
+
+
+class PerplexityStreamEvent(BaseModel):
+    """Single event produced while streaming a deep research response.
+
+    CONTENT events carry the text delta from one upstream chunk. The stream
+    ends with one FINAL_RESULT event whose response holds the full message
+    together with the citations, search results and usage accumulated from
+    every chunk.
+    """
+
+    event: PerplexityStreamEventType = Field(
+        description="Type of stream event",
+    )
+    content: str | None = Field(
+        default=None,
+        description="Text delta (CONTENT events only)",
+    )
+    response: PerplexityDeepResearchResponse | None = Field(
+        default=None,
+        description="Accumulated response (FINAL_RESULT events only)",
+    )
@@ -0,0 +1,164 @@
+"""Pydantic schemas for the research updates WebSocket.
+
+A client sends SubscriptionRequest messages to follow or stop following
+Gemini interactions and queued research jobs. The server answers each with
+a SubscriptionAck and then pushes an InteractionUpdate or JobUpdate whenever
+a followed item changes, and a SubscriptionError for items it cannot follow.
+Every server message carries a type field naming its schema.
+
+Schema Organization:
+    1. Enums - SubscriptionAction, SubscriptionMessageType
+    2. Request Models - SubscriptionRequest
+    3. Server Messages - SubscriptionAck, InteractionUpdate, JobUpdate,
+       SubscriptionError
+"""
+
+import uuid
+from enum import StrEnum
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from app.models import ResearchJobPublic
+from app.schemas.gemini import GeminiDeepResearchPollResponse
+from app.schemas.tavily import ErrorResponse
+
+# =============================================================================
+# Enums
+# =============================================================================
+
+
+class SubscriptionAction(StrEnum):
+    """Actions a client can request on its subscriptions.
+
+    Attributes:
+        SUBSCRIBE: Start following the listed items.
+        UNSUBSCRIBE: Stop following the listed items.
+    """
+
+    SUBSCRIBE = "subscribe"
+    UNSUBSCRIBE = "unsubscribe"
+
+
+class SubscriptionMessageType(StrEnum):
+    """Types of the messages the server sends.
+
+    Attributes:
+        SUBSCRIBED: Items the connection now follows.
+        UNSUBSCRIBED: Items the connection no longer follows.
+        INTERACTION: A Gemini interaction changed.
+        JOB: A queued research job changed.
+        ERROR: A request or a followed item failed.
+    """
+
+    SUBSCRIBED = "subscribed"
+    UNSUBSCRIBED = "unsubscribed"
+    INTERACTION = "interaction"
+    JOB = "job"
+    ERROR = "error"
+
+
+# =============================================================================
+# Request Schemas
+# =============================================================================
+
+
+class SubscriptionRequest(BaseModel):
+    """Message subscribing to or unsubscribing from research updates.
+
+    Items already followed are ignored on subscribe; the first update of a
+    new interaction subscription holds its current status and every output
+    after its cursor (all outputs without one).
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    action: SubscriptionAction = Field(description="What to do with the items")
+    interaction_ids: list[str] = Field(
+        default_factory=list,
+        max_length=100,
+        description="Gemini interaction IDs",
+    )
+    job_ids: list[uuid.UUID] = Field(
+        default_factory=list,
+        max_length=100,
+        description="IDs of queued Perplexity or You.com research jobs",
+    )
+    cursors: dict[str, str] = Field(
+        default_factory=dict,
+        description="Cursor of a previous update per interaction ID, to "
+        "receive only the outputs produced since then",
+    )
+
+    @field_validator("interaction_ids")
+    @classmethod
+    def dedupe_interaction_ids(cls, v: list[str]) -> list[str]:
+        """Strip IDs and drop blanks and repeats, keeping request order."""
+        return list(dict.fromkeys(i.strip() for i in v if i.strip()))
+
+    @field_validator("job_ids")
+    @classmethod
+    def dedupe_job_ids(cls, v: list[uuid.UUID]) -> list[uuid.UUID]:
+        """Drop repeated job IDs, keeping request order."""
+        return list(dict.fromkeys(v))
+
+
+# =============================================================================
+# Server Messages
+# =============================================================================
+
+
+class SubscriptionAck(BaseModel):
+    """Acknowledgement of a subscription request.
+
+    Lists the items the request took effect for; items that could not be
+    followed are reported in separate SubscriptionError messages.
+    """
+
+    type: Literal[
+        SubscriptionMessageType.SUBSCRIBED, SubscriptionMessageType.UNSUBSCRIBED
+    ]
+    interaction_ids: list[str] = Field(default_factory=list)
+    job_ids: list[uuid.UUID] = Field(default_factory=list)
+
+
+class InteractionUpdate(BaseModel):
+    """Change of a followed Gemini interaction.
+
+    Sent when the status changes or new outputs arrive. The update holds
+    only the outputs not sent before on this connection; its cursor can be
+    passed back in SubscriptionRequest.cursors (or as a poll's
+    last_event_id) to resume after a reconnect. The subscription ends after
+    the update with a terminal status.
+    """
+
+    type: Literal[SubscriptionMessageType.INTERACTION] = (
+        SubscriptionMessageType.INTERACTION
+    )
+    interaction_id: str
+    update: GeminiDeepResearchPollResponse
+
+
+class JobUpdate(BaseModel):
+    """Change of a followed research job.
+
+    Sent when the job's status, attempts or error change. The subscription
+    ends after the update with status succeeded or failed; the result is
+    then read from the provider's job result route.
+    """
+
+    type: Literal[SubscriptionMessageType.JOB] = SubscriptionMessageType.JOB
+    job: ResearchJobPublic
+
+
+class SubscriptionError(BaseModel):
+    """A rejected message, or an item that cannot be followed.
+
+    interaction_id or job_id names the item concerned, if any; following it
+    has stopped.
+    """
+
+    type: Literal[SubscriptionMessageType.ERROR] = SubscriptionMessageType.ERROR
+    interaction_id: str | None = None
+    job_id: uuid.UUID | None = None
+    error: ErrorResponse
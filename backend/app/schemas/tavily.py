@@ -8,12 +8,17 @@ and OpenAPI documentation generation for the FastAPI routes.
 Schema Organization:
     1. Enums - SearchDepth, SearchTopic
     2. Nested Result Models - SearchResult, ExtractResult, CrawlResult
-    3. Request Models - SearchRequest, ExtractRequest, CrawlRequest, MapRequest
+    3. Request Models - SearchRequest, ExtractRequest, CrawlRequest, MapRequest,
+       BatchSearchRequest
     4. Response Models - SearchResponse, ExtractResponse, CrawlResponse, MapResponse
+    5. Error, Cache and Batch Response Models - ErrorResponse, SearchCacheStats,
+       BatchSearchItem, BatchSearchResponse
+    6. Streaming Record Models - CrawlStreamResult, CrawlStreamSummary,
+       MapStreamUrl, MapStreamSummary
 """
 
 from enum import StrEnum
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
@@ -174,6 +179,13 @@ class SearchRequest(BaseModel):
         default=None,
         description="List of domains to exclude from search (e.g., ['pinterest.com'])",
     )
+    hedge: bool | None = Field(
+        default=None,
+        description=(
+            "Send a second request if the search is slower than usual and "
+            "return whichever answers first (default: TAVILY_HEDGE)"
+        ),
+    )
 
     @field_validator("include_domains", "exclude_domains", mode="before")
     @classmethod
@@ -265,6 +277,10 @@ class CrawlRequest(BaseModel):
         default=None,
         description="Additional domains to include in crawl (e.g., ['api.example.com'])",
     )
+    stream: bool = Field(
+        default=False,
+        description="Stream each page as newline-delimited JSON, then a summary",
+    )
 
     @field_validator("url", mode="before")
     @classmethod
@@ -317,6 +333,10 @@ class MapRequest(BaseModel):
         default=None,
         description="Additional domains to include in mapping",
     )
+    stream: bool = Field(
+        default=False,
+        description="Stream each URL as newline-delimited JSON, then a summary",
+    )
 
     @field_validator("url", mode="before")
     @classmethod
@@ -332,6 +352,33 @@ class MapRequest(BaseModel):
         return v
 
 
+class BatchSearchRequest(BaseModel):
+    """Request schema for running several Tavily searches in one call.
+
+    Searches run concurrently, up to the smaller of concurrency and the
+    configured TAVILY_BATCH_CONCURRENCY.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    queries: list[SearchRequest] = Field(
+        min_length=1,
+        max_length=100,
+        description="Searches to run, each shaped like a single search request",
+    )
+    concurrency: Annotated[int, Field(ge=1, le=20)] | None = Field(
+        default=None,
+        description="Maximum searches run at once (default: server setting)",
+    )
+    stream: bool = Field(
+        default=False,
+        description=(
+            "Stream each result as a Server-Sent Event as soon as it completes "
+            "instead of returning them all at the end"
+        ),
+    )
+
+
 # =============================================================================
 # Response Schemas
 # =============================================================================
@@ -499,3 +546,79 @@ class ErrorResponse(BaseModel):
         default=None,
         description="Additional error details",
     )
+
+
+# =============================================================================
+# Cache and Batch Response Schemas
+# =============================================================================
+
+
+class SearchCacheStats(BaseModel):
+    """Counters of the in-memory search response cache."""
+
+    enabled: bool = Field(description="Whether search responses are cached")
+    entries: int = Field(description="Responses currently cached")
+    max_entries: int = Field(description="Maximum responses cached")
+    hits: int = Field(description="Searches answered from the cache")
+    misses: int = Field(description="Searches sent upstream")
+    evictions: int = Field(description="Responses evicted to make room")
+    expirations: int = Field(description="Responses dropped after their TTL")
+
+
+class BatchSearchItem(BaseModel):
+    """Outcome of one search in a batch: a result or an error."""
+
+    index: int = Field(description="Position of the search in the request")
+    result: SearchResponse | None = Field(
+        default=None,
+        description="Search response when the search succeeded",
+    )
+    error: ErrorResponse | None = Field(
+        default=None,
+        description="Error when the search failed",
+    )
+
+
+class BatchSearchResponse(BaseModel):
+    """Response schema for batch searches, in request order."""
+
+    results: list[BatchSearchItem] = Field(
+        description="Per-search outcomes, ordered by index",
+    )
+    succeeded: int = Field(description="Number of searches that succeeded")
+    failed: int = Field(description="Number of searches that failed")
+
+
+# =============================================================================
+# Streaming Record Schemas
+# =============================================================================
+
+
+class CrawlStreamResult(BaseModel):
+    """One crawled page in a streamed (NDJSON) crawl response."""
+
+    type: Literal["result"] = "result"
+    result: CrawlResult = Field(description="The crawled page")
+
+
+class CrawlStreamSummary(BaseModel):
+    """Final record of a streamed (NDJSON) crawl response."""
+
+    type: Literal["summary"] = "summary"
+    base_url: str = Field(description="The starting URL for the crawl")
+    total_pages: int = Field(description="Number of pages streamed")
+
+
+class MapStreamUrl(BaseModel):
+    """One discovered URL in a streamed (NDJSON) map response."""
+
+    type: Literal["url"] = "url"
+    url: str = Field(description="Discovered URL")
+
+
+class MapStreamSummary(BaseModel):
+    """Final record of a streamed (NDJSON) map response."""
+
+    type: Literal["summary"] = "summary"
+    base_url: str = Field(description="The starting URL for mapping")
+    total_urls: int = Field(description="Number of URLs streamed")
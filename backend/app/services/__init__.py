@@ -1,9 +1,11 @@
 """Services package for Tavily API integration.
 
 This package provides the TavilyService class which encapsulates all
-interactions with the Tavily Python SDK.
+interactions with the Tavily Python SDK, and the process-wide registry
+that shares one instance of each provider service across requests.
 """
 
+from app.services.registry import ServiceRegistry, services
 from app.services.tavily import TavilyService
 
-__all__ = ["TavilyService"]
+__all__ = ["ServiceRegistry", "TavilyService", "services"]
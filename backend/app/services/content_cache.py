@@ -0,0 +1,273 @@
+"""Persistent cache of extracted page content.
+
+Tavily extraction results are stored in Postgres (the ``content_cache``
+table) keyed by canonical URL, so repeated extractions of the same
+documentation and news pages are served locally instead of paying for and
+waiting on another upstream call.
+
+Entries expire after CONTENT_CACHE_TTL seconds. Every entry records the size
+of its content; when the total grows past CONTENT_CACHE_MAX_BYTES, expired
+entries and then the least recently used ones are evicted.
+
+A whole extraction is looked up and stored with one statement each
+(get_many and put_many); the Tavily service runs them off the event loop
+with asyncio.to_thread, and the admin routes are sync endpoints.
+
+Usage:
+    from app.services.content_cache import content_cache
+
+    cached = content_cache.get_many(["https://example.com/docs"])
+    content_cache.put_many(results)
+"""
+
+import json
+import logging
+from collections.abc import Iterable
+from datetime import timedelta
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, Engine, func, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, col, delete, select
+
+from app.core.config import ContentCacheSettings, settings
+from app.core.db import engine, utc_now
+from app.core.http_utils import canonicalize_url
+from app.models import ContentCacheEntry, ContentCacheStats
+
+logger = logging.getLogger(__name__)
+
+# Eviction frees space down to this fraction of max_bytes, so that it does
+# not run again on every following insert
+_EVICTION_TARGET = 0.9
+
+
+class ContentCache:
+    """Postgres-backed TTL cache of extraction results with LRU eviction.
+
+    Attributes:
+        _engine: Database engine used for cache sessions.
+        _settings: Cache configuration.
+    """
+
+    def __init__(
+        self,
+        db_engine: Engine | None = None,
+        cache_settings: ContentCacheSettings | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            db_engine: Database engine. Defaults to the application engine.
+            cache_settings: Override for settings.content_cache.
+        """
+        self._engine = db_engine or engine
+        self._settings = cache_settings or settings.content_cache
+
+    @property
+    def enabled(self) -> bool:
+        """Whether extractions should be served from and stored in the cache."""
+        return self._settings.enabled
+
+    def get_many(self, urls: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Return fresh cached extractions for URLs, recording the hits.
+
+        Args:
+            urls: URLs to look up (in any form; they are canonicalized).
+
+        Returns:
+            Cached extraction results keyed by canonical URL, for hits only.
+        """
+        keys = {canonicalize_url(url) for url in urls}
+        if not keys:
+            return {}
+
+        now = utc_now()
+        with Session(self._engine) as session:
+            entries = session.exec(
+                select(ContentCacheEntry).where(
+                    col(ContentCacheEntry.url_key).in_(keys),
+                    col(ContentCacheEntry.expires_at) > now,
+                )
+            ).all()
+            hits = {entry.url_key: entry.data for entry in entries}
+            if hits:
+                session.execute(
+                    update(ContentCacheEntry)
+                    .where(col(ContentCacheEntry.url_key).in_(hits))
+                    .values(
+                        hits=ContentCacheEntry.hits + 1,
+                        last_accessed_at=now,
+                    )
+                )
+                session.commit()
+        return hits
+
+    def put_many(self, results: Iterable[dict[str, Any]]) -> int:
+        """Store extraction results, replacing older entries for their URLs.
+
+        Evicts entries afterwards if the cache has grown past max_bytes.
+
+        Args:
+            results: Tavily extraction results, each with a "url" key.
+
+        Returns:
+            Number of entries stored.
+        """
+        now = utc_now()
+        expires_at = now + timedelta(seconds=self._settings.ttl)
+        rows: dict[str, dict[str, Any]] = {}
+        for result in results:
+            url = result.get("url")
+            if not isinstance(url, str) or not url:
+                continue
+            rows[canonicalize_url(url)] = {
+                "url_key": canonicalize_url(url),
+                "url": url[:2048],
+                "data": result,
+                "size_bytes": len(json.dumps(result, default=str).encode()),
+                "hits": 0,
+                "created_at": now,
+                "expires_at": expires_at,
+                "last_accessed_at": now,
+            }
+        if not rows:
+            return 0
+
+        statement = insert(ContentCacheEntry).values(list(rows.values()))
+        statement = statement.on_conflict_do_update(
+            index_elements=[ContentCacheEntry.url_key],
+            set_={
+                "url": statement.excluded.url,
+                "data": statement.excluded.data,
+                "size_bytes": statement.excluded.size_bytes,
+                "created_at": statement.excluded.created_at,
+                "expires_at": statement.excluded.expires_at,
+                "last_accessed_at": statement.excluded.last_accessed_at,
+            },
+        )
+        with Session(self._engine) as session:
+            session.execute(statement)
+            session.commit()
+            self._evict(session)
+        return len(rows)
+
+    def _evict(self, session: Session) -> None:
+        """Drop expired, then least recently used, entries when over budget."""
+        total: int = session.exec(
+            select(func.coalesce(func.sum(ContentCacheEntry.size_bytes), 0))
+        ).one()
+        if total <= self._settings.max_bytes:
+            return
+
+        expired = cast(
+            CursorResult[Any],
+            session.execute(
+                delete(ContentCacheEntry).where(
+                    col(ContentCacheEntry.expires_at) <= utc_now()
+                )
+            ),
+        )
+        target = int(self._settings.max_bytes * _EVICTION_TARGET)
+        running = (
+            select(
+                col(ContentCacheEntry.url_key),
+                func.sum(ContentCacheEntry.size_bytes)
+                .over(
+                    order_by=(
+                        col(ContentCacheEntry.last_accessed_at).desc(),
+                        col(ContentCacheEntry.url_key),
+                    )
+                )
+                .label("running_bytes"),
+            )
+        ).subquery()
+        evicted = cast(
+            CursorResult[Any],
+            session.execute(
+                delete(ContentCacheEntry).where(
+                    col(ContentCacheEntry.url_key).in_(
+                        select(running.c.url_key).where(
+                            running.c.running_bytes > target
+                        )
+                    )
+                )
+            ),
+        )
+        session.commit()
+        logger.info(
+            "Content cache over %d bytes: evicted %d expired and %d LRU entries",
+            self._settings.max_bytes,
+            expired.rowcount,
+            evicted.rowcount,
+        )
+
+    def stats(self) -> ContentCacheStats:
+        """Return entry counts, size and hit totals."""
+        with Session(self._engine) as session:
+            row = session.execute(
+                select(
+                    func.count(),
+                    func.coalesce(func.sum(ContentCacheEntry.size_bytes), 0),
+                    func.coalesce(func.sum(ContentCacheEntry.hits), 0),
+                    func.count().filter(col(ContentCacheEntry.expires_at) <= utc_now()),
+                ).select_from(ContentCacheEntry)
+            ).one()
+        entries, total_bytes, hits, expired = row
+        return ContentCacheStats(
+            entries=entries,
+            expired=expired,
+            total_bytes=total_bytes,
+            max_bytes=self._settings.max_bytes,
+            hits=hits,
+        )
+
+    def list_entries(
+        self, *, skip: int = 0, limit: int = 100
+    ) -> tuple[list[ContentCacheEntry], int]:
+        """Return entries, most recently used first, and the total count.
+
+        Args:
+            skip: Number of entries to skip.
+            limit: Maximum number of entries to return.
+
+        Returns:
+            The page of entries and the total number of entries.
+        """
+        with Session(self._engine) as session:
+            count = session.exec(
+                select(func.count()).select_from(ContentCacheEntry)
+            ).one()
+            entries = session.exec(
+                select(ContentCacheEntry)
+                .order_by(col(ContentCacheEntry.last_accessed_at).desc())
+                .offset(skip)
+                .limit(limit)
+            ).all()
+        return list(entries), count
+
+    def purge(self, *, url: str | None = None, expired_only: bool = False) -> int:
+        """Delete cache entries.
+
+        Args:
+            url: Only delete the entry for this URL (canonicalized).
+            expired_only: Only delete entries that have expired.
+
+        Returns:
+            Number of entries deleted.
+        """
+        statement = delete(ContentCacheEntry)
+        if url is not None:
+            statement = statement.where(
+                col(ContentCacheEntry.url_key) == canonicalize_url(url)
+            )
+        if expired_only:
+            statement = statement.where(col(ContentCacheEntry.expires_at) <= utc_now())
+        with Session(self._engine) as session:
+            result = cast(CursorResult[Any], session.execute(statement))
+            session.commit()
+        return result.rowcount
+
+
+# Process-wide content cache used by TavilyService and the admin routes
+content_cache = ContentCache()
@@ -0,0 +1,227 @@
+"""Federated research across several providers.
+
+FederatedResearchService sends one query concurrently to Tavily search,
+Perplexity deep research and You.com research. Each provider call runs under
+its own deadline and its outcome (result, error or timeout) is captured
+independently, so a slow or failing provider never holds back the others:
+the fan-out takes as long as the slowest provider within its deadline
+rather than the sum of all of them.
+
+Provider services are resolved from the registry per call, so a provider
+without credentials is reported as a per-provider error instead of failing
+the whole request.
+
+Usage:
+    from app.services.federated import FederatedResearchService
+
+    response = await FederatedResearchService().research(request)
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from app.core.config import settings
+from app.exceptions import PROVIDER_ERRORS
+from app.schemas.federated import (
+    FederatedProvider,
+    FederatedProviderResult,
+    FederatedProviderStatus,
+    FederatedResearchRequest,
+    FederatedResearchResponse,
+    FederatedResult,
+)
+from app.schemas.perplexity import PerplexityDeepResearchRequest
+from app.schemas.tavily import ErrorResponse, SearchRequest, SearchResponse
+from app.schemas.youcom import YouComDeepResearchRequest
+from app.services.perplexity import PerplexityService
+from app.services.registry import ServiceRegistry, services
+from app.services.search_cache import SearchCache, search_cache
+from app.services.tavily import TavilyService
+from app.services.youcom import YouComService
+
+logger = logging.getLogger(__name__)
+
+
+class FederatedResearchService:
+    """Fans a research query out to several providers concurrently."""
+
+    def __init__(
+        self,
+        registry: ServiceRegistry | None = None,
+        cache: SearchCache | None = None,
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            registry: Registry to resolve provider services from. Defaults to
+                the process-wide registry.
+            cache: Search response cache. Defaults to the process-wide cache.
+        """
+        self._registry = registry or services
+        self._search_cache = cache or search_cache
+
+    @staticmethod
+    def _default_timeout(provider: FederatedProvider) -> float:
+        """Return the configured request timeout of a provider."""
+        if provider == FederatedProvider.TAVILY:
+            return float(settings.tavily.timeout)
+        if provider == FederatedProvider.PERPLEXITY:
+            return float(settings.perplexity.timeout)
+        return float(settings.youcom.timeout)
+
+    def _deadline(
+        self,
+        provider: FederatedProvider,
+        request: FederatedResearchRequest,
+    ) -> float:
+        """Return the deadline in seconds for one provider call."""
+        if provider in request.provider_timeouts:
+            return request.provider_timeouts[provider]
+        if request.timeout is not None:
+            return request.timeout
+        return self._default_timeout(provider)
+
+    async def _search_tavily(
+        self, request: FederatedResearchRequest
+    ) -> FederatedResult:
+        """Run a Tavily search with the request's depth and result count.
+
+        The search shares the search response cache with the Tavily routes.
+        """
+        tavily = self._registry.get(TavilyService)
+        # Not validated: federated queries may be longer than plain searches
+        search = SearchRequest.model_construct(
+            query=request.query,
+            search_depth=request.search_depth,
+            max_results=request.max_results,
+        )
+        body = await self._search_cache.search(tavily, search)
+        return SearchResponse.model_validate_json(body)
+
+    async def _research_perplexity(
+        self, request: FederatedResearchRequest
+    ) -> FederatedResult:
+        """Run Perplexity deep research on the request's query."""
+        perplexity = self._registry.get(PerplexityService)
+        return await perplexity.deep_research(
+            PerplexityDeepResearchRequest(query=request.query)
+        )
+
+    async def _research_youcom(
+        self, request: FederatedResearchRequest
+    ) -> FederatedResult:
+        """Run You.com research on the query at the request's effort level."""
+        youcom = self._registry.get(YouComService)
+        return await youcom.deep_research(
+            YouComDeepResearchRequest(
+                query=request.query,
+                research_effort=request.research_effort,
+            )
+        )
+
+    async def _run(
+        self,
+        provider: FederatedProvider,
+        call: Callable[[], Awaitable[FederatedResult]],
+        timeout: float,
+    ) -> FederatedProviderResult:
+        """Run one provider call under its deadline, capturing the outcome.
+
+        Args:
+            provider: Provider being called.
+            call: Zero-argument coroutine function making the call.
+            timeout: Deadline in seconds.
+
+        Returns:
+            The provider's result, error or timeout.
+        """
+        started = time.perf_counter()
+
+        def elapsed_ms() -> float:
+            return round((time.perf_counter() - started) * 1000, 1)
+
+        try:
+            result = await asyncio.wait_for(call(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return FederatedProviderResult(
+                provider=provider,
+                status=FederatedProviderStatus.TIMEOUT,
+                duration_ms=elapsed_ms(),
+                error=ErrorResponse(
+                    error_code="request_timeout",
+                    message=f"{provider.value} did not respond within {timeout:g} seconds.",
+                    details={"timeout": timeout},
+                ),
+            )
+        except PROVIDER_ERRORS as exc:
+            error = ErrorResponse(
+                error_code=exc.error_code,
+                message=exc.message,
+                details=exc.details,
+            )
+        except Exception as exc:
+            logger.exception("Federated %s call failed", provider.value)
+            error = ErrorResponse(
+                error_code=f"{provider.value}_api_error",
+                message=f"{provider.value} request failed: {exc}",
+            )
+        else:
+            return FederatedProviderResult(
+                provider=provider,
+                status=FederatedProviderStatus.SUCCESS,
+                duration_ms=elapsed_ms(),
+                result=result,
+            )
+
+        return FederatedProviderResult(
+            provider=provider,
+            status=FederatedProviderStatus.ERROR,
+            duration_ms=elapsed_ms(),
+            error=error,
+        )
+
+    async def research(
+        self,
+        request: FederatedResearchRequest,
+    ) -> FederatedResearchResponse:
+        """Query every requested provider concurrently.
+
+        Args:
+            request: Federated research request.
+
+        Returns:
+            Per-provider outcomes in the requested order, with timings.
+        """
+        calls: dict[
+            FederatedProvider,
+            Callable[[FederatedResearchRequest], Awaitable[FederatedResult]],
+        ] = {
+            FederatedProvider.TAVILY: self._search_tavily,
+            FederatedProvider.PERPLEXITY: self._research_perplexity,
+            FederatedProvider.YOUCOM: self._research_youcom,
+        }
+
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(
+                self._run(
+                    provider,
+                    functools.partial(calls[provider], request),
+                    self._deadline(provider, request),
+                )
+                for provider in request.providers
+            )
+        )
+        succeeded = sum(
+            result.status == FederatedProviderStatus.SUCCESS for result in results
+        )
+        return FederatedResearchResponse(
+            query=request.query,
+            results=list(results),
+            succeeded=succeeded,
+            failed=len(results) - succeeded,
+            duration_ms=round((time.perf_counter() - started) * 1000, 1),
+        )
@@ -24,6 +24,10 @@ from typing import Any
 import httpx
 
 from app.core.config import settings
+from app.core.deadline import cap_timeout
+from app.core.http_utils import http_clients, parse_retry_after
+from app.core.polling import FixedPolling, PollingStrategy, create_polling_strategy
+from app.core.resilience import ResiliencePolicy, resilient
 from app.exceptions.gemini import GeminiAPIError
 from app.schemas.gemini import (
     GeminiDeepResearchJobResponse,
@@ -32,6 +36,15 @@ from app.schemas.gemini import (
     GeminiInteractionStatus,
 )
 
+# Statuses after which an interaction no longer changes
+TERMINAL_STATUSES: frozenset[GeminiInteractionStatus] = frozenset(
+    {
+        GeminiInteractionStatus.COMPLETED,
+        GeminiInteractionStatus.FAILED,
+        GeminiInteractionStatus.CANCELLED,
+    }
+)
+
 
 class GeminiService:
     """Service layer for Google Gemini Deep Research API operations.
@@ -41,11 +54,13 @@ class GeminiService:
     this service uses a polling workflow for long-running research jobs.
 
     The service reads configuration from settings.gemini and handles:
-    - x-goog-api-key header authentication
+    - x-goog-api-key header authentication over the shared pooled client
     - Request payload formatting with agent_config structure
     - Response parsing for job creation and polling
-    - Polling loop with configurable interval and max attempts
+    - Polling loop with a configurable strategy (fixed or adaptive backoff)
+      and max attempts
     - Error mapping from HTTP status codes to typed exceptions
+    - Retries and circuit breaking via the provider's ResiliencePolicy
 
     Attributes:
         BASE_URL: The Gemini API v1beta base URL.
@@ -53,6 +68,8 @@ class GeminiService:
         _timeout: Request timeout in seconds.
         _poll_interval: Polling interval in seconds.
         _max_poll_attempts: Maximum number of polling attempts.
+        _polling: Strategy deciding the delay between polls.
+        _resilience: Retry and circuit breaker policy for upstream calls.
     """
 
     BASE_URL: str = "https://generativelanguage.googleapis.com/v1beta"
@@ -65,6 +82,7 @@ class GeminiService:
         - timeout: Request timeout in seconds (default: 120)
         - poll_interval: Polling interval in seconds (default: 10)
         - max_poll_attempts: Maximum polling attempts (default: 360)
+        - poll_strategy and poll_*: Polling strategy (default: adaptive)
 
         Raises:
             GeminiAPIError: If API key is not configured.
@@ -80,6 +98,8 @@ class GeminiService:
         self._timeout: int = gemini_settings.timeout
         self._poll_interval: int = gemini_settings.poll_interval
         self._max_poll_attempts: int = gemini_settings.max_poll_attempts
+        self._polling: PollingStrategy = create_polling_strategy(gemini_settings)
+        self._resilience = ResiliencePolicy("Gemini", GeminiAPIError)
 
     def _build_headers(self) -> dict[str, str]:
         """Build HTTP headers for Gemini API requests.
@@ -95,16 +115,23 @@ class GeminiService:
             "Content-Type": "application/json",
         }
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client shared by all Gemini requests."""
+        return http_clients.get("gemini")
+
     def _handle_error(
         self,
         status_code: int,
         response_body: str | None = None,
+        retry_after: float | None = None,
     ) -> GeminiAPIError:
         """Map HTTP status codes to GeminiAPIError subtypes.
 
         Args:
             status_code: HTTP status code from the response.
             response_body: Optional response body for error details.
+            retry_after: Optional Retry-After hint in seconds, recorded in the
+                details of retryable errors for the resilience layer.
 
         Returns:
             Appropriate GeminiAPIError subtype.
@@ -112,6 +139,8 @@ class GeminiService:
         details: dict[str, Any] | None = None
         if response_body:
             details = {"response_body": response_body}
+        if retry_after is not None and status_code in (429, 502, 503, 504):
+            details = {**(details or {}), "retry_after": retry_after}
 
         parsed_error = self._extract_error_details(response_body)
 
@@ -138,6 +167,11 @@ class GeminiService:
                 message=f"Invalid request: {response_body or 'Bad Request'}",
                 details=details,
             )
+        elif status_code in (502, 503, 504):
+            return GeminiAPIError.service_unavailable(
+                message=f"Gemini API unavailable (HTTP {status_code})",
+                details=details,
+            )
         else:
             return GeminiAPIError.api_error(
                 message=f"Gemini API error (HTTP {status_code})",
@@ -290,12 +324,35 @@ class GeminiService:
         Returns:
             True if status is completed, failed, or cancelled.
         """
-        return status in (
-            GeminiInteractionStatus.COMPLETED,
-            GeminiInteractionStatus.FAILED,
-            GeminiInteractionStatus.CANCELLED,
-        )
+        return status in TERMINAL_STATUSES
+
+    def raise_for_terminal_failure(
+        self,
+        interaction_id: str,
+        result: GeminiDeepResearchResultResponse,
+    ) -> None:
+        """Raise if a terminal result represents a failed or cancelled job.
+
+        Args:
+            interaction_id: The interaction ID the result belongs to.
+            result: A poll result with a terminal status.
+
+        Raises:
+            GeminiAPIError: research_failed for FAILED, api_error for CANCELLED.
+        """
+        if result.status == GeminiInteractionStatus.FAILED:
+            raise GeminiAPIError.research_failed(
+                message=result.error_message or "Deep research job failed.",
+                details={"interaction_id": interaction_id},
+            )
 
+        if result.status == GeminiInteractionStatus.CANCELLED:
+            raise GeminiAPIError.api_error(
+                message="Deep research job was cancelled.",
+                details={"interaction_id": interaction_id},
+            )
+
+    @resilient(idempotent=False)
     async def start_research(
         self,
         request: GeminiDeepResearchRequest,
@@ -318,32 +375,34 @@ class GeminiService:
         headers = self._build_headers()
         payload = self._build_payload(request)
         url = f"{self.BASE_URL}/interactions"
+        timeout = cap_timeout(self._timeout)
 
         try:
-            async with httpx.AsyncClient(
-                timeout=httpx.Timeout(self._timeout)
-            ) as client:
-                response = await client.post(
-                    url,
-                    headers=headers,
-                    json=payload,
-                )
+            response = await self._get_client().post(
+                url,
+                headers=headers,
+                json=payload,
+                timeout=httpx.Timeout(timeout),
+            )
+
+            self._resilience.observe_headers(response.headers, "start_research")
 
-                if response.status_code != 200:
-                    raise self._handle_error(
-                        status_code=response.status_code,
-                        response_body=response.text,
-                    )
+            if response.status_code != 200:
+                raise self._handle_error(
+                    status_code=response.status_code,
+                    response_body=response.text,
+                    retry_after=parse_retry_after(response.headers.get("retry-after")),
+                )
 
-                response_data = response.json()
-                return self._parse_job_response(response_data)
+            response_data = response.json()
+            return self._parse_job_response(response_data)
 
         except GeminiAPIError:
             # Re-raise our own exceptions
             raise
         except httpx.TimeoutException as exc:
             raise GeminiAPIError.request_timeout(
-                message=f"Request timed out after {self._timeout} seconds.",
+                message=f"Request timed out after {timeout:g} seconds.",
                 details={"original_error": str(exc)},
             ) from exc
         except httpx.HTTPError as exc:
@@ -357,6 +416,7 @@ class GeminiService:
                 details={"original_error": str(exc)},
             ) from exc
 
+    @resilient()
     async def poll_research(
         self,
         interaction_id: str,
@@ -385,32 +445,36 @@ class GeminiService:
         params: dict[str, str] = {}
         if last_event_id:
             params["last_event_id"] = last_event_id
+        timeout = cap_timeout(self._timeout)
 
         try:
-            async with httpx.AsyncClient(
-                timeout=httpx.Timeout(self._timeout)
-            ) as client:
-                response = await client.get(
-                    url,
-                    headers=headers,
-                    params=params if params else None,
-                )
+            response = await self._get_client().get(
+                url,
+                headers=headers,
+                params=params if params else None,
+                timeout=httpx.Timeout(timeout),
+            )
+
+            self._resilience.observe_headers(response.headers, "poll_research")
 
-                if response.status_code != 200:
-                    raise self._handle_error(
-                        status_code=response.status_code,
-                        response_body=response.text,
-                    )
+            if response.status_code != 200:
+                raise self._handle_error(
+                    status_code=response.status_code,
+                    response_body=response.text,
+                    retry_after=parse_retry_after(response.headers.get("retry-after")),
+                )
 
-                response_data = response.json()
-                return self._parse_poll_response(response_data)
+            response_data = response.json()
+            result = self._parse_poll_response(response_data)
+            result.retry_after = parse_retry_after(response.headers.get("retry-after"))
+            return result
 
         except GeminiAPIError:
             # Re-raise our own exceptions
             raise
         except httpx.TimeoutException as exc:
             raise GeminiAPIError.request_timeout(
-                message=f"Poll request timed out after {self._timeout} seconds.",
+                message=f"Poll request timed out after {timeout:g} seconds.",
                 details={"original_error": str(exc)},
             ) from exc
         except httpx.HTTPError as exc:
@@ -432,13 +496,15 @@ class GeminiService:
     ) -> GeminiDeepResearchResultResponse:
         """Wait for a deep research job to complete.
 
-        Polls the job status at regular intervals until a terminal status
-        is reached (completed, failed, or cancelled) or the maximum number
-        of polling attempts is exceeded.
+        Polls the job status until a terminal status is reached (completed,
+        failed, or cancelled) or the maximum number of polling attempts is
+        exceeded. The delay between polls comes from the configured polling
+        strategy, and an upstream Retry-After hint overrides it.
 
         Args:
             interaction_id: The interaction ID from job creation.
-            poll_interval: Optional override for polling interval in seconds.
+            poll_interval: Optional fixed polling interval in seconds,
+                overriding the configured strategy.
             max_attempts: Optional override for maximum polling attempts.
 
         Returns:
@@ -447,12 +513,12 @@ class GeminiService:
         Raises:
             GeminiAPIError: If polling fails, max attempts exceeded, or job failed.
         """
-        interval = poll_interval or self._poll_interval
+        polling = FixedPolling(poll_interval) if poll_interval else self._polling
         attempts = max_attempts or self._max_poll_attempts
 
         last_event_id: str | None = None
 
-        for _attempt in range(attempts):
+        for attempt in range(attempts):
             result = await self.poll_research(
                 interaction_id=interaction_id,
                 last_event_id=last_event_id,
@@ -464,25 +530,12 @@ class GeminiService:
 
             # Check for terminal status
             if self._is_terminal_status(result.status):
-                # Handle failure status
-                if result.status == GeminiInteractionStatus.FAILED:
-                    raise GeminiAPIError.research_failed(
-                        message=result.error_message or "Deep research job failed.",
-                        details={"interaction_id": interaction_id},
-                    )
-
-                # Handle cancelled status
-                if result.status == GeminiInteractionStatus.CANCELLED:
-                    raise GeminiAPIError.api_error(
-                        message="Deep research job was cancelled.",
-                        details={"interaction_id": interaction_id},
-                    )
-
-                # Return completed result
+                # Failed and cancelled jobs raise; completed jobs return
+                self.raise_for_terminal_failure(interaction_id, result)
                 return result
 
             # Wait before next poll
-            await asyncio.sleep(interval)
+            await asyncio.sleep(polling.next_delay(attempt, result.retry_after))
 
         # Max attempts exceeded
         raise GeminiAPIError.max_polls_exceeded(
@@ -490,10 +543,10 @@ class GeminiService:
             details={
                 "interaction_id": interaction_id,
                 "attempts": attempts,
-                "poll_interval": interval,
             },
         )
 
+    @resilient()
     async def cancel_research(
         self,
         interaction_id: str,
@@ -512,28 +565,30 @@ class GeminiService:
         """
         headers = self._build_headers()
         url = f"{self.BASE_URL}/interactions/{interaction_id}/cancel"
+        timeout = cap_timeout(self._timeout)
 
         try:
-            async with httpx.AsyncClient(
-                timeout=httpx.Timeout(self._timeout)
-            ) as client:
-                response = await client.post(
-                    url,
-                    headers=headers,
-                )
+            response = await self._get_client().post(
+                url,
+                headers=headers,
+                timeout=httpx.Timeout(timeout),
+            )
+
+            self._resilience.observe_headers(response.headers, "cancel_research")
 
-                if response.status_code != 200:
-                    raise self._handle_error(
-                        status_code=response.status_code,
-                        response_body=response.text,
-                    )
+            if response.status_code != 200:
+                raise self._handle_error(
+                    status_code=response.status_code,
+                    response_body=response.text,
+                    retry_after=parse_retry_after(response.headers.get("retry-after")),
+                )
 
         except GeminiAPIError:
             # Re-raise our own exceptions
             raise
         except httpx.TimeoutException as exc:
             raise GeminiAPIError.request_timeout(
-                message=f"Cancel request timed out after {self._timeout} seconds.",
+                message=f"Cancel request timed out after {timeout:g} seconds.",
                 details={"original_error": str(exc)},
             ) from exc
         except httpx.HTTPError as exc:
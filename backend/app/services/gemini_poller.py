@@ -0,0 +1,862 @@
+"""Shared background status poller for Gemini deep research interactions.
+
+Gemini research jobs run for up to an hour and every client that watches one
+used to poll Google on its own. This module keeps a single scheduler loop per
+process that polls each tracked interaction on the configured polling strategy
+(see app.core.polling) and caches the latest GeminiDeepResearchResultResponse. Route handlers read from
+that cache, and concurrent waiters on the same interaction share one upstream
+poll stream instead of running their own wait_for_completion loops.
+
+Interactions are tracked when a job is started or first read. A job keeps
+being polled while someone has read it within the idle timeout (or is waiting
+on it); finished jobs stay cached for the retention period.
+
+Every poll that changes an interaction's status, event ID or output count is
+written to the interaction registry (app.services.gemini_registry), and on
+startup resume() tracks the registry's unfinished interactions again so
+their recorded status is brought up to date after a restart.
+
+Interactions started with a callback URL are watched: they keep being polled
+without readers until they finish, and the poll that finishes one queues its
+completion webhook (app.services.webhooks).
+
+Polling without readers (resumed and watched interactions) is claimed per
+interaction in the registry, so with several worker processes each one is
+polled in the background by a single process. The scheduler renews its
+claims every third of GEMINI_STATUS_LEASE and takes over watched
+interactions whose holder stopped renewing (it exited or crashed); readers
+are always served by the process they are connected to.
+
+Usage:
+    from app.services.gemini_poller import gemini_poller
+
+    gemini_poller.track(job.interaction_id)
+    result = await gemini_poller.get_status(job.interaction_id)
+    final = await gemini_poller.wait_for_completion(job.interaction_id)
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import socket
+import time
+import uuid
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+from app.core.config import settings
+from app.core.deadline import deadline_scope
+from app.core.polling import FixedPolling, PollingStrategy, create_polling_strategy
+from app.exceptions.gemini import GeminiAPIError
+from app.models import GeminiInteraction
+from app.schemas.gemini import (
+    GeminiDeepResearchPollResponse,
+    GeminiDeepResearchResultResponse,
+    GeminiInteractionStatus,
+)
+from app.services.gemini import TERMINAL_STATUSES, GeminiService
+from app.services.gemini_registry import GeminiInteractionRegistry, gemini_interactions
+from app.services.registry import services
+from app.services.webhooks import WebhookDispatcher, webhooks
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on how long the scheduler sleeps between passes
+_MAX_TICK_SECONDS = 1.0
+
+
+def build_cursor(output_count: int, event_id: str | None = None) -> str:
+    """Build a resumable stream cursor for an interaction snapshot.
+
+    The cursor records how many output segments a client has received plus
+    the upstream event_id of that snapshot, e.g. ``"3:evt-42"``.
+
+    Args:
+        output_count: Number of output segments delivered so far.
+        event_id: Upstream event ID of the snapshot, if any.
+
+    Returns:
+        The encoded cursor string.
+    """
+    return f"{output_count}:{event_id or ''}"
+
+
+def parse_cursor(cursor: str | None) -> tuple[int, str | None]:
+    """Decode a cursor produced by build_cursor.
+
+    Unknown or malformed cursors (including bare upstream event IDs) decode
+    to an output count of 0 so the client receives the full history.
+
+    Args:
+        cursor: The cursor string, typically from a Last-Event-ID header.
+
+    Returns:
+        Tuple of (output_count, event_id).
+    """
+    if not cursor:
+        return 0, None
+    count, _, event_id = cursor.partition(":")
+    if not count.isdigit():
+        return 0, None
+    return int(count), event_id or None
+
+
+def cursor_offset(result: GeminiDeepResearchResultResponse, cursor: str | None) -> int:
+    """Return the index of the first output a client holding a cursor lacks."""
+    delivered, _ = parse_cursor(cursor)
+    return min(delivered, len(result.outputs))
+
+
+def delta_response(
+    result: GeminiDeepResearchResultResponse, offset: int
+) -> GeminiDeepResearchPollResponse:
+    """Build a poll response holding only the outputs after a cursor.
+
+    The poller keeps the full accumulated snapshot, so the delta is a slice
+    of it; nothing is re-validated.
+
+    Args:
+        result: The full cached snapshot.
+        offset: Index of the first output to return (see cursor_offset).
+
+    Returns:
+        GeminiDeepResearchPollResponse with the new outputs and the cursor
+        to resume from.
+    """
+    fields = dict(result)
+    fields["outputs"] = result.outputs[offset:]
+    return GeminiDeepResearchPollResponse.model_construct(
+        **fields,
+        output_offset=offset,
+        cursor=build_cursor(len(result.outputs), result.event_id),
+    )
+
+
+async def _wait_event(event: asyncio.Event, timeout: float) -> bool:
+    """Wait for an event to be set, for at most timeout seconds.
+
+    Unlike asyncio.wait_for before Python 3.12, this never swallows a
+    cancellation that arrives as the event is set, so tasks waiting on
+    frequently set events can always be cancelled.
+
+    Returns:
+        True if the event was set, False if the timeout elapsed first.
+    """
+    waiter = asyncio.ensure_future(event.wait())
+    try:
+        done, _ = await asyncio.wait({waiter}, timeout=timeout)
+    finally:
+        waiter.cancel()
+    return bool(done)
+
+
+class InteractionState:
+    """Cached status and change notification for one tracked interaction.
+
+    Attributes:
+        interaction_id: The Gemini interaction ID.
+        result: Latest successful poll result, if any.
+        error: Error from the latest poll, cleared by the next success.
+        last_event_id: Latest upstream event ID, sent on the next poll.
+        updated_at: Monotonic time of the latest poll (success or error).
+        last_access: Monotonic time a reader last asked for this job.
+        next_poll_at: Monotonic time the scheduler may poll this job again.
+        poll_count: Number of upstream polls made for this job.
+        poll_delay: Delay chosen after the latest poll; a cached result is
+            fresh for this long.
+        version: Incremented on every published update.
+        waiters: Number of callers blocked in wait_for_completion.
+        watched: Whether the job is polled until it finishes, with or
+            without readers (it has a completion webhook).
+    """
+
+    def __init__(self, interaction_id: str) -> None:
+        """Initialize an empty state for an interaction.
+
+        Args:
+            interaction_id: The Gemini interaction ID to track.
+        """
+        self.interaction_id = interaction_id
+        self.result: GeminiDeepResearchResultResponse | None = None
+        self.error: GeminiAPIError | None = None
+        self.last_event_id: str | None = None
+        self.updated_at: float = 0.0
+        self.last_access: float = time.monotonic()
+        self.next_poll_at: float = 0.0
+        self.poll_count: int = 0
+        self.poll_delay: float = 0.0
+        self.version: int = 0
+        self.waiters: int = 0
+        self.watched: bool = False
+        self.inflight: asyncio.Task[GeminiDeepResearchResultResponse] | None = None
+        self._changed = asyncio.Event()
+
+    @property
+    def is_terminal(self) -> bool:
+        """Whether the cached result has a terminal status."""
+        return self.result is not None and self.result.status in TERMINAL_STATUSES
+
+    def publish(
+        self,
+        result: GeminiDeepResearchResultResponse | None = None,
+        error: GeminiAPIError | None = None,
+    ) -> None:
+        """Record a poll outcome and wake everyone waiting for a change.
+
+        Args:
+            result: Successful poll result, if the poll succeeded.
+            error: Error raised by the poll, if it failed.
+        """
+        if result is not None:
+            self.result = result
+            if result.event_id:
+                self.last_event_id = result.event_id
+        self.error = error
+        self.updated_at = time.monotonic()
+        self.version += 1
+
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    async def wait_changed(self, version: int, timeout: float) -> bool:
+        """Wait until the state moves past a known version.
+
+        Args:
+            version: The version the caller has already seen.
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            True if the state changed, False if the timeout elapsed first.
+        """
+        if self.version != version:
+            return True
+        return await _wait_event(self._changed, timeout)
+
+
+class GeminiStatusPoller:
+    """Polls tracked Gemini interactions from one scheduler loop.
+
+    The scheduler task starts lazily on the running event loop the first time
+    an interaction is tracked, and is stopped by the application lifespan.
+
+    Attributes:
+        _service_factory: Returns the GeminiService used for upstream polls.
+        _polling: Strategy deciding the delay between polls of the same job.
+        _max_wait: Default seconds wait_for_completion and iter_updates follow
+            a job (poll_interval * max_poll_attempts).
+        _max_poll_attempts: Poll budget reported when a wait times out.
+        _concurrency: Maximum concurrent upstream polls.
+        _idle_timeout: Seconds without readers before polling stops.
+        _retention: Seconds a finished job stays cached.
+        _lease: Seconds a background polling claim lasts unless renewed.
+        _registry: Interaction registry that poll results are written to.
+        _webhooks: Dispatcher of completion webhooks.
+        _poller_id: ID of this poller in registry claims.
+        _states: Tracked interactions keyed by interaction ID.
+        _owned: Interactions this poller holds the background polling of.
+        _claim_requests: Interactions to claim on the next scheduler pass.
+        _claims_due: Monotonic time claims are next renewed.
+    """
+
+    def __init__(
+        self,
+        service_factory: Callable[[], GeminiService] | None = None,
+        *,
+        poll_interval: float | None = None,
+        polling: PollingStrategy | None = None,
+        max_poll_attempts: int | None = None,
+        concurrency: int | None = None,
+        idle_timeout: float | None = None,
+        retention: float | None = None,
+        lease: float | None = None,
+        registry: GeminiInteractionRegistry | None = None,
+        webhook_dispatcher: WebhookDispatcher | None = None,
+    ) -> None:
+        """Initialize the poller with configuration from settings.gemini.
+
+        Args:
+            service_factory: Optional factory for the GeminiService. Defaults
+                to the process-wide instance from the service registry.
+            poll_interval: Fixed polling interval, overriding the configured
+                strategy.
+            polling: Polling strategy, overriding the configured one.
+            max_poll_attempts: Override for settings.gemini.max_poll_attempts.
+            concurrency: Override for settings.gemini.status_poll_concurrency.
+            idle_timeout: Override for settings.gemini.status_idle_timeout.
+            retention: Override for settings.gemini.status_retention.
+            lease: Override for settings.gemini.status_lease.
+            registry: Interaction registry to persist poll results to.
+                Defaults to the process-wide registry.
+            webhook_dispatcher: Dispatcher of completion webhooks. Defaults
+                to the process-wide dispatcher.
+        """
+        gemini_settings = settings.gemini
+
+        self._service_factory: Callable[[], GeminiService] = service_factory or (
+            lambda: services.get(GeminiService)
+        )
+        if polling is None:
+            polling = (
+                FixedPolling(poll_interval)
+                if poll_interval
+                else create_polling_strategy(gemini_settings)
+            )
+        self._polling = polling
+        self._max_poll_attempts = max_poll_attempts or gemini_settings.max_poll_attempts
+        self._max_wait = float(
+            (poll_interval or gemini_settings.poll_interval) * self._max_poll_attempts
+        )
+        self._concurrency = concurrency or gemini_settings.status_poll_concurrency
+        self._idle_timeout = float(idle_timeout or gemini_settings.status_idle_timeout)
+        self._retention = float(
+            retention if retention is not None else gemini_settings.status_retention
+        )
+
+        self._lease = float(lease or gemini_settings.status_lease)
+
+        self._registry = registry or gemini_interactions
+        self._webhooks = webhook_dispatcher or webhooks
+        self._poller_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self._states: dict[str, InteractionState] = {}
+        self._owned: set[str] = set()
+        self._claim_requests: set[str] = set()
+        self._claims_due = 0.0
+        self._task: asyncio.Task[None] | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def _ensure_running(self) -> None:
+        """Start the scheduler on the running loop if it is not running there.
+
+        Cached states hold loop-bound primitives, so they are dropped when the
+        scheduler moves to a new event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._task is not None and self._task.get_loop() is loop:
+            if not self._task.done():
+                return
+        elif self._task is not None:
+            self._states.clear()
+            self._owned.clear()
+            self._claim_requests.clear()
+            self._claims_due = 0.0
+
+        self._wakeup = asyncio.Event()
+        self._semaphore = asyncio.Semaphore(self._concurrency)
+        # Tasks copy the current context; the scheduler outlives the request
+        # that happens to start it and must not inherit its deadline
+        with deadline_scope(None):
+            self._task = loop.create_task(self._run(), name="gemini-status-poller")
+
+    async def stop(self) -> None:
+        """Stop the scheduler, release its claims and drop all cached state."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            if task.get_loop() is asyncio.get_running_loop():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        for state in self._states.values():
+            if state.inflight is not None and not state.inflight.done():
+                state.inflight.cancel()
+        self._states.clear()
+        self._claim_requests.clear()
+        owned, self._owned = self._owned, set()
+        if owned:
+            # Lets another process take them over without waiting for expiry
+            try:
+                await asyncio.to_thread(
+                    self._registry.release, list(owned), self._poller_id
+                )
+            except Exception:
+                logger.exception("Failed to release Gemini polling claims")
+
+    async def resume(self) -> int:
+        """Claim and track the registry's unfinished interactions after a restart.
+
+        The scheduler then polls each of them, updating their recorded
+        status, and keeps them cached for the idle timeout (watched ones
+        until they finish). Interactions claimed by another live process are
+        left to it.
+
+        Returns:
+            Number of interactions tracked.
+        """
+        # Runs the scheduler even with nothing to resume, so it adopts
+        # interactions of processes that exit later
+        self._ensure_running()
+        interactions = await asyncio.to_thread(
+            self._registry.claim, self._poller_id, self._lease
+        )
+        for interaction in interactions:
+            state = self.track(interaction.interaction_id)
+            state.watched = interaction.callback_url is not None
+            self._owned.add(interaction.interaction_id)
+        self._claims_due = time.monotonic() + self._lease / 3
+        if interactions:
+            logger.info(
+                "Resumed polling %d unfinished Gemini interactions",
+                len(interactions),
+            )
+        return len(interactions)
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def track(self, interaction_id: str, *, watch: bool = False) -> InteractionState:
+        """Start (or keep) tracking an interaction and mark it as read.
+
+        Args:
+            interaction_id: The Gemini interaction ID.
+            watch: Keep polling the interaction until it finishes, even
+                without readers. The scheduler first claims it in the
+                registry, so it must have been recorded with a callback URL.
+
+        Returns:
+            The shared InteractionState for the interaction.
+        """
+        self._ensure_running()
+        state = self._states.get(interaction_id)
+        if state is None:
+            state = InteractionState(interaction_id)
+            self._states[interaction_id] = state
+            self._wake()
+        state.last_access = time.monotonic()
+        if watch and not state.watched:
+            self._claim_requests.add(interaction_id)
+            self._wake()
+        return state
+
+    def get_cached(
+        self, interaction_id: str
+    ) -> GeminiDeepResearchResultResponse | None:
+        """Return the cached result for an interaction without polling.
+
+        Args:
+            interaction_id: The Gemini interaction ID.
+
+        Returns:
+            The latest cached result, or None if nothing is cached.
+        """
+        state = self._states.get(interaction_id)
+        return state.result if state is not None else None
+
+    def invalidate(self, interaction_id: str) -> None:
+        """Force the next read of an interaction to poll upstream.
+
+        Args:
+            interaction_id: The Gemini interaction ID.
+        """
+        state = self._states.get(interaction_id)
+        if state is not None:
+            state.updated_at = 0.0
+            state.next_poll_at = 0.0
+            self._wake()
+
+    async def get_status(
+        self,
+        interaction_id: str,
+    ) -> GeminiDeepResearchResultResponse:
+        """Return the current status, polling upstream only when stale.
+
+        A cached result younger than the delay chosen after its poll (or any
+        terminal result) is returned directly; otherwise this joins the in-flight poll
+        for the interaction or starts one.
+
+        Args:
+            interaction_id: The Gemini interaction ID.
+
+        Returns:
+            GeminiDeepResearchResultResponse with current status and outputs.
+
+        Raises:
+            GeminiAPIError: If the upstream poll fails.
+        """
+        state = self.track(interaction_id)
+        if state.result is not None and (
+            state.is_terminal or time.monotonic() - state.updated_at < state.poll_delay
+        ):
+            return state.result
+        return await self._refresh(state)
+
+    async def wait_for_change(
+        self,
+        interaction_id: str,
+        cursor: str | None,
+        timeout: float,
+    ) -> GeminiDeepResearchResultResponse:
+        """Return the status once it differs from a client's cursor (long poll).
+
+        The current status is returned at once if it already differs from
+        the cursor (or no cursor is given) or the job has finished.
+        Otherwise this waits on the interaction's change notification, while
+        the scheduler keeps polling upstream on its usual schedule, until a
+        new snapshot arrives or the timeout elapses.
+
+        Args:
+            interaction_id: The Gemini interaction ID.
+            cursor: Cursor (see build_cursor) of the snapshot the client has.
+            timeout: Maximum seconds to wait for a change.
+
+        Returns:
+            The newer GeminiDeepResearchResultResponse, or the unchanged
+            current one if the timeout elapsed.
+
+        Raises:
+            GeminiAPIError: If an upstream poll fails.
+        """
+        result = await self.get_status(interaction_id)
+        deadline = time.monotonic() + timeout
+        state = self.track(interaction_id)
+        state.waiters += 1
+        self._wake()
+
+        try:
+            while (
+                cursor == build_cursor(len(result.outputs), result.event_id)
+                and result.status not in TERMINAL_STATUSES
+            ):
+                seen_version = state.version
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if not await state.wait_changed(seen_version, remaining):
+                    break
+                state.last_access = time.monotonic()
+                if state.error is not None:
+                    raise state.error
+                if state.result is not None:
+                    result = state.result
+        finally:
+            state.waiters -= 1
+        return result
+
+    async def wait_for_completion(
+        self,
+        interaction_id: str,
+        timeout: float | None = None,
+    ) -> GeminiDeepResearchResultResponse:
+        """Wait for an interaction to reach a terminal status.
+
+        All callers waiting on the same interaction share the scheduler's
+        upstream polls. Poll errors seen while waiting are raised to every
+        waiter, matching GeminiService.wait_for_completion.
+
+        Args:
+            interaction_id: The Gemini interaction ID.
+            timeout: Optional maximum seconds to wait. Defaults to
+                poll_interval * max_poll_attempts.
+
+        Returns:
+            GeminiDeepResearchResultResponse with final status and results.
+
+        Raises:
+            GeminiAPIError: If polling fails, the wait times out, or the job
+                failed or was cancelled.
+        """
+        limit = timeout if timeout is not None else self._max_wait
+        deadline = time.monotonic() + limit
+        state = self.track(interaction_id)
+        seen_version = state.version
+        state.waiters += 1
+        self._wake()
+
+        try:
+            while True:
+                if state.is_terminal and state.result is not None:
+                    service = self._service_factory()
+                    service.raise_for_terminal_failure(interaction_id, state.result)
+                    return state.result
+
+                if state.version != seen_version and state.error is not None:
+                    raise state.error
+                seen_version = state.version
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                await state.wait_changed(seen_version, remaining)
+                state.last_access = time.monotonic()
+        finally:
+            state.waiters -= 1
+
+        raise GeminiAPIError.max_polls_exceeded(
+            message=f"Maximum polling attempts ({self._max_poll_attempts}) exceeded.",
+            details={
+                "interaction_id": interaction_id,
+                "attempts": self._max_poll_attempts,
+                "timeout": limit,
+            },
+        )
+
+    async def iter_updates(
+        self,
+        interaction_id: str,
+        *,
+        heartbeat: float,
+        timeout: float | None = None,
+    ) -> AsyncIterator[GeminiDeepResearchResultResponse | None]:
+        """Yield each new snapshot of an interaction until it finishes.
+
+        The caller counts as a waiter, so the interaction keeps being polled
+        for as long as the iterator is consumed. The latest cached snapshot
+        (if any) is yielded first.
+
+        Args:
+            interaction_id: The Gemini interaction ID.
+            heartbeat: Seconds after which None is yielded if nothing changed,
+                letting streaming callers send keep-alive frames.
+            timeout: Optional maximum seconds to follow the interaction.
+                Defaults to poll_interval * max_poll_attempts.
+
+        Yields:
+            Each new GeminiDeepResearchResultResponse, or None on heartbeat.
+
+        Raises:
+            GeminiAPIError: If an upstream poll fails while following, or the
+                interaction is still running when the timeout elapses.
+        """
+        limit = timeout if timeout is not None else self._max_wait
+        deadline = time.monotonic() + limit
+        state = self.track(interaction_id)
+        seen_version = -1 if state.result is not None else state.version
+        state.waiters += 1
+        self._wake()
+
+        try:
+            while True:
+                if state.version != seen_version:
+                    if state.error is not None and seen_version != -1:
+                        raise state.error
+                    seen_version = state.version
+                    if state.result is not None:
+                        yield state.result
+                    if state.is_terminal:
+                        return
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                changed = await state.wait_changed(
+                    seen_version, min(heartbeat, remaining)
+                )
+                state.last_access = time.monotonic()
+                if not changed:
+                    yield None
+        finally:
+            state.waiters -= 1
+
+        raise GeminiAPIError.max_polls_exceeded(
+            message=f"Maximum polling attempts ({self._max_poll_attempts}) exceeded.",
+            details={
+                "interaction_id": interaction_id,
+                "attempts": self._max_poll_attempts,
+                "timeout": limit,
+            },
+        )
+
+    # -------------------------------------------------------------------------
+    # Scheduler
+    # -------------------------------------------------------------------------
+
+    def _wake(self) -> None:
+        """Wake the scheduler so new work is picked up immediately."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _should_poll(self, state: InteractionState, now: float) -> bool:
+        """Check whether the scheduler should poll an interaction now."""
+        if state.is_terminal or state.next_poll_at > now:
+            return False
+        if state.inflight is not None and not state.inflight.done():
+            return False
+        if state.waiters > 0 or state.watched:
+            return True
+        return now - state.last_access < self._idle_timeout
+
+    def _evict(self, now: float) -> None:
+        """Drop finished jobs past retention and idle unfinished jobs."""
+        for interaction_id, state in list(self._states.items()):
+            if state.waiters > 0 or (state.watched and not state.is_terminal):
+                continue
+            if state.inflight is not None and not state.inflight.done():
+                continue
+            if state.is_terminal:
+                expired = now - state.updated_at > self._retention
+            else:
+                expired = now - state.last_access > self._idle_timeout
+            if expired:
+                del self._states[interaction_id]
+
+    async def _refresh_claims(self, now: float) -> None:
+        """Renew held claims, take requested ones and adopt orphaned ones.
+
+        Held interactions that were evicted or have finished are released.
+        Watched interactions whose holder stopped renewing its lease are
+        taken over; held ones another process took over stop being watched.
+        """
+        requested, self._claim_requests = self._claim_requests, set()
+        previous = set(self._owned)
+        self._claims_due = now + self._lease / 3
+        try:
+            done = [
+                interaction_id
+                for interaction_id in previous
+                if (state := self._states.get(interaction_id)) is None
+                or state.is_terminal
+            ]
+            if done:
+                await asyncio.to_thread(self._registry.release, done, self._poller_id)
+            held = (previous - set(done)) | requested
+            claimed = await asyncio.to_thread(
+                self._registry.claim, self._poller_id, self._lease, list(held)
+            )
+            orphans = await asyncio.to_thread(
+                self._registry.claim, self._poller_id, self._lease, watched_only=True
+            )
+        except Exception:
+            self._claim_requests |= requested
+            raise
+
+        owned: set[str] = set()
+        for interaction in (*claimed, *orphans):
+            owned.add(interaction.interaction_id)
+            state = self._states.get(interaction.interaction_id)
+            if state is None:
+                state = InteractionState(interaction.interaction_id)
+                self._states[interaction.interaction_id] = state
+            state.watched = interaction.callback_url is not None
+        for interaction_id in held - owned:
+            if (state := self._states.get(interaction_id)) is not None:
+                state.watched = False
+        # Keeps what resume claimed meanwhile
+        self._owned = owned | (self._owned - previous)
+
+    async def _run(self) -> None:
+        """Scheduler loop: start due polls, then sleep until the next tick."""
+        tick = min(_MAX_TICK_SECONDS, self._polling.min_interval)
+        while True:
+            if self._claim_requests or time.monotonic() >= self._claims_due:
+                try:
+                    await self._refresh_claims(time.monotonic())
+                except Exception:
+                    logger.exception("Failed to refresh Gemini polling claims")
+            try:
+                now = time.monotonic()
+                self._evict(now)
+                for state in list(self._states.values()):
+                    if self._should_poll(state, now):
+                        self._start_poll(state)
+            except Exception:
+                logger.exception("Gemini status poller pass failed")
+
+            assert self._wakeup is not None
+            self._wakeup.clear()
+            await _wait_event(self._wakeup, tick)
+
+    def _start_poll(
+        self,
+        state: InteractionState,
+    ) -> asyncio.Task[GeminiDeepResearchResultResponse]:
+        """Start a shared upstream poll for an interaction."""
+        # Guards against double starts; _poll reschedules once it finishes
+        state.next_poll_at = time.monotonic() + self._polling.min_interval
+        # A shared poll serves every reader, so it runs without the deadline
+        # of the reader that starts it
+        with deadline_scope(None):
+            task = asyncio.ensure_future(self._poll(state))
+        # Errors are delivered through the state; don't warn if nobody awaits
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        state.inflight = task
+        return task
+
+    async def _refresh(
+        self,
+        state: InteractionState,
+    ) -> GeminiDeepResearchResultResponse:
+        """Join the in-flight poll for an interaction, or start one.
+
+        The shared poll is shielded so a cancelled reader does not cancel it
+        for everyone else.
+        """
+        task = state.inflight
+        if task is None or task.done():
+            task = self._start_poll(state)
+        return await asyncio.shield(task)
+
+    async def _poll(self, state: InteractionState) -> GeminiDeepResearchResultResponse:
+        """Poll upstream once, schedule the next poll, and publish the outcome."""
+        assert self._semaphore is not None
+        result: GeminiDeepResearchResultResponse | None = None
+        async with self._semaphore:
+            try:
+                service = self._service_factory()
+                result = await service.poll_research(
+                    interaction_id=state.interaction_id,
+                    last_event_id=state.last_event_id,
+                )
+            except GeminiAPIError as exc:
+                if exc.status_code == 404:
+                    # Gemini has forgotten the job, so it will never finish
+                    state.watched = False
+                    await self._persist(
+                        self._registry.mark,
+                        state.interaction_id,
+                        GeminiInteractionStatus.FAILED,
+                        exc.message,
+                    )
+                state.publish(error=exc)
+                raise
+            finally:
+                self._schedule_next(
+                    state, result.retry_after if result is not None else None
+                )
+
+        # Persist before publishing, so readers that see a status can rely
+        # on the registry having it too
+        previous = state.result
+        if (
+            previous is None
+            or previous.status != result.status
+            or previous.event_id != result.event_id
+            or len(previous.outputs) != len(result.outputs)
+        ):
+            await self._persist(
+                self._registry.update_from_result, state.interaction_id, result
+            )
+        state.publish(result=result)
+        return result
+
+    async def _persist(
+        self, write: Callable[..., GeminiInteraction | None], *args: Any
+    ) -> None:
+        """Write a poll outcome to the registry, logging (not raising) errors.
+
+        If the write finished the interaction, its webhook is queued.
+        """
+        try:
+            finished = await asyncio.to_thread(write, *args)
+        except Exception:
+            logger.exception("Failed to record Gemini interaction %s", args[0])
+            return
+        if finished is not None:
+            self._webhooks.notify_finished(finished)
+
+    def _schedule_next(
+        self, state: InteractionState, retry_after: float | None
+    ) -> None:
+        """Pick the delay before the next poll of a job from the strategy."""
+        state.poll_delay = self._polling.next_delay(state.poll_count, retry_after)
+        state.poll_count += 1
+        state.next_poll_at = time.monotonic() + state.poll_delay
+
+
+# Process-wide poller shared by the Gemini routes
+gemini_poller = GeminiStatusPoller()
@@ -0,0 +1,422 @@
+"""Persistent registry of Gemini deep research interactions.
+
+Gemini interaction IDs used to live only in clients: the backend did not
+know who started a job or how far it had got, so anyone holding an ID could
+poll it and nothing survived a restart. Every interaction started through
+the API is now recorded here (the ``gemini_interaction`` table) with its
+owner, and the shared status poller writes back each new status, event ID
+and output count as it polls.
+
+That lets routes restrict an interaction to its owner (and superusers),
+list a user's jobs without calling Gemini, and lets a restarted backend
+resume polling the interactions that had not finished.
+
+With several API processes, the background polling of each unfinished
+interaction is claimed by one of them at a time: claim() leases it to a
+poller with ``SELECT ... FOR UPDATE SKIP LOCKED``, the holder renews the
+lease while it polls, and another process takes the interaction over once
+the lease has expired.
+
+A terminal status is final: updates only apply to unfinished interactions,
+and the update that finishes one returns it, so exactly one caller (across
+all processes) sees each interaction finish and sends its webhook. The
+webhook is recorded as delivered only once a receiver accepts it, so
+notifications lost to a restart can be sent again; claim_undelivered()
+leases them the same way, so one restarting process resends each.
+
+Each method opens its own session rather than joining the request's, so a
+status written by the poller is committed before readers are woken; the
+poller and the routes call them through asyncio.to_thread.
+
+Usage:
+    from app.services.gemini_registry import gemini_interactions
+
+    gemini_interactions.record(job.interaction_id, user.id, request.query)
+    interaction = gemini_interactions.get_for_user(interaction_id, user)
+"""
+
+import uuid
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import Engine, or_, update
+from sqlmodel import Session, col, func, select
+
+from app.core.db import engine, utc_now
+from app.models import GeminiInteraction, User
+from app.schemas.gemini import (
+    GeminiDeepResearchResultResponse,
+    GeminiInteractionStatus,
+)
+from app.services.gemini import TERMINAL_STATUSES
+
+# Stored status values that never change again
+_TERMINAL_VALUES = sorted(status.value for status in TERMINAL_STATUSES)
+
+
+class GeminiInteractionRegistry:
+    """Postgres record of Gemini interactions, their owners and status.
+
+    Attributes:
+        _engine: Database engine used for registry sessions.
+    """
+
+    def __init__(self, db_engine: Engine | None = None) -> None:
+        """Initialize the registry.
+
+        Args:
+            db_engine: Database engine. Defaults to the application engine.
+        """
+        self._engine = db_engine or engine
+
+    def record(
+        self,
+        interaction_id: str,
+        owner_id: uuid.UUID,
+        query: str,
+        status: GeminiInteractionStatus = GeminiInteractionStatus.PENDING,
+        callback_url: str | None = None,
+    ) -> GeminiInteraction:
+        """Record a newly started interaction.
+
+        Args:
+            interaction_id: Interaction ID returned by Gemini.
+            owner_id: ID of the user who started it.
+            query: The research query.
+            status: Initial status reported by Gemini.
+            callback_url: URL to notify when the interaction finishes.
+
+        Returns:
+            The stored interaction.
+        """
+        now = utc_now()
+        interaction = GeminiInteraction(
+            interaction_id=interaction_id,
+            owner_id=owner_id,
+            query=query,
+            status=status.value,
+            callback_url=callback_url,
+            created_at=now,
+            updated_at=now,
+        )
+        with Session(self._engine) as session:
+            session.add(interaction)
+            session.commit()
+            session.refresh(interaction)
+        return interaction
+
+    def get(self, interaction_id: str) -> GeminiInteraction | None:
+        """Return an interaction by ID."""
+        with Session(self._engine) as session:
+            return session.get(GeminiInteraction, interaction_id)
+
+    def get_for_user(self, interaction_id: str, user: User) -> GeminiInteraction | None:
+        """Return an interaction if the user may see it.
+
+        Users see the interactions they started; superusers see every one.
+
+        Args:
+            interaction_id: Interaction ID.
+            user: The requesting user.
+
+        Returns:
+            The interaction, or None if it is unknown or not visible.
+        """
+        interaction = self.get(interaction_id)
+        if interaction is None:
+            return None
+        if interaction.owner_id != user.id and not user.is_superuser:
+            return None
+        return interaction
+
+    def get_many_for_user(
+        self, interaction_ids: list[str], user: User
+    ) -> dict[str, GeminiInteraction]:
+        """Return the interactions among the IDs that the user may see.
+
+        Args:
+            interaction_ids: Interaction IDs.
+            user: The requesting user. Superusers see every interaction.
+
+        Returns:
+            Visible interactions keyed by ID; unknown and foreign IDs are
+            left out.
+        """
+        query = select(GeminiInteraction).where(
+            col(GeminiInteraction.interaction_id).in_(interaction_ids)
+        )
+        if not user.is_superuser:
+            query = query.where(GeminiInteraction.owner_id == user.id)
+        with Session(self._engine) as session:
+            return {
+                interaction.interaction_id: interaction
+                for interaction in session.exec(query).all()
+            }
+
+    def list_for_user(
+        self,
+        user: User,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        status: GeminiInteractionStatus | None = None,
+    ) -> tuple[list[GeminiInteraction], int]:
+        """List the interactions a user may see, newest first.
+
+        Args:
+            user: The requesting user. Superusers see every interaction.
+            skip: Number of interactions to skip.
+            limit: Maximum number of interactions to return.
+            status: Only return interactions with this status.
+
+        Returns:
+            Tuple of (interactions, total count matching the filters).
+        """
+        count_query = select(func.count()).select_from(GeminiInteraction)
+        query = select(GeminiInteraction)
+        if not user.is_superuser:
+            count_query = count_query.where(GeminiInteraction.owner_id == user.id)
+            query = query.where(GeminiInteraction.owner_id == user.id)
+        if status is not None:
+            count_query = count_query.where(GeminiInteraction.status == status.value)
+            query = query.where(GeminiInteraction.status == status.value)
+
+        query = (
+            query.order_by(col(GeminiInteraction.created_at).desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        with Session(self._engine) as session:
+            count = session.exec(count_query).one()
+            return list(session.exec(query).all()), count
+
+    def claim(
+        self,
+        poller_id: str,
+        lease: float,
+        interaction_ids: list[str] | None = None,
+        *,
+        watched_only: bool = False,
+    ) -> list[GeminiInteraction]:
+        """Take or renew the background polling of unfinished interactions.
+
+        An interaction can be claimed when no process holds it, when the
+        caller already holds it (renewing its lease) or when the holder's
+        lease has expired. Rows locked by another process's concurrent claim
+        are skipped, so each interaction is held by one process at a time.
+
+        Args:
+            poller_id: ID of the claiming process.
+            lease: Seconds the claim lasts unless renewed.
+            interaction_ids: Only claim these interactions. Defaults to every
+                claimable one.
+            watched_only: Only claim interactions with a callback URL.
+
+        Returns:
+            The interactions now held by the caller.
+        """
+        if interaction_ids is not None and not interaction_ids:
+            return []
+
+        now = utc_now()
+        claimable = select(GeminiInteraction.interaction_id).where(
+            col(GeminiInteraction.status).not_in(_TERMINAL_VALUES),
+            or_(
+                col(GeminiInteraction.poller_id).is_(None),
+                col(GeminiInteraction.poller_id) == poller_id,
+                col(GeminiInteraction.poll_lease_expires_at) < now,
+            ),
+        )
+        if interaction_ids is not None:
+            claimable = claimable.where(
+                col(GeminiInteraction.interaction_id).in_(interaction_ids)
+            )
+        if watched_only:
+            claimable = claimable.where(
+                col(GeminiInteraction.callback_url).is_not(None)
+            )
+        # A locking CTE is evaluated once, unlike an IN (subquery)
+        claimable_cte = claimable.with_for_update(skip_locked=True).cte("claimable")
+        statement = (
+            update(GeminiInteraction)
+            .where(
+                col(GeminiInteraction.interaction_id) == claimable_cte.c.interaction_id
+            )
+            .values(
+                poller_id=poller_id,
+                poll_lease_expires_at=now + timedelta(seconds=lease),
+            )
+            .returning(GeminiInteraction)
+        )
+        with Session(self._engine, expire_on_commit=False) as session:
+            claimed = list(session.execute(statement).scalars().all())
+            session.commit()
+        return claimed
+
+    def release(self, interaction_ids: list[str], poller_id: str) -> None:
+        """Give up the background polling of interactions a process holds.
+
+        Args:
+            interaction_ids: Interaction IDs.
+            poller_id: ID of the process holding them; others' claims are
+                left alone.
+        """
+        if not interaction_ids:
+            return
+        statement = (
+            update(GeminiInteraction)
+            .where(
+                col(GeminiInteraction.interaction_id).in_(interaction_ids),
+                col(GeminiInteraction.poller_id) == poller_id,
+            )
+            .values(poller_id=None, poll_lease_expires_at=None)
+        )
+        with Session(self._engine) as session:
+            session.execute(statement)
+            session.commit()
+
+    def claim_undelivered(
+        self, finished_since: datetime, lease: float
+    ) -> list[GeminiInteraction]:
+        """Take the finished interactions whose webhook was never accepted.
+
+        Interactions already leased by another process are skipped, as are
+        rows locked by a concurrent claim, so each notification is resent by
+        one process at a time.
+
+        Args:
+            finished_since: Only interactions completed at or after this time.
+            lease: Seconds before another process may resend them.
+
+        Returns:
+            Interactions with a callback URL and no delivery recorded, now
+            leased to the caller.
+        """
+        now = utc_now()
+        claimable = (
+            select(GeminiInteraction.interaction_id)
+            .where(
+                col(GeminiInteraction.status).in_(_TERMINAL_VALUES),
+                col(GeminiInteraction.callback_url).is_not(None),
+                col(GeminiInteraction.webhook_delivered_at).is_(None),
+                col(GeminiInteraction.completed_at) >= finished_since,
+                or_(
+                    col(GeminiInteraction.webhook_lease_expires_at).is_(None),
+                    col(GeminiInteraction.webhook_lease_expires_at) < now,
+                ),
+            )
+            .with_for_update(skip_locked=True)
+            .cte("claimable")
+        )
+        statement = (
+            update(GeminiInteraction)
+            .where(col(GeminiInteraction.interaction_id) == claimable.c.interaction_id)
+            .values(webhook_lease_expires_at=now + timedelta(seconds=lease))
+            .returning(GeminiInteraction)
+        )
+        with Session(self._engine, expire_on_commit=False) as session:
+            claimed = list(session.execute(statement).scalars().all())
+            session.commit()
+        return claimed
+
+    def release_webhook(self, interaction_id: str) -> None:
+        """Let the next restart resend an interaction's unaccepted webhook."""
+        statement = (
+            update(GeminiInteraction)
+            .where(col(GeminiInteraction.interaction_id) == interaction_id)
+            .values(webhook_lease_expires_at=None)
+        )
+        with Session(self._engine) as session:
+            session.execute(statement)
+            session.commit()
+
+    def mark_webhook_delivered(self, interaction_id: str) -> None:
+        """Record that an interaction's completion webhook was accepted."""
+        statement = (
+            update(GeminiInteraction)
+            .where(col(GeminiInteraction.interaction_id) == interaction_id)
+            .values(webhook_delivered_at=utc_now())
+        )
+        with Session(self._engine) as session:
+            session.execute(statement)
+            session.commit()
+
+    def _update(
+        self, interaction_id: str, values: dict[str, Any]
+    ) -> GeminiInteraction | None:
+        """Update an unfinished interaction.
+
+        Returns:
+            The updated interaction if this update finished it, else None.
+        """
+        statement = (
+            update(GeminiInteraction)
+            .where(
+                col(GeminiInteraction.interaction_id) == interaction_id,
+                col(GeminiInteraction.status).not_in(_TERMINAL_VALUES),
+            )
+            .values(updated_at=utc_now(), **values)
+            .returning(GeminiInteraction)
+        )
+        with Session(self._engine, expire_on_commit=False) as session:
+            interaction: GeminiInteraction | None = (
+                session.execute(statement).scalars().one_or_none()
+            )
+            session.commit()
+        if interaction is None or interaction.status not in _TERMINAL_VALUES:
+            return None
+        return interaction
+
+    def update_from_result(
+        self, interaction_id: str, result: GeminiDeepResearchResultResponse
+    ) -> GeminiInteraction | None:
+        """Store the status reported by a poll of an interaction.
+
+        Args:
+            interaction_id: Interaction ID.
+            result: The poll result.
+
+        Returns:
+            The interaction if this result finished it; None if it is still
+            running, already finished, or not recorded.
+        """
+        values: dict[str, Any] = {
+            "status": result.status.value,
+            "output_count": len(result.outputs),
+            "error_message": result.error_message,
+        }
+        if result.event_id:
+            values["last_event_id"] = result.event_id
+        if result.status in TERMINAL_STATUSES:
+            values["completed_at"] = result.completed_at or utc_now()
+        return self._update(interaction_id, values)
+
+    def mark(
+        self,
+        interaction_id: str,
+        status: GeminiInteractionStatus,
+        error_message: str | None = None,
+    ) -> GeminiInteraction | None:
+        """Set the status of an interaction without a poll result.
+
+        Used when the backend learns the outcome another way, e.g. after a
+        cancel request or when Gemini no longer knows the interaction.
+
+        Args:
+            interaction_id: Interaction ID.
+            status: The new status.
+            error_message: Optional reason, for failed interactions.
+
+        Returns:
+            The interaction if this call finished it, else None.
+        """
+        values: dict[str, Any] = {"status": status.value}
+        if error_message is not None:
+            values["error_message"] = error_message
+        if status in TERMINAL_STATUSES:
+            values["completed_at"] = utc_now()
+        return self._update(interaction_id, values)
+
+
+# Process-wide registry shared by the Gemini routes and status poller
+gemini_interactions = GeminiInteractionRegistry()
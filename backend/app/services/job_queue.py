@@ -0,0 +1,333 @@
+"""Postgres-backed queue of background research jobs.
+
+Deep research calls to Perplexity and You.com can take minutes. Instead of
+holding an API worker for that long, routes submit them here as jobs and
+return immediately; separate worker processes (python -m app.worker) claim
+and run them, and clients poll for the status and result.
+
+Workers claim jobs with ``SELECT ... FOR UPDATE SKIP LOCKED``, so any number
+of workers on any number of nodes can drain the queue without handing the
+same job to two of them. A claimed job is leased to its worker, which renews
+the lease while the job runs; if the worker dies, the lease expires and the
+job is claimed again, up to JOB_QUEUE_MAX_ATTEMPTS times.
+
+Every call is its own short transaction, so a submitted, claimed or
+finished job is visible to the API and the other workers as soon as the call
+returns. The job routes are sync endpoints that call it directly; the async
+worker loop goes through asyncio.to_thread.
+
+Usage:
+    from app.services.job_queue import job_queue
+
+    job = job_queue.submit(user.id, "perplexity", request.model_dump())
+    jobs = job_queue.claim("worker-1", limit=4)
+"""
+
+import uuid
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, Engine, and_, or_, update
+from sqlmodel import Session, col, select
+
+from app.core.config import JobQueueSettings, settings
+from app.core.db import engine, utc_now
+from app.models import ResearchJob, ResearchJobProvider, User
+
+
+class JobQueue:
+    """Durable queue of research jobs with leased, skip-locked claims.
+
+    Attributes:
+        _engine: Database engine used for queue sessions.
+        _settings: Queue configuration.
+    """
+
+    def __init__(
+        self,
+        db_engine: Engine | None = None,
+        queue_settings: JobQueueSettings | None = None,
+    ) -> None:
+        """Initialize the queue.
+
+        Args:
+            db_engine: Database engine. Defaults to the application engine.
+            queue_settings: Override for settings.job_queue.
+        """
+        self._engine = db_engine or engine
+        self._settings = queue_settings or settings.job_queue
+
+    def submit(
+        self,
+        owner_id: uuid.UUID,
+        provider: ResearchJobProvider,
+        request: dict[str, Any],
+    ) -> ResearchJob:
+        """Queue a research request.
+
+        Args:
+            owner_id: ID of the user submitting the job.
+            provider: Provider to run the research with.
+            request: The provider's deep research request, JSON-encodable.
+
+        Returns:
+            The queued job.
+        """
+        job = ResearchJob(
+            owner_id=owner_id,
+            provider=provider,
+            request=request,
+            created_at=utc_now(),
+        )
+        with Session(self._engine) as session:
+            session.add(job)
+            session.commit()
+            session.refresh(job)
+        return job
+
+    def get(self, job_id: uuid.UUID) -> ResearchJob | None:
+        """Return a job by ID."""
+        with Session(self._engine) as session:
+            return session.get(ResearchJob, job_id)
+
+    def get_for_user(
+        self,
+        job_id: uuid.UUID,
+        user: User,
+        provider: ResearchJobProvider,
+    ) -> ResearchJob | None:
+        """Return a provider's job if the user may see it.
+
+        Users see their own jobs; superusers see every job.
+
+        Args:
+            job_id: ID of the job.
+            user: The requesting user.
+            provider: Provider the job must belong to.
+
+        Returns:
+            The job, or None if it does not exist or is not visible.
+        """
+        job = self.get(job_id)
+        if job is None or job.provider != provider:
+            return None
+        if job.owner_id != user.id and not user.is_superuser:
+            return None
+        return job
+
+    def get_many_for_user(
+        self, job_ids: Iterable[uuid.UUID], user: User
+    ) -> dict[uuid.UUID, ResearchJob]:
+        """Return the jobs among the IDs that the user may see.
+
+        Args:
+            job_ids: IDs of the jobs, of any provider.
+            user: The requesting user. Superusers see every job.
+
+        Returns:
+            Visible jobs keyed by ID; unknown and foreign IDs are left out.
+        """
+        query = select(ResearchJob).where(col(ResearchJob.id).in_(list(job_ids)))
+        if not user.is_superuser:
+            query = query.where(ResearchJob.owner_id == user.id)
+        with Session(self._engine) as session:
+            return {job.id: job for job in session.exec(query).all()}
+
+    def _fail_abandoned(self, session: Session, now: datetime) -> None:
+        """Fail running jobs whose lease expired after their last attempt."""
+        session.execute(
+            update(ResearchJob)
+            .where(
+                col(ResearchJob.status) == "running",
+                col(ResearchJob.lease_expires_at) < now,
+                col(ResearchJob.attempts) >= self._settings.max_attempts,
+            )
+            .values(
+                status="failed",
+                finished_at=now,
+                lease_expires_at=None,
+                error={
+                    "status_code": 500,
+                    "error_code": "job_abandoned",
+                    "message": (
+                        "The job was interrupted "
+                        f"{self._settings.max_attempts} times and was given up."
+                    ),
+                    "details": None,
+                },
+            )
+        )
+
+    def claim(self, worker_id: str, limit: int) -> list[ResearchJob]:
+        """Claim up to limit runnable jobs for a worker, oldest first.
+
+        Runnable jobs are queued ones and running ones whose lease expired.
+        Rows locked by another worker's concurrent claim are skipped.
+
+        Args:
+            worker_id: ID of the claiming worker.
+            limit: Maximum number of jobs to claim.
+
+        Returns:
+            The claimed jobs, now running and leased to the worker.
+        """
+        if limit < 1:
+            return []
+
+        now = utc_now()
+        # A CTE, not an IN (subquery): Postgres may re-run a subquery for
+        # each candidate row, claiming more than limit jobs. A locking CTE is
+        # never inlined, so it is evaluated exactly once.
+        claimable = (
+            select(ResearchJob.id)
+            .where(
+                or_(
+                    col(ResearchJob.status) == "queued",
+                    and_(
+                        col(ResearchJob.status) == "running",
+                        col(ResearchJob.lease_expires_at) < now,
+                    ),
+                )
+            )
+            .order_by(col(ResearchJob.created_at))
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte("claimable")
+        )
+        statement = (
+            update(ResearchJob)
+            .where(col(ResearchJob.id) == claimable.c.id)
+            .values(
+                status="running",
+                worker_id=worker_id,
+                attempts=ResearchJob.attempts + 1,
+                started_at=now,
+                lease_expires_at=now + timedelta(seconds=self._settings.lease),
+            )
+            .returning(ResearchJob)
+        )
+        with Session(self._engine, expire_on_commit=False) as session:
+            self._fail_abandoned(session, now)
+            jobs = list(session.execute(statement).scalars().all())
+            session.commit()
+        # RETURNING does not preserve the subquery's order
+        return sorted(jobs, key=lambda job: job.created_at)
+
+    def _update_held(
+        self,
+        session: Session,
+        job_ids: Iterable[uuid.UUID],
+        worker_id: str,
+        values: dict[str, Any],
+    ) -> int:
+        """Update running jobs still leased to a worker."""
+        result = cast(
+            CursorResult[Any],
+            session.execute(
+                update(ResearchJob)
+                .where(
+                    col(ResearchJob.id).in_(list(job_ids)),
+                    col(ResearchJob.status) == "running",
+                    col(ResearchJob.worker_id) == worker_id,
+                )
+                .values(**values)
+            ),
+        )
+        session.commit()
+        return result.rowcount
+
+    def renew(self, job_ids: Iterable[uuid.UUID], worker_id: str) -> set[uuid.UUID]:
+        """Extend the leases of jobs a worker is still running.
+
+        Args:
+            job_ids: IDs of the worker's running jobs.
+            worker_id: ID of the worker.
+
+        Returns:
+            IDs of the jobs whose leases were renewed; the worker no longer
+            holds the others.
+        """
+        expires_at = utc_now() + timedelta(seconds=self._settings.lease)
+        statement = (
+            update(ResearchJob)
+            .where(
+                col(ResearchJob.id).in_(list(job_ids)),
+                col(ResearchJob.status) == "running",
+                col(ResearchJob.worker_id) == worker_id,
+            )
+            .values(lease_expires_at=expires_at)
+            .returning(col(ResearchJob.id))
+        )
+        with Session(self._engine) as session:
+            renewed = set(session.execute(statement).scalars().all())
+            session.commit()
+        return renewed
+
+    def complete(
+        self, job_id: uuid.UUID, worker_id: str, result: dict[str, Any]
+    ) -> bool:
+        """Store a job's result and mark it succeeded.
+
+        Args:
+            job_id: ID of the job.
+            worker_id: ID of the worker that ran it.
+            result: The provider response, JSON-encodable.
+
+        Returns:
+            False if the job is no longer leased to the worker.
+        """
+        values = {
+            "status": "succeeded",
+            "result": result,
+            "finished_at": utc_now(),
+            "lease_expires_at": None,
+        }
+        with Session(self._engine) as session:
+            return self._update_held(session, [job_id], worker_id, values) == 1
+
+    def fail(self, job_id: uuid.UUID, worker_id: str, error: dict[str, Any]) -> bool:
+        """Store a job's error and mark it failed.
+
+        Args:
+            job_id: ID of the job.
+            worker_id: ID of the worker that ran it.
+            error: The error, with status_code, error_code, message and details.
+
+        Returns:
+            False if the job is no longer leased to the worker.
+        """
+        values = {
+            "status": "failed",
+            "error": error,
+            "finished_at": utc_now(),
+            "lease_expires_at": None,
+        }
+        with Session(self._engine) as session:
+            return self._update_held(session, [job_id], worker_id, values) == 1
+
+    def release(self, job_id: uuid.UUID, worker_id: str) -> bool:
+        """Put a job a worker stopped running back in the queue.
+
+        The interrupted claim does not count towards max_attempts.
+
+        Args:
+            job_id: ID of the job.
+            worker_id: ID of the worker releasing it.
+
+        Returns:
+            False if the job is no longer leased to the worker.
+        """
+        values = {
+            "status": "queued",
+            "worker_id": None,
+            "started_at": None,
+            "lease_expires_at": None,
+            "attempts": ResearchJob.attempts - 1,
+        }
+        with Session(self._engine) as session:
+            return self._update_held(session, [job_id], worker_id, values) == 1
+
+
+# Process-wide job queue used by the research routes and workers
+job_queue = JobQueue()
@@ -1,27 +1,111 @@
 """Perplexity Sonar API service layer.
 
 This module provides the PerplexityService class which encapsulates all interactions
-with the Perplexity Sonar API for deep research queries. It uses httpx AsyncClient
-for HTTP requests with Bearer token authentication.
+with the Perplexity Sonar API for deep research queries. It uses the shared
+pooled httpx AsyncClient for HTTP requests with Bearer token authentication.
 
 Usage:
     from app.services.perplexity import PerplexityService
 
     service = PerplexityService()
     result = await service.deep_research(request)
+
+    # Or consume the upstream SSE stream incrementally
+    async for event in service.stream_deep_research(request):
+        ...
 """
 
+import json
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
 
 from app.core.config import settings
+from app.core.deadline import cap_timeout
+from app.core.http_utils import http_clients, parse_retry_after
+from app.core.resilience import ResiliencePolicy, resilient
 from app.exceptions.perplexity import PerplexityAPIError
 from app.schemas.perplexity import (
     PerplexityDeepResearchRequest,
     PerplexityDeepResearchResponse,
+    PerplexityStreamEvent,
+    PerplexityStreamEventType,
+)
+
+# Response-level fields copied from the latest stream chunk that carries them
+_STREAM_RESPONSE_FIELDS: tuple[str, ...] = (
+    "id",
+    "model",
+    "created",
+    "citations",
+    "search_results",
+    "images",
+    "videos",
+    "related_questions",
+    "usage",
 )
 
+# Sentinel payload some OpenAI-compatible APIs send to end a stream
+_STREAM_DONE = "[DONE]"
+
+
+class _StreamAccumulator:
+    """Merges streamed chat.completion.chunk payloads into one response.
+
+    Text deltas are concatenated; citations, search results and usage are
+    taken from the most recent chunk that includes them, since Perplexity
+    repeats the cumulative lists and reports usage on the final chunk.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty accumulator."""
+        self._fields: dict[str, Any] = {}
+        self._parts: list[str] = []
+        self._role = "assistant"
+        self._finish_reason: str | None = None
+
+    def add(self, chunk: dict[str, Any]) -> str:
+        """Merge one chunk and return its text delta.
+
+        Args:
+            chunk: Decoded JSON payload of a single SSE data line.
+
+        Returns:
+            The text added by this chunk (empty if none).
+        """
+        for field in _STREAM_RESPONSE_FIELDS:
+            if chunk.get(field) is not None:
+                self._fields[field] = chunk[field]
+
+        choices = chunk.get("choices") or []
+        if not choices:
+            return ""
+        choice = choices[0]
+        if choice.get("finish_reason"):
+            self._finish_reason = choice["finish_reason"]
+
+        delta = choice.get("delta") or {}
+        self._role = delta.get("role") or self._role
+        content = delta.get("content") or ""
+        if content:
+            self._parts.append(content)
+        return str(content)
+
+    def build(self) -> dict[str, Any]:
+        """Return the accumulated response as a non-streaming payload."""
+        return {
+            **self._fields,
+            "object": "chat.completion",
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": self._role, "content": "".join(self._parts)},
+                    "finish_reason": self._finish_reason,
+                }
+            ],
+        }
+
 
 class PerplexityService:
     """Service layer for Perplexity Sonar API operations.
@@ -35,12 +119,14 @@ class PerplexityService:
     - Request payload formatting with web_search_options nesting
     - Response parsing and error mapping
     - 300-second timeout for deep research queries
+    - Retries and circuit breaking via the provider's ResiliencePolicy
 
     Attributes:
         BASE_URL: The Perplexity API base URL for chat completions.
         _api_key: The API key for authentication.
         _timeout: Request timeout in seconds.
         _default_model: Default model for requests.
+        _resilience: Retry and circuit breaker policy for upstream calls.
     """
 
     BASE_URL: str = "https://api.perplexity.ai/chat/completions"
@@ -66,6 +152,7 @@ class PerplexityService:
         self._api_key: str = perplexity_settings.api_key
         self._timeout: int = perplexity_settings.timeout
         self._default_model: str = perplexity_settings.default_model.value
+        self._resilience = ResiliencePolicy("Perplexity", PerplexityAPIError)
 
     def _build_headers(self) -> dict[str, str]:
         """Build HTTP headers for Perplexity API requests.
@@ -78,6 +165,10 @@ class PerplexityService:
             "Content-Type": "application/json",
         }
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client shared by all Perplexity requests."""
+        return http_clients.get("perplexity")
+
     def _build_payload(
         self,
         request: PerplexityDeepResearchRequest,
@@ -195,12 +286,15 @@ class PerplexityService:
         self,
         status_code: int,
         response_body: str | None = None,
+        retry_after: float | None = None,
     ) -> PerplexityAPIError:
         """Map HTTP status codes to PerplexityAPIError subtypes.
 
         Args:
             status_code: HTTP status code from the response.
             response_body: Optional response body for error details.
+            retry_after: Optional Retry-After hint in seconds, recorded in the
+                details of retryable errors for the resilience layer.
 
         Returns:
             Appropriate PerplexityAPIError subtype.
@@ -208,6 +302,8 @@ class PerplexityService:
         details: dict[str, Any] | None = None
         if response_body:
             details = {"response_body": response_body}
+        if retry_after is not None and status_code in (429, 502, 503, 504):
+            details = {**(details or {}), "retry_after": retry_after}
 
         if status_code == 401:
             return PerplexityAPIError.invalid_api_key(details=details)
@@ -220,12 +316,18 @@ class PerplexityService:
                 message=f"Invalid request: {response_body or 'Bad Request'}",
                 details=details,
             )
+        elif status_code in (502, 503, 504):
+            return PerplexityAPIError.service_unavailable(
+                message=f"Perplexity API unavailable (HTTP {status_code})",
+                details=details,
+            )
         else:
             return PerplexityAPIError.api_error(
                 message=f"Perplexity API error (HTTP {status_code})",
                 details=details,
             )
 
+    @resilient()
     async def deep_research(
         self,
         request: PerplexityDeepResearchRequest,
@@ -247,32 +349,34 @@ class PerplexityService:
         """
         headers = self._build_headers()
         payload = self._build_payload(request)
+        timeout = cap_timeout(self._timeout)
 
         try:
-            async with httpx.AsyncClient(
-                timeout=httpx.Timeout(self._timeout)
-            ) as client:
-                response = await client.post(
-                    self.BASE_URL,
-                    headers=headers,
-                    json=payload,
-                )
+            response = await self._get_client().post(
+                self.BASE_URL,
+                headers=headers,
+                json=payload,
+                timeout=httpx.Timeout(timeout),
+            )
 
-                if response.status_code != 200:
-                    raise self._handle_error(
-                        status_code=response.status_code,
-                        response_body=response.text,
-                    )
+            self._resilience.observe_headers(response.headers, "deep_research")
 
-                response_data = response.json()
-                return self._parse_response(response_data)
+            if response.status_code != 200:
+                raise self._handle_error(
+                    status_code=response.status_code,
+                    response_body=response.text,
+                    retry_after=parse_retry_after(response.headers.get("retry-after")),
+                )
+
+            response_data = response.json()
+            return self._parse_response(response_data)
 
         except PerplexityAPIError:
             # Re-raise our own exceptions
             raise
         except httpx.TimeoutException as exc:
             raise PerplexityAPIError.request_timeout(
-                message=f"Request timed out after {self._timeout} seconds.",
+                message=f"Request timed out after {timeout:g} seconds.",
                 details={"original_error": str(exc)},
             ) from exc
         except httpx.HTTPError as exc:
@@ -285,3 +389,97 @@ class PerplexityService:
                 message="Unexpected error occurred.",
                 details={"original_error": str(exc)},
             ) from exc
+
+    async def stream_deep_research(
+        self,
+        request: PerplexityDeepResearchRequest,
+    ) -> AsyncIterator[PerplexityStreamEvent]:
+        """Stream a deep research query from the Perplexity Sonar API.
+
+        Sends the request with stream enabled and parses the upstream
+        Server-Sent Events as they arrive, yielding each text delta
+        immediately. Once the upstream stream ends, a final event carries
+        the full response with accumulated citations and usage.
+
+        Args:
+            request: Deep research request with query and optional parameters.
+
+        Yields:
+            CONTENT events for each text delta, then one FINAL_RESULT event.
+
+        Raises:
+            PerplexityAPIError: If the API request fails or the stream is
+                malformed.
+        """
+        headers = self._build_headers()
+        payload = self._build_payload(request)
+        payload["stream"] = True
+        accumulator = _StreamAccumulator()
+
+        # Streams cannot be replayed once started, so they are guarded by
+        # the circuit breaker and rate limiter but not retried
+        async with self._resilience.guard("deep_research"):
+            timeout = cap_timeout(self._timeout)
+
+            try:
+                async with self._get_client().stream(
+                    "POST",
+                    self.BASE_URL,
+                    headers=headers,
+                    json=payload,
+                    timeout=httpx.Timeout(timeout),
+                ) as response:
+                    self._resilience.observe_headers(response.headers, "deep_research")
+
+                    if response.status_code != 200:
+                        await response.aread()
+                        raise self._handle_error(
+                            status_code=response.status_code,
+                            response_body=response.text,
+                            retry_after=parse_retry_after(
+                                response.headers.get("retry-after")
+                            ),
+                        )
+
+                    async for line in response.aiter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        data = line[len("data:") :].strip()
+                        if data == _STREAM_DONE:
+                            break
+                        if not data:
+                            continue
+
+                        try:
+                            chunk = json.loads(data)
+                        except json.JSONDecodeError as exc:
+                            raise PerplexityAPIError.api_error(
+                                message="Failed to parse Perplexity stream chunk.",
+                                details={"original_error": str(exc), "chunk": data},
+                            ) from exc
+
+                        content = accumulator.add(chunk)
+                        if content:
+                            yield PerplexityStreamEvent(
+                                event=PerplexityStreamEventType.CONTENT,
+                                content=content,
+                            )
+
+            except PerplexityAPIError:
+                # Re-raise our own exceptions
+                raise
+            except httpx.TimeoutException as exc:
+                raise PerplexityAPIError.request_timeout(
+                    message=f"Request timed out after {timeout:g} seconds.",
+                    details={"original_error": str(exc)},
+                ) from exc
+            except httpx.HTTPError as exc:
+                raise PerplexityAPIError.api_error(
+                    message="HTTP error occurred while communicating with Perplexity API.",
+                    details={"original_error": str(exc)},
+                ) from exc
+
+        yield PerplexityStreamEvent(
+            event=PerplexityStreamEventType.FINAL_RESULT,
+            response=self._parse_response(accumulator.build()),
+        )
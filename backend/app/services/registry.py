@@ -0,0 +1,119 @@
+"""Process-wide registry of provider service singletons.
+
+Provider services are stateless with respect to individual requests, so a
+single instance of each is created at application startup and shared by every
+request. The registry owns their lifecycle: it constructs them lazily (or
+eagerly from the FastAPI lifespan), hands out the shared instance, and drops
+them on shutdown. The services own no connections themselves: the pooled HTTP
+clients they use are closed by ``http_clients.aclose()``.
+
+Tests can replace an instance with ``services.override(...)``; route tests can
+keep using ``app.dependency_overrides`` on the ``get_*_service`` dependencies.
+
+Usage:
+    from app.services.registry import services
+    from app.services.tavily import TavilyService
+
+    tavily = services.get(TavilyService)
+"""
+
+from typing import Any, TypeVar, cast
+
+from app.core.exceptions import TavilyAPIError
+from app.exceptions.gemini import GeminiAPIError
+from app.exceptions.perplexity import PerplexityAPIError
+from app.exceptions.youcom import YouComAPIError
+from app.services.gemini import GeminiService
+from app.services.perplexity import PerplexityService
+from app.services.tavily import TavilyService
+from app.services.youcom import YouComService
+
+ServiceT = TypeVar("ServiceT")
+
+# Services constructed eagerly at startup
+PROVIDER_SERVICES: tuple[type[Any], ...] = (
+    TavilyService,
+    PerplexityService,
+    GeminiService,
+    YouComService,
+)
+
+# Errors raised by service constructors when a provider is not configured
+_CONFIGURATION_ERRORS = (
+    TavilyAPIError,
+    PerplexityAPIError,
+    GeminiAPIError,
+    YouComAPIError,
+)
+
+
+class ServiceRegistry:
+    """Holds one shared instance per provider service class.
+
+    Attributes:
+        _instances: Constructed service instances keyed by class.
+        _overrides: Test overrides keyed by class, consulted first.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._instances: dict[type[Any], Any] = {}
+        self._overrides: dict[type[Any], Any] = {}
+
+    def get(self, service_cls: type[ServiceT]) -> ServiceT:
+        """Return the shared instance of a service, constructing it if needed.
+
+        A provider whose constructor raises (e.g. missing API key) is not
+        cached, so the error surfaces on every request until it is configured.
+
+        Args:
+            service_cls: The service class to look up.
+
+        Returns:
+            The override or shared instance for that class.
+        """
+        override = self._overrides.get(service_cls)
+        if override is not None:
+            return cast(ServiceT, override)
+
+        instance = self._instances.get(service_cls)
+        if instance is None:
+            instance = service_cls()
+            self._instances[service_cls] = instance
+        return cast(ServiceT, instance)
+
+    def override(self, service_cls: type[ServiceT], instance: ServiceT) -> None:
+        """Replace the shared instance of a service (intended for tests).
+
+        Args:
+            service_cls: The service class to override.
+            instance: The object to return from get() instead.
+        """
+        self._overrides[service_cls] = instance
+
+    def clear_overrides(self) -> None:
+        """Remove all overrides registered with override()."""
+        self._overrides.clear()
+
+    def startup(self) -> None:
+        """Eagerly construct every configured provider service.
+
+        Providers without credentials are skipped; their dependency raises
+        the usual invalid_api_key error when a route asks for them.
+        """
+        for service_cls in PROVIDER_SERVICES:
+            try:
+                self.get(service_cls)
+            except _CONFIGURATION_ERRORS:
+                continue
+
+    def clear(self) -> None:
+        """Drop every constructed service instance.
+
+        The next get() constructs a fresh instance with current settings.
+        """
+        self._instances.clear()
+
+
+# Process-wide registry used by app.api.deps and the application lifespan
+services = ServiceRegistry()
@@ -0,0 +1,231 @@
+"""Worker that runs queued research jobs.
+
+ResearchWorker claims jobs from the JobQueue, runs each one through the
+provider's shared service (so rate limiting, retries and circuit breaking
+apply as for any API request), and stores its result or error. It keeps at
+most JOB_QUEUE_WORKER_CONCURRENCY jobs in flight, renews their leases while
+they run, and on shutdown gives them JOB_QUEUE_SHUTDOWN_GRACE seconds to
+finish before putting the rest back in the queue.
+
+The worker runs in its own process (see app/worker.py), so slow provider
+calls never occupy API workers.
+
+Usage:
+    from app.services.research_worker import ResearchWorker
+
+    stop = asyncio.Event()
+    await ResearchWorker().run(stop)
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import socket
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from app.core.config import JobQueueSettings, settings
+from app.exceptions import PROVIDER_ERRORS
+from app.models import ResearchJob
+from app.schemas.perplexity import PerplexityDeepResearchRequest
+from app.schemas.youcom import YouComDeepResearchRequest
+from app.services.job_queue import JobQueue, job_queue
+from app.services.perplexity import PerplexityService
+from app.services.registry import ServiceRegistry, services
+from app.services.youcom import YouComService
+
+logger = logging.getLogger(__name__)
+
+
+def _default_worker_id() -> str:
+    """Return an ID identifying this worker process across nodes."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class ResearchWorker:
+    """Claims and runs research jobs with bounded concurrency.
+
+    Attributes:
+        worker_id: ID recorded on the jobs this worker claims.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue | None = None,
+        registry: ServiceRegistry | None = None,
+        queue_settings: JobQueueSettings | None = None,
+        worker_id: str | None = None,
+    ) -> None:
+        """Initialize the worker.
+
+        Args:
+            queue: Job queue to drain. Defaults to the process-wide queue.
+            registry: Registry to resolve provider services from. Defaults
+                to the process-wide registry.
+            queue_settings: Override for settings.job_queue.
+            worker_id: Worker ID. Defaults to host, process ID and a suffix.
+        """
+        self._queue = queue or job_queue
+        self._registry = registry or services
+        self._settings = queue_settings or settings.job_queue
+        self.worker_id = worker_id or _default_worker_id()
+        self._running: dict[uuid.UUID, asyncio.Task[None]] = {}
+
+    async def _research_perplexity(self, request: dict[str, Any]) -> dict[str, Any]:
+        perplexity = self._registry.get(PerplexityService)
+        response = await perplexity.deep_research(
+            PerplexityDeepResearchRequest.model_validate({**request, "stream": False})
+        )
+        return response.model_dump(mode="json")
+
+    async def _research_youcom(self, request: dict[str, Any]) -> dict[str, Any]:
+        youcom = self._registry.get(YouComService)
+        response = await youcom.deep_research(
+            YouComDeepResearchRequest.model_validate(request)
+        )
+        return response.model_dump(mode="json")
+
+    def _runner(
+        self, job: ResearchJob
+    ) -> Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]:
+        """Return the coroutine function running a job's provider call."""
+        if job.provider == "perplexity":
+            return self._research_perplexity
+        return self._research_youcom
+
+    async def execute(self, job: ResearchJob) -> None:
+        """Run one claimed job and store its outcome.
+
+        If the job is cancelled (worker shutdown), it is put back in the
+        queue for another worker.
+
+        Args:
+            job: A job claimed by this worker.
+        """
+        try:
+            result = await self._runner(job)(job.request)
+        except asyncio.CancelledError:
+            await asyncio.to_thread(self._queue.release, job.id, self.worker_id)
+            raise
+        except PROVIDER_ERRORS as exc:
+            error: dict[str, Any] = {
+                "status_code": exc.status_code,
+                "error_code": exc.error_code,
+                "message": exc.message,
+                "details": exc.details,
+            }
+        except Exception as exc:
+            logger.exception("Research job %s failed", job.id)
+            error = {
+                "status_code": 500,
+                "error_code": f"{job.provider}_api_error",
+                "message": f"{job.provider} research failed: {exc}",
+                "details": None,
+            }
+        else:
+            stored = await asyncio.to_thread(
+                self._queue.complete, job.id, self.worker_id, result
+            )
+            if not stored:
+                logger.warning("Research job %s lease was lost", job.id)
+            return
+
+        await asyncio.to_thread(self._queue.fail, job.id, self.worker_id, error)
+
+    def _forget(self, job_id: uuid.UUID, _task: asyncio.Task[None]) -> None:
+        """Drop a finished job from the running set."""
+        self._running.pop(job_id, None)
+
+    async def _claim(self) -> int:
+        """Claim jobs for the free slots and start them.
+
+        Returns:
+            Number of jobs started.
+        """
+        free = self._settings.worker_concurrency - len(self._running)
+        if free < 1:
+            return 0
+        jobs = await asyncio.to_thread(self._queue.claim, self.worker_id, free)
+        for job in jobs:
+            task = asyncio.create_task(self.execute(job))
+            self._running[job.id] = task
+            task.add_done_callback(functools.partial(self._forget, job.id))
+        return len(jobs)
+
+    async def _renew_leases(self, stop: asyncio.Event) -> None:
+        """Renew the leases of running jobs until stopped.
+
+        A failed renewal is logged and retried on the next tick. Jobs whose
+        lease was lost (it expired and another worker claimed them) are
+        cancelled, so they do not run twice.
+        """
+        interval = self._settings.lease / 3
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                if not self._running:
+                    continue
+                job_ids = list(self._running)
+                try:
+                    renewed = await asyncio.to_thread(
+                        self._queue.renew, job_ids, self.worker_id
+                    )
+                except Exception:
+                    logger.exception("Renewing research job leases failed")
+                    continue
+                for job_id in job_ids:
+                    task = self._running.get(job_id)
+                    if job_id in renewed or task is None or task.done():
+                        continue
+                    logger.warning(
+                        "Research job %s lease was lost; cancelling it", job_id
+                    )
+                    task.cancel()
+
+    async def _wait(self, stop: asyncio.Event) -> None:
+        """Wait for the poll interval, a finished job or the stop signal."""
+        stop_waiter = asyncio.ensure_future(stop.wait())
+        waiters: set[asyncio.Future[Any]] = {stop_waiter, *self._running.values()}
+        try:
+            await asyncio.wait(
+                waiters,
+                timeout=self._settings.poll_interval,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            # Only the stop waiter is ours; running jobs must keep running
+            stop_waiter.cancel()
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """Drain the queue until stop is set, then shut down gracefully.
+
+        Args:
+            stop: Event that asks the worker to stop.
+        """
+        logger.info("Research worker %s started", self.worker_id)
+        renewer = asyncio.create_task(self._renew_leases(stop))
+        try:
+            while not stop.is_set():
+                try:
+                    started = await self._claim()
+                except Exception:
+                    logger.exception("Claiming research jobs failed")
+                    started = 0
+                if not started:
+                    await self._wait(stop)
+        finally:
+            running = list(self._running.values())
+            if running:
+                logger.info("Waiting for %d running research jobs", len(running))
+                _, pending = await asyncio.wait(
+                    running, timeout=self._settings.shutdown_grace
+                )
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+            stop.set()
+            await renewer
+            logger.info("Research worker %s stopped", self.worker_id)
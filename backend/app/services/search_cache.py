@@ -0,0 +1,175 @@
+"""In-memory response cache for Tavily search.
+
+Identical search requests are common (popular queries, retried jobs), and
+each one used to cost an upstream round trip of a second or more. Responses
+are cached here keyed by a normalized request: the query trimmed, with
+whitespace collapsed and case-folded, and domain lists lower-cased, deduped
+and sorted, alongside every other option that changes the response.
+
+Responses are stored pre-encoded as JSON bytes, so a hit is returned as-is
+without Pydantic validation or serialization. News results go stale faster
+than general results, so each topic has its own TTL.
+
+Every Tavily search (the search routes and federated research) runs through
+SearchCache.search, so identical searches share entries whoever sends them.
+
+Usage:
+    from app.services.search_cache import search_cache
+
+    body = await search_cache.search(tavily, request)
+"""
+
+import hashlib
+import json
+
+from app.core.cache import TTLCache
+from app.core.config import SearchCacheSettings, settings
+from app.schemas.tavily import (
+    SearchCacheStats,
+    SearchRequest,
+    SearchResponse,
+    SearchTopic,
+)
+from app.services.tavily import TavilyService
+
+
+def _normalize_domains(domains: list[str] | None) -> list[str]:
+    """Lower-case, dedupe and sort a domain filter list."""
+    return sorted({domain.strip().lower() for domain in domains or []})
+
+
+def search_cache_key(request: SearchRequest) -> str:
+    """Return the cache key of a search request.
+
+    Requests that differ only in query case or whitespace, or in the order
+    or case of their domain filters, share a key.
+
+    Args:
+        request: The search request.
+
+    Returns:
+        A SHA-256 hex digest of the normalized request.
+    """
+    normalized = {
+        "query": " ".join(request.query.split()).casefold(),
+        "search_depth": request.search_depth.value,
+        "topic": request.topic.value,
+        "max_results": request.max_results,
+        "include_images": request.include_images,
+        "include_image_descriptions": request.include_image_descriptions,
+        "include_answer": request.include_answer,
+        "include_raw_content": request.include_raw_content,
+        "include_domains": _normalize_domains(request.include_domains),
+        "exclude_domains": _normalize_domains(request.exclude_domains),
+    }
+    encoded = json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class SearchCache:
+    """TTL and LRU cache of encoded Tavily search responses.
+
+    Attributes:
+        _settings: Cache configuration.
+        _cache: Encoded responses keyed by normalized request.
+    """
+
+    def __init__(self, cache_settings: SearchCacheSettings | None = None) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            cache_settings: Override for settings.search_cache.
+        """
+        self._settings = cache_settings or settings.search_cache
+        self._cache: TTLCache[bytes] = TTLCache(self._settings.max_entries)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether search responses are served from and stored in the cache."""
+        return self._settings.enabled
+
+    def ttl(self, topic: SearchTopic) -> float:
+        """Return the TTL in seconds for responses of a search topic."""
+        if topic == SearchTopic.NEWS:
+            return self._settings.news_ttl
+        return self._settings.general_ttl
+
+    def get(self, request: SearchRequest) -> bytes | None:
+        """Return the cached encoded response for a request, if fresh.
+
+        Args:
+            request: The search request.
+
+        Returns:
+            The JSON-encoded SearchResponse, or None on a miss (or when the
+            cache is disabled).
+        """
+        if not self.enabled:
+            return None
+        return self._cache.get(search_cache_key(request))
+
+    def set(self, request: SearchRequest, body: bytes) -> None:
+        """Cache the encoded response of a request.
+
+        Args:
+            request: The search request.
+            body: The JSON-encoded SearchResponse.
+        """
+        if self.enabled:
+            self._cache.set(search_cache_key(request), body, self.ttl(request.topic))
+
+    async def search(self, tavily: TavilyService, request: SearchRequest) -> bytes:
+        """Run a search through the cache.
+
+        On a miss the upstream response is validated once and stored
+        encoded; failed searches are not cached.
+
+        Args:
+            tavily: Service sending the search upstream on a miss.
+            request: The search request.
+
+        Returns:
+            The JSON-encoded SearchResponse, cached or fresh.
+
+        Raises:
+            TavilyAPIError: If the Tavily API request fails (SDK errors
+                without a known mapping propagate unchanged).
+        """
+        body = self.get(request)
+        if body is None:
+            result = await tavily.search(
+                query=request.query,
+                search_depth=request.search_depth.value,
+                topic=request.topic.value,
+                max_results=request.max_results,
+                include_images=request.include_images,
+                include_image_descriptions=request.include_image_descriptions,
+                include_answer=request.include_answer,
+                include_raw_content=request.include_raw_content,
+                include_domains=request.include_domains,
+                exclude_domains=request.exclude_domains,
+                hedge=request.hedge,
+            )
+            body = SearchResponse.model_validate(result).model_dump_json().encode()
+            self.set(request, body)
+        return body
+
+    def stats(self) -> SearchCacheStats:
+        """Return the cache's size and hit, miss and eviction counters."""
+        return SearchCacheStats(
+            enabled=self.enabled,
+            entries=len(self._cache),
+            max_entries=self._cache.max_entries,
+            hits=self._cache.hits,
+            misses=self._cache.misses,
+            evictions=self._cache.evictions,
+            expirations=self._cache.expirations,
+        )
+
+    def clear(self) -> None:
+        """Drop every cached response and reset the counters."""
+        self._cache.clear()
+
+
+# Process-wide search response cache used by every Tavily search
+search_cache = SearchCache()
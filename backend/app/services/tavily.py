@@ -11,11 +11,47 @@ Usage:
     results = await service.search("python web scraping")
 """
 
+import asyncio
+import functools
+import logging
+from collections.abc import Awaitable, Callable
 from typing import Any
 
+import httpx
+from sqlalchemy.exc import SQLAlchemyError
 from tavily import AsyncTavilyClient  # type: ignore[import-untyped]
+from tavily.errors import (  # type: ignore[import-untyped]
+    BadRequestError,
+    InvalidAPIKeyError,
+    MissingAPIKeyError,
+    UsageLimitExceededError,
+)
+from tavily.errors import TimeoutError as TavilyTimeoutError
 
 from app.core.config import settings
+from app.core.deadline import cap_timeout
+from app.core.exceptions import TavilyAPIError, TavilyErrorCode
+from app.core.hedging import Hedger
+from app.core.http_utils import canonicalize_url, parse_retry_after
+from app.core.resilience import ResiliencePolicy, resilient
+from app.services.content_cache import ContentCache, content_cache
+
+logger = logging.getLogger(__name__)
+
+
+def _dedupe_urls(urls: list[str]) -> list[str]:
+    """Drop URLs that are canonically equivalent to an earlier one.
+
+    Args:
+        urls: URLs in request order.
+
+    Returns:
+        The first occurrence of each distinct URL, in request order.
+    """
+    unique: dict[str, str] = {}
+    for url in urls:
+        unique.setdefault(canonicalize_url(url), url)
+    return list(unique.values())
 
 
 class TavilyService:
@@ -28,14 +64,22 @@ class TavilyService:
     - map_urls: Sitemap generation for domains
 
     The service initializes an AsyncTavilyClient using configuration from
-    TavilySettings (api_key, timeout, proxy).
+    TavilySettings (api_key, timeout, proxy). SDK errors with a known meaning
+    are mapped to TavilyAPIError so calls can be retried and circuit-broken
+    by the provider's ResiliencePolicy; other SDK errors propagate unchanged.
 
     Attributes:
         _client: The underlying AsyncTavilyClient instance.
         _timeout: Default timeout for API requests in seconds.
+        _extract_chunk_size: Maximum URLs sent in one extract call.
+        _extract_concurrency: Maximum extract chunks in flight at once.
+        _cache: Persistent cache of extracted page content.
+        _hedge: Whether searches are hedged unless they ask otherwise.
+        _hedger: Latency tracker and hedging policy for searches.
+        _resilience: Retry and circuit breaker policy for upstream calls.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, cache: ContentCache | None = None) -> None:
         """Initialize TavilyService with configured AsyncTavilyClient.
 
         Reads configuration from settings.tavily:
@@ -45,6 +89,10 @@ class TavilyService:
 
         The proxy string is converted to the dict format expected by
         AsyncTavilyClient ({"http": url, "https": url}).
+
+        Args:
+            cache: Extracted-content cache. Defaults to the process-wide
+                content cache.
         """
         tavily_settings = settings.tavily
 
@@ -58,12 +106,102 @@ class TavilyService:
 
         # Store timeout for use in service methods
         self._timeout: int = tavily_settings.timeout
+        self._extract_chunk_size: int = tavily_settings.extract_chunk_size
+        self._extract_concurrency: int = tavily_settings.extract_concurrency
 
         # Initialize the async client
         self._client: AsyncTavilyClient = AsyncTavilyClient(
             api_key=tavily_settings.api_key,
             proxies=proxies,
         )
+        self._resilience = ResiliencePolicy("Tavily", TavilyAPIError)
+        self._cache = cache or content_cache
+        self._hedge = tavily_settings.hedge
+        self._hedger = Hedger(
+            percentile=tavily_settings.hedge_percentile,
+            max_rate=tavily_settings.hedge_max_rate,
+            window=tavily_settings.hedge_window,
+            min_samples=tavily_settings.hedge_min_samples,
+        )
+
+    def _handle_error(self, exc: Exception) -> TavilyAPIError | None:
+        """Map a Tavily SDK exception to TavilyAPIError by type.
+
+        Args:
+            exc: The exception raised by the Tavily SDK.
+
+        Returns:
+            The matching TavilyAPIError, or None for exceptions without a
+            well-defined mapping (left to the route-level handler).
+        """
+        details: dict[str, Any] = {"original_error": str(exc)}
+
+        if isinstance(exc, UsageLimitExceededError):
+            return TavilyAPIError.rate_limit_exceeded(details=details)
+        if isinstance(exc, InvalidAPIKeyError | MissingAPIKeyError):
+            return TavilyAPIError.invalid_api_key(details=details)
+        if isinstance(exc, BadRequestError):
+            return TavilyAPIError.invalid_request(message=str(exc), details=details)
+        if isinstance(exc, TavilyTimeoutError | httpx.TimeoutException):
+            return TavilyAPIError.request_timeout(details=details)
+        if isinstance(exc, httpx.HTTPStatusError):
+            status_code = exc.response.status_code
+            if status_code in (502, 503, 504):
+                retry_after = parse_retry_after(exc.response.headers.get("retry-after"))
+                if retry_after is not None:
+                    details["retry_after"] = retry_after
+                return TavilyAPIError.service_unavailable(
+                    message=f"Tavily API unavailable (HTTP {status_code})",
+                    details=details,
+                )
+            if status_code >= 500:
+                return TavilyAPIError.api_error(
+                    message=f"Tavily API error (HTTP {status_code})",
+                    details=details,
+                )
+        return None
+
+    async def _request(
+        self,
+        method: Callable[..., Awaitable[dict[str, Any]]],
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Call an SDK method, mapping known SDK errors to TavilyAPIError.
+
+        A timeout argument is capped at the remaining request deadline.
+
+        Args:
+            method: Bound AsyncTavilyClient method to call.
+            **kwargs: Arguments for the SDK method.
+
+        Returns:
+            The SDK response dictionary.
+
+        Raises:
+            TavilyAPIError: For SDK errors with a known mapping.
+        """
+        if "timeout" in kwargs:
+            kwargs["timeout"] = cap_timeout(kwargs["timeout"])
+        try:
+            return await method(**kwargs)
+        except Exception as exc:
+            mapped = self._handle_error(exc)
+            if mapped is None:
+                raise
+            raise mapped from exc
+
+    @resilient(endpoint="search")
+    async def _search_once(self, **kwargs: Any) -> dict[str, Any]:
+        """Send one search request (one attempt of a possibly hedged search).
+
+        Args:
+            **kwargs: Arguments for the SDK search method.
+
+        Returns:
+            The SDK search response.
+        """
+        result: dict[str, Any] = await self._request(self._client.search, **kwargs)
+        return result
 
     async def search(
         self,
@@ -79,9 +217,16 @@ class TavilyService:
         include_domains: list[str] | None = None,
         exclude_domains: list[str] | None = None,
         timeout: int | None = None,
+        hedge: bool | None = None,
     ) -> dict[str, Any]:
         """Perform a web search using the Tavily API.
 
+        A hedged search sends a second, identical request when the first has
+        been running longer than the configured percentile of recent search
+        latencies, and returns whichever answers first (cancelling the
+        other). Hedges are capped at TAVILY_HEDGE_MAX_RATE of hedged
+        searches.
+
         Args:
             query: The search query string.
             search_depth: Search depth - "basic" or "advanced". Advanced provides
@@ -98,6 +243,7 @@ class TavilyService:
             exclude_domains: List of domains to exclude from search.
                 Example: ["pinterest.com", "facebook.com"]. Default: None.
             timeout: Request timeout in seconds. Uses configured default if None.
+            hedge: Whether to hedge the search. Uses configured default if None.
 
         Returns:
             dict containing search results with keys:
@@ -108,7 +254,8 @@ class TavilyService:
         """
         effective_timeout = timeout if timeout is not None else self._timeout
 
-        result: dict[str, Any] = await self._client.search(
+        call = functools.partial(
+            self._search_once,
             query=query,
             search_depth=search_depth,
             topic=topic,
@@ -121,8 +268,141 @@ class TavilyService:
             exclude_domains=exclude_domains,
             timeout=effective_timeout,
         )
+        return await self._hedger.run(
+            call, hedge=self._hedge if hedge is None else hedge
+        )
+
+    @resilient(endpoint="extract")
+    async def _extract_chunk(self, urls: list[str], timeout: int) -> dict[str, Any]:
+        """Extract one provider-sized chunk of URLs in a single SDK call.
+
+        Args:
+            urls: URLs to extract (at most the configured chunk size).
+            timeout: Request timeout in seconds.
+
+        Returns:
+            The SDK extraction response for the chunk.
+        """
+        result: dict[str, Any] = await self._request(
+            self._client.extract,
+            urls=urls,
+            timeout=timeout,
+        )
         return result
 
+    async def _extract_chunks(
+        self,
+        chunks: list[list[str]],
+        timeout: int,
+    ) -> list[dict[str, Any] | BaseException]:
+        """Extract chunks in parallel under the extract concurrency cap.
+
+        Args:
+            chunks: URL chunks to extract.
+            timeout: Request timeout in seconds per chunk.
+
+        Returns:
+            Each chunk's response, or the exception it failed with.
+        """
+        semaphore = asyncio.Semaphore(self._extract_concurrency)
+
+        async def run(chunk: list[str]) -> dict[str, Any]:
+            async with semaphore:
+                return await self._extract_chunk(chunk, timeout)
+
+        return list(
+            await asyncio.gather(
+                *(run(chunk) for chunk in chunks), return_exceptions=True
+            )
+        )
+
+    async def _extract_urls(self, urls: list[str], timeout: int) -> dict[str, Any]:
+        """Extract URLs upstream, chunking large lists.
+
+        Duplicate and canonically equivalent URLs are sent once. Lists larger
+        than the provider chunk size are split into chunks that are
+        extracted in parallel (up to the configured concurrency) and merged.
+        Only failed chunks are retried: each chunk on its own by the
+        resilience policy, and timed-out chunks once more after the others
+        finish. A chunk that still fails reports its URLs in failed_results
+        instead of failing the whole extraction.
+
+        Args:
+            urls: URLs to extract.
+            timeout: Request timeout in seconds per chunk.
+
+        Returns:
+            The (merged) SDK extraction response.
+
+        Raises:
+            TavilyAPIError: If every chunk failed with a mapped error (other
+                SDK errors propagate unchanged).
+        """
+        unique = _dedupe_urls(urls)
+        size = self._extract_chunk_size
+        chunks = [unique[start : start + size] for start in range(0, len(unique), size)]
+        if len(chunks) == 1:
+            return await self._extract_chunk(chunks[0], timeout)
+
+        outcomes = await self._extract_chunks(chunks, timeout)
+
+        # Rate limits and unavailability were already retried per chunk by
+        # the resilience policy; chunks that timed out get one more attempt
+        timed_out = [
+            index
+            for index, outcome in enumerate(outcomes)
+            if isinstance(outcome, TavilyAPIError)
+            and outcome.error_code == TavilyErrorCode.REQUEST_TIMEOUT
+        ]
+        if timed_out:
+            retried = await self._extract_chunks(
+                [chunks[index] for index in timed_out], timeout
+            )
+            for index, outcome in zip(timed_out, retried, strict=True):
+                outcomes[index] = outcome
+
+        merged: dict[str, Any] = {"results": [], "failed_results": []}
+        errors: list[BaseException] = []
+        for chunk, outcome in zip(chunks, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                logger.warning(
+                    "Tavily extract chunk of %d URLs failed: %s", len(chunk), outcome
+                )
+                errors.append(outcome)
+                message = getattr(outcome, "message", None) or str(outcome)
+                merged["failed_results"].extend(
+                    {"url": url, "error": message} for url in chunk
+                )
+                continue
+            if isinstance(outcome, BaseException):
+                raise outcome
+            merged["results"].extend(outcome.get("results", []))
+            merged["failed_results"].extend(outcome.get("failed_results", []))
+            response_time = outcome.get("response_time")
+            if response_time is not None:
+                merged["response_time"] = max(
+                    merged.get("response_time", 0.0), response_time
+                )
+
+        if len(errors) == len(chunks):
+            raise errors[0]
+        return merged
+
+    async def _cached_extractions(self, urls: list[str]) -> dict[str, dict[str, Any]]:
+        """Look URLs up in the content cache, treating cache errors as misses."""
+        try:
+            return await asyncio.to_thread(self._cache.get_many, urls)
+        except SQLAlchemyError:
+            logger.warning("Content cache lookup failed", exc_info=True)
+            return {}
+
+    async def _cache_extractions(self, results: list[dict[str, Any]]) -> None:
+        """Store extraction results in the content cache (best effort)."""
+        try:
+            await asyncio.to_thread(self._cache.put_many, results)
+        except SQLAlchemyError:
+            logger.warning("Content cache update failed", exc_info=True)
+
     async def extract(
         self,
         urls: str | list[str],
@@ -134,10 +414,15 @@ class TavilyService:
         Uses Tavily's extraction API to retrieve clean, structured content
         from web pages. Handles both single URLs and batch extraction.
 
+        Fresh extractions in the content cache are served locally and only
+        the misses are sent upstream (see _extract_urls for chunking and
+        retries); new extractions are stored in the cache.
+
         Args:
             urls: Single URL string or list of URLs to extract content from.
                 Example: "https://example.com" or ["https://a.com", "https://b.com"]
-            timeout: Request timeout in seconds. Uses configured default if None.
+            timeout: Request timeout in seconds per chunk. Uses configured
+                default if None.
 
         Returns:
             dict containing extraction results with keys:
@@ -145,15 +430,61 @@ class TavilyService:
                 - url: The source URL
                 - raw_content: Extracted text content
                 - images: List of image URLs found (if any)
+            - failed_results: List of {"url", "error"} objects for URLs
+              that could not be extracted
+            - cache_hits: Number of results served from the content cache
+              (when the cache is enabled)
+
+        Raises:
+            TavilyAPIError: If no URL could be served from the cache and
+                every upstream chunk failed with a mapped error (other SDK
+                errors propagate unchanged).
         """
         effective_timeout = timeout if timeout is not None else self._timeout
-
-        result: dict[str, Any] = await self._client.extract(
-            urls=urls,
-            timeout=effective_timeout,
-        )
-        return result
-
+        url_list = [urls] if isinstance(urls, str) else urls
+
+        if not self._cache.enabled:
+            return await self._extract_urls(url_list, effective_timeout)
+
+        unique = _dedupe_urls(url_list)
+        cached = await self._cached_extractions(unique)
+        misses = [url for url in unique if canonicalize_url(url) not in cached]
+
+        upstream: dict[str, Any] = {"results": [], "failed_results": []}
+        if misses:
+            try:
+                upstream = await self._extract_urls(misses, effective_timeout)
+            except Exception as exc:
+                if not cached:
+                    raise
+                message = getattr(exc, "message", None) or str(exc)
+                upstream["failed_results"] = [
+                    {"url": url, "error": message} for url in misses
+                ]
+            if upstream.get("results"):
+                await self._cache_extractions(upstream["results"])
+
+        # Return results in request order, cached and fresh alike
+        fresh = {
+            canonicalize_url(result.get("url", "")): result
+            for result in upstream.get("results", [])
+        }
+        results: list[dict[str, Any]] = []
+        for url in unique:
+            key = canonicalize_url(url)
+            result = cached.get(key) or fresh.pop(key, None)
+            if result is not None:
+                results.append(result)
+        results.extend(fresh.values())
+
+        return {
+            **upstream,
+            "results": results,
+            "failed_results": upstream.get("failed_results", []),
+            "cache_hits": len(cached),
+        }
+
+    @resilient()
     async def crawl(
         self,
         url: str,
@@ -197,7 +528,8 @@ class TavilyService:
         """
         effective_timeout = timeout if timeout is not None else self._timeout
 
-        result: dict[str, Any] = await self._client.crawl(
+        result: dict[str, Any] = await self._request(
+            self._client.crawl,
             url=url,
             max_depth=max_depth,
             max_breadth=max_breadth,
@@ -209,6 +541,7 @@ class TavilyService:
         )
         return result
 
+    @resilient(endpoint="map")
     async def map_urls(
         self,
         url: str,
@@ -254,7 +587,8 @@ class TavilyService:
         """
         effective_timeout = timeout if timeout is not None else self._timeout
 
-        result: dict[str, Any] = await self._client.map(
+        result: dict[str, Any] = await self._request(
+            self._client.map,
             url=url,
             max_depth=max_depth,
             max_breadth=max_breadth,
@@ -0,0 +1,472 @@
+"""Signed completion webhooks for asynchronous research jobs.
+
+Clients that start Gemini deep research with a callback_url are notified
+with a POST when the job finishes, instead of polling for up to an hour.
+
+Each notification is signed with HMAC-SHA256 using WEBHOOK_SECRET. The
+signed message is ``"{timestamp}.{body}"`` and is sent as::
+
+    X-Webhook-Id: <delivery ID, stable across retries>
+    X-Webhook-Timestamp: <Unix time in seconds>
+    X-Webhook-Signature: sha256=<hex digest>
+
+Receivers recompute the digest (see verify_signature) and should reject
+stale timestamps to prevent replays.
+
+Notifications go through a bounded in-memory queue drained by
+WEBHOOK_CONCURRENCY background senders, so a slow or unreachable receiver
+never blocks request handling or status polling. Failed deliveries (network
+errors, timeouts, 408, 429 and 5xx responses) are retried with jittered
+exponential backoff, honouring Retry-After, up to WEBHOOK_MAX_ATTEMPTS
+times. When the queue is full, new notifications are dropped and logged.
+
+A notification accepted by its receiver is recorded in the interaction
+registry. On startup, resume() queues again the notifications of jobs that
+finished within WEBHOOK_REDELIVERY_WINDOW but were never accepted (the
+process stopped first, or every attempt failed). Each is leased to the
+process resending it for WEBHOOK_REDELIVERY_LEASE seconds, so with several
+processes starting together only one of them sends it. They keep their
+delivery ID, so receivers can drop duplicates.
+
+Callback URLs must not reach the backend's own network: their host is
+resolved when the job is started and again before each delivery, and
+loopback, private, link-local (including the 169.254.169.254 metadata
+endpoint) and other non-public addresses are refused unless the host is
+listed in WEBHOOK_ALLOWED_HOSTS.
+
+Usage:
+    from app.services.webhooks import webhooks
+
+    await webhooks.check_url(callback_url)
+    webhooks.notify_finished(interaction)
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import hmac
+import ipaddress
+import logging
+import random
+import socket
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.core.config import WebhookSettings, settings
+from app.core.db import utc_now
+from app.core.http_utils import http_clients, parse_retry_after
+from app.models import GeminiInteraction
+from app.schemas.gemini import GeminiInteractionStatus, GeminiWebhookPayload
+from app.services.gemini_registry import GeminiInteractionRegistry, gemini_interactions
+
+logger = logging.getLogger(__name__)
+
+# Header carrying the delivery ID (the same for every retry)
+DELIVERY_ID_HEADER = "X-Webhook-Id"
+
+# Header carrying the Unix time the notification was signed at
+TIMESTAMP_HEADER = "X-Webhook-Timestamp"
+
+# Header carrying the HMAC-SHA256 signature
+SIGNATURE_HEADER = "X-Webhook-Signature"
+
+# Responses worth another delivery attempt besides 5xx
+_RETRYABLE_STATUS_CODES = frozenset({408, 429})
+
+
+class WebhookURLError(ValueError):
+    """Raised for callback URLs that notifications must not be sent to."""
+
+
+def sign_payload(secret: str, timestamp: int, body: bytes) -> str:
+    """Sign a notification body.
+
+    Args:
+        secret: Shared webhook secret.
+        timestamp: Unix time in seconds sent with the notification.
+        body: The exact request body.
+
+    Returns:
+        The signature header value, ``"sha256=<hex digest>"``.
+    """
+    message = f"{timestamp}.".encode() + body
+    digest = hmac.new(secret.encode(), message, hashlib.sha256).hexdigest()
+    return f"sha256={digest}"
+
+
+def verify_signature(secret: str, timestamp: int, body: bytes, signature: str) -> bool:
+    """Check a notification signature in constant time.
+
+    Args:
+        secret: Shared webhook secret.
+        timestamp: Value of the timestamp header.
+        body: The exact request body received.
+        signature: Value of the signature header.
+
+    Returns:
+        Whether the signature matches.
+    """
+    return hmac.compare_digest(sign_payload(secret, timestamp, body), signature)
+
+
+async def resolve_host(host: str) -> list[str]:
+    """Return the IP addresses a host name resolves to."""
+    infos = await asyncio.get_running_loop().getaddrinfo(
+        host, None, type=socket.SOCK_STREAM
+    )
+    return [str(info[4][0]) for info in infos]
+
+
+def _is_public(address: str) -> bool:
+    """Whether an IP address is globally routable and unicast."""
+    ip = ipaddress.ip_address(address.split("%", 1)[0])
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    return ip.is_global and not ip.is_multicast
+
+
+class WebhookDelivery:
+    """One notification waiting to be delivered.
+
+    Attributes:
+        url: Callback URL to POST to.
+        body: Encoded JSON body.
+        delivery_id: ID sent with every attempt, for receiver deduplication.
+        interaction_id: Interaction whose delivery is recorded once accepted.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        body: bytes,
+        delivery_id: str | None = None,
+        interaction_id: str | None = None,
+    ) -> None:
+        """Create a delivery.
+
+        Args:
+            url: Callback URL to POST to.
+            body: Encoded JSON body.
+            delivery_id: Delivery ID. Defaults to a fresh random one.
+            interaction_id: Interaction the notification is about, if any.
+        """
+        self.url = url
+        self.body = body
+        self.delivery_id = delivery_id or str(uuid.uuid4())
+        self.interaction_id = interaction_id
+
+
+class WebhookDispatcher:
+    """Delivers signed notifications from a bounded queue.
+
+    The queue and sender tasks start lazily on the running event loop the
+    first time a notification is enqueued, and are stopped by the
+    application lifespan.
+
+    Attributes:
+        _settings: Webhook configuration.
+        _client_factory: Returns the HTTP client used for deliveries.
+        _sleep: Coroutine used to wait between attempts.
+        _registry: Interaction registry recording accepted notifications.
+        _resolve: Coroutine resolving a host name to IP addresses.
+        _queue: Pending deliveries.
+        _tasks: Running sender tasks.
+    """
+
+    def __init__(
+        self,
+        webhook_settings: WebhookSettings | None = None,
+        client_factory: Callable[[], httpx.AsyncClient] | None = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        registry: GeminiInteractionRegistry | None = None,
+        resolve: Callable[[str], Awaitable[list[str]]] = resolve_host,
+    ) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+            webhook_settings: Override for settings.webhook.
+            client_factory: Optional factory for the HTTP client. Defaults to
+                the pooled "webhooks" client.
+            sleep: Coroutine used to wait between attempts (overridable in
+                tests).
+            registry: Interaction registry. Defaults to the process-wide
+                registry.
+            resolve: Coroutine resolving callback hosts (overridable in
+                tests).
+        """
+        self._settings = webhook_settings or settings.webhook
+        self._client_factory: Callable[[], httpx.AsyncClient] = client_factory or (
+            lambda: http_clients.get("webhooks")
+        )
+        self._sleep = sleep
+        self._registry = registry or gemini_interactions
+        self._resolve = resolve
+        self._queue: asyncio.Queue[WebhookDelivery] | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a signing secret is configured."""
+        return bool(self._settings.secret)
+
+    async def check_url(self, url: str) -> None:
+        """Check that a callback URL only reaches public addresses.
+
+        Args:
+            url: The callback URL.
+
+        Raises:
+            WebhookURLError: If the host is missing, cannot be resolved, or
+                resolves to a non-public address and is not allowlisted.
+        """
+        host = urlsplit(url).hostname
+        if not host:
+            raise WebhookURLError("callback_url has no host.")
+        if host.lower().rstrip(".") in {
+            allowed.lower().rstrip(".") for allowed in self._settings.allowed_hosts
+        }:
+            return
+        try:
+            addresses = await self._resolve(host)
+        except OSError as exc:
+            raise WebhookURLError(
+                f"callback_url host cannot be resolved: {exc}"
+            ) from exc
+        if not addresses or not all(_is_public(a) for a in addresses):
+            raise WebhookURLError("callback_url must resolve to a public address.")
+
+    def _ensure_running(self) -> asyncio.Queue[WebhookDelivery]:
+        """Start the queue and senders on the running loop if needed."""
+        loop = asyncio.get_running_loop()
+        if (
+            self._queue is not None
+            and self._tasks
+            and self._tasks[0].get_loop() is loop
+            and not self._tasks[0].done()
+        ):
+            return self._queue
+
+        self._queue = asyncio.Queue(maxsize=self._settings.queue_size)
+        self._tasks = [
+            loop.create_task(self._sender(self._queue), name=f"webhook-sender-{i}")
+            for i in range(self._settings.concurrency)
+        ]
+        return self._queue
+
+    def enqueue(
+        self,
+        url: str,
+        body: bytes,
+        *,
+        delivery_id: str | None = None,
+        interaction_id: str | None = None,
+    ) -> bool:
+        """Queue a notification for delivery without waiting for it.
+
+        Args:
+            url: Callback URL to POST to.
+            body: Encoded JSON body.
+            delivery_id: Stable delivery ID. Defaults to a fresh one.
+            interaction_id: Interaction whose delivery is recorded once a
+                receiver accepts it.
+
+        Returns:
+            False if the queue is full (or webhooks are not configured) and
+            the notification was dropped.
+        """
+        if not self.enabled:
+            logger.warning("Dropping webhook for %s: WEBHOOK_SECRET is unset", url)
+            return False
+        queue = self._ensure_running()
+        try:
+            queue.put_nowait(WebhookDelivery(url, body, delivery_id, interaction_id))
+        except asyncio.QueueFull:
+            logger.warning("Webhook queue is full; dropping notification for %s", url)
+            return False
+        return True
+
+    def notify_finished(self, interaction: GeminiInteraction) -> bool:
+        """Queue the completion notification of a finished interaction.
+
+        Args:
+            interaction: The interaction, in its terminal state.
+
+        Returns:
+            Whether a notification was queued (False without a callback URL).
+        """
+        if not interaction.callback_url:
+            return False
+        payload = GeminiWebhookPayload(
+            interaction_id=interaction.interaction_id,
+            status=GeminiInteractionStatus(interaction.status),
+            output_count=interaction.output_count,
+            completed_at=interaction.completed_at,
+            error_message=interaction.error_message,
+        )
+        return self.enqueue(
+            interaction.callback_url,
+            payload.model_dump_json().encode(),
+            delivery_id=str(
+                uuid.uuid5(uuid.NAMESPACE_URL, f"gemini:{interaction.interaction_id}")
+            ),
+            interaction_id=interaction.interaction_id,
+        )
+
+    async def resume(self) -> int:
+        """Queue the notifications that were never accepted, after a restart.
+
+        Only jobs finished within WEBHOOK_REDELIVERY_WINDOW are notified
+        again, and only those this process could lease: notifications another
+        process is already resending are skipped.
+
+        Returns:
+            Number of notifications queued.
+        """
+        if not self.enabled:
+            return 0
+        since = utc_now() - timedelta(seconds=self._settings.redelivery_window)
+        interactions = await asyncio.to_thread(
+            self._registry.claim_undelivered, since, self._settings.redelivery_lease
+        )
+        queued = sum(self.notify_finished(i) for i in interactions)
+        if queued:
+            logger.info("Queued %d undelivered Gemini webhooks", queued)
+        return queued
+
+    async def join(self) -> None:
+        """Wait until every queued notification has been handled."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def stop(self, timeout: float | None = None) -> None:
+        """Let queued notifications go out for a while, then stop the senders.
+
+        Args:
+            timeout: Seconds to wait for the queue to drain. Defaults to the
+                delivery timeout.
+        """
+        tasks, self._tasks = self._tasks, []
+        queue, self._queue = self._queue, None
+        if not tasks or tasks[0].get_loop() is not asyncio.get_running_loop():
+            return
+
+        if queue is not None and not queue.empty():
+            wait = timeout if timeout is not None else self._settings.timeout
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(queue.join(), timeout=wait)
+            if not queue.empty():
+                logger.warning(
+                    "Dropping %d undelivered webhook notifications", queue.qsize()
+                )
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _sender(self, queue: asyncio.Queue[WebhookDelivery]) -> None:
+        """Deliver queued notifications one at a time, forever."""
+        while True:
+            delivery = await queue.get()
+            try:
+                delivered = await self.deliver(delivery)
+                if delivery.interaction_id:
+                    # Released so the next restart sends a failed notification again
+                    record = (
+                        self._registry.mark_webhook_delivered
+                        if delivered
+                        else self._registry.release_webhook
+                    )
+                    await asyncio.to_thread(record, delivery.interaction_id)
+            except Exception:
+                logger.exception("Webhook delivery to %s failed", delivery.url)
+            finally:
+                queue.task_done()
+
+    def _backoff(self, attempt: int, retry_after: float | None) -> float:
+        """Return the delay before the next attempt (full jitter)."""
+        ceiling = min(
+            self._settings.backoff_max, self._settings.backoff_base * 2**attempt
+        )
+        delay = random.uniform(0, ceiling)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self._settings.backoff_max))
+        return delay
+
+    async def deliver(self, delivery: WebhookDelivery) -> bool:
+        """POST a notification, retrying transient failures.
+
+        Args:
+            delivery: The notification to deliver.
+
+        Returns:
+            Whether a receiver accepted it with a 2xx response. Deliveries
+            to URLs failing check_url are not attempted.
+        """
+        try:
+            # Resolved again, as DNS may have changed since the job started
+            await self.check_url(delivery.url)
+        except WebhookURLError as exc:
+            logger.warning("Not delivering webhook to %s: %s", delivery.url, exc)
+            return False
+        secret = self._settings.secret or ""
+        for attempt in range(self._settings.max_attempts):
+            timestamp = int(time.time())
+            headers = {
+                "Content-Type": "application/json",
+                DELIVERY_ID_HEADER: delivery.delivery_id,
+                TIMESTAMP_HEADER: str(timestamp),
+                SIGNATURE_HEADER: sign_payload(secret, timestamp, delivery.body),
+            }
+            retry_after: float | None = None
+            try:
+                response = await self._client_factory().post(
+                    delivery.url,
+                    content=delivery.body,
+                    headers=headers,
+                    timeout=httpx.Timeout(self._settings.timeout),
+                )
+            except httpx.HTTPError as exc:
+                logger.info(
+                    "Webhook attempt %d to %s failed: %s",
+                    attempt + 1,
+                    delivery.url,
+                    exc,
+                )
+            else:
+                if response.is_success:
+                    return True
+                if (
+                    response.status_code < 500
+                    and response.status_code not in _RETRYABLE_STATUS_CODES
+                ):
+                    logger.warning(
+                        "Webhook to %s rejected with %d; not retrying",
+                        delivery.url,
+                        response.status_code,
+                    )
+                    return False
+                retry_after = parse_retry_after(response.headers.get("retry-after"))
+                logger.info(
+                    "Webhook attempt %d to %s got %d",
+                    attempt + 1,
+                    delivery.url,
+                    response.status_code,
+                )
+
+            if attempt + 1 < self._settings.max_attempts:
+                await self._sleep(self._backoff(attempt, retry_after))
+
+        logger.warning(
+            "Giving up on webhook to %s after %d attempts",
+            delivery.url,
+            self._settings.max_attempts,
+        )
+        return False
+
+
+# Process-wide dispatcher shared by the Gemini routes and status poller
+webhooks = WebhookDispatcher()
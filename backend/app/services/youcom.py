@@ -5,6 +5,9 @@ from typing import Any
 import httpx
 
 from app.core.config import settings
+from app.core.deadline import cap_timeout
+from app.core.http_utils import http_clients, parse_retry_after
+from app.core.resilience import ResiliencePolicy, resilient
 from app.exceptions.youcom import YouComAPIError
 from app.schemas.youcom import YouComDeepResearchRequest, YouComDeepResearchResponse
 
@@ -24,6 +27,9 @@ class YouComService:
 
         self._api_key: str = youcom_settings.api_key
         self._timeout: int = youcom_settings.timeout
+        self._resilience = ResiliencePolicy(
+            "You.com", YouComAPIError, rate_limit_key="youcom"
+        )
 
     def _build_headers(self) -> dict[str, str]:
         return {
@@ -31,6 +37,9 @@ class YouComService:
             "Content-Type": "application/json",
         }
 
+    def _get_client(self) -> httpx.AsyncClient:
+        return http_clients.get("youcom")
+
     def _build_payload(
         self,
         request: YouComDeepResearchRequest,
@@ -56,10 +65,13 @@ class YouComService:
         self,
         status_code: int,
         response_body: str | None = None,
+        retry_after: float | None = None,
     ) -> YouComAPIError:
         details: dict[str, Any] | None = None
         if response_body:
             details = {"response_body": response_body}
+        if retry_after is not None and status_code in (429, 502, 503, 504):
+            details = {**(details or {}), "retry_after": retry_after}
 
         if status_code == 401:
             return YouComAPIError.invalid_api_key(details=details)
@@ -71,39 +83,50 @@ class YouComService:
                 details=details,
             )
 
+        if status_code in (502, 503, 504):
+            return YouComAPIError.service_unavailable(
+                message=f"You.com API unavailable (HTTP {status_code})",
+                details=details,
+            )
+
         return YouComAPIError.api_error(
             message=f"You.com API error (HTTP {status_code})",
             details=details,
         )
 
+    @resilient()
     async def deep_research(
         self,
         request: YouComDeepResearchRequest,
     ) -> YouComDeepResearchResponse:
         headers = self._build_headers()
         payload = self._build_payload(request)
+        timeout = cap_timeout(self._timeout)
 
         try:
-            async with httpx.AsyncClient(timeout=httpx.Timeout(self._timeout)) as client:
-                response = await client.post(
-                    self.BASE_URL,
-                    headers=headers,
-                    json=payload,
-                )
+            response = await self._get_client().post(
+                self.BASE_URL,
+                headers=headers,
+                json=payload,
+                timeout=httpx.Timeout(timeout),
+            )
 
-                if response.status_code != 200:
-                    raise self._handle_error(
-                        status_code=response.status_code,
-                        response_body=response.text,
-                    )
+            self._resilience.observe_headers(response.headers, "deep_research")
+
+            if response.status_code != 200:
+                raise self._handle_error(
+                    status_code=response.status_code,
+                    response_body=response.text,
+                    retry_after=parse_retry_after(response.headers.get("retry-after")),
+                )
 
-                return self._parse_response(response.json())
+            return self._parse_response(response.json())
 
         except YouComAPIError:
             raise
         except httpx.TimeoutException as exc:
             raise YouComAPIError.request_timeout(
-                message=f"Request timed out after {self._timeout} seconds.",
+                message=f"Request timed out after {timeout:g} seconds.",
                 details={"original_error": str(exc)},
             ) from exc
         except httpx.HTTPError as exc:
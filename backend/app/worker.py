@@ -0,0 +1,42 @@
+"""Entry point of the background research worker process.
+
+Runs queued Perplexity and You.com deep research jobs until SIGTERM or
+SIGINT. Start as many workers (on as many nodes) as needed:
+
+    python -m app.worker
+"""
+
+import asyncio
+import logging
+import signal
+
+from app.core.http_utils import http_clients
+from app.services.registry import services
+from app.services.research_worker import ResearchWorker
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def run() -> None:
+    """Run a research worker until the process is asked to stop."""
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, stop.set)
+
+    services.startup()
+    try:
+        await ResearchWorker().run(stop)
+    finally:
+        services.clear()
+        await http_clients.aclose()
+
+
+def main() -> None:
+    logger.info("Starting research worker")
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+from collections.abc import Generator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.services.content_cache import content_cache
+
+
+@pytest.fixture
+def cached_entries() -> Generator[None, None, None]:
+    content_cache.purge()
+    content_cache.put_many(
+        [
+            {"url": "https://example.com/a", "raw_content": "a"},
+            {"url": "https://example.com/b", "raw_content": "b"},
+        ]
+    )
+    yield
+    content_cache.purge()
+
+
+def test_content_cache_requires_superuser(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/content-cache/stats",
+        headers=normal_user_token_headers,
+    )
+
+    assert response.status_code == 403
+
+
+@pytest.mark.usefixtures("cached_entries")
+def test_content_cache_inspect_and_purge(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    url = f"{settings.API_V1_STR}/content-cache/"
+
+    stats = client.get(f"{url}stats", headers=superuser_token_headers).json()
+    assert stats["entries"] == 2
+
+    listing = client.get(url, headers=superuser_token_headers).json()
+    assert listing["count"] == 2
+    assert "data" not in listing["data"][0]
+    assert {entry["url"] for entry in listing["data"]} == {
+        "https://example.com/a",
+        "https://example.com/b",
+    }
+
+    response = client.delete(
+        url,
+        headers=superuser_token_headers,
+        params={"url": "https://EXAMPLE.com/a/"},
+    )
+    assert response.json() == {"message": "Purged 1 cached extractions"}
+
+    response = client.delete(url, headers=superuser_token_headers)
+    assert response.json() == {"message": "Purged 1 cached extractions"}
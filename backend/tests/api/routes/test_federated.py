@@ -0,0 +1,99 @@
+from collections.abc import Generator
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_federated_service
+from app.core.config import settings
+from app.main import app
+from app.schemas.federated import (
+    FederatedProvider,
+    FederatedProviderResult,
+    FederatedProviderStatus,
+    FederatedResearchResponse,
+)
+from app.schemas.tavily import ErrorResponse, SearchResponse
+
+
+@pytest.fixture
+def mock_federated_service() -> MagicMock:
+    service = MagicMock()
+    service.research = AsyncMock()
+    return service
+
+
+@pytest.fixture
+def client_with_mock_federated(
+    mock_federated_service: MagicMock,
+) -> Generator[TestClient, None, None]:
+    app.dependency_overrides[get_federated_service] = lambda: mock_federated_service
+    with TestClient(app) as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
+def test_federated_research_requires_auth(
+    client_with_mock_federated: TestClient,
+) -> None:
+    response = client_with_mock_federated.post(
+        f"{settings.API_V1_STR}/federated/research",
+        json={"query": "test query"},
+    )
+
+    assert response.status_code == 401
+
+
+def test_federated_research_returns_partial_results(
+    client_with_mock_federated: TestClient,
+    mock_federated_service: MagicMock,
+    superuser_token_headers: dict[str, str],
+) -> None:
+    mock_federated_service.research.return_value = FederatedResearchResponse(
+        query="test query",
+        results=[
+            FederatedProviderResult(
+                provider=FederatedProvider.TAVILY,
+                status=FederatedProviderStatus.SUCCESS,
+                duration_ms=12.5,
+                result=SearchResponse(query="test query", results=[]),
+            ),
+            FederatedProviderResult(
+                provider=FederatedProvider.YOUCOM,
+                status=FederatedProviderStatus.TIMEOUT,
+                duration_ms=1000.0,
+                error=ErrorResponse(error_code="request_timeout", message="slow"),
+            ),
+        ],
+        succeeded=1,
+        failed=1,
+        duration_ms=1000.2,
+    )
+
+    response = client_with_mock_federated.post(
+        f"{settings.API_V1_STR}/federated/research",
+        headers=superuser_token_headers,
+        json={"query": "test query", "providers": ["tavily", "youcom"], "timeout": 1},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [result["status"] for result in body["results"]] == ["success", "timeout"]
+    assert body["results"][0]["result"]["query"] == "test query"
+    assert body["results"][1]["error"]["error_code"] == "request_timeout"
+    request = mock_federated_service.research.call_args.args[0]
+    assert request.providers == [FederatedProvider.TAVILY, FederatedProvider.YOUCOM]
+    assert request.timeout == 1
+
+
+def test_federated_research_validates_providers(
+    client_with_mock_federated: TestClient,
+    superuser_token_headers: dict[str, str],
+) -> None:
+    response = client_with_mock_federated.post(
+        f"{settings.API_V1_STR}/federated/research",
+        headers=superuser_token_headers,
+        json={"query": "test query", "providers": []},
+    )
+
+    assert response.status_code == 422
@@ -0,0 +1,583 @@
+import asyncio
+import json
+import time
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, delete
+from starlette.requests import Request
+
+from app import crud
+from app.api.deps import (
+    get_gemini_poller,
+    get_gemini_service,
+    get_webhook_dispatcher,
+)
+from app.api.routes.gemini import deep_research_sync
+from app.core.config import settings
+from app.core.db import engine
+from app.core.disconnect import ClientDisconnectedError
+from app.exceptions.gemini import GeminiAPIError
+from app.main import app
+from app.models import GeminiInteraction
+from app.schemas.gemini import (
+    GeminiDeepResearchJobResponse,
+    GeminiDeepResearchRequest,
+    GeminiInteractionStatus,
+)
+from app.services.gemini_poller import GeminiStatusPoller
+from app.services.gemini_registry import gemini_interactions
+from app.services.webhooks import WebhookDispatcher
+from tests.utils.gemini import ScriptedGemini, statuses
+
+URL = f"{settings.API_V1_STR}/gemini/deep-research"
+STREAM_URL = f"{URL}/interaction-1/stream"
+
+SNAPSHOTS: list[dict[str, Any]] = [
+    {"status": "in_progress", "event_id": "evt-1"},
+    {
+        "status": "in_progress",
+        "event_id": "evt-2",
+        "outputs": [{"thinking_summary": "Planning the search"}],
+    },
+    {
+        "status": "completed",
+        "event_id": "evt-3",
+        "outputs": [
+            {"thinking_summary": "Planning the search"},
+            {"text": "## Findings"},
+        ],
+    },
+]
+
+
+@pytest.fixture
+def scripted_gemini(monkeypatch: pytest.MonkeyPatch) -> ScriptedGemini:
+    monkeypatch.setattr(settings.gemini, "api_key", "test-gemini-key")
+    return ScriptedGemini(SNAPSHOTS)
+
+
+@pytest.fixture(autouse=True)
+def recorded_interaction(db: Session) -> Generator[None, None, None]:
+    owner = crud.get_user_by_email(session=db, email=settings.FIRST_SUPERUSER)
+    assert owner is not None
+    gemini_interactions.record("interaction-1", owner.id, "Research question")
+    yield
+    with Session(engine) as session:
+        session.execute(delete(GeminiInteraction))
+        session.commit()
+
+
+@pytest.fixture
+def client_with_scripted_gemini(
+    scripted_gemini: ScriptedGemini,
+) -> Generator[TestClient, None, None]:
+    poller = GeminiStatusPoller(lambda: scripted_gemini, poll_interval=0.01)
+    app.dependency_overrides[get_gemini_service] = lambda: scripted_gemini
+    app.dependency_overrides[get_gemini_poller] = lambda: poller
+    with TestClient(app) as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
+def parse_sse(body: str) -> list[dict[str, Any]]:
+    events = []
+    for frame in body.strip().split("\n\n"):
+        fields: dict[str, Any] = {}
+        for line in frame.splitlines():
+            if line.startswith(":"):
+                continue
+            key, _, value = line.partition(": ")
+            fields[key] = json.loads(value) if key == "data" else value
+        if fields:
+            events.append(fields)
+    return events
+
+
+def test_gemini_stream_requires_auth(client_with_scripted_gemini: TestClient) -> None:
+    response = client_with_scripted_gemini.get(STREAM_URL)
+
+    assert response.status_code == 401
+
+
+def test_gemini_stream_emits_progress_and_final_result(
+    client_with_scripted_gemini: TestClient,
+    superuser_token_headers: dict[str, str],
+) -> None:
+    response = client_with_scripted_gemini.get(
+        STREAM_URL, headers=superuser_token_headers
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = parse_sse(response.text)
+    assert [event["event"] for event in events] == [
+        "status_update",
+        "thinking_update",
+        "status_update",
+        "research_update",
+        "final_result",
+    ]
+    assert events[1]["id"] == "1:evt-2"
+    assert events[3]["data"]["output"]["content"] == "## Findings"
+    assert events[-1]["data"]["status"] == "completed"
+    assert events[-1]["data"]["output_count"] == 2
+
+
+def test_gemini_stream_resumes_from_last_event_id(
+    client_with_scripted_gemini: TestClient,
+    superuser_token_headers: dict[str, str],
+) -> None:
+    response = client_with_scripted_gemini.get(
+        STREAM_URL,
+        headers={**superuser_token_headers, "Last-Event-ID": "1:evt-2"},
+    )
+
+    events = parse_sse(response.text)
+    updates = [event for event in events if event["event"].endswith("_update")]
+    assert [
+        event["data"]["index"] for event in updates if "index" in event["data"]
+    ] == [1]
+    assert events[-1]["event"] == "final_result"
+
+
+def test_gemini_stream_reports_failure_as_error_event(
+    client_with_scripted_gemini: TestClient,
+    scripted_gemini: ScriptedGemini,
+    superuser_token_headers: dict[str, str],
+) -> None:
+    scripted_gemini.snapshots = [{"status": "failed", "error_message": "boom"}]
+
+    response = client_with_scripted_gemini.get(
+        STREAM_URL, headers=superuser_token_headers
+    )
+
+    events = parse_sse(response.text)
+    assert events[-1]["event"] == "error"
+    assert events[-1]["data"]["error_code"] == "research_failed"
+
+
+def test_gemini_interaction_hidden_from_other_users(
+    client_with_scripted_gemini: TestClient,
+    scripted_gemini: ScriptedGemini,
+    normal_user_token_headers: dict[str, str],
+) -> None:
+    for response in (
+        client_with_scripted_gemini.get(STREAM_URL, headers=normal_user_token_headers),
+        client_with_scripted_gemini.get(
+            f"{URL}/interaction-1", headers=normal_user_token_headers
+        ),
+        client_with_scripted_gemini.delete(
+            f"{URL}/interaction-1", headers=normal_user_token_headers
+        ),
+    ):
+        assert response.status_code == 404
+        assert response.json()["error_code"] == "interaction_not_found"
+
+    response = client_with_scripted_gemini.get(URL, headers=normal_user_token_headers)
+    assert response.json() == {"data": [], "count": 0}
+    assert scripted_gemini.poll_calls == []
+
+
+def test_gemini_list_reflects_polled_status(
+    client_with_scripted_gemini: TestClient,
+    superuser_token_headers: dict[str, str],
+) -> None:
+    response = client_with_scripted_gemini.get(URL, headers=superuser_token_headers)
+    assert response.status_code == 200
+    assert response.json()["data"][0]["status"] == "pending"
+
+    client_with_scripted_gemini.get(STREAM_URL, headers=superuser_token_headers)
+
+    response = client_with_scripted_gemini.get(URL, headers=superuser_token_headers)
+    data = response.json()
+    assert data["count"] == 1
+    interaction = data["data"][0]
+    assert interaction["interaction_id"] == "interaction-1"
+    assert interaction["query"] == "Research question"
+    assert interaction["status"] == "completed"
+    assert interaction["last_event_id"] == "evt-3"
+    assert interaction["output_count"] == 2
+    assert interaction["completed_at"] is not None
+
+    response = client_with_scripted_gemini.get(
+        URL, headers=superuser_token_headers, params={"status": "in_progress"}
+    )
+    assert response.json()["count"] == 0
+
+
+async def resolve_public(_host: str) -> list[str]:
+    return ["93.184.216.34"]
+
+
+class RecordingDispatcher(WebhookDispatcher):
+    def __init__(self) -> None:
+        super().__init__(resolve=resolve_public)
+        self.finished: list[GeminiInteraction] = []
+
+    def notify_finished(self, interaction: GeminiInteraction) -> bool:
+        self.finished.append(interaction)
+        return True
+
+
+def test_gemini_callback_url_requires_webhooks(
+    client_with_scripted_gemini: TestClient,
+    superuser_token_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings.webhook, "secret", None)
+
+    response = client_with_scripted_gemini.post(
+        URL,
+        headers=superuser_token_headers,
+        json={"query": "Research question", "callback_url": "https://c.test/hook"},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["error_code"] == "invalid_request"
+
+
+@pytest.mark.parametrize(
+    ("callback_url", "status_code"),
+    [
+        ("https://127.0.0.1/hook", 400),
+        ("https://169.254.169.254/latest/meta-data", 400),
+        (f"https://c.test/{'x' * 2100}", 422),
+    ],
+)
+def test_gemini_callback_url_rejected_before_the_job_starts(
+    client_with_scripted_gemini: TestClient,
+    scripted_gemini: ScriptedGemini,
+    superuser_token_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+    callback_url: str,
+    status_code: int,
+) -> None:
+    monkeypatch.setattr(settings.webhook, "secret", "test-webhook-secret")
+    started: list[Any] = []
+
+    async def start_research(request: Any) -> GeminiDeepResearchJobResponse:
+        started.append(request)
+        return GeminiDeepResearchJobResponse.model_validate({"id": "interaction-2"})
+
+    monkeypatch.setattr(scripted_gemini, "start_research", start_research)
+
+    response = client_with_scripted_gemini.post(
+        URL,
+        headers=superuser_token_headers,
+        json={"query": "Research question", "callback_url": callback_url},
+    )
+
+    assert response.status_code == status_code
+    assert started == []
+
+
+def test_gemini_callback_url_notified_when_job_finishes(
+    scripted_gemini: ScriptedGemini,
+    superuser_token_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings.webhook, "secret", "test-webhook-secret")
+
+    async def start_research(_request: Any) -> GeminiDeepResearchJobResponse:
+        return GeminiDeepResearchJobResponse.model_validate({"id": "interaction-2"})
+
+    monkeypatch.setattr(scripted_gemini, "start_research", start_research)
+    dispatcher = RecordingDispatcher()
+    poller = GeminiStatusPoller(
+        lambda: scripted_gemini, poll_interval=0.01, webhook_dispatcher=dispatcher
+    )
+    app.dependency_overrides[get_gemini_service] = lambda: scripted_gemini
+    app.dependency_overrides[get_gemini_poller] = lambda: poller
+    app.dependency_overrides[get_webhook_dispatcher] = lambda: dispatcher
+    try:
+        with TestClient(app) as client:
+            response = client.post(
+                URL,
+                headers=superuser_token_headers,
+                json={
+                    "query": "Research question",
+                    "callback_url": "https://c.test/hook",
+                },
+            )
+            assert response.status_code == 200
+            for _ in range(200):
+                if dispatcher.finished:
+                    break
+                time.sleep(0.01)
+            client.portal.call(poller.stop)  # type: ignore[union-attr]
+    finally:
+        app.dependency_overrides.clear()
+
+    (finished,) = dispatcher.finished
+    assert finished.interaction_id == "interaction-2"
+    assert finished.status == "completed"
+    assert finished.callback_url == "https://c.test/hook"
+
+
+def test_gemini_sync_stops_waiting_at_the_request_deadline(
+    client_with_scripted_gemini: TestClient,
+    scripted_gemini: ScriptedGemini,
+    superuser_token_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    scripted_gemini.snapshots = [{"status": "in_progress"}]
+
+    async def start_research(_request: Any) -> GeminiDeepResearchJobResponse:
+        return GeminiDeepResearchJobResponse.model_validate({"id": "interaction-2"})
+
+    monkeypatch.setattr(scripted_gemini, "start_research", start_research)
+
+    started = time.monotonic()
+    response = client_with_scripted_gemini.post(
+        f"{URL}/sync",
+        headers={**superuser_token_headers, "X-Timeout-Ms": "800"},
+        json={"query": "Research question"},
+    )
+
+    assert time.monotonic() - started < 5
+    assert response.status_code == 504
+    body = response.json()
+    assert body["error_code"] == "request_timeout"
+    assert body["details"] == {"interaction_id": "interaction-2"}
+
+
+@pytest.mark.parametrize("cancel_on_disconnect", [True, False])
+def test_gemini_sync_cancels_job_when_client_disconnects(
+    db: Session,
+    monkeypatch: pytest.MonkeyPatch,
+    cancel_on_disconnect: bool,
+) -> None:
+    monkeypatch.setattr(settings.gemini, "api_key", "test-gemini-key")
+    monkeypatch.setattr(settings.gemini, "cancel_on_disconnect", cancel_on_disconnect)
+    gemini = ScriptedGemini(statuses("in_progress"))
+    cancelled: list[str] = []
+
+    async def start_research(_request: Any) -> GeminiDeepResearchJobResponse:
+        return GeminiDeepResearchJobResponse.model_validate({"id": "interaction-2"})
+
+    async def cancel_research(interaction_id: str) -> None:
+        cancelled.append(interaction_id)
+
+    monkeypatch.setattr(gemini, "start_research", start_research)
+    monkeypatch.setattr(gemini, "cancel_research", cancel_research)
+    user = crud.get_user_by_email(session=db, email=settings.FIRST_SUPERUSER)
+    assert user is not None
+
+    async def scenario() -> None:
+        disconnect = asyncio.Event()
+
+        async def receive() -> dict[str, Any]:
+            await disconnect.wait()
+            return {"type": "http.disconnect"}
+
+        poller = GeminiStatusPoller(lambda: gemini, poll_interval=0.01)
+        asyncio.get_running_loop().call_later(0.05, disconnect.set)
+        try:
+            await deep_research_sync(
+                current_user=user,
+                gemini=gemini,
+                poller=poller,
+                registry=gemini_interactions,
+                webhooks=RecordingDispatcher(),
+                request=GeminiDeepResearchRequest(query="Research question"),
+                http_request=Request({"type": "http", "headers": []}, receive),
+            )
+        finally:
+            await poller.stop()
+
+    with pytest.raises(ClientDisconnectedError):
+        asyncio.run(scenario())
+
+    interaction = gemini_interactions.get("interaction-2")
+    assert interaction is not None
+    if cancel_on_disconnect:
+        assert cancelled == ["interaction-2"]
+        assert interaction.status == "cancelled"
+    else:
+        assert cancelled == []
+        assert interaction.status == "in_progress"
+
+
+def test_gemini_bulk_status_reports_statuses_and_errors(
+    client_with_scripted_gemini: TestClient,
+    scripted_gemini: ScriptedGemini,
+    superuser_token_headers: dict[str, str],
+    db: Session,
+) -> None:
+    owner = crud.get_user_by_email(session=db, email=settings.FIRST_SUPERUSER)
+    assert owner is not None
+    gemini_interactions.record("interaction-done", owner.id, "Earlier question")
+    gemini_interactions.mark("interaction-done", GeminiInteractionStatus.CANCELLED)
+
+    response = client_with_scripted_gemini.post(
+        f"{URL}/status",
+        headers=superuser_token_headers,
+        json={
+            "interaction_ids": [
+                "interaction-1",
+                "interaction-done",
+                "unknown",
+                "interaction-1",
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert list(body["statuses"]) == ["interaction-1", "interaction-done"]
+    assert body["statuses"]["interaction-1"]["status"] == "in_progress"
+    assert body["statuses"]["interaction-1"]["event_id"] == "evt-1"
+    assert body["statuses"]["interaction-done"]["status"] == "cancelled"
+    assert body["errors"]["unknown"]["error_code"] == "interaction_not_found"
+    # The finished job was answered from the registry; only the running one
+    # is polled (the scheduler may already have polled it again)
+    assert {call["interaction_id"] for call in scripted_gemini.poll_calls} == {
+        "interaction-1"
+    }
+
+
+def test_gemini_bulk_status_hides_other_users_jobs_and_upstream_errors(
+    client_with_scripted_gemini: TestClient,
+    scripted_gemini: ScriptedGemini,
+    superuser_token_headers: dict[str, str],
+    normal_user_token_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    response = client_with_scripted_gemini.post(
+        f"{URL}/status",
+        headers=normal_user_token_headers,
+        json={"interaction_ids": ["interaction-1"]},
+    )
+    assert response.json()["statuses"] == {}
+    assert response.json()["errors"]["interaction-1"]["error_code"] == (
+        "interaction_not_found"
+    )
+
+    async def rate_limited(*_args: Any, **_kwargs: Any) -> None:
+        raise GeminiAPIError.rate_limit_exceeded()
+
+    monkeypatch.setattr(scripted_gemini, "poll_research", rate_limited)
+    response = client_with_scripted_gemini.post(
+        f"{URL}/status",
+        headers=superuser_token_headers,
+        json={"interaction_ids": ["interaction-1"]},
+    )
+    assert response.status_code == 200
+    assert response.json()["errors"]["interaction-1"]["error_code"] == (
+        "rate_limit_exceeded"
+    )
+
+
+def test_gemini_poll_returns_outputs_since_cursor(
+    client_with_scripted_gemini: TestClient,
+    scripted_gemini: ScriptedGemini,
+    superuser_token_headers: dict[str, str],
+) -> None:
+    scripted_gemini.snapshots = [SNAPSHOTS[1]]
+    response = client_with_scripted_gemini.get(
+        f"{URL}/interaction-1", headers=superuser_token_headers
+    )
+    first = response.json()
+    assert first["output_offset"] == 0
+    assert [o["thinking_summary"] for o in first["outputs"]] == ["Planning the search"]
+    assert first["cursor"] == "1:evt-2"
+
+    scripted_gemini.snapshots = [SNAPSHOTS[2]]
+    poller = app.dependency_overrides[get_gemini_poller]()
+    poller.invalidate("interaction-1")
+    response = client_with_scripted_gemini.get(
+        f"{URL}/interaction-1",
+        headers=superuser_token_headers,
+        params={"last_event_id": first["cursor"]},
+    )
+    delta = response.json()
+    assert delta["status"] == "completed"
+    assert delta["output_offset"] == 1
+    assert [o["content"] for o in delta["outputs"]] == ["## Findings"]
+    assert delta["cursor"] == "2:evt-3"
+
+    for cursor, expected in (("2:evt-3", 0), ("evt-3", 2), ("9:evt-3", 0)):
+        response = client_with_scripted_gemini.get(
+            f"{URL}/interaction-1",
+            headers=superuser_token_headers,
+            params={"last_event_id": cursor},
+        )
+        assert len(response.json()["outputs"]) == expected
+
+
+def test_gemini_long_poll_waits_for_change_within_deadline(
+    client_with_scripted_gemini: TestClient,
+    scripted_gemini: ScriptedGemini,
+    superuser_token_headers: dict[str, str],
+) -> None:
+    scripted_gemini.snapshots = [{"status": "in_progress", "event_id": "evt-1"}]
+    response = client_with_scripted_gemini.get(
+        f"{URL}/interaction-1", headers=superuser_token_headers
+    )
+    cursor = response.json()["cursor"]
+
+    # Nothing changes: the request deadline cuts the wait short
+    started = time.monotonic()
+    response = client_with_scripted_gemini.get(
+        f"{URL}/interaction-1",
+        headers={**superuser_token_headers, "X-Timeout-Ms": "700"},
+        params={"last_event_id": cursor, "wait": 30},
+    )
+    assert response.status_code == 200
+    assert response.json()["cursor"] == cursor
+    assert time.monotonic() - started < 5
+
+    scripted_gemini.snapshots = SNAPSHOTS
+    response = client_with_scripted_gemini.get(
+        f"{URL}/interaction-1",
+        headers=superuser_token_headers,
+        params={"last_event_id": cursor, "wait": 30},
+    )
+    body = response.json()
+    assert body["cursor"] != cursor
+    assert body["status"] in {"in_progress", "completed"}
+
+
+def test_gemini_poll_answers_304_while_unchanged(
+    client_with_scripted_gemini: TestClient,
+    scripted_gemini: ScriptedGemini,
+    superuser_token_headers: dict[str, str],
+) -> None:
+    scripted_gemini.snapshots = [SNAPSHOTS[1]]
+    response = client_with_scripted_gemini.get(
+        f"{URL}/interaction-1", headers=superuser_token_headers
+    )
+    etag = response.headers["etag"]
+    assert response.status_code == 200
+
+    for if_none_match in (etag, f"W/{etag}", f'"other", {etag}'):
+        response = client_with_scripted_gemini.get(
+            f"{URL}/interaction-1",
+            headers={**superuser_token_headers, "If-None-Match": if_none_match},
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    # The same snapshot seen from a cursor is a different representation
+    response = client_with_scripted_gemini.get(
+        f"{URL}/interaction-1",
+        headers={**superuser_token_headers, "If-None-Match": etag},
+        params={"last_event_id": "1:evt-2"},
+    )
+    assert response.status_code == 200
+    assert response.json()["outputs"] == []
+
+    scripted_gemini.snapshots = [SNAPSHOTS[2]]
+    poller = app.dependency_overrides[get_gemini_poller]()
+    poller.invalidate("interaction-1")
+    response = client_with_scripted_gemini.get(
+        f"{URL}/interaction-1",
+        headers={**superuser_token_headers, "If-None-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["status"] == "completed"
@@ -0,0 +1,187 @@
+import asyncio
+import json
+import uuid
+from collections.abc import AsyncIterator, Generator
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, delete
+
+from app.api.deps import get_perplexity_service
+from app.core.config import settings
+from app.core.db import engine
+from app.exceptions.perplexity import PerplexityAPIError
+from app.main import app
+from app.models import ResearchJob
+from app.schemas.perplexity import (
+    PerplexityDeepResearchResponse,
+    PerplexityStreamEvent,
+    PerplexityStreamEventType,
+)
+from app.services.job_queue import job_queue
+from tests.utils.disconnect import post_then_disconnect
+
+URL = f"{settings.API_V1_STR}/perplexity/deep-research"
+
+
+@pytest.fixture
+def mock_perplexity_service() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def client_with_mock_perplexity(
+    mock_perplexity_service: MagicMock,
+) -> Generator[TestClient, None, None]:
+    app.dependency_overrides[get_perplexity_service] = lambda: mock_perplexity_service
+    with TestClient(app) as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
+def stream_of(*items: PerplexityStreamEvent | Exception) -> Any:
+    async def events(_request: Any) -> AsyncIterator[PerplexityStreamEvent]:
+        for item in items:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    return events
+
+
+def parse_sse(body: str) -> list[tuple[str, Any]]:
+    events = []
+    for frame in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in frame.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def test_perplexity_stream_relays_deltas_and_final_result(
+    client_with_mock_perplexity: TestClient,
+    mock_perplexity_service: MagicMock,
+    superuser_token_headers: dict[str, str],
+) -> None:
+    final = PerplexityDeepResearchResponse(
+        id="resp-1",
+        model="sonar-deep-research",
+        citations=["https://example.com/a"],
+    )
+    mock_perplexity_service.stream_deep_research = stream_of(
+        PerplexityStreamEvent(event=PerplexityStreamEventType.CONTENT, content="Hi"),
+        PerplexityStreamEvent(
+            event=PerplexityStreamEventType.FINAL_RESULT, response=final
+        ),
+    )
+
+    response = client_with_mock_perplexity.post(
+        URL, headers=superuser_token_headers, json={"query": "q", "stream": True}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = parse_sse(response.text)
+    assert events[0] == ("content", {"content": "Hi"})
+    assert events[1][0] == "final_result"
+    assert events[1][1]["citations"] == ["https://example.com/a"]
+
+
+def test_perplexity_stream_error_before_first_chunk_returns_status(
+    client_with_mock_perplexity: TestClient,
+    mock_perplexity_service: MagicMock,
+    superuser_token_headers: dict[str, str],
+) -> None:
+    mock_perplexity_service.stream_deep_research = stream_of(
+        PerplexityAPIError.rate_limit_exceeded()
+    )
+
+    response = client_with_mock_perplexity.post(
+        URL, headers=superuser_token_headers, json={"query": "q", "stream": True}
+    )
+
+    assert response.status_code == 429
+    assert response.json()["error_code"] == "rate_limit_exceeded"
+
+
+def test_perplexity_stream_error_mid_stream_sends_error_event(
+    client_with_mock_perplexity: TestClient,
+    mock_perplexity_service: MagicMock,
+    superuser_token_headers: dict[str, str],
+) -> None:
+    mock_perplexity_service.stream_deep_research = stream_of(
+        PerplexityStreamEvent(event=PerplexityStreamEventType.CONTENT, content="Hi"),
+        PerplexityAPIError.request_timeout(),
+    )
+
+    response = client_with_mock_perplexity.post(
+        URL, headers=superuser_token_headers, json={"query": "q", "stream": True}
+    )
+
+    events = parse_sse(response.text)
+    assert events[-1][0] == "error"
+    assert events[-1][1]["error_code"] == "request_timeout"
+
+
+def test_perplexity_job_submit_drops_stream_option(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+) -> None:
+    response = client.post(
+        f"{URL}/jobs",
+        headers=superuser_token_headers,
+        json={"query": "q", "stream": True},
+    )
+
+    assert response.status_code == 202
+    job = job_queue.get(uuid.UUID(response.json()["id"]))
+    assert job is not None
+    assert job.provider == "perplexity"
+    assert job.request["query"] == "q"
+    assert "stream" not in job.request
+
+    response = client.get(
+        f"{settings.API_V1_STR}/youcom/deep-research/jobs/{job.id}",
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 404
+
+    with Session(engine) as session:
+        session.execute(delete(ResearchJob))
+        session.commit()
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_perplexity_research_cancelled_when_client_disconnects(
+    mock_perplexity_service: MagicMock,
+    superuser_token_headers: dict[str, str],
+    stream: bool,
+) -> None:
+    cancelled = asyncio.Event()
+
+    async def slow_research(_request: Any) -> None:
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def slow_stream(_request: Any) -> AsyncIterator[PerplexityStreamEvent]:
+        await slow_research(_request)
+        yield PerplexityStreamEvent(event=PerplexityStreamEventType.CONTENT)
+
+    mock_perplexity_service.deep_research = slow_research
+    mock_perplexity_service.stream_deep_research = slow_stream
+    app.dependency_overrides[get_perplexity_service] = lambda: mock_perplexity_service
+    try:
+        messages = asyncio.run(
+            post_then_disconnect(
+                URL, superuser_token_headers, {"query": "test", "stream": stream}
+            )
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert cancelled.is_set()
+    assert messages[0]["status"] == 499
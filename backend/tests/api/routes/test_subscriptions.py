@@ -0,0 +1,274 @@
+import uuid
+from collections.abc import Generator, Iterable
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, delete
+from starlette.websockets import WebSocketDisconnect
+
+from app import crud
+from app.api.deps import get_gemini_poller, get_job_queue
+from app.core.config import settings
+from app.core.db import engine
+from app.main import app
+from app.models import GeminiInteraction, ResearchJob, User
+from app.services.gemini_poller import GeminiStatusPoller
+from app.services.gemini_registry import gemini_interactions
+from app.services.job_queue import JobQueue, job_queue
+from tests.utils.gemini import ScriptedGemini
+
+WS_URL = f"{settings.API_V1_STR}/subscriptions/ws"
+
+SNAPSHOTS: list[dict[str, Any]] = [
+    {"status": "in_progress", "event_id": "evt-1"},
+    {
+        "status": "in_progress",
+        "event_id": "evt-2",
+        "outputs": [{"thinking_summary": "Planning the search"}],
+    },
+    {
+        "status": "completed",
+        "event_id": "evt-3",
+        "outputs": [
+            {"thinking_summary": "Planning the search"},
+            {"text": "## Findings"},
+        ],
+    },
+]
+
+
+@pytest.fixture
+def superuser(db: Session) -> User:
+    user = crud.get_user_by_email(session=db, email=settings.FIRST_SUPERUSER)
+    assert user is not None
+    return user
+
+
+@pytest.fixture(autouse=True)
+def recorded_interaction(superuser: User) -> Generator[None, None, None]:
+    gemini_interactions.record("interaction-1", superuser.id, "Research question")
+    yield
+    with Session(engine) as session:
+        session.execute(delete(GeminiInteraction))
+        session.execute(delete(ResearchJob))
+        session.commit()
+
+
+@pytest.fixture
+def scripted_gemini(monkeypatch: pytest.MonkeyPatch) -> ScriptedGemini:
+    monkeypatch.setattr(settings.gemini, "api_key", "test-gemini-key")
+    monkeypatch.setattr(settings.subscriptions, "job_refresh_interval", 0.01)
+    return ScriptedGemini(SNAPSHOTS)
+
+
+@pytest.fixture
+def ws_client(scripted_gemini: ScriptedGemini) -> Generator[TestClient, None, None]:
+    poller = GeminiStatusPoller(lambda: scripted_gemini, poll_interval=0.01)
+    app.dependency_overrides[get_gemini_poller] = lambda: poller
+    with TestClient(app) as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
+def token_of(headers: dict[str, str]) -> str:
+    return headers["Authorization"].removeprefix("Bearer ")
+
+
+@pytest.mark.parametrize("token", [None, "not-a-jwt"])
+def test_subscriptions_reject_unauthenticated_connections(
+    ws_client: TestClient, token: str | None
+) -> None:
+    url = WS_URL if token is None else f"{WS_URL}?token={token}"
+
+    with pytest.raises(WebSocketDisconnect) as exc_info:
+        with ws_client.websocket_connect(url):
+            pass
+
+    assert exc_info.value.code == 1008
+
+
+def test_subscriptions_push_interaction_changes_until_finished(
+    ws_client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    with ws_client.websocket_connect(WS_URL, headers=superuser_token_headers) as ws:
+        ws.send_json({"action": "subscribe", "interaction_ids": ["interaction-1"]})
+
+        assert ws.receive_json() == {
+            "type": "subscribed",
+            "interaction_ids": ["interaction-1"],
+            "job_ids": [],
+        }
+        updates = [ws.receive_json() for _ in range(3)]
+
+    assert {update["type"] for update in updates} == {"interaction"}
+    assert [update["update"]["status"] for update in updates] == [
+        "in_progress",
+        "in_progress",
+        "completed",
+    ]
+    assert [len(update["update"]["outputs"]) for update in updates] == [0, 1, 1]
+    assert updates[1]["update"]["outputs"][0]["thinking_summary"] == (
+        "Planning the search"
+    )
+    assert updates[-1]["update"]["outputs"][0]["content"] == "## Findings"
+    assert updates[-1]["update"]["output_offset"] == 1
+    assert updates[-1]["update"]["cursor"] == "2:evt-3"
+
+
+def test_subscriptions_resume_interactions_from_cursor(
+    ws_client: TestClient,
+    scripted_gemini: ScriptedGemini,
+    superuser_token_headers: dict[str, str],
+) -> None:
+    scripted_gemini.snapshots = SNAPSHOTS[1:]
+    token = token_of(superuser_token_headers)
+
+    with ws_client.websocket_connect(f"{WS_URL}?token={token}") as ws:
+        ws.send_json(
+            {
+                "action": "subscribe",
+                "interaction_ids": ["interaction-1"],
+                "cursors": {"interaction-1": "1:evt-2"},
+            }
+        )
+        ws.receive_json()
+        first = ws.receive_json()
+        final = ws.receive_json()
+
+    assert first["update"]["outputs"] == []
+    assert first["update"]["output_offset"] == 1
+    assert [output["content"] for output in final["update"]["outputs"]] == [
+        "## Findings"
+    ]
+
+
+def test_subscriptions_push_job_changes_until_finished(
+    ws_client: TestClient, superuser: User, superuser_token_headers: dict[str, str]
+) -> None:
+    job = job_queue.submit(superuser.id, "perplexity", {"query": "Research"})
+
+    with ws_client.websocket_connect(WS_URL, headers=superuser_token_headers) as ws:
+        ws.send_json({"action": "subscribe", "job_ids": [str(job.id)]})
+        assert ws.receive_json()["job_ids"] == [str(job.id)]
+        queued = ws.receive_json()
+
+        job_queue.claim("worker-1", limit=100)
+        running = ws.receive_json()
+        job_queue.complete(job.id, "worker-1", {"answer": "done"})
+        succeeded = ws.receive_json()
+
+    assert queued["type"] == "job"
+    assert queued["job"]["id"] == str(job.id)
+    assert [update["job"]["status"] for update in (queued, running, succeeded)] == [
+        "queued",
+        "running",
+        "succeeded",
+    ]
+    assert succeeded["job"]["finished_at"] is not None
+
+
+class FlakyJobQueue(JobQueue):
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads = 0
+
+    def get_many_for_user(
+        self, job_ids: Iterable[uuid.UUID], user: User
+    ) -> dict[uuid.UUID, ResearchJob]:
+        self.reads += 1
+        if self.reads == 2:
+            raise RuntimeError("connection lost")
+        return super().get_many_for_user(job_ids, user)
+
+
+def test_subscriptions_keep_following_jobs_after_a_failed_read(
+    ws_client: TestClient, superuser: User, superuser_token_headers: dict[str, str]
+) -> None:
+    queue = FlakyJobQueue()
+    app.dependency_overrides[get_job_queue] = lambda: queue
+    job = queue.submit(superuser.id, "perplexity", {"query": "Research"})
+
+    with ws_client.websocket_connect(WS_URL, headers=superuser_token_headers) as ws:
+        ws.send_json({"action": "subscribe", "job_ids": [str(job.id)]})
+        ws.receive_json()
+        queued = ws.receive_json()
+        # The next read fails; the one after still sees the change
+        queue.claim("worker-1", limit=100)
+        running = ws.receive_json()
+
+    assert queue.reads > 2
+    assert [update["job"]["status"] for update in (queued, running)] == [
+        "queued",
+        "running",
+    ]
+
+
+def test_subscriptions_report_items_the_user_cannot_follow(
+    ws_client: TestClient,
+    scripted_gemini: ScriptedGemini,
+    superuser: User,
+    normal_user_token_headers: dict[str, str],
+) -> None:
+    job = job_queue.submit(superuser.id, "youcom", {"query": "Research"})
+
+    with ws_client.websocket_connect(WS_URL, headers=normal_user_token_headers) as ws:
+        ws.send_json(
+            {
+                "action": "subscribe",
+                "interaction_ids": ["interaction-1"],
+                "job_ids": [str(job.id)],
+            }
+        )
+        ack = ws.receive_json()
+        errors = [ws.receive_json(), ws.receive_json()]
+
+    assert ack == {"type": "subscribed", "interaction_ids": [], "job_ids": []}
+    assert errors[0]["interaction_id"] == "interaction-1"
+    assert errors[0]["error"]["error_code"] == "interaction_not_found"
+    assert errors[1]["job_id"] == str(job.id)
+    assert errors[1]["error"]["error_code"] == "job_not_found"
+    assert scripted_gemini.poll_calls == []
+
+
+def test_subscriptions_enforce_the_subscription_limit(
+    ws_client: TestClient,
+    superuser: User,
+    superuser_token_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings.subscriptions, "max_subscriptions", 1)
+    job = job_queue.submit(superuser.id, "perplexity", {"query": "Research"})
+
+    with ws_client.websocket_connect(WS_URL, headers=superuser_token_headers) as ws:
+        ws.send_json({"action": "subscribe", "job_ids": [str(job.id)]})
+        ws.receive_json()
+        ws.receive_json()
+        ws.send_json({"action": "subscribe", "interaction_ids": ["interaction-1"]})
+        ack = ws.receive_json()
+        error = ws.receive_json()
+
+        ws.send_json({"action": "unsubscribe", "job_ids": [str(job.id)]})
+        unsubscribed = ws.receive_json()
+
+    assert ack["interaction_ids"] == []
+    assert error["error"]["error_code"] == "too_many_subscriptions"
+    assert unsubscribed == {
+        "type": "unsubscribed",
+        "interaction_ids": [],
+        "job_ids": [str(job.id)],
+    }
+
+
+def test_subscriptions_report_invalid_requests(
+    ws_client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    with ws_client.websocket_connect(WS_URL, headers=superuser_token_headers) as ws:
+        ws.send_text("not json")
+        invalid_json = ws.receive_json()
+        ws.send_json({"action": "subscribe", "job_ids": [str(uuid.uuid4()), "x"]})
+        invalid_id = ws.receive_json()
+
+    for message in (invalid_json, invalid_id):
+        assert message["type"] == "error"
+        assert message["error"]["error_code"] == "invalid_request"
@@ -2,6 +2,7 @@
 
 This module contains comprehensive tests for all Tavily endpoints:
 - POST /tavily/search - Web search functionality
+- POST /tavily/search/batch - Concurrent batch search
 - POST /tavily/extract - URL content extraction
 - POST /tavily/crawl - Website crawling
 - POST /tavily/map - URL mapping/sitemap generation
@@ -10,6 +11,8 @@ Tests use mocked TavilyService to ensure fast, deterministic execution.
 Integration tests with real API calls are marked with @pytest.mark.integration.
 """
 
+import asyncio
+import json
 from collections.abc import Generator
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
@@ -17,9 +20,11 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 from fastapi.testclient import TestClient
 
-from app.api.deps import get_tavily_service
-from app.core.config import settings
+from app.api.deps import get_search_cache, get_tavily_service
+from app.core.config import SearchCacheSettings, settings
 from app.main import app
+from app.schemas.tavily import SearchRequest
+from app.services.search_cache import SearchCache
 
 # =============================================================================
 # Mock Response Factories
@@ -317,6 +322,282 @@ class TestSearchEndpoint:
         assert data["error_code"] == "tavily_api_error"
 
 
+# =============================================================================
+# Search Cache Tests
+# =============================================================================
+
+
+@pytest.fixture
+def search_cache() -> Generator[SearchCache, None, None]:
+    """Enable a fresh search response cache for the test."""
+    cache = SearchCache(SearchCacheSettings(enabled=True))
+    app.dependency_overrides[get_search_cache] = lambda: cache
+    yield cache
+    app.dependency_overrides.pop(get_search_cache, None)
+
+
+class TestSearchCache:
+    """Tests for search response caching and its admin endpoints."""
+
+    def test_identical_searches_hit_cache(
+        self,
+        client_with_mock_tavily: TestClient,
+        mock_tavily_service: MagicMock,
+        superuser_token_headers: dict[str, str],
+        search_cache: SearchCache,
+    ) -> None:
+        """Test normalized repeats of a search are served from the cache."""
+        mock_tavily_service.search.return_value = create_mock_search_response(
+            query="python programming"
+        )
+        url = f"{settings.API_V1_STR}/tavily/search"
+
+        first = client_with_mock_tavily.post(
+            url, headers=superuser_token_headers, json={"query": "python programming"}
+        )
+        second = client_with_mock_tavily.post(
+            url, headers=superuser_token_headers, json={"query": " Python  PROGRAMMING"}
+        )
+
+        assert first.status_code == second.status_code == 200
+        assert second.json() == first.json()
+        mock_tavily_service.search.assert_called_once()
+
+    def test_errors_are_not_cached(
+        self,
+        client_with_mock_tavily: TestClient,
+        mock_tavily_service: MagicMock,
+        superuser_token_headers: dict[str, str],
+        search_cache: SearchCache,
+    ) -> None:
+        """Test a failed search is retried upstream on the next request."""
+        mock_tavily_service.search.side_effect = [
+            Exception("Request timeout"),
+            create_mock_search_response(query="python"),
+        ]
+        url = f"{settings.API_V1_STR}/tavily/search"
+
+        first = client_with_mock_tavily.post(
+            url, headers=superuser_token_headers, json={"query": "python"}
+        )
+        second = client_with_mock_tavily.post(
+            url, headers=superuser_token_headers, json={"query": "python"}
+        )
+
+        assert first.status_code != 200
+        assert second.status_code == 200
+        assert mock_tavily_service.search.call_count == 2
+
+    def test_stats_and_clear(
+        self,
+        client_with_mock_tavily: TestClient,
+        mock_tavily_service: MagicMock,
+        superuser_token_headers: dict[str, str],
+        search_cache: SearchCache,
+    ) -> None:
+        """Test superusers can read cache counters and clear the cache."""
+        mock_tavily_service.search.return_value = create_mock_search_response()
+        client_with_mock_tavily.post(
+            f"{settings.API_V1_STR}/tavily/search",
+            headers=superuser_token_headers,
+            json={"query": "test query"},
+        )
+        url = f"{settings.API_V1_STR}/tavily/search/cache"
+
+        stats = client_with_mock_tavily.get(url, headers=superuser_token_headers)
+        assert stats.status_code == 200
+        assert stats.json()["entries"] == 1
+        assert stats.json()["misses"] == 1
+
+        cleared = client_with_mock_tavily.delete(url, headers=superuser_token_headers)
+        assert cleared.status_code == 200
+        assert search_cache.stats().entries == 0
+
+    def test_stats_requires_superuser(
+        self,
+        client_with_mock_tavily: TestClient,
+        normal_user_token_headers: dict[str, str],
+    ) -> None:
+        """Test normal users cannot read the cache counters."""
+        response = client_with_mock_tavily.get(
+            f"{settings.API_V1_STR}/tavily/search/cache",
+            headers=normal_user_token_headers,
+        )
+
+        assert response.status_code == 403
+
+
+# =============================================================================
+# Batch Search Endpoint Tests
+# =============================================================================
+
+
+class TestBatchSearchEndpoint:
+    """Tests for POST /tavily/search/batch endpoint."""
+
+    def test_batch_search_returns_results_in_order_with_errors(
+        self,
+        client_with_mock_tavily: TestClient,
+        mock_tavily_service: MagicMock,
+        superuser_token_headers: dict[str, str],
+    ) -> None:
+        """Test batch search keeps request order and reports per-item errors."""
+
+        async def search(query: str, **_kwargs: Any) -> dict[str, Any]:
+            if query == "bad":
+                raise Exception("rate limit exceeded")
+            await asyncio.sleep(0.05 if query == "slow" else 0)
+            return create_mock_search_response(query=query, num_results=1)
+
+        mock_tavily_service.search.side_effect = search
+
+        response = client_with_mock_tavily.post(
+            f"{settings.API_V1_STR}/tavily/search/batch",
+            headers=superuser_token_headers,
+            json={
+                "queries": [
+                    {"query": "slow"},
+                    {"query": "bad"},
+                    {"query": "fast", "max_results": 3},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["index"] for item in data["results"]] == [0, 1, 2]
+        assert data["results"][0]["result"]["query"] == "slow"
+        assert data["results"][1]["error"]["error_code"] == "rate_limit_exceeded"
+        assert data["results"][2]["result"]["query"] == "fast"
+        assert (data["succeeded"], data["failed"]) == (2, 1)
+        assert mock_tavily_service.search.call_count == 3
+
+    def test_batch_search_respects_concurrency(
+        self,
+        client_with_mock_tavily: TestClient,
+        mock_tavily_service: MagicMock,
+        superuser_token_headers: dict[str, str],
+    ) -> None:
+        """Test no more than the requested number of searches run at once."""
+        running = peak = 0
+
+        async def search(query: str, **_kwargs: Any) -> dict[str, Any]:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return create_mock_search_response(query=query)
+
+        mock_tavily_service.search.side_effect = search
+
+        response = client_with_mock_tavily.post(
+            f"{settings.API_V1_STR}/tavily/search/batch",
+            headers=superuser_token_headers,
+            json={
+                "queries": [{"query": f"q{i}"} for i in range(8)],
+                "concurrency": 2,
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json()["succeeded"] == 8
+        assert peak == 2
+
+    def test_batch_search_streams_results_as_completed(
+        self,
+        client_with_mock_tavily: TestClient,
+        mock_tavily_service: MagicMock,
+        superuser_token_headers: dict[str, str],
+    ) -> None:
+        """Test streamed batch search sends results in completion order."""
+
+        async def search(query: str, **_kwargs: Any) -> dict[str, Any]:
+            await asyncio.sleep(0.05 if query == "slow" else 0)
+            return create_mock_search_response(query=query)
+
+        mock_tavily_service.search.side_effect = search
+
+        response = client_with_mock_tavily.post(
+            f"{settings.API_V1_STR}/tavily/search/batch",
+            headers=superuser_token_headers,
+            json={
+                "queries": [{"query": "slow"}, {"query": "fast"}],
+                "stream": True,
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        frames = [frame for frame in response.text.split("\n\n") if frame]
+        assert frames[0].startswith("id: 1\nevent: result\n")
+        assert frames[1].startswith("id: 0\nevent: result\n")
+        assert frames[2] == 'event: done\ndata: {"succeeded": 2, "failed": 0}'
+
+    def test_batch_search_serves_repeated_queries_from_cache(
+        self,
+        client_with_mock_tavily: TestClient,
+        mock_tavily_service: MagicMock,
+        superuser_token_headers: dict[str, str],
+        search_cache: SearchCache,
+    ) -> None:
+        """Test a cached search is reused by a later batch."""
+        mock_tavily_service.search.return_value = create_mock_search_response(
+            query="python"
+        )
+        client_with_mock_tavily.post(
+            f"{settings.API_V1_STR}/tavily/search",
+            headers=superuser_token_headers,
+            json={"query": "python"},
+        )
+
+        response = client_with_mock_tavily.post(
+            f"{settings.API_V1_STR}/tavily/search/batch",
+            headers=superuser_token_headers,
+            json={"queries": [{"query": "Python"}]},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["results"][0]["result"]["query"] == "python"
+        mock_tavily_service.search.assert_called_once()
+
+    def test_batch_search_sends_cached_responses_as_stored(
+        self,
+        client_with_mock_tavily: TestClient,
+        mock_tavily_service: MagicMock,
+        superuser_token_headers: dict[str, str],
+        search_cache: SearchCache,
+    ) -> None:
+        """Test batch hits are spliced in as cached, not re-validated."""
+        stored = b'{"query":"python","results":[],"response_time":0.5,"stored":1}'
+        search_cache.set(SearchRequest(query="python"), stored)
+
+        response = client_with_mock_tavily.post(
+            f"{settings.API_V1_STR}/tavily/search/batch",
+            headers=superuser_token_headers,
+            json={"queries": [{"query": "python"}]},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["results"][0]["result"]["stored"] == 1
+        assert response.json()["succeeded"] == 1
+        mock_tavily_service.search.assert_not_called()
+
+    def test_batch_search_rejects_empty_batch(
+        self,
+        client_with_mock_tavily: TestClient,
+        superuser_token_headers: dict[str, str],
+    ) -> None:
+        """Test batch search without queries returns 422."""
+        response = client_with_mock_tavily.post(
+            f"{settings.API_V1_STR}/tavily/search/batch",
+            headers=superuser_token_headers,
+            json={"queries": []},
+        )
+
+        assert response.status_code == 422
+
+
 # =============================================================================
 # Extract Endpoint Tests
 # =============================================================================
@@ -523,6 +804,49 @@ class TestCrawlEndpoint:
         data = response.json()
         assert data["base_url"] == url
 
+    def test_crawl_streams_ndjson(
+        self,
+        client_with_mock_tavily: TestClient,
+        mock_tavily_service: MagicMock,
+        superuser_token_headers: dict[str, str],
+    ) -> None:
+        """Test streamed crawl emits one line per page and a summary."""
+        url = "https://docs.example.com"
+        mock_tavily_service.crawl.return_value = create_mock_crawl_response(
+            url=url, num_pages=3
+        )
+
+        response = client_with_mock_tavily.post(
+            f"{settings.API_V1_STR}/tavily/crawl",
+            headers=superuser_token_headers,
+            json={"url": url, "stream": True},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["type"] for line in lines] == ["result"] * 3 + ["summary"]
+        assert lines[0]["result"]["url"] == f"{url}/page1"
+        assert lines[0]["result"]["raw_content"] == "Crawled content from page 1"
+        assert lines[-1] == {"type": "summary", "base_url": url, "total_pages": 3}
+
+    def test_crawl_stream_reports_errors_before_streaming(
+        self,
+        client_with_mock_tavily: TestClient,
+        mock_tavily_service: MagicMock,
+        superuser_token_headers: dict[str, str],
+    ) -> None:
+        """Test a failed streamed crawl still returns an error status."""
+        mock_tavily_service.crawl.side_effect = Exception("Rate limit exceeded")
+
+        response = client_with_mock_tavily.post(
+            f"{settings.API_V1_STR}/tavily/crawl",
+            headers=superuser_token_headers,
+            json={"url": "https://example.com", "stream": True},
+        )
+
+        assert response.status_code == 429
+
     def test_crawl_unauthenticated(
         self,
         client_with_mock_tavily: TestClient,
@@ -662,6 +986,33 @@ class TestMapEndpoint:
         data = response.json()
         assert data["base_url"] == url
 
+    def test_map_streams_ndjson(
+        self,
+        client_with_mock_tavily: TestClient,
+        mock_tavily_service: MagicMock,
+        superuser_token_headers: dict[str, str],
+    ) -> None:
+        """Test streamed map emits one line per URL and a summary."""
+        url = "https://example.com"
+        mock_tavily_service.map_urls.return_value = {
+            "base_url": url,
+            "results": [f"{url}/a", f"{url}/b"],
+        }
+
+        response = client_with_mock_tavily.post(
+            f"{settings.API_V1_STR}/tavily/map",
+            headers=superuser_token_headers,
+            json={"url": url, "stream": True},
+        )
+
+        assert response.status_code == 200
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines == [
+            {"type": "url", "url": f"{url}/a"},
+            {"type": "url", "url": f"{url}/b"},
+            {"type": "summary", "base_url": url, "total_urls": 2},
+        ]
+
     def test_map_unauthenticated(
         self,
         client_with_mock_tavily: TestClient,
@@ -1,12 +1,18 @@
+import asyncio
 from collections.abc import Generator
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlmodel import Session, delete
 
 from app.api.deps import get_youcom_service
 from app.core.config import settings
+from app.core.db import engine
 from app.main import app
+from app.models import ResearchJob
+from app.services.job_queue import job_queue
+from tests.utils.disconnect import post_then_disconnect
 
 
 @pytest.fixture
@@ -73,3 +79,121 @@ def test_youcom_deep_research_success(
     called_request = mock_youcom_service.deep_research.await_args.args[0]
     assert called_request.query == "Compare open-source agent platforms"
     assert called_request.research_effort == "deep"
+
+
+@pytest.fixture(autouse=True)
+def clean_jobs() -> Generator[None, None, None]:
+    yield
+    with Session(engine) as session:
+        session.execute(delete(ResearchJob))
+        session.commit()
+
+
+JOBS_URL = f"{settings.API_V1_STR}/youcom/deep-research/jobs"
+
+
+def test_youcom_job_submit_status_and_result(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+) -> None:
+    response = client.post(
+        JOBS_URL,
+        headers=superuser_token_headers,
+        json={"query": "Compare open-source agent platforms"},
+    )
+
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == "queued"
+    assert job["provider"] == "youcom"
+
+    response = client.get(f"{JOBS_URL}/{job['id']}", headers=superuser_token_headers)
+    assert response.status_code == 200
+    assert response.json()["id"] == job["id"]
+
+    response = client.get(
+        f"{JOBS_URL}/{job['id']}/result", headers=superuser_token_headers
+    )
+    assert response.status_code == 409
+
+    (claimed,) = job_queue.claim("worker-1", limit=1)
+    job_queue.complete(
+        claimed.id, "worker-1", {"output": {"content": "done", "sources": []}}
+    )
+
+    response = client.get(
+        f"{JOBS_URL}/{job['id']}/result", headers=superuser_token_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["output"]["content"] == "done"
+
+
+def test_youcom_job_result_returns_stored_error(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+) -> None:
+    job = client.post(
+        JOBS_URL, headers=superuser_token_headers, json={"query": "q"}
+    ).json()
+    (claimed,) = job_queue.claim("worker-1", limit=1)
+    job_queue.fail(
+        claimed.id,
+        "worker-1",
+        {
+            "status_code": 429,
+            "error_code": "rate_limit_exceeded",
+            "message": "Rate limited",
+            "details": None,
+        },
+    )
+
+    response = client.get(
+        f"{JOBS_URL}/{job['id']}/result", headers=superuser_token_headers
+    )
+
+    assert response.status_code == 429
+    assert response.json()["error_code"] == "rate_limit_exceeded"
+
+
+def test_youcom_job_hidden_from_other_users(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    normal_user_token_headers: dict[str, str],
+) -> None:
+    job = client.post(
+        JOBS_URL, headers=superuser_token_headers, json={"query": "q"}
+    ).json()
+
+    response = client.get(f"{JOBS_URL}/{job['id']}", headers=normal_user_token_headers)
+
+    assert response.status_code == 404
+
+
+def test_youcom_deep_research_cancelled_when_client_disconnects(
+    mock_youcom_service: MagicMock,
+    superuser_token_headers: dict[str, str],
+) -> None:
+    cancelled = asyncio.Event()
+
+    async def slow_research(_request: object) -> None:
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    mock_youcom_service.deep_research.side_effect = slow_research
+    app.dependency_overrides[get_youcom_service] = lambda: mock_youcom_service
+    try:
+        messages = asyncio.run(
+            post_then_disconnect(
+                f"{settings.API_V1_STR}/youcom/deep-research",
+                superuser_token_headers,
+                {"query": "test query"},
+            )
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert cancelled.is_set()
+    assert messages[0]["status"] == 499
@@ -40,3 +40,27 @@ def normal_user_token_headers(client: TestClient, db: Session) -> dict[str, str]
     return authentication_token_from_email(
         client=client, email=settings.EMAIL_TEST_USER, db=db
     )
+
+
+@pytest.fixture(autouse=True)
+def no_retry_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep provider retries instant so error-path tests stay fast."""
+    monkeypatch.setattr(settings.resilience, "backoff_base", 0.0)
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Disable client-side rate limiting so tests are never paced."""
+    monkeypatch.setattr(settings.rate_limit, "enabled", False)
+
+
+@pytest.fixture(autouse=True)
+def no_content_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Disable the extracted-content cache so extractions always go upstream."""
+    monkeypatch.setattr(settings.content_cache, "enabled", False)
+
+
+@pytest.fixture(autouse=True)
+def no_search_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Disable the search response cache so searches always go upstream."""
+    monkeypatch.setattr(settings.search_cache, "enabled", False)
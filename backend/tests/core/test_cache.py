@@ -0,0 +1,58 @@
+from app.core.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_ttl() -> None:
+    clock = FakeClock()
+    cache: TTLCache[str] = TTLCache(max_entries=10, clock=clock)
+    cache.set("a", "value", ttl=5)
+
+    clock.now = 4.9
+    assert cache.get("a") == "value"
+
+    clock.now = 5.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses, cache.expirations) == (1, 1, 1)
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache: TTLCache[int] = TTLCache(max_entries=2, clock=FakeClock())
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3, ttl=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+def test_set_replaces_existing_entry_without_evicting() -> None:
+    cache: TTLCache[int] = TTLCache(max_entries=1, clock=FakeClock())
+    cache.set("a", 1, ttl=60)
+    cache.set("a", 2, ttl=60)
+
+    assert cache.get("a") == 2
+    assert cache.evictions == 0
+
+
+def test_clear_drops_entries_and_counters() -> None:
+    cache: TTLCache[int] = TTLCache(max_entries=2, clock=FakeClock())
+    cache.set("a", 1, ttl=60)
+    cache.get("a")
+    cache.get("missing")
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
@@ -0,0 +1,106 @@
+import time
+from collections.abc import Callable
+from email.utils import formatdate
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.deadline import (
+    DeadlineMiddleware,
+    cap_timeout,
+    deadline_scope,
+    expired,
+    parse_budget,
+    remaining,
+)
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({}, None),
+        ({"x-timeout-ms": "1500"}, 1.5),
+        ({"x-timeout-ms": "soon"}, None),
+        ({"x-request-deadline": "not a date"}, None),
+    ],
+)
+def test_parse_budget_from_timeout_header(
+    headers: dict[str, str], expected: float | None
+) -> None:
+    assert parse_budget(headers) == expected
+
+
+@pytest.mark.parametrize(
+    "format_deadline",
+    [
+        str,
+        lambda at: str(int(at * 1000)),
+        lambda at: formatdate(at, usegmt=True),
+    ],
+)
+def test_parse_budget_from_absolute_deadline(
+    format_deadline: Callable[[float], str],
+) -> None:
+    budget = parse_budget({"x-request-deadline": format_deadline(time.time() + 30)})
+
+    assert budget is not None
+    assert 28 < budget <= 30
+
+
+def test_parse_budget_from_iso_deadline() -> None:
+    budget = parse_budget({"x-request-deadline": "2000-01-01T00:00:00Z"})
+
+    assert budget is not None
+    assert budget < 0
+
+
+def test_earliest_deadline_wins() -> None:
+    budget = parse_budget(
+        {"x-timeout-ms": "60000", "x-request-deadline": str(time.time() + 5)}
+    )
+
+    assert budget is not None
+    assert budget <= 5
+
+
+def test_cap_timeout_uses_remaining_budget() -> None:
+    assert cap_timeout(300) == 300
+    assert remaining() is None
+
+    with deadline_scope(10):
+        assert 9 < cap_timeout(300) <= 10
+        assert cap_timeout(5) == 5
+        assert not expired()
+
+    with deadline_scope(-1):
+        assert expired()
+        assert cap_timeout(300) == 0.001
+
+    assert remaining() is None
+
+
+def make_client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(DeadlineMiddleware)
+
+    @app.get("/budget")
+    def budget() -> dict[str, float | None]:
+        return {"remaining": remaining()}
+
+    return TestClient(app)
+
+
+def test_middleware_sets_request_deadline() -> None:
+    client = make_client()
+
+    assert client.get("/budget").json() == {"remaining": None}
+    budget = client.get("/budget", headers={"X-Timeout-Ms": "2000"}).json()
+    assert 0 < budget["remaining"] <= 2
+
+
+def test_middleware_rejects_spent_budget() -> None:
+    response = make_client().get("/budget", headers={"X-Timeout-Ms": "0"})
+
+    assert response.status_code == 504
+    assert response.json()["error_code"] == "deadline_exceeded"
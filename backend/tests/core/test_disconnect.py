@@ -0,0 +1,61 @@
+import asyncio
+from typing import Any
+
+import pytest
+from starlette.requests import Request
+
+from app.core.disconnect import ClientDisconnectedError, cancel_on_disconnect
+
+
+def make_request(disconnect: asyncio.Event) -> Request:
+    async def receive() -> dict[str, Any]:
+        await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    return Request({"type": "http", "method": "POST", "headers": []}, receive)
+
+
+def test_result_returned_while_client_connected() -> None:
+    async def scenario() -> str:
+        async def work() -> str:
+            await asyncio.sleep(0.01)
+            return "done"
+
+        return await cancel_on_disconnect(make_request(asyncio.Event()), work())
+
+    assert asyncio.run(scenario()) == "done"
+
+
+def test_work_cancelled_when_client_disconnects() -> None:
+    cancelled = []
+
+    async def scenario() -> None:
+        disconnect = asyncio.Event()
+
+        async def work() -> str:
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return "never"
+
+        asyncio.get_running_loop().call_later(0.01, disconnect.set)
+        await asyncio.wait_for(
+            cancel_on_disconnect(make_request(disconnect), work()), timeout=5
+        )
+
+    with pytest.raises(ClientDisconnectedError):
+        asyncio.run(scenario())
+    assert cancelled == [True]
+
+
+def test_work_errors_propagate() -> None:
+    async def scenario() -> None:
+        async def work() -> None:
+            raise ValueError("upstream failed")
+
+        await cancel_on_disconnect(make_request(asyncio.Event()), work())
+
+    with pytest.raises(ValueError, match="upstream failed"):
+        asyncio.run(scenario())
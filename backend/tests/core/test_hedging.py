@@ -0,0 +1,157 @@
+import asyncio
+
+import pytest
+
+from app.core.hedging import Hedger, LatencyTracker
+
+
+def warmed_hedger(latency: float = 0.01, **overrides: float) -> Hedger:
+    config = {"percentile": 50.0, "max_rate": 1.0, "window": 100, "min_samples": 5}
+    hedger = Hedger(**{**config, **overrides})  # type: ignore[arg-type]
+    for _ in range(40):
+        hedger.latencies.record(latency)
+    return hedger
+
+
+def test_percentile_needs_min_samples() -> None:
+    tracker = LatencyTracker(window=10, min_samples=3)
+    tracker.record(1.0)
+    tracker.record(2.0)
+    assert tracker.percentile(50) is None
+
+    tracker.record(3.0)
+    assert tracker.percentile(50) == 2.0
+    assert tracker.percentile(99) == 3.0
+
+
+def test_window_keeps_recent_latencies() -> None:
+    tracker = LatencyTracker(window=2, min_samples=1)
+    for latency in (10.0, 1.0, 2.0):
+        tracker.record(latency)
+
+    assert tracker.percentile(100) == 2.0
+
+
+def test_slow_call_is_hedged_and_loser_cancelled() -> None:
+    hedger = warmed_hedger()
+    cancelled: list[int] = []
+    attempts = 0
+
+    async def call() -> int:
+        nonlocal attempts
+        attempts += 1
+        attempt = attempts
+        try:
+            await asyncio.sleep(5 if attempt == 1 else 0)
+        except asyncio.CancelledError:
+            cancelled.append(attempt)
+            raise
+        return attempt
+
+    assert asyncio.run(hedger.run(call, hedge=True)) == 2
+    assert cancelled == [1]
+    assert (hedger.hedges_sent, hedger.hedges_won) == (1, 1)
+
+
+def test_latency_of_cancelled_and_failed_attempts_is_recorded() -> None:
+    now = 0.0
+    hedger = warmed_hedger(clock=lambda: now)  # type: ignore[arg-type]
+    attempts = 0
+
+    async def call() -> int:
+        nonlocal now, attempts
+        attempts += 1
+        if attempts == 1:
+            await asyncio.sleep(5)
+        now += 0.5
+        return attempts
+
+    assert asyncio.run(hedger.run(call, hedge=True)) == 2
+    # The cancelled first attempt counts with the time it had run
+    assert len(hedger.latencies) == 42
+    assert hedger.latencies.percentile(100) == 0.5
+
+    async def failing() -> None:
+        nonlocal now
+        now += 2.0
+        raise RuntimeError("upstream failed")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(hedger.run(failing, hedge=False))
+    assert len(hedger.latencies) == 43
+    assert hedger.latencies.percentile(100) == 2.0
+
+
+def test_fast_call_is_not_hedged() -> None:
+    hedger = warmed_hedger(latency=1.0)
+    attempts = 0
+
+    async def call() -> str:
+        nonlocal attempts
+        attempts += 1
+        return "ok"
+
+    assert asyncio.run(hedger.run(call, hedge=True)) == "ok"
+    assert attempts == 1
+    assert hedger.hedges_sent == 0
+
+
+def test_no_hedge_unless_requested() -> None:
+    hedger = warmed_hedger()
+    attempts = 0
+
+    async def call() -> str:
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    assert asyncio.run(hedger.run(call, hedge=False)) == "ok"
+    assert attempts == 1
+
+
+def test_failed_attempt_waits_for_the_other() -> None:
+    hedger = warmed_hedger()
+    attempts = 0
+
+    async def call() -> str:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            await asyncio.sleep(0.05)
+            raise RuntimeError("first failed")
+        await asyncio.sleep(0.1)
+        return "second"
+
+    assert asyncio.run(hedger.run(call, hedge=True)) == "second"
+
+
+def test_error_raised_when_every_attempt_fails() -> None:
+    hedger = warmed_hedger()
+
+    async def call() -> str:
+        await asyncio.sleep(0.05)
+        raise RuntimeError("down")
+
+    with pytest.raises(RuntimeError, match="down"):
+        asyncio.run(hedger.run(call, hedge=True))
+
+
+def test_hedge_rate_is_capped() -> None:
+    hedger = warmed_hedger(max_rate=0.25)
+    attempts = 0
+
+    async def call() -> str:
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0.03)
+        return "ok"
+
+    async def run_many() -> None:
+        for _ in range(8):
+            await hedger.run(call, hedge=True)
+
+    asyncio.run(run_many())
+
+    assert hedger.hedges_sent == 2
+    assert attempts == 10
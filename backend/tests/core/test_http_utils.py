@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from app.core.config import HTTPClientSettings
+from app.core.http_utils import (
+    HTTPClientRegistry,
+    canonicalize_url,
+    create_pooled_client,
+)
+
+
+def test_registry_reuses_client_per_provider() -> None:
+    registry = HTTPClientRegistry(HTTPClientSettings())
+
+    gemini_client = registry.get("gemini")
+
+    assert registry.get("gemini") is gemini_client
+    assert registry.get("perplexity") is not gemini_client
+
+    asyncio.run(registry.aclose())
+
+
+def test_registry_recreates_client_after_close() -> None:
+    registry = HTTPClientRegistry(HTTPClientSettings())
+    client = registry.get("youcom")
+
+    asyncio.run(registry.aclose())
+
+    assert client.is_closed
+    replacement = registry.get("youcom")
+    assert replacement is not client
+    assert not replacement.is_closed
+
+    asyncio.run(registry.aclose())
+
+
+def test_pooled_client_applies_limits() -> None:
+    client = create_pooled_client(
+        HTTPClientSettings(
+            max_connections=7,
+            max_keepalive_connections=3,
+            keepalive_expiry=12.5,
+        )
+    )
+
+    pool = client._transport._pool  # type: ignore[attr-defined]
+    assert pool._max_connections == 7
+    assert pool._max_keepalive_connections == 3
+    assert pool._keepalive_expiry == 12.5
+
+    asyncio.run(client.aclose())
+
+
+def test_pooled_client_falls_back_without_h2(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("app.core.http_utils.importlib.util.find_spec", lambda _: None)
+
+    client = create_pooled_client(HTTPClientSettings(http2=True))
+
+    assert client._transport._pool._http2 is False  # type: ignore[attr-defined]
+
+    asyncio.run(client.aclose())
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("HTTPS://Example.COM:443/a/?b=2&a=1#top", "https://example.com/a?a=1&b=2"),
+        ("https://example.com", "https://example.com/"),
+        ("http://example.com:8080/docs/", "http://example.com:8080/docs"),
+        ("https://[::1]:8443/", "https://[::1]:8443/"),
+    ],
+)
+def test_canonicalize_url(url: str, expected: str) -> None:
+    assert canonicalize_url(url) == expected
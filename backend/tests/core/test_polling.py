@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from app.core.config import GeminiPollStrategy, GeminiSettings
+from app.core.http_utils import parse_retry_after
+from app.core.polling import AdaptivePolling, FixedPolling, create_polling_strategy
+
+
+def test_adaptive_polling_fast_phase_then_capped_backoff() -> None:
+    strategy = AdaptivePolling(
+        initial_interval=1.0, max_interval=5.0, multiplier=2.0, fast_attempts=2
+    )
+
+    delays = [strategy.next_delay(attempt) for attempt in range(6)]
+
+    assert delays == [1.0, 1.0, 2.0, 4.0, 5.0, 5.0]
+    assert strategy.next_delay(10_000) == 5.0
+
+
+def test_adaptive_polling_jitter_stays_within_bounds() -> None:
+    strategy = AdaptivePolling(initial_interval=10.0, max_interval=10.0, jitter=0.2)
+
+    delays = {strategy.next_delay(0) for _ in range(50)}
+
+    assert all(8.0 <= delay <= 12.0 for delay in delays)
+    assert len(delays) > 1
+    assert strategy.min_interval == pytest.approx(8.0)
+
+
+def test_retry_after_hint_overrides_strategy() -> None:
+    assert FixedPolling(10).next_delay(0, retry_after=3.0) == 3.0
+    assert AdaptivePolling(1.0, 60.0).next_delay(0, retry_after=90.0) == 90.0
+
+
+def test_create_polling_strategy_from_settings() -> None:
+    fixed = create_polling_strategy(
+        GeminiSettings(poll_strategy=GeminiPollStrategy.FIXED, poll_interval=7)
+    )
+    adaptive = create_polling_strategy(GeminiSettings(poll_initial_interval=0.5))
+
+    assert isinstance(fixed, FixedPolling)
+    assert fixed.next_delay(100) == 7
+    assert isinstance(adaptive, AdaptivePolling)
+    assert adaptive.initial_interval == 0.5
+
+
+def test_parse_retry_after_seconds_and_http_date() -> None:
+    future = datetime.now(timezone.utc) + timedelta(seconds=120)
+
+    assert parse_retry_after("15") == 15.0
+    assert parse_retry_after("-3") == 0.0
+    assert 100 < (parse_retry_after(format_datetime(future, usegmt=True)) or 0) <= 120
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
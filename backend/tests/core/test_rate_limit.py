@@ -0,0 +1,191 @@
+import asyncio
+import time
+from typing import Any
+
+import httpx
+import pytest
+
+from app.core.config import RateLimitSettings, ResilienceSettings
+from app.core.rate_limit import (
+    ProviderRateLimiter,
+    RateLimitQueueFull,
+    RateLimitTimeout,
+    TokenBucket,
+)
+from app.core.resilience import ResiliencePolicy
+from app.exceptions.perplexity import PerplexityAPIError, PerplexityErrorCode
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_limiter(**overrides: Any) -> ProviderRateLimiter:
+    config = {"provider_rpm": {"tavily": 600}, "burst": 2, **overrides}
+    return ProviderRateLimiter("tavily", RateLimitSettings(**config))
+
+
+def test_bucket_allows_burst_then_paces() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket("tavily", rate=2.0, capacity=2, max_queue=10, clock=clock)
+
+    assert bucket._reserve() == 0
+    assert bucket._reserve() == 0
+    assert bucket._reserve() == pytest.approx(0.5)
+
+    clock.now = 0.5
+    assert bucket._reserve() == 0
+
+
+def test_acquire_waits_for_next_slot_in_order() -> None:
+    limiter = make_limiter(burst=1)
+    order: list[int] = []
+
+    async def caller(index: int) -> None:
+        await limiter.acquire("search")
+        order.append(index)
+
+    async def run() -> None:
+        await asyncio.gather(*(caller(index) for index in range(3)))
+
+    started = time.monotonic()
+    asyncio.run(run())
+
+    assert order == [0, 1, 2]
+    # 600 rpm is one slot every 0.1s after the first
+    assert time.monotonic() - started == pytest.approx(0.2, abs=0.1)
+
+
+def test_acquire_rejects_when_queue_is_full() -> None:
+    limiter = make_limiter(burst=1, max_queue=1, provider_rpm={"tavily": 60})
+
+    async def run() -> None:
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        try:
+            await limiter.acquire()
+        finally:
+            waiter.cancel()
+
+    with pytest.raises(RateLimitQueueFull):
+        asyncio.run(run())
+
+
+def test_acquire_times_out() -> None:
+    limiter = make_limiter(burst=1, provider_rpm={"tavily": 6})
+
+    async def run() -> None:
+        await limiter.acquire()
+        await limiter.acquire(timeout=0.05)
+
+    with pytest.raises(RateLimitTimeout):
+        asyncio.run(run())
+    assert limiter.buckets()[0].queued == 0
+
+
+def test_endpoint_buckets_apply_before_provider_bucket() -> None:
+    limiter = make_limiter(endpoint_rpm={"tavily:crawl": 60})
+
+    assert [bucket.name for bucket in limiter.buckets("crawl")] == [
+        "tavily:crawl",
+        "tavily",
+    ]
+    assert [bucket.name for bucket in limiter.buckets("search")] == ["tavily"]
+    assert make_limiter(enabled=False).buckets("crawl") == []
+
+
+def test_endpoint_slot_is_refunded_when_provider_bucket_refuses() -> None:
+    limiter = make_limiter(
+        burst=1,
+        max_queue=0,
+        provider_rpm={"tavily": 6},
+        endpoint_rpm={"tavily:crawl": 6},
+    )
+    endpoint_bucket, provider_bucket = limiter.buckets("crawl")
+
+    async def run() -> None:
+        # Another endpoint drains the provider bucket
+        await limiter.acquire("search")
+        with pytest.raises(RateLimitQueueFull):
+            await limiter.acquire("crawl")
+
+    asyncio.run(run())
+
+    assert endpoint_bucket._reserve() == 0
+    assert provider_bucket._reserve() > 0
+
+
+def test_penalize_slows_down_and_recover_restores_rate() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket("tavily", rate=10.0, capacity=5, max_queue=10, clock=clock)
+
+    bucket.penalize(retry_after=3)
+    assert bucket.rate == 5.0
+    assert bucket._reserve() == pytest.approx(3)
+
+    for _ in range(20):
+        bucket.recover()
+    assert bucket.rate == 10.0
+
+
+def test_observe_adapts_to_rate_limit_headers() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket("tavily", rate=10.0, capacity=5, max_queue=10, clock=clock)
+
+    bucket.observe(
+        httpx.Headers({"X-RateLimit-Remaining": "20", "X-RateLimit-Reset": "10"})
+    )
+    assert bucket.rate == 2.0
+
+    bucket.observe(httpx.Headers({"RateLimit-Remaining": "0", "RateLimit-Reset": "4"}))
+    assert bucket._reserve() == pytest.approx(4)
+
+
+def test_policy_converts_full_queue_to_rate_limit_error() -> None:
+    policy = ResiliencePolicy(
+        "Perplexity", PerplexityAPIError, ResilienceSettings(backoff_base=0.0)
+    )
+    policy.limiter = ProviderRateLimiter(
+        "perplexity",
+        RateLimitSettings(provider_rpm={"perplexity": 60}, burst=1, max_queue=0),
+    )
+    calls: list[int] = []
+
+    async def call() -> str:
+        calls.append(1)
+        return "ok"
+
+    assert asyncio.run(policy.call(call)) == "ok"
+    with pytest.raises(PerplexityAPIError) as exc_info:
+        asyncio.run(policy.call(call))
+
+    assert exc_info.value.error_code == PerplexityErrorCode.RATE_LIMIT_EXCEEDED
+    assert exc_info.value.details["rate_limiter"] == "queue_full"
+    assert exc_info.value.details["retry_after"] > 0
+    assert len(calls) == 1
+
+
+def test_policy_penalizes_limiter_on_provider_rate_limit() -> None:
+    policy = ResiliencePolicy(
+        "Perplexity",
+        PerplexityAPIError,
+        ResilienceSettings(backoff_base=0.0, max_attempts=1),
+    )
+    policy.limiter = ProviderRateLimiter(
+        "perplexity", RateLimitSettings(provider_rpm={"perplexity": 600})
+    )
+
+    async def call() -> str:
+        raise PerplexityAPIError.rate_limit_exceeded(details={"retry_after": 2})
+
+    with pytest.raises(PerplexityAPIError):
+        asyncio.run(policy.call(call))
+
+    (bucket,) = policy.limiter.buckets()
+    assert bucket.rate == 5.0
+    assert bucket.estimated_wait() >= 1.9
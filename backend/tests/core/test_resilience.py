@@ -0,0 +1,181 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+
+from app.core.config import ResilienceSettings
+from app.core.deadline import deadline_scope
+from app.core.resilience import CircuitBreaker, CircuitState, ResiliencePolicy
+from app.exceptions.perplexity import PerplexityAPIError, PerplexityErrorCode
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_policy(**overrides: Any) -> ResiliencePolicy:
+    config = {"backoff_base": 0.0, "failure_threshold": 3, **overrides}
+    return ResiliencePolicy(
+        "Perplexity", PerplexityAPIError, ResilienceSettings(**config)
+    )
+
+
+def scripted(
+    *outcomes: Exception | str,
+) -> tuple[Callable[[], Awaitable[str]], list[int]]:
+    calls: list[int] = []
+
+    async def call() -> str:
+        calls.append(1)
+        outcome = outcomes[min(len(calls), len(outcomes)) - 1]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return call, calls
+
+
+def test_breaker_opens_probes_and_closes() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.acquire()
+    assert breaker.retry_after() == 10
+
+    clock.now = 10
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.acquire()
+    assert not breaker.acquire()
+
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.acquire()
+
+
+def test_breaker_reopens_when_probe_fails() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5, clock=clock)
+    breaker.record_failure()
+    clock.now = 5
+
+    assert breaker.acquire()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.retry_after() == 5
+
+
+def test_policy_retries_retryable_errors_until_success() -> None:
+    policy = make_policy()
+    call, calls = scripted(
+        PerplexityAPIError.service_unavailable(),
+        PerplexityAPIError.rate_limit_exceeded(),
+        "ok",
+    )
+
+    assert asyncio.run(policy.call(call)) == "ok"
+    assert len(calls) == 3
+    assert policy.breaker.state == CircuitState.CLOSED
+
+
+@pytest.mark.parametrize(
+    ("error", "idempotent"),
+    [
+        (PerplexityAPIError.invalid_request(), True),
+        (PerplexityAPIError.api_error(), True),
+        (PerplexityAPIError.service_unavailable(), False),
+        (PerplexityAPIError.rate_limit_exceeded(details={"retry_after": 120}), True),
+    ],
+)
+def test_policy_does_not_retry(error: PerplexityAPIError, idempotent: bool) -> None:
+    policy = make_policy()
+    call, calls = scripted(error, "ok")
+
+    with pytest.raises(PerplexityAPIError):
+        asyncio.run(policy.call(call, idempotent=idempotent))
+
+    assert len(calls) == 1
+
+
+def test_policy_retries_rate_limit_for_non_idempotent_calls() -> None:
+    policy = make_policy()
+    call, calls = scripted(PerplexityAPIError.rate_limit_exceeded(), "ok")
+
+    assert asyncio.run(policy.call(call, idempotent=False)) == "ok"
+    assert len(calls) == 2
+
+
+def test_policy_waits_out_retry_after_hint(monkeypatch: pytest.MonkeyPatch) -> None:
+    policy = make_policy()
+    call, _ = scripted(
+        PerplexityAPIError.service_unavailable(details={"retry_after": 2.5}), "ok"
+    )
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr("asyncio.sleep", fake_sleep)
+
+    assert asyncio.run(policy.call(call)) == "ok"
+    assert sleeps == [2.5]
+
+
+def test_policy_fails_fast_while_circuit_is_open() -> None:
+    policy = make_policy(max_attempts=1, failure_threshold=2)
+    failing, _ = scripted(PerplexityAPIError.request_timeout())
+    for _ in range(2):
+        with pytest.raises(PerplexityAPIError):
+            asyncio.run(policy.call(failing))
+
+    call, calls = scripted("ok")
+    with pytest.raises(PerplexityAPIError) as exc_info:
+        asyncio.run(policy.call(call))
+
+    assert calls == []
+    assert exc_info.value.error_code == PerplexityErrorCode.SERVICE_UNAVAILABLE
+    assert exc_info.value.details is not None
+    assert exc_info.value.details["circuit"] == "open"
+
+
+def test_client_errors_do_not_trip_the_breaker() -> None:
+    policy = make_policy(max_attempts=1, failure_threshold=1)
+    call, _ = scripted(PerplexityAPIError.invalid_request())
+
+    with pytest.raises(PerplexityAPIError):
+        asyncio.run(policy.call(call))
+
+    assert policy.breaker.state == CircuitState.CLOSED
+
+
+def test_policy_fails_fast_once_deadline_passed() -> None:
+    policy = make_policy()
+    call, calls = scripted("ok")
+
+    with deadline_scope(0), pytest.raises(PerplexityAPIError) as exc_info:
+        asyncio.run(policy.call(call))
+
+    assert calls == []
+    assert exc_info.value.error_code == PerplexityErrorCode.REQUEST_TIMEOUT
+    assert exc_info.value.details == {"deadline": "exceeded"}
+
+
+def test_policy_does_not_retry_past_deadline() -> None:
+    policy = make_policy()
+    call, calls = scripted(
+        PerplexityAPIError.service_unavailable(details={"retry_after": 5.0}), "ok"
+    )
+
+    with deadline_scope(1.0), pytest.raises(PerplexityAPIError):
+        asyncio.run(policy.call(call))
+
+    assert calls == [1]
@@ -0,0 +1,98 @@
+import asyncio
+from collections.abc import Generator
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+from sqlmodel import Session, select
+
+from app.core.config import ContentCacheSettings
+from app.core.db import engine
+from app.models import ContentCacheEntry
+from app.services.content_cache import ContentCache
+from app.services.tavily import TavilyService
+
+
+@pytest.fixture
+def cache() -> Generator[ContentCache, None, None]:
+    cache = ContentCache(cache_settings=ContentCacheSettings(ttl=60))
+    cache.purge()
+    yield cache
+    cache.purge()
+
+
+def extraction(url: str, size: int = 10) -> dict[str, Any]:
+    return {"url": url, "raw_content": "x" * size, "images": []}
+
+
+def test_hits_are_keyed_by_canonical_url(cache: ContentCache) -> None:
+    cache.put_many([extraction("https://Example.com/docs/")])
+
+    hits = cache.get_many(["https://example.com/docs#intro", "https://other.com"])
+
+    assert list(hits) == ["https://example.com/docs"]
+    assert hits["https://example.com/docs"]["url"] == "https://Example.com/docs/"
+    stats = cache.stats()
+    assert (stats.entries, stats.hits, stats.expired) == (1, 1, 0)
+    assert stats.total_bytes > 10
+
+
+def test_expired_entries_are_misses(cache: ContentCache) -> None:
+    cache.put_many([extraction("https://example.com/old")])
+    with Session(engine) as session:
+        entry = session.exec(select(ContentCacheEntry)).one()
+        entry.expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        session.add(entry)
+        session.commit()
+
+    assert cache.get_many(["https://example.com/old"]) == {}
+    assert cache.stats().expired == 1
+    assert cache.purge(expired_only=True) == 1
+
+
+def test_eviction_drops_least_recently_used_entries() -> None:
+    cache = ContentCache(cache_settings=ContentCacheSettings(max_bytes=300))
+    cache.purge()
+    try:
+        cache.put_many([extraction("https://a.com", 50)])
+        cache.put_many([extraction("https://b.com", 50)])
+        cache.get_many(["https://a.com"])
+        cache.put_many([extraction("https://c.com", 50)])
+
+        entries, count = cache.list_entries()
+
+        assert count == 2
+        assert {entry.url_key for entry in entries} == {
+            "https://a.com/",
+            "https://c.com/",
+        }
+        assert cache.stats().total_bytes <= 300
+    finally:
+        cache.purge()
+
+
+def test_extract_serves_hits_and_sends_only_misses(
+    cache: ContentCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service = TavilyService(cache=cache)
+    cache.put_many([extraction("https://a.com/page")])
+    calls: list[list[str]] = []
+
+    async def fake_extract(urls: list[str], **_kwargs: Any) -> dict[str, Any]:
+        calls.append(urls)
+        return {"results": [extraction(url) for url in urls], "failed_results": []}
+
+    monkeypatch.setattr(service._client, "extract", fake_extract)
+
+    result = asyncio.run(service.extract(["https://b.com", "https://a.com/page/"]))
+
+    assert calls == [["https://b.com"]]
+    assert [item["url"] for item in result["results"]] == [
+        "https://b.com",
+        "https://a.com/page",
+    ]
+    assert result["cache_hits"] == 1
+    assert "https://b.com/" in cache.get_many(["https://b.com"])
+
+    asyncio.run(service.extract("https://b.com"))
+    assert calls == [["https://b.com"]]
@@ -0,0 +1,136 @@
+import asyncio
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.config import SearchCacheSettings, settings
+from app.exceptions.perplexity import PerplexityAPIError
+from app.schemas.federated import (
+    FederatedProvider,
+    FederatedProviderStatus,
+    FederatedResearchRequest,
+)
+from app.schemas.perplexity import PerplexityDeepResearchResponse
+from app.schemas.youcom import YouComDeepResearchResponse, YouComOutput
+from app.services.federated import FederatedResearchService
+from app.services.perplexity import PerplexityService
+from app.services.registry import ServiceRegistry
+from app.services.search_cache import SearchCache
+from app.services.tavily import TavilyService
+from app.services.youcom import YouComService
+
+TAVILY_RESULT = {"query": "q", "results": [], "response_time": 0.1}
+PERPLEXITY_RESULT = PerplexityDeepResearchResponse(
+    id="resp-1", model="sonar-deep-research", created=0
+)
+YOUCOM_RESULT = YouComDeepResearchResponse(output=YouComOutput(content="answer"))
+
+
+def delayed(result: Any, delay: float) -> AsyncMock:
+    async def call(*_args: Any, **_kwargs: Any) -> Any:
+        await asyncio.sleep(delay)
+        return result
+
+    return AsyncMock(side_effect=call)
+
+
+def make_registry(
+    tavily: AsyncMock, perplexity: AsyncMock, youcom: AsyncMock
+) -> ServiceRegistry:
+    registry = ServiceRegistry()
+    registry.override(TavilyService, MagicMock(search=tavily))
+    registry.override(PerplexityService, MagicMock(deep_research=perplexity))
+    registry.override(YouComService, MagicMock(deep_research=youcom))
+    return registry
+
+
+def test_research_fans_out_concurrently() -> None:
+    registry = make_registry(
+        delayed(TAVILY_RESULT, 0.2),
+        delayed(PERPLEXITY_RESULT, 0.2),
+        delayed(YOUCOM_RESULT, 0.2),
+    )
+    request = FederatedResearchRequest(query=" q ")
+
+    started = time.perf_counter()
+    response = asyncio.run(FederatedResearchService(registry).research(request))
+
+    assert time.perf_counter() - started < 0.5
+    assert [result.provider for result in response.results] == list(FederatedProvider)
+    assert response.succeeded == 3
+    assert response.failed == 0
+    assert all(result.duration_ms >= 150 for result in response.results)
+    assert response.results[2].result == YOUCOM_RESULT
+
+
+def test_research_reports_partial_failures_and_timeouts() -> None:
+    registry = make_registry(
+        delayed(TAVILY_RESULT, 0),
+        AsyncMock(side_effect=PerplexityAPIError.rate_limit_exceeded()),
+        delayed(YOUCOM_RESULT, 5),
+    )
+    request = FederatedResearchRequest(
+        query="q", provider_timeouts={FederatedProvider.YOUCOM: 0.05}
+    )
+
+    response = asyncio.run(FederatedResearchService(registry).research(request))
+
+    tavily, perplexity, youcom = response.results
+    assert tavily.status == FederatedProviderStatus.SUCCESS
+    assert perplexity.status == FederatedProviderStatus.ERROR
+    assert perplexity.error is not None
+    assert perplexity.error.error_code == "rate_limit_exceeded"
+    assert youcom.status == FederatedProviderStatus.TIMEOUT
+    assert youcom.error is not None
+    assert youcom.error.details == {"timeout": 0.05}
+    assert (response.succeeded, response.failed) == (1, 2)
+
+
+def test_research_reports_unconfigured_provider(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings.youcom, "api_key", None)
+    registry = ServiceRegistry()
+    request = FederatedResearchRequest(
+        query="q", providers=[FederatedProvider.YOUCOM, FederatedProvider.YOUCOM]
+    )
+
+    response = asyncio.run(FederatedResearchService(registry).research(request))
+
+    (youcom,) = response.results
+    assert youcom.status == FederatedProviderStatus.ERROR
+    assert youcom.error is not None
+    assert youcom.error.error_code == "invalid_api_key"
+
+
+def test_deadline_precedence() -> None:
+    service = FederatedResearchService(ServiceRegistry())
+    request = FederatedResearchRequest(
+        query="q", timeout=10, provider_timeouts={FederatedProvider.TAVILY: 2}
+    )
+
+    assert service._deadline(FederatedProvider.TAVILY, request) == 2
+    assert service._deadline(FederatedProvider.YOUCOM, request) == 10
+    assert service._deadline(
+        FederatedProvider.PERPLEXITY, FederatedResearchRequest(query="q")
+    ) == float(settings.perplexity.timeout)
+
+
+def test_tavily_searches_go_through_the_search_cache() -> None:
+    tavily = delayed(TAVILY_RESULT, 0)
+    registry = make_registry(
+        tavily, delayed(PERPLEXITY_RESULT, 0), delayed(YOUCOM_RESULT, 0)
+    )
+    service = FederatedResearchService(
+        registry, cache=SearchCache(SearchCacheSettings(enabled=True))
+    )
+    request = FederatedResearchRequest(query="q", providers=[FederatedProvider.TAVILY])
+
+    first = asyncio.run(service.research(request))
+    second = asyncio.run(service.research(request))
+
+    assert first.results[0].result == second.results[0].result
+    assert first.results[0].result is not None
+    tavily.assert_awaited_once()
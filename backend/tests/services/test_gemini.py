@@ -1,11 +1,17 @@
 import asyncio
 from typing import Any
 
+import httpx
 import pytest
 
 from app.core.config import settings
+from app.core.polling import AdaptivePolling
 from app.exceptions.gemini import GeminiErrorCode
-from app.schemas.gemini import GeminiDeepResearchRequest
+from app.schemas.gemini import (
+    GeminiDeepResearchRequest,
+    GeminiDeepResearchResultResponse,
+    GeminiInteractionStatus,
+)
 from app.services.gemini import GeminiService
 
 
@@ -15,10 +21,12 @@ class MockResponse:
         status_code: int,
         json_data: dict[str, Any] | None = None,
         text: str = "",
+        headers: dict[str, str] | None = None,
     ) -> None:
         self.status_code = status_code
         self._json_data = json_data or {}
         self.text = text
+        self.headers = httpx.Headers(headers)
 
     def json(self) -> dict[str, Any]:
         return self._json_data
@@ -35,18 +43,14 @@ class MockAsyncClient:
         self.request: dict[str, Any] | None = None
         self.timeout: Any = None
 
-    async def __aenter__(self) -> "MockAsyncClient":
-        return self
-
-    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
-        return False
-
     async def post(
         self,
         url: str,
         headers: dict[str, str],
         json: dict[str, Any] | None = None,
+        timeout: Any = None,
     ) -> MockResponse:
+        self.timeout = timeout
         self.request = {"method": "POST", "url": url, "headers": headers, "json": json}
         if self.exception is not None:
             raise self.exception
@@ -130,11 +134,7 @@ def test_service_start_research_success(
         )
     )
 
-    def async_client_factory(*_: Any, **kwargs: Any) -> MockAsyncClient:
-        mock_client.timeout = kwargs.get("timeout")
-        return mock_client
-
-    monkeypatch.setattr("app.services.gemini.httpx.AsyncClient", async_client_factory)
+    monkeypatch.setattr(configured_gemini, "_get_client", lambda: mock_client)
 
     response = asyncio.run(
         configured_gemini.start_research(
@@ -206,10 +206,7 @@ def test_service_cancel_research_posts_cancel_endpoint(
 ) -> None:
     mock_client = MockAsyncClient(response=MockResponse(status_code=200, json_data={}))
 
-    monkeypatch.setattr(
-        "app.services.gemini.httpx.AsyncClient",
-        lambda *args, **kwargs: mock_client,
-    )
+    monkeypatch.setattr(configured_gemini, "_get_client", lambda: mock_client)
 
     asyncio.run(configured_gemini.cancel_research("interaction-456"))
 
@@ -222,3 +219,40 @@ def test_service_cancel_research_posts_cancel_endpoint(
         },
         "json": None,
     }
+
+
+def test_wait_for_completion_backs_off_and_honours_retry_after(
+    configured_gemini: GeminiService,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    snapshots = [
+        GeminiDeepResearchResultResponse(status=GeminiInteractionStatus.IN_PROGRESS),
+        GeminiDeepResearchResultResponse(
+            status=GeminiInteractionStatus.IN_PROGRESS, retry_after=30.0
+        ),
+        GeminiDeepResearchResultResponse(status=GeminiInteractionStatus.IN_PROGRESS),
+        GeminiDeepResearchResultResponse(status=GeminiInteractionStatus.COMPLETED),
+    ]
+    delays: list[float] = []
+
+    async def fake_poll(
+        interaction_id: str,  # noqa: ARG001
+        last_event_id: str | None = None,  # noqa: ARG001
+    ) -> GeminiDeepResearchResultResponse:
+        return snapshots.pop(0)
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(configured_gemini, "poll_research", fake_poll)
+    monkeypatch.setattr(
+        configured_gemini,
+        "_polling",
+        AdaptivePolling(initial_interval=1.0, max_interval=8.0, multiplier=2.0),
+    )
+    monkeypatch.setattr("app.services.gemini.asyncio.sleep", fake_sleep)
+
+    result = asyncio.run(configured_gemini.wait_for_completion("interaction-789"))
+
+    assert result.status == GeminiInteractionStatus.COMPLETED
+    assert delays == [2.0, 30.0, 8.0]
@@ -0,0 +1,192 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from app.core.config import settings
+from app.core.deadline import deadline_scope, remaining
+from app.exceptions.gemini import GeminiAPIError, GeminiErrorCode
+from app.schemas.gemini import GeminiDeepResearchResultResponse
+from app.services.gemini import GeminiService
+from app.services.gemini_poller import GeminiStatusPoller
+from tests.utils.gemini import ScriptedGemini, statuses
+
+
+@pytest.fixture(autouse=True)
+def gemini_api_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings.gemini, "api_key", "test-gemini-key")
+
+
+def make_poller(service: GeminiService, **kwargs: Any) -> GeminiStatusPoller:
+    kwargs.setdefault("poll_interval", 0.01)
+    return GeminiStatusPoller(lambda: service, **kwargs)
+
+
+def test_concurrent_reads_share_one_upstream_poll() -> None:
+    service = ScriptedGemini(statuses("in_progress"), delay=0.05)
+    poller = make_poller(service, poll_interval=5)
+
+    async def scenario() -> list[GeminiDeepResearchResultResponse]:
+        results = await asyncio.gather(
+            *(poller.get_status("interaction-1") for _ in range(5))
+        )
+        # A fresh cached result is served without another upstream call
+        results.append(await poller.get_status("interaction-1"))
+        await poller.stop()
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert len(service.poll_calls) == 1
+    assert {result.status for result in results} == {"in_progress"}
+
+
+def test_waiters_share_poll_stream_until_completion() -> None:
+    service = ScriptedGemini(statuses("pending", "in_progress", "completed"))
+    poller = make_poller(service)
+
+    async def scenario() -> list[GeminiDeepResearchResultResponse]:
+        results = await asyncio.gather(
+            *(poller.wait_for_completion("interaction-2") for _ in range(4))
+        )
+        await poller.stop()
+        return list(results)
+
+    results = asyncio.run(scenario())
+
+    assert [result.status for result in results] == ["completed"] * 4
+    assert len(service.poll_calls) == 3
+    # Upstream event IDs are carried forward between polls
+    assert service.poll_calls[1]["last_event_id"] == "evt-1"
+
+
+def test_wait_raises_for_failed_job() -> None:
+    service = ScriptedGemini(statuses("in_progress", "failed"))
+    poller = make_poller(service)
+
+    async def scenario() -> None:
+        try:
+            await poller.wait_for_completion("interaction-3")
+        finally:
+            await poller.stop()
+
+    with pytest.raises(GeminiAPIError) as exc_info:
+        asyncio.run(scenario())
+
+    assert exc_info.value.error_code == GeminiErrorCode.RESEARCH_FAILED
+
+
+def test_wait_times_out_with_max_polls_exceeded() -> None:
+    service = ScriptedGemini(statuses("in_progress"))
+    poller = make_poller(service)
+
+    async def scenario() -> None:
+        try:
+            await poller.wait_for_completion("interaction-4", timeout=0.05)
+        finally:
+            await poller.stop()
+
+    with pytest.raises(GeminiAPIError) as exc_info:
+        asyncio.run(scenario())
+
+    assert exc_info.value.error_code == GeminiErrorCode.MAX_POLLS_EXCEEDED
+
+
+def test_wait_for_change_returns_next_snapshot() -> None:
+    unchanged = {"status": "in_progress", "event_id": "evt-1"}
+    service = ScriptedGemini(
+        [
+            unchanged,
+            unchanged,
+            unchanged,
+            {
+                "status": "in_progress",
+                "event_id": "evt-2",
+                "outputs": [{"thinking_summary": "Reading sources"}],
+            },
+        ]
+    )
+    poller = make_poller(service)
+
+    async def scenario() -> GeminiDeepResearchResultResponse:
+        try:
+            return await poller.wait_for_change("interaction-1", "0:evt-1", 5)
+        finally:
+            await poller.stop()
+
+    result = asyncio.run(scenario())
+
+    assert result.event_id == "evt-2"
+    assert len(result.outputs) == 1
+    assert len(service.poll_calls) == 4
+
+
+def test_wait_for_change_times_out_with_unchanged_snapshot() -> None:
+    service = ScriptedGemini([{"status": "in_progress", "event_id": "evt-1"}])
+    poller = make_poller(service, poll_interval=5)
+
+    async def scenario() -> tuple[GeminiDeepResearchResultResponse, float]:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            result = await poller.wait_for_change("interaction-1", "0:evt-1", 0.1)
+        finally:
+            await poller.stop()
+        return result, loop.time() - started
+
+    result, elapsed = asyncio.run(scenario())
+
+    assert result.event_id == "evt-1"
+    assert 0.1 <= elapsed < 1
+    # Waiting never made the handler poll upstream itself
+    assert len(service.poll_calls) == 1
+
+
+def test_wait_for_change_answers_stale_cursor_at_once() -> None:
+    service = ScriptedGemini([{"status": "in_progress", "event_id": "evt-5"}])
+    poller = make_poller(service, poll_interval=5)
+
+    async def scenario() -> GeminiDeepResearchResultResponse:
+        try:
+            return await poller.wait_for_change("interaction-1", "0:evt-1", 30)
+        finally:
+            await poller.stop()
+
+    result = asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+
+    assert result.event_id == "evt-5"
+
+
+class DeadlineRecordingGemini(ScriptedGemini):
+    """ScriptedGemini recording the request deadline seen by each poll."""
+
+    def __init__(self, snapshots: list[dict[str, Any]]) -> None:
+        super().__init__(snapshots)
+        self.budgets: list[float | None] = []
+
+    async def poll_research(
+        self,
+        interaction_id: str,
+        last_event_id: str | None = None,
+    ) -> GeminiDeepResearchResultResponse:
+        self.budgets.append(remaining())
+        return await super().poll_research(interaction_id, last_event_id)
+
+
+def test_polls_do_not_inherit_the_deadline_of_the_first_reader() -> None:
+    service = DeadlineRecordingGemini(statuses("pending", "in_progress", "completed"))
+    poller = make_poller(service)
+
+    async def scenario() -> GeminiDeepResearchResultResponse:
+        # The first reader starts the scheduler and the first shared poll
+        with deadline_scope(0.05):
+            await poller.get_status("interaction-1")
+        await asyncio.sleep(0.1)
+        result = await poller.wait_for_completion("interaction-1")
+        await poller.stop()
+        return result
+
+    result = asyncio.run(scenario())
+
+    assert result.status == "completed"
+    assert service.budgets == [None] * len(service.poll_calls)
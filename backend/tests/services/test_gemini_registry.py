@@ -0,0 +1,301 @@
+import asyncio
+import time
+from collections.abc import Generator
+
+import pytest
+from sqlmodel import Session, delete
+
+from app import crud
+from app.core.config import settings
+from app.core.db import engine
+from app.exceptions.gemini import GeminiAPIError
+from app.models import GeminiInteraction, User
+from app.schemas.gemini import (
+    GeminiDeepResearchResultResponse,
+    GeminiInteractionStatus,
+)
+from app.services.gemini_poller import GeminiStatusPoller
+from app.services.gemini_registry import GeminiInteractionRegistry
+from app.services.webhooks import WebhookDispatcher
+from tests.utils.gemini import ScriptedGemini, statuses
+
+
+@pytest.fixture(autouse=True)
+def clean_interactions(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    monkeypatch.setattr(settings.gemini, "api_key", "test-gemini-key")
+    yield
+    with Session(engine) as session:
+        session.execute(delete(GeminiInteraction))
+        session.commit()
+
+
+@pytest.fixture
+def owner(db: Session) -> User:
+    user = crud.get_user_by_email(session=db, email=settings.FIRST_SUPERUSER)
+    assert user is not None
+    return user
+
+
+def test_get_for_user_is_restricted_to_owner_and_superusers(owner: User) -> None:
+    registry = GeminiInteractionRegistry()
+    registry.record("interaction-1", owner.id, "query")
+    other = User(email="other@example.com", hashed_password="x", is_superuser=False)
+    admin = User(email="admin2@example.com", hashed_password="x", is_superuser=True)
+
+    assert registry.get_for_user("interaction-1", owner) is not None
+    assert registry.get_for_user("interaction-1", admin) is not None
+    assert registry.get_for_user("interaction-1", other) is None
+    assert registry.get_for_user("unknown", owner) is None
+
+
+def test_get_many_for_user_leaves_out_unknown_and_foreign(owner: User) -> None:
+    registry = GeminiInteractionRegistry()
+    registry.record("interaction-1", owner.id, "query")
+    registry.record("interaction-2", owner.id, "query")
+    other = User(email="other@example.com", hashed_password="x", is_superuser=False)
+
+    found = registry.get_many_for_user(["interaction-2", "unknown"], owner)
+    assert list(found) == ["interaction-2"]
+    assert registry.get_many_for_user(["interaction-1"], other) == {}
+
+
+def test_list_for_user_filters_and_orders_newest_first(owner: User) -> None:
+    registry = GeminiInteractionRegistry()
+    for index in range(3):
+        registry.record(f"interaction-{index}", owner.id, f"query {index}")
+    registry.mark("interaction-0", GeminiInteractionStatus.CANCELLED)
+
+    interactions, count = registry.list_for_user(owner, limit=2)
+    assert count == 3
+    assert [i.interaction_id for i in interactions] == [
+        "interaction-2",
+        "interaction-1",
+    ]
+
+    interactions, count = registry.list_for_user(
+        owner, status=GeminiInteractionStatus.CANCELLED
+    )
+    assert count == 1
+    assert interactions[0].completed_at is not None
+
+    other = User(email="other@example.com", hashed_password="x", is_superuser=False)
+    assert registry.list_for_user(other) == ([], 0)
+
+
+def test_update_from_result_finishes_interaction(owner: User) -> None:
+    registry = GeminiInteractionRegistry()
+    registry.record("running", owner.id, "query")
+    registry.record("done", owner.id, "query")
+
+    registry.update_from_result(
+        "done",
+        GeminiDeepResearchResultResponse.model_validate(
+            {"status": "completed", "event_id": "evt-9", "outputs": [{"text": "x"}]}
+        ),
+    )
+
+    done = registry.get("done")
+    assert done is not None
+    assert done.status == "completed"
+    assert done.last_event_id == "evt-9"
+    assert done.output_count == 1
+    assert done.completed_at is not None
+    # Finished interactions are no longer claimed for polling
+    assert [i.interaction_id for i in registry.claim("poller", 60)] == ["running"]
+    assert registry.mark("unknown", GeminiInteractionStatus.FAILED) is None
+
+
+def test_terminal_status_is_final_and_reported_once(owner: User) -> None:
+    registry = GeminiInteractionRegistry()
+    registry.record("interaction-1", owner.id, "query", callback_url="https://x.test")
+    running = GeminiDeepResearchResultResponse.model_validate({"status": "in_progress"})
+    completed = GeminiDeepResearchResultResponse.model_validate({"status": "completed"})
+
+    assert registry.update_from_result("interaction-1", running) is None
+    finished = registry.update_from_result("interaction-1", completed)
+    assert finished is not None
+    assert finished.callback_url == "https://x.test"
+
+    assert registry.update_from_result("interaction-1", completed) is None
+    assert registry.mark("interaction-1", GeminiInteractionStatus.CANCELLED) is None
+    interaction = registry.get("interaction-1")
+    assert interaction is not None
+    assert interaction.status == "completed"
+
+
+def test_poller_persists_changes_and_resumes_active_interactions(
+    owner: User,
+) -> None:
+    registry = GeminiInteractionRegistry()
+    registry.record("interaction-1", owner.id, "query")
+    service = ScriptedGemini(statuses("in_progress", "in_progress", "completed"))
+
+    async def scenario() -> int:
+        poller = GeminiStatusPoller(
+            lambda: service, poll_interval=0.01, registry=registry
+        )
+        resumed = await poller.resume()
+        await poller.wait_for_completion("interaction-1", timeout=5)
+        await poller.stop()
+        return resumed
+
+    assert asyncio.run(scenario()) == 1
+
+    interaction = registry.get("interaction-1")
+    assert interaction is not None
+    assert interaction.status == "completed"
+    assert interaction.last_event_id == "evt-3"
+    assert registry.claim("poller", 60) == []
+
+
+def test_claims_give_each_interaction_one_holder_until_the_lease_expires(
+    owner: User,
+) -> None:
+    registry = GeminiInteractionRegistry()
+    registry.record("interaction-1", owner.id, "query")
+    registry.record("watched", owner.id, "query", callback_url="https://x.test")
+
+    assert {i.interaction_id for i in registry.claim("poller-a", 60)} == {
+        "interaction-1",
+        "watched",
+    }
+    assert registry.claim("poller-b", 60) == []
+    # Renewing is allowed to the holder only
+    renewed = registry.claim("poller-a", 60, ["interaction-1"])
+    assert [i.interaction_id for i in renewed] == ["interaction-1"]
+
+    registry.release(["interaction-1"], "poller-b")
+    assert registry.claim("poller-b", 60, ["interaction-1"]) == []
+    registry.release(["interaction-1"], "poller-a")
+    claimed = registry.claim("poller-b", 60, watched_only=True)
+    assert claimed == []
+    assert [i.interaction_id for i in registry.claim("poller-b", 60)] == [
+        "interaction-1"
+    ]
+
+    registry.claim("poller-a", 0.01, ["watched"])
+    time.sleep(0.05)
+    taken = registry.claim("poller-b", 60, watched_only=True)
+    assert [i.interaction_id for i in taken] == ["watched"]
+
+
+def test_only_one_poller_resumes_an_interaction(owner: User) -> None:
+    registry = GeminiInteractionRegistry()
+    registry.record("interaction-1", owner.id, "query")
+    service = ScriptedGemini(statuses("in_progress"))
+
+    async def scenario() -> list[int]:
+        pollers = [
+            GeminiStatusPoller(lambda: service, poll_interval=0.01, registry=registry)
+            for _ in range(2)
+        ]
+        resumed = [await poller.resume() for poller in pollers]
+        for poller in pollers:
+            await poller.stop()
+        return resumed
+
+    assert asyncio.run(scenario()) == [1, 0]
+    # Stopping released the claim for the next process
+    interaction = registry.get("interaction-1")
+    assert interaction is not None
+    assert interaction.poller_id is None
+
+
+class RecordingDispatcher(WebhookDispatcher):
+    def __init__(self) -> None:
+        super().__init__()
+        self.finished: list[GeminiInteraction] = []
+
+    def notify_finished(self, interaction: GeminiInteraction) -> bool:
+        self.finished.append(interaction)
+        return True
+
+
+def test_poller_follows_watched_interaction_and_notifies(owner: User) -> None:
+    registry = GeminiInteractionRegistry()
+    registry.record(
+        "interaction-1", owner.id, "query", callback_url="https://client.test/hook"
+    )
+    service = ScriptedGemini(statuses("in_progress", "in_progress", "completed"))
+    dispatcher = RecordingDispatcher()
+
+    async def scenario() -> None:
+        poller = GeminiStatusPoller(
+            lambda: service,
+            poll_interval=0.01,
+            idle_timeout=0.001,
+            registry=registry,
+            webhook_dispatcher=dispatcher,
+        )
+        # Nobody reads the job; it is followed because it has a callback
+        await poller.resume()
+        for _ in range(200):
+            if dispatcher.finished:
+                break
+            await asyncio.sleep(0.01)
+        await poller.stop()
+
+    asyncio.run(scenario())
+
+    assert [i.interaction_id for i in dispatcher.finished] == ["interaction-1"]
+    assert dispatcher.finished[0].status == "completed"
+
+
+def test_poller_marks_interactions_gemini_no_longer_knows(owner: User) -> None:
+    registry = GeminiInteractionRegistry()
+    registry.record("expired", owner.id, "query")
+    service = ScriptedGemini([])
+
+    async def missing(*_args: object, **_kwargs: object) -> None:
+        raise GeminiAPIError.interaction_not_found()
+
+    service.poll_research = missing  # type: ignore[method-assign]
+
+    async def scenario() -> None:
+        poller = GeminiStatusPoller(
+            lambda: service, poll_interval=0.01, registry=registry
+        )
+        with pytest.raises(GeminiAPIError):
+            await poller.get_status("expired")
+        await poller.stop()
+
+    asyncio.run(scenario())
+
+    interaction = registry.get("expired")
+    assert interaction is not None
+    assert interaction.status == "failed"
+    assert interaction.error_message is not None
+
+
+def test_poller_takes_over_watched_interactions_of_a_lost_process(
+    owner: User,
+) -> None:
+    registry = GeminiInteractionRegistry()
+    registry.record(
+        "interaction-1", owner.id, "query", callback_url="https://client.test/hook"
+    )
+    # Held by a process that stops renewing its lease
+    registry.claim("lost-process", 0.2)
+    service = ScriptedGemini(statuses("in_progress", "completed"))
+    dispatcher = RecordingDispatcher()
+
+    async def scenario() -> int:
+        poller = GeminiStatusPoller(
+            lambda: service,
+            poll_interval=0.01,
+            idle_timeout=0.001,
+            lease=0.03,
+            registry=registry,
+            webhook_dispatcher=dispatcher,
+        )
+        resumed = await poller.resume()
+        for _ in range(300):
+            if dispatcher.finished:
+                break
+            await asyncio.sleep(0.01)
+        await poller.stop()
+        return resumed
+
+    assert asyncio.run(scenario()) == 0
+
+    assert [i.interaction_id for i in dispatcher.finished] == ["interaction-1"]
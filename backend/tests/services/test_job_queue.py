@@ -0,0 +1,283 @@
+import asyncio
+import time
+import uuid
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlmodel import Session, delete
+
+from app import crud
+from app.core.config import JobQueueSettings, settings
+from app.core.db import engine
+from app.exceptions.youcom import YouComAPIError, YouComErrorCode
+from app.models import ResearchJob, User
+from app.schemas.youcom import YouComDeepResearchResponse
+from app.services.job_queue import JobQueue
+from app.services.registry import ServiceRegistry
+from app.services.research_worker import ResearchWorker
+from app.services.youcom import YouComService
+
+REQUEST = {"query": "Compare open-source agent platforms", "research_effort": "deep"}
+
+
+@pytest.fixture(autouse=True)
+def clean_jobs() -> Generator[None, None, None]:
+    with Session(engine) as session:
+        session.execute(delete(ResearchJob))
+        session.commit()
+    yield
+    with Session(engine) as session:
+        session.execute(delete(ResearchJob))
+        session.commit()
+
+
+@pytest.fixture
+def owner(db: Session) -> User:
+    user = crud.get_user_by_email(session=db, email=settings.FIRST_SUPERUSER)
+    assert user is not None
+    return user
+
+
+def make_queue(**overrides: Any) -> JobQueue:
+    return JobQueue(queue_settings=JobQueueSettings(**overrides))
+
+
+def test_submit_claim_complete(owner: User) -> None:
+    queue = make_queue()
+    job = queue.submit(owner.id, "youcom", REQUEST)
+    assert job.status == "queued"
+
+    claimed = queue.claim("worker-1", limit=4)
+
+    assert [j.id for j in claimed] == [job.id]
+    assert claimed[0].status == "running"
+    assert claimed[0].attempts == 1
+    assert claimed[0].lease_expires_at is not None
+
+    assert queue.complete(job.id, "worker-1", {"output": {"content": "done"}})
+    stored = queue.get(job.id)
+    assert stored is not None
+    assert stored.status == "succeeded"
+    assert stored.result == {"output": {"content": "done"}}
+    assert stored.lease_expires_at is None
+
+
+def test_claims_are_disjoint_and_oldest_first(owner: User) -> None:
+    queue = make_queue()
+    jobs = [queue.submit(owner.id, "youcom", REQUEST) for _ in range(3)]
+
+    first = queue.claim("worker-1", limit=2)
+    second = queue.claim("worker-2", limit=2)
+
+    assert [j.id for j in first] == [jobs[0].id, jobs[1].id]
+    assert [j.id for j in second] == [jobs[2].id]
+    assert queue.claim("worker-3", limit=2) == []
+
+
+def test_complete_requires_the_lease(owner: User) -> None:
+    queue = make_queue()
+    job = queue.submit(owner.id, "youcom", REQUEST)
+    queue.claim("worker-1", limit=1)
+
+    assert not queue.complete(job.id, "worker-2", {})
+    assert queue.renew([job.id], "worker-2") == set()
+    assert queue.renew([job.id], "worker-1") == {job.id}
+
+
+def test_expired_lease_is_reclaimed(owner: User) -> None:
+    queue = make_queue(lease=0.01)
+    job = queue.submit(owner.id, "youcom", REQUEST)
+    queue.claim("worker-1", limit=1)
+    time.sleep(0.05)
+
+    reclaimed = queue.claim("worker-2", limit=1)
+
+    assert [j.id for j in reclaimed] == [job.id]
+    assert reclaimed[0].worker_id == "worker-2"
+    assert reclaimed[0].attempts == 2
+    assert not queue.complete(job.id, "worker-1", {})
+
+
+def test_job_is_abandoned_after_max_attempts(owner: User) -> None:
+    queue = make_queue(lease=0.01, max_attempts=2)
+    job = queue.submit(owner.id, "youcom", REQUEST)
+    for worker_id in ("worker-1", "worker-2"):
+        assert queue.claim(worker_id, limit=1)
+        time.sleep(0.05)
+
+    assert queue.claim("worker-3", limit=1) == []
+    stored = queue.get(job.id)
+    assert stored is not None
+    assert stored.status == "failed"
+    assert stored.error is not None
+    assert stored.error["error_code"] == "job_abandoned"
+
+
+def test_release_requeues_without_counting_the_attempt(owner: User) -> None:
+    queue = make_queue()
+    job = queue.submit(owner.id, "youcom", REQUEST)
+    queue.claim("worker-1", limit=1)
+
+    assert queue.release(job.id, "worker-1")
+
+    stored = queue.get(job.id)
+    assert stored is not None
+    assert stored.status == "queued"
+    assert stored.attempts == 0
+    assert stored.worker_id is None
+
+
+def test_get_for_user_hides_other_users_jobs(owner: User) -> None:
+    queue = make_queue()
+    job = queue.submit(owner.id, "youcom", REQUEST)
+    other = User(email="other@example.com", hashed_password="x", is_superuser=False)
+
+    assert queue.get_for_user(job.id, owner, "youcom") is not None
+    assert queue.get_for_user(job.id, owner, "perplexity") is None
+    assert queue.get_for_user(job.id, other, "youcom") is None
+
+
+def worker_with(youcom: Any, queue: JobQueue) -> ResearchWorker:
+    registry = ServiceRegistry()
+    registry.override(YouComService, youcom)
+    return ResearchWorker(
+        queue=queue,
+        registry=registry,
+        queue_settings=JobQueueSettings(poll_interval=0.01),
+        worker_id="worker-1",
+    )
+
+
+def test_worker_stores_result(owner: User) -> None:
+    queue = make_queue()
+    job = queue.submit(owner.id, "youcom", REQUEST)
+    youcom = MagicMock()
+    youcom.deep_research = AsyncMock(
+        return_value=YouComDeepResearchResponse.model_validate(
+            {"output": {"content": "## Summary", "content_type": "text"}}
+        )
+    )
+    worker = worker_with(youcom, queue)
+
+    (claimed,) = queue.claim(worker.worker_id, limit=1)
+    asyncio.run(worker.execute(claimed))
+
+    stored = queue.get(job.id)
+    assert stored is not None
+    assert stored.status == "succeeded"
+    assert stored.result is not None
+    assert stored.result["output"]["content"] == "## Summary"
+    called_request = youcom.deep_research.await_args.args[0]
+    assert called_request.query == REQUEST["query"]
+
+
+def test_worker_stores_provider_error(owner: User) -> None:
+    queue = make_queue()
+    job = queue.submit(owner.id, "youcom", REQUEST)
+    youcom = MagicMock()
+    youcom.deep_research = AsyncMock(
+        side_effect=YouComAPIError(
+            message="Rate limited",
+            error_code=YouComErrorCode.RATE_LIMIT_EXCEEDED,
+            status_code=429,
+        )
+    )
+    worker = worker_with(youcom, queue)
+
+    (claimed,) = queue.claim(worker.worker_id, limit=1)
+    asyncio.run(worker.execute(claimed))
+
+    stored = queue.get(job.id)
+    assert stored is not None
+    assert stored.status == "failed"
+    assert stored.error is not None
+    assert stored.error["status_code"] == 429
+    assert stored.error["error_code"] == YouComErrorCode.RATE_LIMIT_EXCEEDED
+
+
+def test_worker_releases_jobs_still_running_at_shutdown(owner: User) -> None:
+    queue = make_queue()
+    job = queue.submit(owner.id, "youcom", REQUEST)
+    youcom = MagicMock()
+    started = asyncio.Event()
+
+    async def never_finishes(_request: Any) -> Any:
+        started.set()
+        await asyncio.sleep(3600)
+
+    youcom.deep_research = never_finishes
+    worker = worker_with(youcom, queue)
+    worker._settings.shutdown_grace = 0.01
+
+    async def scenario() -> None:
+        stop = asyncio.Event()
+        runner = asyncio.create_task(worker.run(stop))
+        await asyncio.wait_for(started.wait(), timeout=5)
+        stop.set()
+        await asyncio.wait_for(runner, timeout=5)
+
+    asyncio.run(scenario())
+
+    stored = queue.get(job.id)
+    assert stored is not None
+    assert stored.status == "queued"
+    assert stored.attempts == 0
+
+
+def test_worker_wait_leaves_running_jobs_alone() -> None:
+    worker = worker_with(MagicMock(), make_queue())
+
+    async def scenario() -> None:
+        stop = asyncio.Event()
+        jobs = [asyncio.create_task(asyncio.sleep(3600)) for _ in range(4)]
+        for job in jobs:
+            worker._running[uuid.uuid4()] = job
+        for _ in range(10):
+            await worker._wait(stop)
+        await asyncio.sleep(0)
+
+        assert not any(job.done() for job in jobs)
+        others = asyncio.all_tasks() - {asyncio.current_task(), *jobs}
+        assert all(task.done() for task in others)
+        for job in jobs:
+            job.cancel()
+        await asyncio.gather(*jobs, return_exceptions=True)
+
+    asyncio.run(scenario())
+
+
+def test_worker_keeps_renewing_after_a_failed_renewal() -> None:
+    queue = MagicMock()
+    kept, lost = uuid.uuid4(), uuid.uuid4()
+    queue.renew.side_effect = [RuntimeError("connection lost"), {kept}]
+    worker = ResearchWorker(
+        queue=queue,
+        registry=ServiceRegistry(),
+        queue_settings=JobQueueSettings(lease=0.03),
+        worker_id="worker-1",
+    )
+
+    async def scenario() -> list[bool]:
+        stop = asyncio.Event()
+        jobs = {
+            job_id: asyncio.create_task(asyncio.sleep(3600)) for job_id in (kept, lost)
+        }
+        worker._running.update(jobs)
+        renewer = asyncio.create_task(worker._renew_leases(stop))
+        for _ in range(200):
+            if queue.renew.call_count >= 2:
+                break
+            await asyncio.sleep(0.005)
+        stop.set()
+        await renewer
+        await asyncio.sleep(0)
+        cancelled = [jobs[kept].cancelled(), jobs[lost].cancelled()]
+        jobs[kept].cancel()
+        await asyncio.gather(*jobs.values(), return_exceptions=True)
+        return cancelled
+
+    # The renewer survived the error, and only the job it lost was stopped
+    assert asyncio.run(scenario()) == [False, True]
+    assert queue.renew.call_count == 2
@@ -0,0 +1,134 @@
+import asyncio
+import json
+from typing import Any
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.exceptions.perplexity import PerplexityAPIError, PerplexityErrorCode
+from app.schemas.perplexity import (
+    PerplexityDeepResearchRequest,
+    PerplexityStreamEvent,
+    PerplexityStreamEventType,
+)
+from app.services.perplexity import PerplexityService
+
+STREAM_CHUNKS: list[dict[str, Any]] = [
+    {
+        "id": "resp-1",
+        "model": "sonar-deep-research",
+        "created": 1,
+        "choices": [{"index": 0, "delta": {"role": "assistant", "content": "Hel"}}],
+    },
+    {
+        "id": "resp-1",
+        "model": "sonar-deep-research",
+        "citations": ["https://example.com/a"],
+        "choices": [{"index": 0, "delta": {"content": "lo"}}],
+    },
+    {
+        "id": "resp-1",
+        "model": "sonar-deep-research",
+        "citations": ["https://example.com/a", "https://example.com/b"],
+        "usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5},
+        "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+    },
+]
+
+
+def sse_body(chunks: list[dict[str, Any]]) -> str:
+    frames = [f"data: {json.dumps(chunk)}\n\n" for chunk in chunks]
+    return "".join(frames) + "data: [DONE]\n\n"
+
+
+@pytest.fixture
+def configured_perplexity(monkeypatch: pytest.MonkeyPatch) -> PerplexityService:
+    monkeypatch.setattr(settings.perplexity, "api_key", "test-perplexity-key")
+    return PerplexityService()
+
+
+def use_transport(
+    monkeypatch: pytest.MonkeyPatch,
+    service: PerplexityService,
+    handler: Any,
+) -> list[httpx.Request]:
+    requests: list[httpx.Request] = []
+
+    def record(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return handler(request)  # type: ignore[no-any-return]
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(record))
+    monkeypatch.setattr(service, "_get_client", lambda: client)
+    return requests
+
+
+def collect(
+    service: PerplexityService, request: PerplexityDeepResearchRequest
+) -> list[PerplexityStreamEvent]:
+    async def scenario() -> list[PerplexityStreamEvent]:
+        return [event async for event in service.stream_deep_research(request)]
+
+    return asyncio.run(scenario())
+
+
+def test_stream_yields_deltas_then_accumulated_response(
+    configured_perplexity: PerplexityService,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    requests = use_transport(
+        monkeypatch,
+        configured_perplexity,
+        lambda _: httpx.Response(200, text=sse_body(STREAM_CHUNKS)),
+    )
+
+    events = collect(configured_perplexity, PerplexityDeepResearchRequest(query="q"))
+
+    assert json.loads(requests[0].content)["stream"] is True
+    assert [event.content for event in events[:-1]] == ["Hel", "lo"]
+    final = events[-1]
+    assert final.event == PerplexityStreamEventType.FINAL_RESULT
+    assert final.response is not None
+    assert final.response.id == "resp-1"
+    assert final.response.choices[0].message.content == "Hello"
+    assert final.response.choices[0].finish_reason == "stop"
+    assert final.response.citations == [
+        "https://example.com/a",
+        "https://example.com/b",
+    ]
+    assert final.response.usage is not None
+    assert final.response.usage.total_tokens == 5
+
+
+def test_stream_maps_upstream_error_status(
+    configured_perplexity: PerplexityService,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    use_transport(
+        monkeypatch,
+        configured_perplexity,
+        lambda _: httpx.Response(429, text="slow down"),
+    )
+
+    with pytest.raises(PerplexityAPIError) as exc_info:
+        collect(configured_perplexity, PerplexityDeepResearchRequest(query="q"))
+
+    assert exc_info.value.error_code == PerplexityErrorCode.RATE_LIMIT_EXCEEDED
+    assert exc_info.value.details == {"response_body": "slow down"}
+
+
+def test_stream_rejects_malformed_chunk(
+    configured_perplexity: PerplexityService,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    use_transport(
+        monkeypatch,
+        configured_perplexity,
+        lambda _: httpx.Response(200, text="data: {not json\n\n"),
+    )
+
+    with pytest.raises(PerplexityAPIError) as exc_info:
+        collect(configured_perplexity, PerplexityDeepResearchRequest(query="q"))
+
+    assert exc_info.value.error_code == PerplexityErrorCode.PERPLEXITY_API_ERROR
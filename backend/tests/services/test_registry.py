@@ -0,0 +1,59 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.api.deps import get_tavily_service
+from app.core.config import settings
+from app.exceptions.youcom import YouComAPIError
+from app.services.registry import ServiceRegistry, services
+from app.services.tavily import TavilyService
+from app.services.youcom import YouComService
+
+
+def test_registry_returns_shared_instance() -> None:
+    registry = ServiceRegistry()
+
+    first = registry.get(TavilyService)
+
+    assert registry.get(TavilyService) is first
+
+
+def test_registry_does_not_cache_unconfigured_service(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings.youcom, "api_key", None)
+    registry = ServiceRegistry()
+
+    registry.startup()
+
+    with pytest.raises(YouComAPIError):
+        registry.get(YouComService)
+
+    monkeypatch.setattr(settings.youcom, "api_key", "late-key")
+    assert isinstance(registry.get(YouComService), YouComService)
+
+
+def test_registry_override_takes_precedence() -> None:
+    registry = ServiceRegistry()
+    fake = MagicMock()
+
+    registry.override(TavilyService, fake)
+    assert registry.get(TavilyService) is fake
+
+    registry.clear_overrides()
+    assert registry.get(TavilyService) is not fake
+
+
+def test_registry_clear_drops_instances() -> None:
+    registry = ServiceRegistry()
+    fake = MagicMock()
+    registry._instances[TavilyService] = fake
+
+    registry.clear()
+
+    assert registry.get(TavilyService) is not fake
+
+
+def test_dependency_uses_process_wide_instance() -> None:
+    assert get_tavily_service() is get_tavily_service()
+    assert get_tavily_service() is services.get(TavilyService)
@@ -0,0 +1,57 @@
+from app.core.config import SearchCacheSettings
+from app.schemas.tavily import SearchRequest, SearchTopic
+from app.services.search_cache import SearchCache, search_cache_key
+
+
+def test_key_ignores_query_case_whitespace_and_domain_order() -> None:
+    first = SearchRequest(
+        query="Python  Async\tIO",
+        include_domains=["Docs.Python.org", "realpython.com"],
+    )
+    second = SearchRequest(
+        query="python async io",
+        include_domains=["realpython.com", "docs.python.org", "realpython.com"],
+    )
+
+    assert search_cache_key(first) == search_cache_key(second)
+
+
+def test_key_differs_for_options_that_change_the_response() -> None:
+    base = SearchRequest(query="python")
+
+    assert search_cache_key(base) != search_cache_key(
+        SearchRequest(query="python", max_results=10)
+    )
+    assert search_cache_key(base) != search_cache_key(
+        SearchRequest(query="python", topic=SearchTopic.NEWS)
+    )
+
+
+def test_news_uses_its_own_ttl() -> None:
+    cache = SearchCache(SearchCacheSettings(general_ttl=3600, news_ttl=60))
+
+    assert cache.ttl(SearchTopic.GENERAL) == 3600
+    assert cache.ttl(SearchTopic.NEWS) == 60
+
+
+def test_round_trip_and_stats() -> None:
+    cache = SearchCache(SearchCacheSettings(max_entries=8))
+    request = SearchRequest(query="python")
+
+    assert cache.get(request) is None
+    cache.set(request, b'{"query": "python"}')
+    assert cache.get(SearchRequest(query=" PYTHON ")) == b'{"query": "python"}'
+
+    stats = cache.stats()
+    assert (stats.entries, stats.hits, stats.misses) == (1, 1, 1)
+    assert stats.max_entries == 8
+
+
+def test_disabled_cache_stores_nothing() -> None:
+    cache = SearchCache(SearchCacheSettings(enabled=False))
+    request = SearchRequest(query="python")
+
+    cache.set(request, b"{}")
+
+    assert cache.get(request) is None
+    assert cache.stats().entries == 0
@@ -0,0 +1,194 @@
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+from tavily.errors import UsageLimitExceededError  # type: ignore[import-untyped]
+
+from app.core.deadline import deadline_scope
+from app.core.exceptions import TavilyAPIError, TavilyErrorCode
+from app.services.tavily import TavilyService
+
+
+def status_error(status_code: int, headers: dict[str, str]) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://api.tavily.com/search")
+    response = httpx.Response(status_code, headers=headers, request=request)
+    return httpx.HTTPStatusError("upstream", request=request, response=response)
+
+
+def test_sdk_errors_map_to_tavily_api_errors() -> None:
+    service = TavilyService()
+
+    rate_limited = service._handle_error(UsageLimitExceededError("slow down"))
+    unavailable = service._handle_error(status_error(503, {"Retry-After": "4"}))
+
+    assert rate_limited is not None
+    assert rate_limited.error_code == TavilyErrorCode.RATE_LIMIT_EXCEEDED
+    assert unavailable is not None
+    assert unavailable.error_code == TavilyErrorCode.SERVICE_UNAVAILABLE
+    assert unavailable.details == {"original_error": "upstream", "retry_after": 4.0}
+    assert service._handle_error(ValueError("something else")) is None
+
+
+def test_search_retries_transient_sdk_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = TavilyService()
+    outcomes: list[Exception | dict[str, Any]] = [
+        status_error(502, {}),
+        {"query": "q", "results": []},
+    ]
+
+    async def fake_search(**_kwargs: Any) -> dict[str, Any]:
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(service._client, "search", fake_search)
+
+    assert asyncio.run(service.search("q")) == {"query": "q", "results": []}
+    assert outcomes == []
+
+
+def test_unmapped_sdk_errors_propagate_unchanged(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service = TavilyService()
+
+    async def fake_search(**_kwargs: Any) -> dict[str, Any]:
+        raise RuntimeError("unexpected")
+
+    monkeypatch.setattr(service._client, "search", fake_search)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(service.search("q"))
+
+
+def fake_extract(calls: list[list[str]], failures: dict[str, list[Exception]]) -> Any:
+    async def extract(urls: list[str], **_kwargs: Any) -> dict[str, Any]:
+        calls.append(urls)
+        pending = failures.get(urls[0])
+        if pending:
+            raise pending.pop(0)
+        return {
+            "results": [{"url": url, "raw_content": url} for url in urls],
+            "failed_results": [],
+            "response_time": 0.5,
+        }
+
+    return extract
+
+
+def test_extract_dedupes_and_chunks_urls(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = TavilyService()
+    service._extract_chunk_size = 2
+    calls: list[list[str]] = []
+    monkeypatch.setattr(service._client, "extract", fake_extract(calls, {}))
+    urls = [
+        "https://a.com/x",
+        "https://A.com/x/",
+        "https://b.com",
+        "https://c.com#intro",
+        "https://c.com",
+        "https://d.com",
+    ]
+
+    result = asyncio.run(service.extract(urls))
+
+    assert sorted(calls) == [
+        ["https://a.com/x", "https://b.com"],
+        ["https://c.com#intro", "https://d.com"],
+    ]
+    assert [item["url"] for item in result["results"]] == [
+        "https://a.com/x",
+        "https://b.com",
+        "https://c.com#intro",
+        "https://d.com",
+    ]
+    assert result["response_time"] == 0.5
+
+
+def test_extract_reports_failed_chunk_per_url(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service = TavilyService()
+    service._extract_chunk_size = 1
+    calls: list[list[str]] = []
+    failures: dict[str, list[Exception]] = {
+        "https://b.com": [TavilyAPIError.invalid_request("bad url")],
+        "https://c.com": [TavilyAPIError.request_timeout()],
+    }
+    monkeypatch.setattr(service._client, "extract", fake_extract(calls, failures))
+
+    result = asyncio.run(
+        service.extract(["https://a.com", "https://b.com", "https://c.com"])
+    )
+
+    assert [item["url"] for item in result["results"]] == [
+        "https://a.com",
+        "https://c.com",
+    ]
+    assert result["failed_results"] == [{"url": "https://b.com", "error": "bad url"}]
+    # Only the timed-out chunk was sent again
+    assert sorted(url for (url,) in calls) == [
+        "https://a.com",
+        "https://b.com",
+        "https://c.com",
+        "https://c.com",
+    ]
+
+
+def test_extract_raises_when_every_chunk_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service = TavilyService()
+    service._extract_chunk_size = 1
+    failures: dict[str, list[Exception]] = {
+        url: [TavilyAPIError.invalid_api_key()]
+        for url in ("https://a.com", "https://b.com")
+    }
+    monkeypatch.setattr(service._client, "extract", fake_extract([], failures))
+
+    with pytest.raises(TavilyAPIError) as exc_info:
+        asyncio.run(service.extract(["https://a.com", "https://b.com"]))
+
+    assert exc_info.value.error_code == TavilyErrorCode.INVALID_API_KEY
+
+
+def test_hedged_search_returns_the_faster_request(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service = TavilyService()
+    service._hedger.max_rate = 1.0
+    for _ in range(service._hedger.latencies.min_samples):
+        service._hedger.latencies.record(0.01)
+    delays = [1.0, 0.0]
+
+    async def fake_search(**kwargs: Any) -> dict[str, Any]:
+        delay = delays.pop(0)
+        await asyncio.sleep(delay)
+        return {"query": kwargs["query"], "results": [], "delay": delay}
+
+    monkeypatch.setattr(service._client, "search", fake_search)
+
+    result = asyncio.run(service.search("q", hedge=True))
+
+    assert result["delay"] == 0.0
+    assert service._hedger.hedges_won == 1
+
+
+def test_search_timeout_is_capped_at_request_deadline(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service = TavilyService()
+    timeouts: list[float] = []
+
+    async def fake_search(**kwargs: Any) -> dict[str, Any]:
+        timeouts.append(kwargs["timeout"])
+        return {"query": kwargs["query"], "results": []}
+
+    monkeypatch.setattr(service._client, "search", fake_search)
+
+    with deadline_scope(2.0):
+        asyncio.run(service.search("q"))
+
+    assert 0 < timeouts[0] <= 2.0
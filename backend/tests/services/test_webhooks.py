@@ -0,0 +1,319 @@
+import asyncio
+import json
+from collections.abc import Generator
+from typing import Any
+
+import httpx
+import pytest
+from sqlmodel import Session, delete
+
+from app import crud
+from app.core.config import WebhookSettings, settings
+from app.core.db import engine
+from app.models import GeminiInteraction
+from app.schemas.gemini import GeminiInteractionStatus
+from app.services.gemini_registry import gemini_interactions
+from app.services.webhooks import (
+    DELIVERY_ID_HEADER,
+    SIGNATURE_HEADER,
+    TIMESTAMP_HEADER,
+    WebhookDelivery,
+    WebhookDispatcher,
+    WebhookURLError,
+    sign_payload,
+    verify_signature,
+)
+
+SECRET = "test-webhook-secret"
+
+
+class Receiver:
+    """httpx transport answering with scripted status codes."""
+
+    def __init__(self, *status_codes: int, delay: float = 0.0) -> None:
+        self.status_codes = list(status_codes)
+        self.delay = delay
+        self.requests: list[httpx.Request] = []
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        await asyncio.sleep(self.delay)
+        index = min(len(self.requests), len(self.status_codes)) - 1
+        return httpx.Response(self.status_codes[index])
+
+
+async def resolve_public(_host: str) -> list[str]:
+    return ["93.184.216.34"]
+
+
+def make_dispatcher(
+    receiver: Receiver,
+    resolve: Any = resolve_public,
+    **overrides: Any,
+) -> WebhookDispatcher:
+    overrides.setdefault("secret", SECRET)
+    sleeps: list[float] = []
+
+    async def no_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    dispatcher = WebhookDispatcher(
+        WebhookSettings(**overrides),
+        client_factory=lambda: httpx.AsyncClient(
+            transport=httpx.MockTransport(receiver.handle)
+        ),
+        sleep=no_sleep,
+        resolve=resolve,
+    )
+    dispatcher.sleeps = sleeps  # type: ignore[attr-defined]
+    return dispatcher
+
+
+def test_signature_round_trip() -> None:
+    signature = sign_payload(SECRET, 1700000000, b'{"a":1}')
+
+    assert signature.startswith("sha256=")
+    assert verify_signature(SECRET, 1700000000, b'{"a":1}', signature)
+    assert not verify_signature(SECRET, 1700000001, b'{"a":1}', signature)
+    assert not verify_signature("other", 1700000000, b'{"a":1}', signature)
+
+
+def test_delivery_is_signed() -> None:
+    receiver = Receiver(204)
+    dispatcher = make_dispatcher(receiver)
+    delivery = WebhookDelivery("https://client.test/hook", b'{"event":"x"}')
+
+    assert asyncio.run(dispatcher.deliver(delivery))
+
+    (request,) = receiver.requests
+    assert request.content == b'{"event":"x"}'
+    assert request.headers[DELIVERY_ID_HEADER] == delivery.delivery_id
+    assert verify_signature(
+        SECRET,
+        int(request.headers[TIMESTAMP_HEADER]),
+        request.content,
+        request.headers[SIGNATURE_HEADER],
+    )
+
+
+def test_delivery_retries_transient_failures_with_backoff() -> None:
+    receiver = Receiver(503, 429, 200)
+    dispatcher = make_dispatcher(receiver, backoff_base=1.0, backoff_max=4.0)
+
+    delivered = asyncio.run(
+        dispatcher.deliver(WebhookDelivery("https://client.test/hook", b"{}"))
+    )
+
+    assert delivered
+    assert len(receiver.requests) == 3
+    assert len(dispatcher.sleeps) == 2  # type: ignore[attr-defined]
+    assert all(0 <= delay <= 4.0 for delay in dispatcher.sleeps)  # type: ignore[attr-defined]
+    ids = {request.headers[DELIVERY_ID_HEADER] for request in receiver.requests}
+    assert len(ids) == 1
+
+
+def test_delivery_gives_up_on_client_errors_and_after_max_attempts() -> None:
+    rejected = Receiver(400)
+    assert not asyncio.run(
+        make_dispatcher(rejected).deliver(WebhookDelivery("https://c.test", b"{}"))
+    )
+    assert len(rejected.requests) == 1
+
+    failing = Receiver(500)
+    assert not asyncio.run(
+        make_dispatcher(failing, max_attempts=3).deliver(
+            WebhookDelivery("https://c.test", b"{}")
+        )
+    )
+    assert len(failing.requests) == 3
+
+
+def test_queue_is_bounded_and_drained_in_background() -> None:
+    receiver = Receiver(200, delay=0.05)
+    dispatcher = make_dispatcher(receiver, queue_size=2, concurrency=1)
+
+    async def scenario() -> list[bool]:
+        queued = [dispatcher.enqueue("https://c.test", b"{}") for _ in range(3)]
+        await dispatcher.join()
+        await dispatcher.stop()
+        return queued
+
+    assert asyncio.run(scenario()) == [True, True, False]
+    assert len(receiver.requests) == 2
+
+
+def test_notify_finished_sends_payload_only_with_callback() -> None:
+    receiver = Receiver(200)
+    dispatcher = make_dispatcher(receiver)
+    interaction = GeminiInteraction.model_validate(
+        {
+            "interaction_id": "interaction-1",
+            "owner_id": "00000000-0000-0000-0000-000000000001",
+            "query": "q",
+            "status": "failed",
+            "error_message": "boom",
+            "output_count": 1,
+            "created_at": "2026-01-01T00:00:00Z",
+            "updated_at": "2026-01-01T00:00:00Z",
+            "callback_url": "https://client.test/hook",
+        }
+    )
+
+    async def scenario() -> tuple[bool, bool]:
+        sent = dispatcher.notify_finished(interaction)
+        interaction.callback_url = None
+        skipped = dispatcher.notify_finished(interaction)
+        await dispatcher.join()
+        await dispatcher.stop()
+        return sent, skipped
+
+    assert asyncio.run(scenario()) == (True, False)
+    body = json.loads(receiver.requests[0].content)
+    assert body["event"] == "deep_research.finished"
+    assert body["interaction_id"] == "interaction-1"
+    assert body["status"] == "failed"
+    assert body["error_message"] == "boom"
+
+
+def test_enqueue_drops_notifications_without_secret() -> None:
+    dispatcher = make_dispatcher(Receiver(200), secret=None)
+
+    async def scenario() -> bool:
+        return dispatcher.enqueue("https://c.test", b"{}")
+
+    assert not asyncio.run(scenario())
+
+
+@pytest.mark.parametrize(
+    "address",
+    [
+        "127.0.0.1",
+        "10.1.2.3",
+        "192.168.0.10",
+        "169.254.169.254",
+        "100.64.0.1",
+        "::1",
+        "fe80::1%eth0",
+        "::ffff:172.16.0.1",
+    ],
+)
+def test_callback_urls_reaching_non_public_addresses_are_refused(
+    address: str,
+) -> None:
+    receiver = Receiver(200)
+
+    async def resolve(_host: str) -> list[str]:
+        return ["93.184.216.34", address]
+
+    dispatcher = make_dispatcher(receiver, resolve=resolve)
+
+    with pytest.raises(WebhookURLError):
+        asyncio.run(dispatcher.check_url("https://client.test/hook"))
+    # DNS may change after the job started, so deliveries check again
+    delivery = WebhookDelivery("https://client.test/hook", b"{}")
+    assert not asyncio.run(dispatcher.deliver(delivery))
+    assert receiver.requests == []
+
+
+def test_callback_url_checks_allow_listed_hosts_and_unresolvable_hosts() -> None:
+    async def resolve(host: str) -> list[str]:
+        if host == "hooks.internal":
+            return ["10.0.0.7"]
+        raise OSError("Name or service not known")
+
+    dispatcher = make_dispatcher(
+        Receiver(200), resolve=resolve, allowed_hosts=["Hooks.Internal"]
+    )
+
+    asyncio.run(dispatcher.check_url("https://hooks.internal/hook"))
+    with pytest.raises(WebhookURLError):
+        asyncio.run(dispatcher.check_url("https://missing.test/hook"))
+
+
+@pytest.fixture
+def finished_interaction(db: Session) -> Generator[GeminiInteraction, None, None]:
+    owner = crud.get_user_by_email(session=db, email=settings.FIRST_SUPERUSER)
+    assert owner is not None
+    gemini_interactions.record(
+        "interaction-1", owner.id, "q", callback_url="https://client.test/hook"
+    )
+    finished = gemini_interactions.mark(
+        "interaction-1", GeminiInteractionStatus.COMPLETED
+    )
+    assert finished is not None
+    yield finished
+    with Session(engine) as session:
+        session.execute(delete(GeminiInteraction))
+        session.commit()
+
+
+def test_unaccepted_notifications_are_sent_again_on_resume(
+    finished_interaction: GeminiInteraction,
+) -> None:
+    failing = Receiver(500)
+    accepting = Receiver(200)
+
+    async def scenario(dispatcher: WebhookDispatcher) -> None:
+        dispatcher.notify_finished(finished_interaction)
+        await dispatcher.join()
+        await dispatcher.stop()
+
+    asyncio.run(scenario(make_dispatcher(failing, max_attempts=2)))
+
+    undelivered = gemini_interactions.get("interaction-1")
+    assert undelivered is not None
+    assert undelivered.webhook_delivered_at is None
+
+    async def resume(dispatcher: WebhookDispatcher) -> int:
+        queued = await dispatcher.resume()
+        await dispatcher.join()
+        await dispatcher.stop()
+        return queued
+
+    assert asyncio.run(resume(make_dispatcher(accepting))) == 1
+
+    stored = gemini_interactions.get("interaction-1")
+    assert stored is not None
+    assert stored.webhook_delivered_at is not None
+    assert asyncio.run(resume(make_dispatcher(accepting))) == 0
+    # Receivers can drop the duplicate: the delivery ID is stable
+    ids = {r.headers[DELIVERY_ID_HEADER] for r in failing.requests + accepting.requests}
+    assert len(ids) == 1
+
+
+@pytest.mark.usefixtures("finished_interaction")
+def test_each_unaccepted_notification_is_resent_by_one_process() -> None:
+    accepting = Receiver(200)
+
+    async def resume(*dispatchers: WebhookDispatcher) -> list[int]:
+        queued = await asyncio.gather(*(d.resume() for d in dispatchers))
+        for dispatcher in dispatchers:
+            await dispatcher.join()
+            await dispatcher.stop()
+        return list(queued)
+
+    queued = asyncio.run(resume(make_dispatcher(accepting), make_dispatcher(accepting)))
+
+    assert sorted(queued) == [0, 1]
+    assert len(accepting.requests) == 1
+
+
+def test_failed_redelivery_is_released_for_the_next_restart(
+    finished_interaction: GeminiInteraction,
+) -> None:
+    failing = Receiver(500)
+    since = finished_interaction.created_at
+
+    assert len(gemini_interactions.claim_undelivered(since, 60)) == 1
+    # Leased: another process starting now skips it
+    assert gemini_interactions.claim_undelivered(since, 60) == []
+    gemini_interactions.release_webhook("interaction-1")
+
+    async def resume(dispatcher: WebhookDispatcher) -> int:
+        queued = await dispatcher.resume()
+        await dispatcher.join()
+        await dispatcher.stop()
+        return queued
+
+    assert asyncio.run(resume(make_dispatcher(failing, max_attempts=1))) == 1
+    assert len(gemini_interactions.claim_undelivered(since, 60)) == 1
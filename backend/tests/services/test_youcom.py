@@ -16,10 +16,12 @@ class MockResponse:
         status_code: int,
         json_data: dict[str, Any] | None = None,
         text: str = "",
+        headers: dict[str, str] | None = None,
     ) -> None:
         self.status_code = status_code
         self._json_data = json_data or {}
         self.text = text
+        self.headers = httpx.Headers(headers)
 
     def json(self) -> dict[str, Any]:
         return self._json_data
@@ -36,18 +38,14 @@ class MockAsyncClient:
         self.request: dict[str, Any] | None = None
         self.timeout: Any = None
 
-    async def __aenter__(self) -> "MockAsyncClient":
-        return self
-
-    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
-        return False
-
     async def post(
         self,
         url: str,
         headers: dict[str, str],
         json: dict[str, Any],
+        timeout: Any = None,
     ) -> MockResponse:
+        self.timeout = timeout
         self.request = {"url": url, "headers": headers, "json": json}
         if self.exception is not None:
             raise self.exception
@@ -119,11 +117,7 @@ def test_service_deep_research_success(
         )
     )
 
-    def async_client_factory(*_: Any, **kwargs: Any) -> MockAsyncClient:
-        mock_client.timeout = kwargs.get("timeout")
-        return mock_client
-
-    monkeypatch.setattr("app.services.youcom.httpx.AsyncClient", async_client_factory)
+    monkeypatch.setattr(configured_youcom, "_get_client", lambda: mock_client)
 
     response = asyncio.run(
         configured_youcom.deep_research(
@@ -132,6 +126,7 @@ def test_service_deep_research_success(
     )
 
     assert response.output.content == "# Report"
+    assert mock_client.timeout == httpx.Timeout(123)
     assert response.output.sources[0].url == "https://example.com/source"
     assert mock_client.request == {
         "url": "https://api.you.com/v1/research",
@@ -164,10 +159,7 @@ def test_service_maps_http_status_errors(
         response=MockResponse(status_code=status_code, text="upstream failure")
     )
 
-    monkeypatch.setattr(
-        "app.services.youcom.httpx.AsyncClient",
-        lambda *args, **kwargs: mock_client,
-    )
+    monkeypatch.setattr(configured_youcom, "_get_client", lambda: mock_client)
 
     with pytest.raises(YouComAPIError) as exc_info:
         asyncio.run(
@@ -189,10 +181,7 @@ def test_service_maps_timeout_errors(
         exception=httpx.ReadTimeout("timed out", request=request)
     )
 
-    monkeypatch.setattr(
-        "app.services.youcom.httpx.AsyncClient",
-        lambda *args, **kwargs: mock_client,
-    )
+    monkeypatch.setattr(configured_youcom, "_get_client", lambda: mock_client)
 
     with pytest.raises(YouComAPIError) as exc_info:
         asyncio.run(
@@ -214,10 +203,7 @@ def test_service_maps_unexpected_http_errors(
         exception=httpx.ConnectError("boom", request=request)
     )
 
-    monkeypatch.setattr(
-        "app.services.youcom.httpx.AsyncClient",
-        lambda *args, **kwargs: mock_client,
-    )
+    monkeypatch.setattr(configured_youcom, "_get_client", lambda: mock_client)
 
     with pytest.raises(YouComAPIError) as exc_info:
         asyncio.run(
@@ -228,3 +214,37 @@ def test_service_maps_unexpected_http_errors(
 
     assert exc_info.value.error_code == YouComErrorCode.YOUCOM_API_ERROR
     assert exc_info.value.status_code == 500
+
+
+def test_service_retries_unavailable_upstream_with_retry_after(
+    configured_youcom: YouComService,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    mock_client = MockAsyncClient(
+        response=MockResponse(
+            status_code=503, text="maintenance", headers={"Retry-After": "0"}
+        )
+    )
+    attempts: list[int] = []
+    original_post = mock_client.post
+
+    async def counting_post(*args: Any, **kwargs: Any) -> MockResponse:
+        attempts.append(1)
+        return await original_post(*args, **kwargs)
+
+    monkeypatch.setattr(mock_client, "post", counting_post)
+    monkeypatch.setattr(configured_youcom, "_get_client", lambda: mock_client)
+
+    with pytest.raises(YouComAPIError) as exc_info:
+        asyncio.run(
+            configured_youcom.deep_research(
+                YouComDeepResearchRequest(query="Compare agent frameworks")
+            )
+        )
+
+    assert len(attempts) == settings.resilience.max_attempts
+    assert exc_info.value.error_code == YouComErrorCode.SERVICE_UNAVAILABLE
+    assert exc_info.value.details == {
+        "response_body": "maintenance",
+        "retry_after": 0.0,
+    }
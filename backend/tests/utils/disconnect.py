@@ -0,0 +1,55 @@
+import asyncio
+import json
+from typing import Any
+
+from app.main import app
+
+
+async def post_then_disconnect(
+    path: str,
+    headers: dict[str, str],
+    body: dict[str, Any],
+    after: float = 0.05,
+) -> list[dict[str, Any]]:
+    """POST to the app over raw ASGI and disconnect after a delay.
+
+    TestClient cannot drop a connection mid-request, so this drives the
+    ASGI app directly: the body is sent, then http.disconnect follows.
+
+    Returns:
+        The ASGI messages the app sent back.
+    """
+    payload = json.dumps(body).encode()
+    sent_body = False
+    sent: list[dict[str, Any]] = []
+
+    async def receive() -> dict[str, Any]:
+        nonlocal sent_body
+        if not sent_body:
+            sent_body = True
+            return {"type": "http.request", "body": payload, "more_body": False}
+        await asyncio.sleep(after)
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"content-type", b"application/json"),
+            *((k.lower().encode(), v.encode()) for k, v in headers.items()),
+        ],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+    await asyncio.wait_for(app(scope, receive, send), timeout=5)
+    return sent
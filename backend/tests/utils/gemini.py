@@ -0,0 +1,40 @@
+import asyncio
+from typing import Any
+
+from app.schemas.gemini import GeminiDeepResearchResultResponse
+from app.services.gemini import GeminiService
+
+
+class ScriptedGemini(GeminiService):
+    """GeminiService whose poll_research replays scripted snapshots.
+
+    Each poll returns the next snapshot; the last one repeats forever.
+    Snapshots without an event_id get "evt-<poll number>".
+    """
+
+    def __init__(self, snapshots: list[dict[str, Any]], delay: float = 0.0) -> None:
+        super().__init__()
+        self.snapshots = snapshots
+        self.delay = delay
+        self.poll_calls: list[dict[str, Any]] = []
+
+    async def poll_research(
+        self,
+        interaction_id: str,
+        last_event_id: str | None = None,
+    ) -> GeminiDeepResearchResultResponse:
+        self.poll_calls.append(
+            {"interaction_id": interaction_id, "last_event_id": last_event_id}
+        )
+        await asyncio.sleep(self.delay)
+        index = min(len(self.poll_calls), len(self.snapshots)) - 1
+        snapshot = {"event_id": f"evt-{len(self.poll_calls)}", **self.snapshots[index]}
+        return GeminiDeepResearchResultResponse.model_validate(snapshot)
+
+
+def statuses(*values: str) -> list[dict[str, Any]]:
+    """Build snapshots that only differ by status."""
+    return [
+        {"status": value, "error_message": "boom" if value == "failed" else None}
+        for value in values
+    ]